@@ -50,6 +50,8 @@ from aea.error_handler.default import ErrorHandler as DefaultErrorHandler
 from aea.exceptions import AEAException, _StopRuntime
 from aea.helpers.exception_policy import ExceptionPolicyEnum
 from aea.helpers.logging import AgentLoggerAdapter, WithLogger, get_logger
+from aea.helpers.overflow_policy import QueueLimit
+from aea.helpers.priority_lanes import PriorityLane
 from aea.identity.base import Identity
 from aea.mail.base import Envelope
 from aea.protocols.base import Message, Protocol
@@ -95,6 +97,10 @@ class AEA(Agent):
         search_service_address: str = DEFAULT_SEARCH_SERVICE_ADDRESS,
         storage_uri: Optional[str] = None,
         task_manager_mode: Optional[str] = None,
+        inbox_limit: Optional[QueueLimit] = None,
+        outbox_limit: Optional[QueueLimit] = None,
+        connection_limits: Optional[Dict[PublicId, QueueLimit]] = None,
+        priority_lanes: Optional[List[PriorityLane]] = None,
         **kwargs: Any,
     ) -> None:
         """
@@ -105,9 +111,9 @@ class AEA(Agent):
         :param resources: the resources (protocols and skills) of the agent.
         :param data_dir: directory where to put local files.
         :param loop: the event loop to run the connections.
-        :param period: period to call agent's act
+        :param period: period to call agent's act, unused: the AEA acts when its skills add handlers or behaviours.
         :param execution_timeout: amount of time to limit single act/handle to execute.
-        :param max_reactions: the processing rate of envelopes per tick (i.e. single loop).
+        :param max_reactions: the maximum number of envelopes, or internal messages, handled per wakeup of the agent loop.
         :param error_handler_class: the class implementing the error handler
         :param error_handler_config: the configuration of the error handler
         :param decision_maker_handler_class: the class implementing the decision maker handler to be used.
@@ -124,6 +130,10 @@ class AEA(Agent):
         :param search_service_address: the address of the search service used.
         :param storage_uri: optional uri to set generic storage
         :param task_manager_mode: task manager mode (threaded) to run tasks with.
+        :param inbox_limit: the capacity and overflow policy of the queue of the received envelopes.
+        :param outbox_limit: the capacity and overflow policy of the queue of the envelopes to send.
+        :param connection_limits: the capacity and overflow policy of the envelopes received from each connection.
+        :param priority_lanes: the priority lanes of the envelopes in the inbox and outbox, by protocol or skill.
         :param kwargs: keyword arguments to be attached in the agent context namespace.
         """
 
@@ -174,6 +184,12 @@ class AEA(Agent):
                 default_routing=default_routing,
                 default_connection=default_connection,
                 protocols=self.resources.get_all_protocols(),
+                inbox_limit=inbox_limit,
+                outbox_limit=outbox_limit,
+                connection_limits=connection_limits,
+                envelope_rejected_callback=self._on_envelope_rejected,
+                priority_lanes=priority_lanes,
+                get_skill_protocols=self._get_skill_protocols,
             ),
         )
 
@@ -207,6 +223,9 @@ class AEA(Agent):
             if currency_denominations is not None
             else DEFAULT_CURRENCY_DENOMINATIONS
         )
+        self._filter = Filter(
+            self.resources, self.runtime.decision_maker.message_out_queue
+        )
         self._context = AgentContext(
             self.identity,
             self.runtime.multiplexer.connection_status,
@@ -224,12 +243,10 @@ class AEA(Agent):
             storage_callable=lambda: self.runtime.storage,
             build_dir=self.get_build_dir(),
             send_to_skill=self.runtime.agent_loop.send_to_skill,
+            new_components_callback=self._filter.notify_new_components,
             **kwargs,
         )
         self._execution_timeout = execution_timeout
-        self._filter = Filter(
-            self.resources, self.runtime.decision_maker.message_out_queue
-        )
 
         self._setup_loggers()
 
@@ -267,9 +284,10 @@ class AEA(Agent):
         """
         Set up the agent.
 
-        Calls setup() on the resources.
+        Calls setup() on the resources, and registers the handlers and behaviours they added.
         """
         self.resources.setup()
+        self.filter.handle_new_handlers_and_behaviours()
 
     def act(self) -> None:
         """
@@ -279,6 +297,16 @@ class AEA(Agent):
         """
         self.filter.handle_new_handlers_and_behaviours()
 
+    def _handle_new_components(self, _notification: Any) -> None:
+        """
+        Register the new handlers and behaviours of the skills, schedule the new behaviours, and update the skill lanes.
+
+        :param _notification: the notification of the filter.
+        """
+        self.filter.handle_new_handlers_and_behaviours()
+        self.runtime.agent_loop.update_periodic_tasks()
+        self.runtime.multiplexer.update_skill_lanes()
+
     def _get_error_handler(self) -> AbstractErrorHandler:
         """Get error handler."""
         return self._error_handler
@@ -357,6 +385,31 @@ class AEA(Agent):
         for handler in handlers:
             handler.handle_wrapper(msg)
 
+    def _on_envelope_rejected(self, envelope: Envelope) -> None:
+        """
+        Handle an envelope rejected by the multiplexer because the inbox is full.
+
+        :param envelope: the envelope rejected.
+        """
+        self._get_error_handler().send_envelope_rejected(
+            envelope, "inbox full", self.logger
+        )
+
+    def _get_skill_protocols(self, skill_id: PublicId) -> List[PublicId]:
+        """
+        Get the protocols handled by a skill.
+
+        :param skill_id: the skill id, version is ignored.
+        :return: the ids of the protocols supported by the handlers of the skill.
+        """
+        return [
+            cast(PublicId, handler.SUPPORTED_PROTOCOL)
+            for skill in self.resources.get_all_skills()
+            if skill.public_id.same_prefix(skill_id)
+            for handler in skill.handlers.values()
+            if handler.SUPPORTED_PROTOCOL is not None
+        ]
+
     def _setup_loggers(self) -> None:
         """Set up logger with agent name."""
         for element in [
@@ -380,11 +433,12 @@ class AEA(Agent):
         """
         Get all periodic tasks for agent.
 
+        The act of the AEA, which registers the new handlers and behaviours, is
+        not periodic: it is run whenever the skills notify new components.
+
         :return: dict of callable with period specified
         """
-        tasks = super().get_periodic_tasks()
-        tasks.update(self._get_behaviours_tasks())
-        return tasks
+        return self._get_behaviours_tasks()
 
     def _get_behaviours_tasks(
         self,
@@ -413,6 +467,10 @@ class AEA(Agent):
                 self.filter.get_internal_message,
             ),
             (self.handle_envelope, self.runtime.agent_loop.skill2skill_queue.get),
+            (
+                self._handle_new_components,
+                self.filter.get_new_components_notification,
+            ),
         ]
 
     def exception_handler(self, exception: Exception, function: Callable) -> bool:
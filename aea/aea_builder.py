@@ -103,6 +103,8 @@ from aea.helpers.exception_policy import ExceptionPolicyEnum
 from aea.helpers.install_dependency import install_dependency
 from aea.helpers.io import open_file
 from aea.helpers.logging import AgentLoggerAdapter, WithLogger, get_logger
+from aea.helpers.overflow_policy import QueueLimit
+from aea.helpers.priority_lanes import PriorityLane
 from aea.identity.base import Identity
 from aea.registries.resources import Resources
 
@@ -406,6 +408,10 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
         self._task_manager_mode: Optional[str] = None
         self._search_service_address: Optional[str] = None
         self._storage_uri: Optional[str] = None
+        self._inbox_limit: Optional[QueueLimit] = None
+        self._outbox_limit: Optional[QueueLimit] = None
+        self._connection_limits: Dict[PublicId, QueueLimit] = {}
+        self._priority_lanes: List[PriorityLane] = []
         self._data_dir: Optional[str] = None
         self._logging_config: Dict = DEFAULT_LOGGING_CONFIG
 
@@ -692,6 +698,37 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
         self._storage_uri = storage_uri
         return self
 
+    def set_queue_limits(
+        self,
+        inbox_limit: Optional[QueueLimit] = None,
+        outbox_limit: Optional[QueueLimit] = None,
+        connection_limits: Optional[Dict[PublicId, QueueLimit]] = None,
+    ) -> "AEABuilder":
+        """
+        Set the capacity limits and overflow policies of the envelope queues.
+
+        :param inbox_limit: the limit of the queue of the received envelopes
+        :param outbox_limit: the limit of the queue of the envelopes to send
+        :param connection_limits: the limits of the envelopes received from each connection
+        :return: self
+        """
+        self._inbox_limit = inbox_limit
+        self._outbox_limit = outbox_limit
+        self._connection_limits = connection_limits or {}
+        return self
+
+    def set_priority_lanes(
+        self, priority_lanes: Optional[List[PriorityLane]] = None
+    ) -> "AEABuilder":
+        """
+        Set the priority lanes of the envelopes, by protocol or skill.
+
+        :param priority_lanes: the priority lanes
+        :return: self
+        """
+        self._priority_lanes = priority_lanes or []
+        return self
+
     def set_data_dir(self, data_dir: Optional[str]) -> "AEABuilder":  # pragma: nocover
         """
         Set the data directory.
@@ -1388,6 +1425,10 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
             connection_ids=connection_ids,
             search_service_address=self._get_search_service_address(),
             storage_uri=self._get_storage_uri(),
+            inbox_limit=self._inbox_limit,
+            outbox_limit=self._outbox_limit,
+            connection_limits=self._connection_limits,
+            priority_lanes=self._priority_lanes,
             **deepcopy(self._context_namespace),
         )
         self._load_and_add_components(
@@ -1765,6 +1806,13 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
         self.set_runtime_mode(agent_configuration.runtime_mode)
         self.set_task_manager_mode(agent_configuration.task_manager_mode)
         self.set_storage_uri(agent_configuration.storage_uri)
+        self._set_queue_limits_from_config(agent_configuration.queue_limits)
+        self.set_priority_lanes(
+            [
+                PriorityLane.from_json(name, lane)
+                for name, lane in agent_configuration.priority_lanes.items()
+            ]
+        )
         self.set_data_dir(agent_configuration.data_dir)
         self.set_logging_config(agent_configuration.logging_config)
 
@@ -1805,6 +1853,23 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
         self.set_default_routing(agent_configuration.default_routing)
         self.set_agent_pypi_dependencies(agent_configuration.dependencies)
 
+    def _set_queue_limits_from_config(self, queue_limits: Dict[str, Any]) -> None:
+        """
+        Set the queue limits from their configuration.
+
+        :param queue_limits: the `queue_limits` field of the agent configuration
+        """
+        inbox = queue_limits.get("inbox")
+        outbox = queue_limits.get("outbox")
+        self.set_queue_limits(
+            inbox_limit=QueueLimit.from_json(inbox) if inbox is not None else None,
+            outbox_limit=QueueLimit.from_json(outbox) if outbox is not None else None,
+            connection_limits={
+                PublicId.from_str(connection_id): QueueLimit.from_json(limit)
+                for connection_id, limit in queue_limits.get("connections", {}).items()
+            },
+        )
+
     @staticmethod
     def _find_import_order(
         component_ids: List[ComponentId],
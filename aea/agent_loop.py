@@ -19,6 +19,7 @@
 """This module contains the implementation of an agent loop using asyncio."""
 import asyncio
 import datetime
+import time
 from abc import ABC, abstractmethod
 from asyncio import CancelledError
 from asyncio.events import AbstractEventLoop
@@ -135,6 +136,8 @@ class BaseAgentLoop(Runnable, WithLogger, ABC):
 
     async def _stop(self) -> None:
         """Stop and cleanup."""
+        if self._state.get() != AgentLoopStates.error:
+            self._state.set(AgentLoopStates.stopping)
         self._teardown()
         self._stop_tasks()
         for t in self._tasks:
@@ -178,11 +181,16 @@ class BaseAgentLoop(Runnable, WithLogger, ABC):
     def skill2skill_queue(self) -> Queue:
         """Get skill to skill message queue."""
 
+    @abstractmethod
+    def update_periodic_tasks(self) -> None:
+        """Schedule the periodic tasks of the agent not scheduled yet, such as the behaviours added at runtime."""
+
 
 class AsyncAgentLoop(BaseAgentLoop):
     """Asyncio based agent loop suitable only for AEA."""
 
-    NEW_BEHAVIOURS_PROCESS_SLEEP = 1  # check new behaviours registered every second.
+    # yield to the behaviours and the other sources after a batch of 10 ms
+    MESSAGE_BATCH_TIME_BUDGET = 0.01
 
     def __init__(
         self,
@@ -332,13 +340,28 @@ class AsyncAgentLoop(BaseAgentLoop):
         self.logger.debug(f"Periodic task {task_callable} registered.")
 
     def _register_periodic_tasks(self) -> None:
-        """Register all AEA related periodic tasks."""
+        """Register all AEA related periodic tasks, unless the loop is stopping."""
+        if self._state.get() not in (
+            AgentLoopStates.starting,
+            AgentLoopStates.started,
+        ):
+            # the periodic tasks are unregistered on stop, do not start new ones
+            return
         for (
             task_callable,
             (period, start_at),
         ) in self._agent.get_periodic_tasks().items():
             self._register_periodic_task(task_callable, period, start_at)
 
+    def update_periodic_tasks(self) -> None:
+        """
+        Schedule the periodic tasks of the agent not scheduled yet, such as the behaviours added at runtime.
+
+        It is called by the agent when notified of new components, so the loop
+        does not poll for them. It does nothing once the loop is stopping.
+        """
+        self._register_periodic_tasks()
+
     def _unregister_periodic_task(self, task_callable: Callable) -> None:
         """
         Unregister periodic execution of the task.
@@ -379,7 +402,6 @@ class AsyncAgentLoop(BaseAgentLoop):
         """
         coros = [
             self._process_messages(),
-            self._task_register_periodic_tasks(),
             self._task_wait_for_error(),
         ]
         return list(map(self._loop.create_task, coros))  # type: ignore  # some issue with map and create_task
@@ -387,11 +409,28 @@ class AsyncAgentLoop(BaseAgentLoop):
     async def _message_processor(
         self, message_handler: Callable, message_getter: Callable
     ) -> None:
-        """Fetch messages from the message getter and process it with message handler."""
+        """
+        Fetch messages from the message getter and process it with message handler.
+
+        The getters return at once while messages are waiting, so the processor
+        drains them in batches, and yields after each batch: a batch ends after
+        `max_reactions` messages of the agent, or once it has taken
+        MESSAGE_BATCH_TIME_BUDGET seconds. So the message sources of the agent
+        (inbox, decision maker, skill to skill) and its behaviours are served in
+        turn, and none waits for another to be drained.
+        """
+        batch_size = max(1, getattr(self.agent, "max_reactions", 1))
         try:
             while self.is_running:
                 message = await message_getter()
+                batch_deadline = time.monotonic() + self.MESSAGE_BATCH_TIME_BUDGET
                 self._execution_control(message_handler, [message])
+                for _ in range(batch_size - 1):
+                    if not self.is_running or time.monotonic() >= batch_deadline:
+                        break
+                    message = await message_getter()
+                    self._execution_control(message_handler, [message])
+                await asyncio.sleep(0)
         except CancelledError:  # pylint: disable=try-except-raise
             raise
         except Exception:  # pragma: nocover
@@ -410,16 +449,11 @@ class AsyncAgentLoop(BaseAgentLoop):
         for handler, getter in self._message_handlers():
             coros.append(self._message_processor(handler, getter))
 
+        self._register_periodic_tasks()
         self.logger.info(LAUNCH_SUCCEED_MESSAGE)
         self._state.set(AgentLoopStates.started)
 
         await asyncio.gather(*coros)
 
-    async def _task_register_periodic_tasks(self) -> None:
-        """Process new behaviours added to skills in runtime."""
-        while self.is_running:
-            self._register_periodic_tasks()  # re register, cause new may appear
-            await asyncio.sleep(self.NEW_BEHAVIOURS_PROCESS_SLEEP)
-
 
 SyncAgentLoop = AsyncAgentLoop  # temporary solution!
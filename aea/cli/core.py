@@ -21,56 +21,60 @@
 from typing import Optional
 
 import click
-from pkg_resources import iter_entry_points
 
 import aea
-from aea.cli.add import add
-from aea.cli.add_key import add_key
-from aea.cli.build import build
-from aea.cli.config import config
-from aea.cli.create import create
-from aea.cli.delete import delete
-from aea.cli.eject import eject
-from aea.cli.fetch import fetch
-from aea.cli.fingerprint import fingerprint
-from aea.cli.freeze import freeze
-from aea.cli.generate import generate
-from aea.cli.generate_key import generate_key
-from aea.cli.generate_wealth import generate_wealth
-from aea.cli.get_address import get_address
-from aea.cli.get_multiaddress import get_multiaddress
-from aea.cli.get_public_key import get_public_key
-from aea.cli.get_wealth import get_wealth
-from aea.cli.init import init
-from aea.cli.install import install
-from aea.cli.interact import interact
-from aea.cli.issue_certificates import issue_certificates
-from aea.cli.launch import launch
-from aea.cli.list import list_command as _list
-from aea.cli.local_registry_sync import local_registry_sync
-from aea.cli.login import login
-from aea.cli.logout import logout
-from aea.cli.plugin import with_plugins
-from aea.cli.publish import publish
-from aea.cli.push import push
-from aea.cli.register import register
-from aea.cli.remove import remove
-from aea.cli.remove_key import remove_key
-from aea.cli.reset_password import reset_password
-from aea.cli.run import run
-from aea.cli.scaffold import scaffold
-from aea.cli.search import search
-from aea.cli.transfer import transfer
-from aea.cli.upgrade import upgrade
-from aea.cli.utils.click_utils import registry_path_option
+from aea.cli.plugin import iter_entry_points, with_plugins
+from aea.cli.utils.click_utils import LazyGroup, registry_path_option
 from aea.cli.utils.config import get_registry_path_from_cli_config
 from aea.cli.utils.context import Context
 from aea.cli.utils.loggers import logger, simple_verbosity_option
 from aea.helpers.win32 import enable_ctrl_c_support
 
 
+# the commands are imported only when invoked, to keep the start-up time low.
+COMMANDS = {
+    "add": "aea.cli.add:add",
+    "add-key": "aea.cli.add_key:add_key",
+    "build": "aea.cli.build:build",
+    "config": "aea.cli.config:config",
+    "create": "aea.cli.create:create",
+    "delete": "aea.cli.delete:delete",
+    "eject": "aea.cli.eject:eject",
+    "fetch": "aea.cli.fetch:fetch",
+    "fingerprint": "aea.cli.fingerprint:fingerprint",
+    "freeze": "aea.cli.freeze:freeze",
+    "generate": "aea.cli.generate:generate",
+    "generate-key": "aea.cli.generate_key:generate_key",
+    "generate-wealth": "aea.cli.generate_wealth:generate_wealth",
+    "get-address": "aea.cli.get_address:get_address",
+    "get-multiaddress": "aea.cli.get_multiaddress:get_multiaddress",
+    "get-public-key": "aea.cli.get_public_key:get_public_key",
+    "get-wealth": "aea.cli.get_wealth:get_wealth",
+    "init": "aea.cli.init:init",
+    "install": "aea.cli.install:install",
+    "interact": "aea.cli.interact:interact",
+    "issue-certificates": "aea.cli.issue_certificates:issue_certificates",
+    "launch": "aea.cli.launch:launch",
+    "list": "aea.cli.list:list_command",
+    "local-registry-sync": "aea.cli.local_registry_sync:local_registry_sync",
+    "login": "aea.cli.login:login",
+    "logout": "aea.cli.logout:logout",
+    "publish": "aea.cli.publish:publish",
+    "push": "aea.cli.push:push",
+    "register": "aea.cli.register:register",
+    "remove": "aea.cli.remove:remove",
+    "remove-key": "aea.cli.remove_key:remove_key",
+    "reset_password": "aea.cli.reset_password:reset_password",
+    "run": "aea.cli.run:run",
+    "scaffold": "aea.cli.scaffold:scaffold",
+    "search": "aea.cli.search:search",
+    "transfer": "aea.cli.transfer:transfer",
+    "upgrade": "aea.cli.upgrade:upgrade",
+}
+
+
 @with_plugins(iter_entry_points("aea.cli"))
-@click.group(name="aea")  # type: ignore
+@click.group(name="aea", cls=LazyGroup, lazy_commands=COMMANDS)  # type: ignore
 @click.version_option(aea.__version__, prog_name="aea")
 @simple_verbosity_option(logger, default="INFO")
 @click.option(
@@ -100,42 +104,3 @@ def cli(
 
     # enables CTRL+C support on windows!
     enable_ctrl_c_support()
-
-
-cli.add_command(_list)
-cli.add_command(add_key)
-cli.add_command(add)
-cli.add_command(build)
-cli.add_command(create)
-cli.add_command(config)
-cli.add_command(delete)
-cli.add_command(eject)
-cli.add_command(fetch)
-cli.add_command(fingerprint)
-cli.add_command(freeze)
-cli.add_command(generate_key)
-cli.add_command(generate_wealth)
-cli.add_command(generate)
-cli.add_command(get_address)
-cli.add_command(get_public_key)
-cli.add_command(get_multiaddress)
-cli.add_command(get_wealth)
-cli.add_command(init)
-cli.add_command(install)
-cli.add_command(interact)
-cli.add_command(issue_certificates)
-cli.add_command(launch)
-cli.add_command(login)
-cli.add_command(logout)
-cli.add_command(publish)
-cli.add_command(push)
-cli.add_command(register)
-cli.add_command(remove)
-cli.add_command(remove_key)
-cli.add_command(reset_password)
-cli.add_command(run)
-cli.add_command(scaffold)
-cli.add_command(search)
-cli.add_command(local_registry_sync)
-cli.add_command(transfer)
-cli.add_command(upgrade)
@@ -29,22 +29,28 @@ from aea.cli.utils.click_utils import AgentDirectory, password_option
 from aea.cli.utils.context import Context
 from aea.cli.utils.loggers import logger
 from aea.helpers.multiple_executor import ExecutorExceptionPolicies
-from aea.launcher import AEALauncher
+from aea.launcher import AEALauncher, SHARDED_MODE
 
 
 @click.command()
 @click.argument("agents", nargs=-1, type=AgentDirectory())
 @password_option()
 @click.option("--multithreaded", is_flag=True)
+@click.option(
+    "--sharded",
+    is_flag=True,
+    help="Pack the agents in one supervised process per CPU.",
+)
 @click.pass_context
 def launch(
     click_context: click.Context,
     agents: List[str],
     password: Optional[str],
     multithreaded: bool,
+    sharded: bool,
 ) -> None:
     """Launch many agents at the same time."""
-    _launch_agents(click_context, agents, multithreaded, password)
+    _launch_agents(click_context, agents, multithreaded, password, sharded)
 
 
 def _launch_agents(
@@ -52,6 +58,7 @@ def _launch_agents(
     agents: List[str],
     multithreaded: bool,
     password: Optional[str] = None,
+    sharded: bool = False,
 ) -> None:
     """
     Run multiple agents.
@@ -60,9 +67,17 @@ def _launch_agents(
     :param agents: agents names.
     :param multithreaded: bool flag to run as multithreads.
     :param password: the password to encrypt/decrypt the private key.
+    :param sharded: bool flag to run in shards of agents, each in a supervised process.
     """
+    if multithreaded and sharded:
+        raise click.ClickException(
+            "Options --multithreaded and --sharded are mutually exclusive."
+        )
     agents_directories = list(map(Path, list(OrderedDict.fromkeys(agents))))
-    mode = "threaded" if multithreaded else "multiprocess"
+    if sharded:
+        mode = SHARDED_MODE
+    else:
+        mode = "threaded" if multithreaded else "multiprocess"
     ctx = cast(Context, click_context.obj)
 
     launcher = AEALauncher(
@@ -21,17 +21,36 @@
 import os
 import sys
 import traceback
-from typing import Callable, Iterable, List
+from typing import Any, Callable, Iterable, Iterator, List
 
 import click
-import pkg_resources
+from importlib_metadata import entry_points
 
+from aea.cli.utils.click_utils import LazyGroup
 
-def with_plugins(plugins: Iterable[pkg_resources.EntryPoint]) -> Callable:
+
+def iter_entry_points(group: str) -> Iterator[Any]:
+    """
+    Iterate over the entry points of a group, from the metadata of the installed distributions.
+
+    Unlike `pkg_resources`, this does not build a working set of every
+    installed distribution and its requirements, and the distributions are
+    only looked up once the iteration starts.
+
+    :param group: the entry point group.
+    :yield: the entry points.
+    """
+    yield from entry_points(group=group)
+
+
+def with_plugins(plugins: Iterable[Any]) -> Callable:
     """
     A decorator to register external CLI commands to an instance of `click.Group()`.
 
-    :param plugins: An iterable producing one `pkg_resources.EntryPoint()` per iteration.
+    On a LazyGroup, plugins are only loaded when a command which is not
+    declared by the group is looked up.
+
+    :param plugins: An iterable producing one entry point per iteration.
     :return: a click.Group instance.
     """
 
@@ -41,20 +60,29 @@ def with_plugins(plugins: Iterable[pkg_resources.EntryPoint]) -> Callable:
                 "Plugins can only be attached to an instance of click.Group()"
             )
 
+        if isinstance(group, LazyGroup):
+            group.add_lazy_plugins(plugins or (), _load_plugin)
+            return group
+
         for entry_point in plugins or ():
-            try:
-                group.add_command(entry_point.load())
-            except Exception:  # pylint: disable=broad-except
-                # Catch this so a busted plugin doesn't take down the CLI.
-                # Handled by registering a dummy command that does nothing
-                # other than explain the error.
-                group.add_command(BrokenCommand(entry_point.name))
+            group.add_command(_load_plugin(entry_point))
 
         return group
 
     return decorator
 
 
+def _load_plugin(entry_point: Any) -> click.Command:
+    """Load the command of a plugin."""
+    try:
+        return entry_point.load()
+    except Exception:  # pylint: disable=broad-except
+        # Catch this so a busted plugin doesn't take down the CLI.
+        # Handled by registering a dummy command that does nothing
+        # other than explain the error.
+        return BrokenCommand(entry_point.name)
+
+
 class BrokenCommand(click.Command):
     """
     Helper click.Command in case a broken plug-in is loaded.
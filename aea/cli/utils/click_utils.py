@@ -18,10 +18,11 @@
 # ------------------------------------------------------------------------------
 """Module with click utils of the aea cli."""
 
+import importlib
 import os
 from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Callable, List, Mapping, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
 import click
 from click import Context, Option, UsageError, option
@@ -32,6 +33,114 @@ from aea.configurations.constants import DEFAULT_AEA_CONFIG_FILE
 from aea.helpers.io import open_file
 
 
+class LazyGroup(click.Group):
+    """
+    Click group which imports its commands only when they are used.
+
+    Commands are declared by name, either with the dotted path of the command
+    object ('package.module:attribute') or with a function that returns it.
+    Plugins, whose command names are only known once loaded, are loaded the
+    first time a command which is not declared is looked up.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_commands: Optional[Dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Initialize the group.
+
+        :param args: positional arguments of click.Group
+        :param lazy_commands: the dotted paths of the commands, by command name.
+        :param kwargs: keyword arguments of click.Group
+        """
+        super().__init__(*args, **kwargs)
+        self._lazy_commands: Dict[str, Callable[[], click.Command]] = {}
+        self._lazy_plugins: List[
+            Tuple[Iterable[Any], Callable[[Any], click.Command]]
+        ] = []
+        for name, dotted_path in (lazy_commands or {}).items():
+            self.add_lazy_command(name, dotted_path)
+
+    def add_lazy_command(
+        self, name: str, command: Union[str, Callable[[], click.Command]]
+    ) -> None:
+        """
+        Declare a command to load when it is used.
+
+        :param name: the name of the command.
+        :param command: the dotted path of the command, or a function returning it.
+        """
+        if isinstance(command, str):
+            module_name, attribute = command.split(":")
+
+            def load() -> click.Command:
+                module = importlib.import_module(module_name)
+                return getattr(module, attribute)
+
+            self._lazy_commands[name] = load
+        else:
+            self._lazy_commands[name] = command
+
+    def add_lazy_plugins(
+        self, plugins: Iterable[Any], load: Callable[[Any], click.Command]
+    ) -> None:
+        """
+        Declare plugins to load when a command which is not declared is used.
+
+        :param plugins: the plugins, iterated only when they are loaded.
+        :param load: the function returning the command of a plugin.
+        """
+        self._lazy_plugins.append((plugins, load))
+
+    def _load_plugins(self) -> None:
+        """Load the commands of the plugins."""
+        while self._lazy_plugins:
+            plugins, load = self._lazy_plugins.pop(0)
+            for plugin in plugins:
+                self.add_command(load(plugin))
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """
+        Get the names of the commands, without loading the declared ones.
+
+        :param ctx: the click context
+        :return: the sorted command names.
+        """
+        self._load_plugins()
+        return sorted(set(super().list_commands(ctx)) | set(self._lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """
+        Get a command, loading it if needed.
+
+        :param ctx: the click context
+        :param cmd_name: the name of the command.
+        :return: the command, or None if there is no such command.
+        """
+        load = self._lazy_commands.get(cmd_name)
+        if load is not None:
+            self.add_command(load(), cmd_name)
+            del self._lazy_commands[cmd_name]
+        elif cmd_name not in self.commands:
+            self._load_plugins()
+        return super().get_command(ctx, cmd_name)
+
+    def load_all_commands(self) -> Dict[str, click.Command]:
+        """
+        Load all the commands.
+
+        :return: the commands, by name.
+        """
+        for name, load in list(self._lazy_commands.items()):
+            self.add_command(load(), name)
+            del self._lazy_commands[name]
+        self._load_plugins()
+        return self.commands
+
+
 class ConnectionsOption(click.Option):
     """Click option for the --connections option in 'aea run'."""
 
@@ -17,13 +17,15 @@
 #
 # ------------------------------------------------------------------------------
 """This module contains definitions of agent components."""
+import importlib.abc
 import importlib.util
 import logging
 import sys
+import threading
 import types
 from abc import ABC
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
 
 from aea.configurations.base import (
     ComponentConfiguration,
@@ -38,6 +40,8 @@ from aea.helpers.logging import WithLogger
 
 _default_logger = logging.getLogger(__name__)
 
+_lazy_load_lock = threading.RLock()
+
 
 class Component(ABC, WithLogger):
     """Abstract class for an agent component."""
@@ -128,21 +132,143 @@ def load_aea_package(configuration: ComponentConfiguration) -> None:
     author = configuration.author
     package_type_plural = configuration.component_type.to_plural()
     package_name = configuration.name
-    perform_load_aea_package(dir_, author, package_type_plural, package_name)
+    perform_load_aea_package(
+        dir_,
+        author,
+        package_type_plural,
+        package_name,
+        fingerprint=configuration.fingerprint,
+    )
+
+
+def get_import_manifest(
+    dir_: Path, fingerprint: Optional[Dict[str, str]] = None
+) -> List[Path]:
+    """
+    Get the import manifest of a package, i.e. the directories of its (sub)packages.
+
+    The manifest is read from the fingerprint of the package, which lists all
+    its files, so the package directory is not walked. It is walked only when
+    the fingerprint does not cover the package, e.g. when it is empty.
+
+    :param dir_: path of the component.
+    :param fingerprint: the fingerprint of the component.
+    :return: the paths, relative to the component directory, of the directories with an __init__.py module.
+    """
+    if fingerprint and "__init__.py" in fingerprint:
+        return sorted(
+            Path(file_path).parent
+            for file_path in fingerprint
+            if Path(file_path).name == "__init__.py" and (dir_ / file_path).is_file()
+        )
+    return sorted(
+        init_file.parent.relative_to(dir_) for init_file in dir_.rglob("__init__.py")
+    )
+
+
+def _remove_unlisted_subpackages(
+    dir_: Path, import_path: str, manifest: List[Path]
+) -> None:
+    """
+    Remove from `sys.modules` the subpackages of a package missing from its import manifest.
+
+    So they are imported again from the package directory, instead of being
+    kept from a previous load of the package.
+
+    :param dir_: path of the component.
+    :param import_path: the import path of the component.
+    :param manifest: the import manifest of the component.
+    """
+    listed = {
+        import_path + "".join(f".{part}" for part in path.parts) for path in manifest
+    }
+    prefix = import_path + "."
+    for module_name in [name for name in sys.modules if name.startswith(prefix)]:
+        relative_path = Path(*module_name[len(prefix) :].split("."))
+        if (
+            module_name not in listed
+            and (dir_ / relative_path / "__init__.py").is_file()
+        ):
+            del sys.modules[module_name]
+
+
+class _LazyModule(types.ModuleType):
+    """
+    A module executed the first time one of its attributes is accessed.
+
+    Unlike importlib's LazyLoader before Python 3.12, the execution holds a
+    lock, so other threads wait for it instead of seeing the module half executed.
+    """
+
+    def __getattribute__(self, attr: str) -> Any:
+        """Execute the module, unless done already, and return the attribute."""
+        with _lazy_load_lock:
+            if type(self) is _LazyModule:
+                self.__class__ = _LoadingModule
+                try:
+                    self.__spec__.loader.exec_module(self)  # type: ignore
+                finally:
+                    self.__class__ = types.ModuleType
+        return getattr(self, attr)
+
+
+class _LoadingModule(types.ModuleType):
+    """A lazy module being executed."""
+
+    def __getattribute__(self, attr: str) -> Any:
+        """Return the attribute, once the module is executed if accessed from another thread."""
+        with _lazy_load_lock:
+            return types.ModuleType.__getattribute__(self, attr)
+
+
+class _LazyLoader(importlib.abc.Loader):
+    """A loader deferring the execution of the modules of another loader."""
+
+    def __init__(self, loader: importlib.abc.Loader) -> None:
+        """
+        Initialize the loader.
+
+        :param loader: the loader executing the modules.
+        """
+        self.loader = loader
+
+    def exec_module(self, module: types.ModuleType) -> None:
+        """
+        Make the module lazy.
+
+        :param module: the module.
+        """
+        module.__spec__.loader = self.loader  # type: ignore
+        module.__loader__ = self.loader
+        module.__class__ = _LazyModule
 
 
 def perform_load_aea_package(
-    dir_: Path, author: str, package_type_plural: str, package_name: str
+    dir_: Path,
+    author: str,
+    package_type_plural: str,
+    package_name: str,
+    fingerprint: Optional[Dict[str, str]] = None,
+    lazy_subpackages: bool = True,
 ) -> None:
     """
     Load the AEA package from values provided.
 
-    It adds all the __init__.py modules into `sys.modules`.
+    It adds all the __init__.py modules into `sys.modules`. The subpackages,
+    if any, are loaded lazily: their __init__.py module is executed the first
+    time one of their attributes is accessed. A subpackage missing from the
+    import manifest, e.g. because the fingerprint is stale or ignores it, is
+    imported normally, from the package path, when it is first imported.
+
+    The first access to a lazy subpackage holds a lock until it is executed,
+    so threaded agents can use it concurrently.
 
     :param dir_: path of the component.
     :param author: str
     :param package_type_plural: str
     :param package_name: str
+    :param fingerprint: the fingerprint of the component, to get its import manifest.
+    :param lazy_subpackages: whether to defer the execution of the subpackages.
     """
 
     if dir_ is None or not dir_.exists():  # pragma: nocover
@@ -165,20 +291,25 @@ def perform_load_aea_package(
     )
 
     prefix_pkg = prefix_pkg_type + f".{package_name}"
+    manifest = get_import_manifest(dir_, fingerprint)
+    _remove_unlisted_subpackages(dir_, prefix_pkg, manifest)
 
-    for subpackage_init_file in dir_.rglob("__init__.py"):
-        parent_dir = subpackage_init_file.parent
-        relative_parent_dir = parent_dir.relative_to(dir_)
+    for relative_parent_dir in manifest:
         if relative_parent_dir == Path("."):
-            # this handles the case when 'subpackage_init_file'
+            # this handles the case when the '__init__.py' file
             # is path/to/package/__init__.py
             import_path = prefix_pkg
-        else:  # pragma: nocover
+            is_lazy = False
+        else:
             import_path = prefix_pkg + "." + ".".join(relative_parent_dir.parts)
+            is_lazy = lazy_subpackages
 
+        subpackage_init_file = dir_ / relative_parent_dir / "__init__.py"
         spec = importlib.util.spec_from_file_location(import_path, subpackage_init_file)
         if spec is None:
             raise RuntimeError(f"Error load module from {subpackage_init_file}")
+        if is_lazy:
+            spec.loader = _LazyLoader(spec.loader)  # type: ignore
         module = importlib.util.module_from_spec(spec)
         sys.modules[import_path] = module
         _default_logger.debug(f"loading {import_path}: {module}")
@@ -81,7 +81,7 @@ from aea.helpers.base import (
     load_module,
     recursive_update,
 )
-from aea.helpers.ipfs.base import IPFSHashOnly
+from aea.helpers.fingerprint import compute_file_hashes
 
 
 # for tests
@@ -1174,6 +1174,8 @@ class AgentConfig(PackageConfiguration):
             "required_ledgers",
             "default_routing",
             "storage_uri",
+            "queue_limits",
+            "priority_lanes",
         ]
     )
     CHECK_EXCLUDES = [
@@ -1184,6 +1186,8 @@ class AgentConfig(PackageConfiguration):
         ("default_routing",),
         ("dependencies",),
         ("logging_config",),
+        ("queue_limits",),
+        ("priority_lanes",),
     ]
 
     __slots__ = (
@@ -1211,6 +1215,8 @@ class AgentConfig(PackageConfiguration):
         "loop_mode",
         "runtime_mode",
         "storage_uri",
+        "queue_limits",
+        "priority_lanes",
         "data_dir",
         "_component_configurations",
         "dependencies",
@@ -1244,6 +1250,8 @@ class AgentConfig(PackageConfiguration):
         runtime_mode: Optional[str] = None,
         task_manager_mode: Optional[str] = None,
         storage_uri: Optional[str] = None,
+        queue_limits: Optional[Dict] = None,
+        priority_lanes: Optional[Dict] = None,
         data_dir: Optional[str] = None,
         component_configurations: Optional[Dict[ComponentId, Dict]] = None,
         dependencies: Optional[Dependencies] = None,
@@ -1310,6 +1318,8 @@ class AgentConfig(PackageConfiguration):
         self.runtime_mode = runtime_mode
         self.task_manager_mode = task_manager_mode
         self.storage_uri = storage_uri
+        self.queue_limits = queue_limits if queue_limits is not None else {}
+        self.priority_lanes = priority_lanes if priority_lanes is not None else {}
         self.data_dir = data_dir
         # this attribute will be set through the setter below
         self._component_configurations: Dict[ComponentId, Dict] = {}
@@ -1451,6 +1461,10 @@ class AgentConfig(PackageConfiguration):
             config["task_manager_mode"] = self.task_manager_mode
         if self.storage_uri is not None:
             config["storage_uri"] = self.storage_uri
+        if self.queue_limits != {}:
+            config["queue_limits"] = self.queue_limits
+        if self.priority_lanes != {}:
+            config["priority_lanes"] = self.priority_lanes
         if self.data_dir is not None:
             config["data_dir"] = self.data_dir
         if self.currency_denominations != {}:
@@ -1495,6 +1509,8 @@ class AgentConfig(PackageConfiguration):
             runtime_mode=cast(str, obj.get("runtime_mode")),
             task_manager_mode=cast(str, obj.get("task_manager_mode")),
             storage_uri=cast(str, obj.get("storage_uri")),
+            queue_limits=cast(Dict, obj.get("queue_limits", {})),
+            priority_lanes=cast(Dict, obj.get("priority_lanes", {})),
             data_dir=cast(str, obj.get("data_dir")),
             component_configurations=None,
             dependencies=cast(
@@ -1847,7 +1863,6 @@ def _compute_fingerprint(  # pylint: disable=unsubscriptable-object
     ignore_patterns = ignore_patterns if ignore_patterns is not None else []
     ignore_directories = ignore_directories if ignore_directories is not None else []
     ignore_patterns = set(ignore_patterns).union(DEFAULT_FINGERPRINT_IGNORE_PATTERNS)
-    hasher = IPFSHashOnly()
     fingerprints = {}  # type: Dict[str, str]
     # find all valid files of the package
     all_files = [
@@ -1858,8 +1873,7 @@ def _compute_fingerprint(  # pylint: disable=unsubscriptable-object
         and not (x.parts[0] in ignore_directories)
     ]
 
-    for file in all_files:
-        file_hash = hasher.get(str(file))
+    for file, file_hash in zip(all_files, compute_file_hashes(all_files)):
         key = str(file.relative_to(package_directory))
         enforce(key not in fingerprints, "Key in fingerprints!")  # nosec
         # use '/' as path separator
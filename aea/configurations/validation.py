@@ -20,9 +20,11 @@
 import inspect
 import json
 import os
+import threading
 from copy import deepcopy
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urldefrag, urljoin
 
 import jsonschema
 from jsonschema import Draft4Validator
@@ -122,6 +124,125 @@ EnvVarsFriendlyDraft4Validator = extend(
 )
 
 
+class _ValidatorsRegistry:
+    """
+    Process-wide registry of the compiled schema validators.
+
+    Schema files are parsed once, and the '$ref's between them are replaced
+    by the referenced schemas, so validating never resolves a reference nor
+    reads a file. The validators hold no state while validating, hence they are
+    shared between all the ConfigValidator instances and threads.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self._lock = threading.Lock()
+        self._schemas: Dict[str, Dict] = {}
+        self._validators: Dict[Tuple[str, bool], Draft4Validator] = {}
+
+    def get_schema(self, schema_path: str) -> Dict:
+        """
+        Get a schema, as in its file.
+
+        :param schema_path: the path to the schema file.
+        :return: the schema.
+        """
+        schema = self._schemas.get(schema_path)
+        if schema is None:
+            with open_file(schema_path) as fp:
+                schema = json.load(fp)
+            self._schemas[schema_path] = schema
+        return schema
+
+    def get_validator(self, schema_path: str, env_vars_friendly: bool) -> Any:
+        """
+        Get the validator of a schema.
+
+        :param schema_path: the path to the schema file.
+        :param env_vars_friendly: whether or not the validator is env var friendly.
+        :return: the validator.
+        """
+        key = (schema_path, env_vars_friendly)
+        validator = self._validators.get(key)
+        if validator is None:
+            with self._lock:
+                validator = self._validators.get(key)
+                if validator is None:
+                    validator = self._make_validator(schema_path, env_vars_friendly)
+                    self._validators[key] = validator
+        return validator
+
+    def _make_validator(self, schema_path: str, env_vars_friendly: bool) -> Any:
+        """Make the validator of a schema, with its references resolved."""
+        root_path = make_jsonschema_base_uri(Path(_SCHEMAS_DIR))
+        schema = self.get_schema(schema_path)
+        documents = {root_path: schema}
+        schema = self._resolve_references(
+            schema, root_path, root_path, documents, set()
+        )
+        resolver = jsonschema.RefResolver(root_path, schema)
+        validator_class = (
+            EnvVarsFriendlyDraft4Validator if env_vars_friendly else OwnDraft4Validator
+        )
+        return validator_class(schema, resolver=resolver)
+
+    def _resolve_references(
+        self,
+        node: Any,
+        base_uri: str,
+        root_path: str,
+        documents: Dict[str, Dict],
+        seen: Set[str],
+    ) -> Any:
+        """
+        Replace the references in a schema by the referenced schemas.
+
+        Recursive references, and references outside of the schemas directory,
+        are left in place for the resolver of the validator.
+
+        :param node: the schema, or a part of it.
+        :param base_uri: the URI of the document containing the node.
+        :param root_path: the URI of the schemas directory.
+        :param documents: the schemas, by URI.
+        :param seen: the references being replaced.
+        :return: the node, with its references replaced.
+        """
+        if isinstance(node, list):
+            return [
+                self._resolve_references(item, base_uri, root_path, documents, seen)
+                for item in node
+            ]
+        if not isinstance(node, dict):
+            return node
+        reference = node.get("$ref")
+        if not isinstance(reference, str):
+            return {
+                key: self._resolve_references(
+                    value, base_uri, root_path, documents, seen
+                )
+                for key, value in node.items()
+            }
+        url = urljoin(base_uri, reference)
+        document_uri, fragment = urldefrag(url)
+        if url in seen or not document_uri.startswith(root_path):  # pragma: nocover
+            return node
+        document = documents.get(document_uri)
+        if document is None:
+            document = self.get_schema(
+                str(Path(_SCHEMAS_DIR) / document_uri[len(root_path) :])
+            )
+            documents[document_uri] = document
+        target = jsonschema.RefResolver(document_uri, document).resolve_fragment(
+            document, fragment
+        )
+        return self._resolve_references(
+            target, document_uri, root_path, documents, seen | {url}
+        )
+
+
+_validators_registry = _ValidatorsRegistry()
+
+
 class ConfigValidator:
     """Configuration validator implementation."""
 
@@ -132,19 +253,12 @@ class ConfigValidator:
         :param schema_filename: the path to the JSON-schema file in 'aea/configurations/schemas'.
         :param env_vars_friendly: whether or not it is env var friendly.
         """
-        base_uri = Path(_SCHEMAS_DIR)
-        with open_file(base_uri / schema_filename) as fp:
-            self._schema = json.load(fp)
-        root_path = make_jsonschema_base_uri(base_uri)
-        self._resolver = jsonschema.RefResolver(root_path, self._schema)
+        schema_path = str(Path(_SCHEMAS_DIR) / schema_filename)
+        self._schema = _validators_registry.get_schema(schema_path)
         self.env_vars_friendly = env_vars_friendly
-
-        if env_vars_friendly:
-            self._validator = EnvVarsFriendlyDraft4Validator(
-                self._schema, resolver=self._resolver
-            )
-        else:
-            self._validator = OwnDraft4Validator(self._schema, resolver=self._resolver)
+        self._validator = _validators_registry.get_validator(
+            schema_path, env_vars_friendly
+        )
 
     @staticmethod
     def split_component_id_and_config(
@@ -269,7 +383,7 @@ class ConfigValidator:
 
         :return: list of required fields.
         """
-        return self._schema["required"]
+        return list(self._schema["required"])
 
 
 def validate_data_with_pattern(
@@ -52,6 +52,7 @@ class AgentContext:
         "_data_dir",
         "_namespace",
         "_send_to_skill",
+        "_new_components_callback",
     )
 
     def __init__(
@@ -71,6 +72,7 @@ class AgentContext:
         data_dir: str,
         storage_callable: Callable[[], Optional[Storage]] = lambda: None,
         send_to_skill: Optional[Callable] = None,
+        new_components_callback: Optional[Callable[[], None]] = None,
         **kwargs: Any,
     ) -> None:
         """
@@ -91,6 +93,7 @@ class AgentContext:
         :param data_dir: directory where to put local files.
         :param storage_callable: function that returns optional storage attached to agent.
         :param send_to_skill: callable for sending envelopes to skills.
+        :param new_components_callback: callable notifying the agent that skills have new handlers or behaviours.
         :param kwargs: keyword arguments to be attached in the agent context namespace.
         """
         self._shared_state = {}  # type: Dict[str, Any]
@@ -110,6 +113,7 @@ class AgentContext:
         self._data_dir = data_dir
         self._namespace = SimpleNamespace(**kwargs)
         self._send_to_skill = send_to_skill
+        self._new_components_callback = new_components_callback
 
     def send_to_skill(
         self,
@@ -128,6 +132,15 @@ class AgentContext:
             raise ValueError("Send to skill feature is not supported")
         self._send_to_skill(message_or_envelope, context)
 
+    def notify_new_components(self) -> None:
+        """
+        Notify the agent that skills have new handlers or behaviours to register.
+
+        It can be called from any thread.
+        """
+        if self._new_components_callback is not None:
+            self._new_components_callback()
+
     @property
     def storage(self) -> Optional[Storage]:
         """Return storage instance if enabled in AEA."""
@@ -22,7 +22,7 @@ import itertools
 import pprint
 from typing import Iterator, List, Set
 
-from pkg_resources import EntryPoint, WorkingSet
+from importlib_metadata import EntryPoint, entry_points
 
 from aea.configurations.constants import (
     ALLOWED_GROUPS,
@@ -78,7 +78,12 @@ class Plugin:
             AEAPluginError,
         )
         enforce(
-            len(self._entry_point.attrs) == 1,
+            self._entry_point.attr is not None,
+            f"{_error_message_prefix} Entry point '{self._entry_point.value}' does not refer to an attribute.",
+            AEAPluginError,
+        )
+        enforce(
+            "." not in self._entry_point.attr,
             f"{_error_message_prefix} Nested attributes currently not supported.",
             AEAPluginError,
         )
@@ -105,13 +110,13 @@ class Plugin:
     @property
     def attr(self) -> str:
         """Get the class name."""
-        return self._entry_point.attrs[0]
+        return self._entry_point.attr
 
     @property
     def entry_point_path(self) -> str:
         """Get the entry point path."""
         class_name = self.attr
-        return f"{self._entry_point.module_name}{DOTTED_PATH_MODULE_ELEMENT_SEPARATOR}{class_name}"
+        return f"{self._entry_point.module}{DOTTED_PATH_MODULE_ELEMENT_SEPARATOR}{class_name}"
 
 
 def _check_no_duplicates(plugins: List[EntryPoint]) -> None:
@@ -129,9 +134,9 @@ def _get_plugins(group: str) -> List[Plugin]:
     :param group: the plugin group.
     :return: a mapping from plugin name to Plugin objects.
     """
-    entry_points: List[EntryPoint] = list(WorkingSet().iter_entry_points(group=group))
-    _check_no_duplicates(entry_points)
-    return [Plugin(group, entry_point) for entry_point in entry_points]
+    group_entry_points: List[EntryPoint] = list(entry_points(group=group))
+    _check_no_duplicates(group_entry_points)
+    return [Plugin(group, entry_point) for entry_point in group_entry_points]
 
 
 def _get_cryptos() -> List[Plugin]:
@@ -21,10 +21,11 @@
 import hashlib
 import threading
 from abc import ABC, abstractmethod
-from queue import Queue
+from multiprocessing.pool import Pool
+from queue import Empty, Queue
 from threading import Thread
 from types import SimpleNamespace
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from uuid import uuid4
 
 from aea.crypto.wallet import Wallet
@@ -153,6 +154,15 @@ class ProtectedQueue(Queue):
         """
         super().__init__()
         self._access_code_hash = _hash(access_code)
+        self._on_put: Optional[Callable[[], None]] = None
+
+    def set_on_put(self, callback: Optional[Callable[[], None]]) -> None:
+        """
+        Set a function called after each message is put on the queue.
+
+        :param callback: the function, or None to unset it.
+        """
+        self._on_put = callback
 
     def put(  # pylint: disable=arguments-differ,arguments-renamed
         self,
@@ -179,6 +189,8 @@ class ProtectedQueue(Queue):
         if not (isinstance(internal_message, Message) or internal_message is None):
             raise ValueError("Only messages are allowed!")
         super().put(internal_message, block=True, timeout=None)
+        if self._on_put is not None:
+            self._on_put()
 
     def put_nowait(  # pylint: disable=arguments-differ,arguments-renamed
         self, internal_message: Optional[Message]
@@ -194,6 +206,8 @@ class ProtectedQueue(Queue):
         if not (isinstance(internal_message, Message) or internal_message is None):
             raise ValueError("Only messages are allowed!")
         super().put_nowait(internal_message)
+        if self._on_put is not None:
+            self._on_put()
 
     def get(self, block: bool = True, timeout: Optional[float] = None) -> None:
         """
@@ -239,6 +253,7 @@ class DecisionMakerHandler(WithLogger, ABC):
     __slots__ = ("_identity", "_wallet", "_config", "_context", "_message_out_queue")
 
     self_address: str = "decision_maker"
+    is_thread_safe: bool = False
 
     def __init__(
         self, identity: Identity, wallet: Wallet, config: Dict[str, Any], **kwargs: Any
@@ -299,7 +314,21 @@ class DecisionMakerHandler(WithLogger, ABC):
 
 
 class DecisionMaker(WithLogger):
-    """This class implements the decision maker."""
+    """
+    This class implements the decision maker.
+
+    Messages are handled sequentially on the decision maker thread. If the handler
+    is thread safe and its configuration sets `num_workers` greater than one,
+    messages are instead dispatched to a pool of worker threads. All the messages of a
+    dialogue are handled by the same worker, so per-dialogue ordering is preserved.
+
+    Alternatively, the decision maker can be set to handle its messages on a thread
+    pool shared with other agents, in batches scheduled as messages arrive. The
+    messages of an agent are then handled sequentially, without a dedicated thread.
+    """
+
+    NUM_WORKERS_CONFIG_KEY = "num_workers"
+    DRAIN_BATCH_SIZE = 100
 
     __slots__ = (
         "_queue_access_code",
@@ -309,6 +338,13 @@ class DecisionMaker(WithLogger):
         "_lock",
         "_message_out_queue",
         "_stopped",
+        "_num_workers",
+        "_workers",
+        "_worker_queues",
+        "_pool",
+        "_drain_lock",
+        "_drain_scheduled",
+        "_drained",
     )
 
     def __init__(
@@ -330,12 +366,64 @@ class DecisionMaker(WithLogger):
         self._lock = threading.Lock()
         self._message_out_queue = decision_maker_handler.message_out_queue
         self._stopped = True
+        self._num_workers = self._get_num_workers(decision_maker_handler)
+        self._workers: List[Thread] = []
+        self._worker_queues: List[Queue] = []
+        self._pool: Optional[Pool] = None
+        self._drain_lock = threading.Lock()
+        self._drain_scheduled = False
+        self._drained = threading.Event()
+        self._drained.set()
+
+    def _get_num_workers(self, decision_maker_handler: DecisionMakerHandler) -> int:
+        """
+        Get the number of worker threads from the handler configuration.
+
+        :param decision_maker_handler: the decision maker handler
+        :return: the number of workers
+        """
+        num_workers = int(
+            decision_maker_handler.config.get(self.NUM_WORKERS_CONFIG_KEY, 1)
+        )
+        if num_workers < 1:
+            raise ValueError(
+                f"{self.NUM_WORKERS_CONFIG_KEY} must be a positive integer, got {num_workers}."
+            )
+        if num_workers > 1 and not decision_maker_handler.is_thread_safe:
+            self.logger.warning(
+                "{} is not thread safe, messages will be handled sequentially.".format(
+                    type(decision_maker_handler).__name__
+                )
+            )
+            num_workers = 1
+        return num_workers
 
     @property
     def agent_name(self) -> str:
         """Get the agent name."""
         return self.decision_maker_handler.identity.name
 
+    @property
+    def num_workers(self) -> int:
+        """Get the number of threads handling messages."""
+        return self._num_workers
+
+    @property
+    def pool(self) -> Optional[Pool]:
+        """Get the shared thread pool handling the messages, if any."""
+        return self._pool
+
+    def set_pool(self, pool: Optional[Pool]) -> None:
+        """
+        Handle the messages on a thread pool shared with other agents, rather than on dedicated threads.
+
+        :param pool: the thread pool, or None to use dedicated threads.
+        :raises ValueError: if the decision maker is running.
+        """
+        if not self._stopped:
+            raise ValueError("Cannot change the pool of a running decision maker.")
+        self._pool = pool
+
     @property
     def message_in_queue(self) -> ProtectedQueue:
         """Get (in) queue."""
@@ -361,6 +449,12 @@ class DecisionMaker(WithLogger):
                 return
 
             self._stopped = False
+            if self._pool is not None:
+                self.message_in_queue.set_on_put(self._schedule_drain)
+                self._schedule_drain()
+                return
+            if self._num_workers > 1:
+                self._start_workers()
             self._thread = Thread(target=self.execute, name=self.__class__.__name__)
             self._thread.start()
 
@@ -368,12 +462,119 @@ class DecisionMaker(WithLogger):
         """Stop the decision maker."""
         with self._lock:
             self._stopped = True
+            if self._pool is not None:
+                self.message_in_queue.set_on_put(None)
+                self._drained.wait()
+                self.logger.debug(
+                    "[{}]: Decision Maker stopped.".format(self.agent_name)
+                )
+                return
             self.message_in_queue.put(None)
             if self._thread is not None:
                 self._thread.join()
+            self._stop_workers()
             self.logger.debug("[{}]: Decision Maker stopped.".format(self.agent_name))
             self._thread = None
 
+    def _start_workers(self) -> None:
+        """Start the worker threads."""
+        self._worker_queues = [Queue() for _ in range(self._num_workers)]
+        self._workers = [
+            Thread(
+                target=self._execute_worker,
+                args=(queue,),
+                name=f"{self.__class__.__name__}Worker-{index}",
+            )
+            for index, queue in enumerate(self._worker_queues)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def _stop_workers(self) -> None:
+        """Stop the worker threads, once they handled the messages already dispatched to them."""
+        for queue in self._worker_queues:
+            queue.put(None)
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+        self._worker_queues = []
+
+    def _schedule_drain(self) -> None:
+        """Schedule the messages in the queue to be handled on the shared pool, unless they already are."""
+        with self._drain_lock:
+            if self._stopped or self._drain_scheduled or self._pool is None:
+                return
+            self._drain_scheduled = True
+            self._drained.clear()
+            self._pool.apply_async(self._drain)
+
+    def _drain(self) -> None:
+        """
+        Handle a batch of the messages in the queue, on the shared pool.
+
+        The drain is scheduled again while messages remain, so that the
+        agents sharing the pool take turns.
+        """
+        for _ in range(self.DRAIN_BATCH_SIZE):
+            if self._stopped:
+                break
+            try:
+                message = self.message_in_queue.protected_get(
+                    self._queue_access_code, block=False
+                )  # type: Optional[Message]
+            except Empty:
+                break
+            if message is None:
+                continue
+            try:
+                self.handle(message)
+            except Exception:  # pylint: disable=broad-except
+                self.logger.exception(
+                    "[{}]: Error while handling message {}".format(
+                        self.agent_name, message
+                    )
+                )
+        with self._drain_lock:
+            if (
+                not self._stopped
+                and self._pool is not None
+                and not self.message_in_queue.empty()
+            ):
+                self._pool.apply_async(self._drain)
+                return
+            self._drain_scheduled = False
+            self._drained.set()
+
+    def _execute_worker(self, queue: Queue) -> None:
+        """
+        Handle the messages dispatched to a worker, until a None is received.
+
+        :param queue: the queue of the worker
+        """
+        while True:
+            message = queue.get(block=True)  # type: Optional[Message]
+            if message is None:
+                return
+            try:
+                self.handle(message)
+            except Exception:  # pylint: disable=broad-except
+                self.logger.exception(
+                    "[{}]: Error while handling message {}".format(
+                        self.agent_name, message
+                    )
+                )
+
+    def _dispatch(self, message: Message) -> None:
+        """
+        Dispatch a message to a worker, so that messages of the same dialogue go to the same worker.
+
+        :param message: the internal message
+        """
+        sender = message.sender if message.has_sender else None
+        dialogue_key = (sender, message.dialogue_reference[0])
+        index = hash(dialogue_key) % len(self._worker_queues)
+        self._worker_queues[index].put(message)
+
     def execute(self) -> None:
         """
         Execute the decision maker.
@@ -395,7 +596,10 @@ class DecisionMaker(WithLogger):
                 )
                 continue
 
-            self.handle(message)
+            if self._worker_queues:
+                self._dispatch(message)
+            else:
+                self.handle(message)
 
     def handle(self, message: Message) -> None:
         """
@@ -19,6 +19,7 @@
 
 """This module contains the decision maker class."""
 
+import threading
 from typing import Any, Dict
 
 from aea.common import Address
@@ -82,8 +83,9 @@ class DecisionMakerHandler(BaseDecisionMakerHandler):
 
     signing_dialogue_class = SigningDialogue
     signing_msg_class = SigningMessage
+    is_thread_safe = True
 
-    __slots__ = ("signing_dialogues",)
+    __slots__ = ("signing_dialogues", "_dialogues_lock")
 
     def __init__(
         self, identity: Identity, wallet: Wallet, config: Dict[str, Any]
@@ -105,6 +107,7 @@ class DecisionMakerHandler(BaseDecisionMakerHandler):
         self.signing_dialogues = DecisionMakerHandler.SigningDialogues(
             self.self_address
         )
+        self._dialogues_lock = threading.Lock()
 
     def handle(self, message: Message) -> None:
         """
@@ -127,7 +130,8 @@ class DecisionMakerHandler(BaseDecisionMakerHandler):
 
         :param signing_msg: the transaction message
         """
-        signing_dialogue = self.signing_dialogues.update(signing_msg)  # type: ignore
+        with self._dialogues_lock:
+            signing_dialogue = self.signing_dialogues.update(signing_msg)  # type: ignore
         if signing_dialogue is None or not isinstance(
             signing_dialogue, self.signing_dialogue_class
         ):  # pragma: no cover
@@ -178,11 +182,12 @@ class DecisionMakerHandler(BaseDecisionMakerHandler):
                 signed_message,
                 signing_msg.raw_message.is_deprecated_mode,
             )
-        signing_msg_response = signing_dialogue.reply(
-            performative=performative,
-            target_message=signing_msg,
-            **kwargs,
-        )
+        with self._dialogues_lock:
+            signing_msg_response = signing_dialogue.reply(
+                performative=performative,
+                target_message=signing_msg,
+                **kwargs,
+            )
         self.message_out_queue.put(signing_msg_response)
 
     def _handle_transaction_signing(
@@ -207,9 +212,10 @@ class DecisionMakerHandler(BaseDecisionMakerHandler):
             kwargs["signed_transaction"] = SignedTransaction(
                 signing_msg.raw_transaction.ledger_id, signed_tx
             )
-        signing_msg_response = signing_dialogue.reply(
-            performative=performative,
-            target_message=signing_msg,
-            **kwargs,
-        )
+        with self._dialogues_lock:
+            signing_msg_response = signing_dialogue.reply(
+                performative=performative,
+                target_message=signing_msg,
+                **kwargs,
+            )
         self.message_out_queue.put(signing_msg_response)
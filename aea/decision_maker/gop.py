@@ -22,7 +22,7 @@
 import copy
 import logging
 from enum import Enum
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
 
 from aea.common import Address
 from aea.crypto.wallet import Wallet
@@ -32,7 +32,9 @@ from aea.decision_maker.base import Preferences as BasePreferences
 from aea.exceptions import enforce
 from aea.helpers.preference_representations.base import (
     linear_utility,
+    linear_utility_change,
     logarithmic_utility,
+    logarithmic_utility_change,
 )
 from aea.helpers.transaction.base import SignedMessage, SignedTransaction, Terms
 from aea.identity.base import Identity
@@ -278,6 +280,25 @@ class OwnershipState(BaseOwnershipState):
         return state
 
 
+def _get_holdings(
+    ownership_state: BaseOwnershipState,
+) -> Tuple[GoodHoldings, CurrencyHoldings]:
+    """
+    Get the good and currency holdings of an ownership state, without copying them.
+
+    :param ownership_state: the ownership state.
+    :return: the good holdings and the currency holdings, which must not be modified.
+    """
+    ownership_state = cast(OwnershipState, ownership_state)
+    enforce(ownership_state.is_initialized, "Ownership state not set!")
+    # pylint: disable=protected-access
+    quantities_by_good_id = cast(GoodHoldings, ownership_state._quantities_by_good_id)
+    amount_by_currency_id = cast(
+        CurrencyHoldings, ownership_state._amount_by_currency_id
+    )
+    return quantities_by_good_id, amount_by_currency_id
+
+
 class Preferences(BasePreferences):
     """Class to represent the preferences."""
 
@@ -393,6 +414,8 @@ class Preferences(BasePreferences):
         """
         Compute the marginal utility.
 
+        Only the holdings which change are evaluated, and the ownership state is not copied, so the cost depends on the size of the changes rather than on the number of goods.
+
         :param ownership_state: the ownership state against which to compute the marginal utility.
         :param delta_quantities_by_good_id: the change in good holdings
         :param delta_amount_by_currency_id: the change in money holdings
@@ -400,27 +423,21 @@ class Preferences(BasePreferences):
         :return: the marginal utility score
         """
         enforce(self.is_initialized, "Preferences params not set!")
-        ownership_state = cast(OwnershipState, ownership_state)
-        current_goods_score = self.logarithmic_utility(
-            ownership_state.quantities_by_good_id
-        )
-        current_currency_score = self.linear_utility(
-            ownership_state.amount_by_currency_id
-        )
-        new_goods_score = current_goods_score
-        new_currency_score = current_currency_score
+        quantities_by_good_id, amount_by_currency_id = _get_holdings(ownership_state)
+        current_goods_score, new_goods_score = 0.0, 0.0
+        current_currency_score, new_currency_score = 0.0, 0.0
         if delta_quantities_by_good_id is not None:
-            new_quantities_by_good_id = {
-                good_id: quantity + delta_quantities_by_good_id[good_id]
-                for good_id, quantity in ownership_state.quantities_by_good_id.items()
-            }
-            new_goods_score = self.logarithmic_utility(new_quantities_by_good_id)
+            current_goods_score, new_goods_score = logarithmic_utility_change(
+                self.utility_params_by_good_id,
+                quantities_by_good_id,
+                delta_quantities_by_good_id,
+            )
         if delta_amount_by_currency_id is not None:
-            new_amount_by_currency_id = {
-                currency: amount + delta_amount_by_currency_id[currency]
-                for currency, amount in ownership_state.amount_by_currency_id.items()
-            }
-            new_currency_score = self.linear_utility(new_amount_by_currency_id)
+            current_currency_score, new_currency_score = linear_utility_change(
+                self.exchange_params_by_currency_id,
+                amount_by_currency_id,
+                delta_amount_by_currency_id,
+            )
         marginal_utility = (
             new_goods_score
             + new_currency_score
@@ -429,27 +446,58 @@ class Preferences(BasePreferences):
         )
         return marginal_utility
 
+    def marginal_utilities(
+        self,
+        ownership_state: BaseOwnershipState,
+        deltas_quantities_by_good_id: Sequence[GoodHoldings],
+    ) -> List[float]:
+        """
+        Compute the marginal utility of each of many candidate changes in good holdings.
+
+        The holdings are read once for all the candidates, without copying them.
+
+        :param ownership_state: the ownership state against which to compute the marginal utilities.
+        :param deltas_quantities_by_good_id: the candidate changes in good holdings
+        :return: the marginal utility score of each candidate change
+        """
+        enforce(self.is_initialized, "Preferences params not set!")
+        quantities_by_good_id, _ = _get_holdings(ownership_state)
+        marginal_utilities = []
+        for delta_quantities_by_good_id in deltas_quantities_by_good_id:
+            current_goods_score, new_goods_score = logarithmic_utility_change(
+                self.utility_params_by_good_id,
+                quantities_by_good_id,
+                delta_quantities_by_good_id,
+            )
+            marginal_utilities.append(new_goods_score - current_goods_score)
+        return marginal_utilities
+
     def utility_diff_from_transaction(
         self, ownership_state: BaseOwnershipState, terms: Terms
     ) -> float:
         """
         Simulate a transaction and get the resulting utility difference (taking into account the fee).
 
+        Only the holdings exchanged in the transaction are evaluated, without copying the ownership state.
+
         :param ownership_state: the ownership state against which to apply the transaction.
         :param terms: the transaction terms.
         :return: the score.
         """
         enforce(self.is_initialized, "Preferences params not set!")
-        ownership_state = cast(OwnershipState, ownership_state)
-        current_score = self.utility(
-            quantities_by_good_id=ownership_state.quantities_by_good_id,
-            amount_by_currency_id=ownership_state.amount_by_currency_id,
+        quantities_by_good_id, amount_by_currency_id = _get_holdings(ownership_state)
+        current_goods_score, new_goods_score = logarithmic_utility_change(
+            self.utility_params_by_good_id,
+            quantities_by_good_id,
+            terms.quantities_by_good_id,
         )
-        new_ownership_state = ownership_state.apply_transactions([terms])
-        new_score = self.utility(
-            quantities_by_good_id=new_ownership_state.quantities_by_good_id,
-            amount_by_currency_id=new_ownership_state.amount_by_currency_id,
+        current_currency_score, new_currency_score = linear_utility_change(
+            self.exchange_params_by_currency_id,
+            amount_by_currency_id,
+            terms.amount_by_currency_id,
         )
+        current_score = current_goods_score + current_currency_score
+        new_score = new_goods_score + new_currency_score
         score_difference = new_score - current_score
         return score_difference
 
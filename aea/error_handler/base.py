@@ -73,3 +73,18 @@ class AbstractErrorHandler(ABC):
         :param logger: the logger
         :return: None
         """
+
+    def send_envelope_rejected(  # pylint: disable=no-self-use
+        self, envelope: Envelope, reason: str, logger: Logger
+    ) -> None:
+        """
+        Handle a received envelope rejected because the agent cannot queue it.
+
+        :param envelope: the envelope
+        :param reason: the reason for the rejection
+        :param logger: the logger
+        :return: None
+        """
+        logger.warning(
+            f"Rejected envelope: {reason}. Sender={envelope.sender}, to={envelope.to}."
+        )
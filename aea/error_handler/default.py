@@ -33,6 +33,7 @@ class ErrorHandler(AbstractErrorHandler):
         "unsupported_protocol_count",
         "no_active_handler_count",
         "decoding_error_count",
+        "envelope_rejected_count",
     )
 
     def __init__(self, **kwargs: Any):
@@ -41,6 +42,7 @@ class ErrorHandler(AbstractErrorHandler):
         self.unsupported_protocol_count = 0
         self.no_active_handler_count = 0
         self.decoding_error_count = 0
+        self.envelope_rejected_count = 0
 
     def send_unsupported_protocol(self, envelope: Envelope, logger: Logger) -> None:
         """
@@ -83,3 +85,16 @@ class ErrorHandler(AbstractErrorHandler):
         logger.warning(
             f"Cannot handle envelope: {reason}. Sender={envelope.sender}, to={envelope.sender}."
         )
+
+    def send_envelope_rejected(
+        self, envelope: Envelope, reason: str, logger: Logger
+    ) -> None:
+        """
+        Handle a received envelope rejected because the agent cannot queue it.
+
+        :param envelope: the envelope
+        :param reason: the reason for the rejection
+        :param logger: the logger
+        """
+        self.envelope_rejected_count += 1
+        super().send_envelope_rejected(envelope, reason, logger)
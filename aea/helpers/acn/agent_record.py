@@ -18,11 +18,121 @@
 # ------------------------------------------------------------------------------
 
 """This module contains types and helpers for ACN Proof-of-Representation."""
-from typing import Optional
+import datetime
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple, Union
 
 from aea.common import PathLike
 from aea.crypto.registries import make_ledger_api
-from aea.helpers.base import CertRequest, SimpleId, SimpleIdOrStr
+from aea.helpers.base import (
+    CertRequest,
+    SimpleId,
+    SimpleIdOrStr,
+    parse_datetime_from_str,
+)
+
+
+DEFAULT_VERIFIED_RECORDS_CACHE_SIZE = 1024
+
+_RecordKey = Tuple[str, str, str, bytes]
+
+
+def _to_timestamp(value: Union[str, datetime.datetime]) -> Optional[float]:
+    """Get the timestamp of a validity bound, or None if it cannot be parsed."""
+    try:
+        if isinstance(value, str):
+            value = parse_datetime_from_str(value)
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=datetime.timezone.utc)
+        return value.timestamp()
+    except (AttributeError, ValueError):
+        return None
+
+
+class _VerifiedRecordsCache:
+    """
+    Bounded cache of the agent records whose signature has been verified.
+
+    Records are keyed by ledger, address, signature and signed message, which
+    includes the representative public key and the validity period, and
+    map to the public key recovered from the signature. An entry is only
+    served while the record is within its validity period, and the least
+    recently used entries are evicted once the cache is full.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_VERIFIED_RECORDS_CACHE_SIZE) -> None:
+        """
+        Initialize the cache.
+
+        :param max_size: the maximum number of records kept.
+        """
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[_RecordKey, Tuple[str, float, float]]" = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        """Get the number of records in the cache."""
+        return len(self._entries)
+
+    def get(self, key: _RecordKey, now: Optional[float] = None) -> Optional[str]:
+        """
+        Get the public key of a verified record.
+
+        :param key: the key of the record.
+        :param now: the current timestamp, by default the time of the call.
+        :return: the public key, or None if the record is not in the cache or not valid at this time.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            public_key, not_before, not_after = entry
+            if now >= not_after:
+                del self._entries[key]
+                return None
+            if now < not_before:
+                return None
+            self._entries.move_to_end(key)
+            return public_key
+
+    def add(
+        self,
+        key: _RecordKey,
+        public_key: str,
+        not_before: float,
+        not_after: float,
+        now: Optional[float] = None,
+    ) -> None:
+        """
+        Add a verified record, unless it is not valid at this time.
+
+        :param key: the key of the record.
+        :param public_key: the public key recovered from the signature.
+        :param not_before: the timestamp the record is valid from.
+        :param not_after: the timestamp the record is valid until.
+        :param now: the current timestamp, by default the time of the call.
+        """
+        now = time.time() if now is None else now
+        if self.max_size <= 0 or not not_before <= now < not_after:
+            return
+        with self._lock:
+            self._entries[key] = (public_key, not_before, not_after)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all the records."""
+        with self._lock:
+            self._entries.clear()
+
+
+_verified_records_cache = _VerifiedRecordsCache()
 
 
 class AgentRecord:
@@ -89,6 +199,26 @@ class AgentRecord:
         - if ledger_id is valid
         - if agent signed the message
 
+        Records already verified and within their validity period are
+        looked up in a cache rather than verified again.
+
+        :return: agent public key
+        """
+        key = (str(self.ledger_id), self.address, self.signature, self.message)
+        public_key = _verified_records_cache.get(key)
+        if public_key is not None:
+            return public_key
+        public_key = self._recover_public_key()
+        not_before = _to_timestamp(self.not_before)
+        not_after = _to_timestamp(self.not_after)
+        if not_before is not None and not_after is not None:
+            _verified_records_cache.add(key, public_key, not_before, not_after)
+        return public_key
+
+    def _recover_public_key(self) -> str:
+        """
+        Recover the agent public key from the signature.
+
         :return: agent public key
         """
         ledger_api = make_ledger_api(self.ledger_id)
@@ -22,16 +22,17 @@ import asyncio
 import queue
 from collections import deque
 from contextlib import suppress
-from typing import Any, Deque
+from typing import Any, Callable, Deque
 
 
 class AsyncFriendlyQueue(queue.Queue):
-    """queue.Queue with async_get method."""
+    """queue.Queue with async_get and async_put methods."""
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Init queue."""
         super().__init__(*args, **kwargs)
         self._non_empty_waiters: Deque = deque()
+        self._get_waiters: Deque = deque()
 
     def put(  # pylint: disable=signature-differs
         self, item: Any, *args: Any, **kwargs: Any
@@ -67,7 +68,49 @@ class AsyncFriendlyQueue(queue.Queue):
         :param kwargs: similar to queue.Queue.get
         :return: similar to queue.Queue.get
         """
-        return super().get(*args, **kwargs)
+        item = super().get(*args, **kwargs)
+        self._notify_get_waiters()
+        return item
+
+    def _notify_get_waiters(self) -> None:
+        """Wake up the coroutines waiting for an item to be removed."""
+        while self._get_waiters:
+            waiter = self._get_waiters.popleft()
+            waiter._loop.call_soon_threadsafe(  # pylint: disable=protected-access
+                self._set_waiter, waiter
+            )
+
+    async def async_wait_until(self, predicate: Callable[[], bool]) -> None:
+        """
+        Wait until a condition on the queue holds, checking it whenever an item is removed.
+
+        :param predicate: the condition to wait for
+        """
+        while not predicate():
+            waiter = asyncio.Future()  # type: ignore
+            self._get_waiters.append(waiter)
+            try:
+                # an item may have been removed by another thread in the meantime
+                if predicate():
+                    return
+                await waiter
+            finally:
+                try:
+                    self._get_waiters.remove(waiter)
+                except ValueError:
+                    pass
+
+    async def async_put(self, item: Any) -> None:
+        """
+        Wait for a free slot and put an item into the queue.
+
+        :param item: item to put in the queue
+        """
+        while True:
+            await self.async_wait_until(lambda: not self.full())
+            with suppress(queue.Full):
+                self.put_nowait(item)
+                return
 
     async def async_wait(self) -> None:
         """
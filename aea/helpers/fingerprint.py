@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2023 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""
+Computation of the IPFS hashes of package files.
+
+Files are hashed in parallel by a pool of threads, and the hashes are kept in
+a cache keyed by the path, size, modification time and inode of the files, so
+checking the fingerprints of an unchanged package does not read its files.
+The cache can be persisted to a file, so that it is shared by successive runs
+of the CLI, by setting the environment variable AEA_FINGERPRINT_CACHE_FILE.
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union, cast
+
+from aea.helpers.io import open_file
+from aea.helpers.ipfs.base import IPFSHashOnly
+
+
+FINGERPRINT_CACHE_FILE_ENV_VAR = "AEA_FINGERPRINT_CACHE_FILE"
+
+# files modified this recently could be modified again without changing their
+# modification time, as seen by the file system; their hashes are not cached.
+_RACY_WINDOW_NS = 2 * 10**9
+
+FileStatType = Tuple[int, int, int]
+
+
+class FingerprintCache:
+    """Cache of the IPFS hashes of files, keyed by their path and file status."""
+
+    def __init__(self, cache_file: Optional[Union[str, Path]] = None) -> None:
+        """
+        Initialize the cache.
+
+        :param cache_file: the file the cache is persisted to, if any.
+        """
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[FileStatType, str]] = {}
+        self._cache_file: Optional[Path] = None
+        self._cache_file_from_env = cache_file is None
+        self._loaded_cache_file: Optional[Path] = None
+        self._dirty = False
+        if cache_file is not None:
+            self.set_cache_file(cache_file)
+
+    @property
+    def cache_file(self) -> Optional[Path]:
+        """Get the file the cache is persisted to, if any."""
+        if self._cache_file_from_env:
+            cache_file = os.environ.get(FINGERPRINT_CACHE_FILE_ENV_VAR)
+            return Path(cache_file) if cache_file else None
+        return self._cache_file
+
+    def set_cache_file(self, cache_file: Optional[Union[str, Path]]) -> None:
+        """
+        Set the file the cache is persisted to, overriding the environment variable.
+
+        :param cache_file: the cache file, or None to keep the cache in memory only.
+        """
+        self._cache_file = Path(cache_file) if cache_file is not None else None
+        self._cache_file_from_env = False
+
+    def clear(self) -> None:
+        """Remove all the entries, in memory."""
+        with self._lock:
+            self._entries.clear()
+            self._loaded_cache_file = None
+
+    @staticmethod
+    def _stat(file: Path) -> FileStatType:
+        """Get the status of a file used to detect changes."""
+        stat = file.stat()
+        return stat.st_size, stat.st_mtime_ns, stat.st_ino
+
+    def get(self, file: Path) -> Tuple[Optional[str], FileStatType]:
+        """
+        Get the cached hash of a file.
+
+        :param file: the file.
+        :return: the hash, or None if the file is not cached or has changed since; and the file status.
+        """
+        stat = self._stat(file)
+        entry = self._entries.get(str(file.absolute()))
+        if entry is not None and entry[0] == stat:
+            return entry[1], stat
+        return None, stat
+
+    def set(self, file: Path, stat: FileStatType, ipfs_hash: str) -> None:
+        """
+        Cache the hash of a file.
+
+        :param file: the file.
+        :param stat: the status of the file when it was hashed.
+        :param ipfs_hash: the hash.
+        """
+        if stat[1] > time.time_ns() - _RACY_WINDOW_NS:
+            return
+        with self._lock:
+            self._entries[str(file.absolute())] = (stat, ipfs_hash)
+            self._dirty = True
+
+    def load(self) -> None:
+        """Load the entries from the cache file, if it is set and not loaded yet."""
+        cache_file = self.cache_file
+        if cache_file is None or cache_file == self._loaded_cache_file:
+            return
+        try:
+            with open_file(cache_file, "r") as fp:
+                entries = json.load(fp)
+            with self._lock:
+                for path, (size, mtime_ns, inode, ipfs_hash) in entries.items():
+                    self._entries.setdefault(path, ((size, mtime_ns, inode), ipfs_hash))
+        except (OSError, ValueError, TypeError):
+            pass
+        self._loaded_cache_file = cache_file
+
+    def save(self) -> None:
+        """Save the entries to the cache file, if it is set and the entries changed."""
+        cache_file = self.cache_file
+        if cache_file is None or not self._dirty:
+            return
+        with self._lock:
+            entries = {
+                path: [*stat, ipfs_hash]
+                for path, (stat, ipfs_hash) in self._entries.items()
+            }
+            self._dirty = False
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            with open_file(tmp_file, "w") as fp:
+                json.dump(entries, fp)
+            os.replace(tmp_file, cache_file)
+        except OSError:  # pragma: nocover
+            pass
+
+
+fingerprint_cache = FingerprintCache()
+
+
+def _hash_file(file: Path, stat: FileStatType) -> str:
+    """Compute the IPFS hash of a file, and cache it."""
+    ipfs_hash = IPFSHashOnly().get(str(file))
+    fingerprint_cache.set(file, stat, ipfs_hash)
+    return ipfs_hash
+
+
+def compute_file_hashes(
+    files: Sequence[Path], max_workers: Optional[int] = None
+) -> List[str]:
+    """
+    Compute the IPFS hashes of files.
+
+    Only the files not in the cache, or changed since they were cached, are read.
+
+    :param files: the files.
+    :param max_workers: the maximum number of threads hashing files; by default, one per CPU.
+    :return: the hashes, in the order of the files.
+    """
+    fingerprint_cache.load()
+    hashes: List[Optional[str]] = []
+    to_hash: List[Tuple[int, Path, FileStatType]] = []
+    for index, file in enumerate(files):
+        ipfs_hash, stat = fingerprint_cache.get(file)
+        hashes.append(ipfs_hash)
+        if ipfs_hash is None:
+            to_hash.append((index, file, stat))
+
+    max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+    if max_workers <= 1 or len(to_hash) <= 1:
+        for index, file, stat in to_hash:
+            hashes[index] = _hash_file(file, stat)
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(to_hash))) as executor:
+            futures = [
+                (index, executor.submit(_hash_file, file, stat))
+                for index, file, stat in to_hash
+            ]
+            for index, future in futures:
+                hashes[index] = future.result()
+
+    fingerprint_cache.save()
+    return cast(List[str], hashes)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2023 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the writer of length-prefixed frames to a stream."""
+
+import asyncio
+import struct
+from asyncio import StreamWriter
+from typing import Callable, List, Optional, cast
+
+
+FRAME_HEADER = struct.Struct("!I")
+
+
+class FrameWriter:
+    """
+    Write length-prefixed frames to a stream writer.
+
+    The frames written in the same loop iteration are handed to the stream
+    writer together, with a single call, and drained once. The frames queued
+    while a drain is in progress are written together once it is done.
+
+    A write returns once its frame has been written and drained, so a slow
+    peer pauses the writers. An error raised while writing or draining a
+    batch of frames is raised to the writers of the frames of that batch, and
+    only to them. Cancelling a write does not cancel the writing of its frame.
+    """
+
+    def __init__(
+        self,
+        writer: StreamWriter,
+        header: struct.Struct = FRAME_HEADER,
+        on_flush: Optional[Callable[[int, int], None]] = None,
+    ) -> None:
+        """
+        Initialize the frame writer.
+
+        :param writer: the stream writer to write frames to.
+        :param header: the structure of the frame header, holding the payload size.
+        :param on_flush: called with the number of frames and of payload bytes of each batch written and drained.
+        """
+        self._writer = writer
+        self._header = header
+        self._on_flush = on_flush
+        self._pending: List[bytes] = []
+        self._pending_size = 0
+        self._pending_done: Optional[asyncio.Future] = None
+        self._flush_task: Optional[asyncio.Future] = None
+
+    @property
+    def pending(self) -> int:
+        """Get the number of frames waiting to be written."""
+        return len(self._pending) // 2
+
+    async def write(self, data: bytes) -> None:
+        """
+        Queue a frame and wait until it has been written and drained.
+
+        :param data: the frame payload.
+        """
+        if self._pending_done is None:
+            self._pending_done = asyncio.get_event_loop().create_future()
+        done = self._pending_done
+        self._pending.append(self._header.pack(len(data)))
+        self._pending.append(data)
+        self._pending_size += len(data)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.ensure_future(self._flush())
+        await asyncio.shield(done)
+
+    async def flush(self) -> None:
+        """Wait until the queued frames have been written and drained, or have failed to."""
+        if self._flush_task is not None:
+            await asyncio.shield(self._flush_task)
+
+    async def _flush(self) -> None:
+        """Write the queued frames, one batch at a time, draining once per batch."""
+        while self._pending:
+            frames, self._pending = self._pending, []
+            size, self._pending_size = self._pending_size, 0
+            done, self._pending_done = cast(asyncio.Future, self._pending_done), None
+            try:
+                self._writer.writelines(frames)
+                await self._writer.drain()
+            except asyncio.CancelledError:
+                done.cancel()
+                if self._pending_done is not None:
+                    self._pending_done.cancel()
+                self._pending, self._pending_size, self._pending_done = [], 0, None
+                raise
+            except Exception as e:  # pylint: disable=broad-except
+                done.set_exception(e)
+                # the writers may have been cancelled, do not log it as never retrieved
+                done.exception()
+                continue
+            if self._on_flush is not None:
+                self._on_flush(len(frames) // 2, size)
+            done.set_result(None)
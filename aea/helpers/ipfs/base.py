@@ -20,8 +20,10 @@
 import codecs
 import hashlib
 import io
+import itertools
 import re
-from typing import Generator, Sized, cast
+from functools import partial
+from typing import Generator, Iterable, Iterator, Sized, cast
 
 import base58
 
@@ -33,6 +35,8 @@ from aea.helpers.ipfs.utils import _protobuf_python_implementation
 SHA256_ID = "12"  # 0x12
 LEN_SHA256 = "20"  # 0x20
 
+_READ_SIZE = 262144
+
 
 with _protobuf_python_implementation():  # pylint: disable=import-outside-toplevel
     from aea.helpers.ipfs.pb import merkledag_pb2, unixfs_pb2
@@ -59,15 +63,36 @@ def _is_text(file_path: str) -> bool:
         return False
 
 
-def _read(file_path: str) -> bytes:
-    """Read a file, replacing Windows line endings if it is a text file."""
+def _read_chunks(file_path: str, size: int) -> Iterator[bytes]:
+    """
+    Read a file in chunks, replacing Windows line endings if it is a text file.
+
+    Only a few chunks of the file are held in memory at once. All the chunks
+    have the given size, except for the last one, which is yielded even if empty.
+
+    :param file_path: the file path.
+    :param size: the size of the chunks.
+    :yield: the chunks of the file content.
+    """
     is_text = _is_text(file_path)
+    data = b""
+    carry = b""
     with open(file_path, "rb") as file:
-        file_b = file.read()
-        if is_text:
-            file_b = _dos2unix(file_b)
-
-    return file_b
+        for block in iter(partial(file.read, _READ_SIZE), b""):
+            if is_text:
+                # a trailing CR could be followed by a LF in the next block
+                block = carry + block
+                carry = b"\r" if block.endswith(b"\r") else b""
+                block = _dos2unix(block[: len(block) - len(carry)])
+            data += block
+            while len(data) > size:
+                yield data[:size]
+                data = data[size:]
+    data += carry
+    if len(data) > size:
+        yield data[:size]
+        data = data[size:]
+    yield data
 
 
 def chunks(data: Sized, size: int) -> Generator:
@@ -89,8 +114,9 @@ class IPFSHashOnly:
         :param file_path: the file path
         :return: the ipfs hash
         """
-        file_b = _read(file_path)
-        file_pb = self._pb_serialize_file(file_b)
+        file_pb = self._pb_serialize_chunks(
+            _read_chunks(file_path, self.DEFAULT_CHUNK_SIZE)
+        )
         ipfs_hash = self._generate_multihash(file_pb)
         return ipfs_hash
 
@@ -120,22 +146,37 @@ class IPFSHashOnly:
         :param data: a bytes string representing a file
         :return: a bytes string representing a file in protobuf serialization
         """
-        if len(data) > cls.DEFAULT_CHUNK_SIZE:
-            outer_node = PBNode()  # type: ignore
-            data_pb = unixfs_pb2.Data()  # type: ignore
-            data_pb.Type = unixfs_pb2.Data.File  # type: ignore # pylint: disable=no-member
-            data_pb.filesize = len(data)
-            for chunk in chunks(data, cls.DEFAULT_CHUNK_SIZE):
-                link = merkledag_pb2.PBLink()
-                block = cls._pb_serialize_data(chunk)
-                link.Hash = cls._generate_multihash_bytes(block)
-                link.Tsize = len(block)
-                link.Name = ""
-                outer_node.Links.append(link)  # type: ignore # pylint: disable=no-member
-                data_pb.blocksizes.append(len(chunk))  # type: ignore # pylint: disable=no-member
-            outer_node.Data = data_pb.SerializeToString(deterministic=True)
-            return cls._serialize(outer_node)
-        return cls._pb_serialize_data(data)
+        return cls._pb_serialize_chunks(chunks(data, cls.DEFAULT_CHUNK_SIZE))
+
+    @classmethod
+    def _pb_serialize_chunks(cls, file_chunks: Iterable[bytes]) -> bytes:
+        """
+        Serialize a file given as an iterable of chunks.
+
+        :param file_chunks: the chunks of the file, of DEFAULT_CHUNK_SIZE bytes but the last one.
+        :return: a bytes string representing a file in protobuf serialization
+        """
+        iterator = iter(file_chunks)
+        first_chunk = next(iterator, b"")
+        second_chunk = next(iterator, None)
+        if second_chunk is None:
+            return cls._pb_serialize_data(first_chunk)
+        outer_node = PBNode()  # type: ignore
+        data_pb = unixfs_pb2.Data()  # type: ignore
+        data_pb.Type = unixfs_pb2.Data.File  # type: ignore # pylint: disable=no-member
+        filesize = 0
+        for chunk in itertools.chain((first_chunk, second_chunk), iterator):
+            link = merkledag_pb2.PBLink()
+            block = cls._pb_serialize_data(chunk)
+            link.Hash = cls._generate_multihash_bytes(block)
+            link.Tsize = len(block)
+            link.Name = ""
+            outer_node.Links.append(link)  # type: ignore # pylint: disable=no-member
+            data_pb.blocksizes.append(len(chunk))  # type: ignore # pylint: disable=no-member
+            filesize += len(chunk)
+        data_pb.filesize = filesize
+        outer_node.Data = data_pb.SerializeToString(deterministic=True)
+        return cls._serialize(outer_node)
 
     @staticmethod
     def _generate_multihash_bytes(pb_data: bytes) -> bytes:
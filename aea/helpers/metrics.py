@@ -0,0 +1,420 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2023 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""
+Runtime metrics of the framework.
+
+Instruments are updated where the measured events happen (envelopes routed,
+handlers and behaviours executed, dialogues created), so collecting a report
+never has to scan the interpreter state. The process-wide registry is disabled
+by default; while disabled, instrumented code only pays a boolean check.
+"""
+
+import inspect
+import threading
+import tracemalloc
+import weakref
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+LabelsType = Tuple[Tuple[str, str], ...]
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+)
+
+
+class Metric(ABC):
+    """
+    Base class of the metric instruments.
+
+    Instruments are shared by the whole process and updated from the worker
+    threads of the decision maker and from threaded agents, so each one guards
+    its updates and reads with its own lock.
+    """
+
+    kind = ""
+
+    __slots__ = ("name", "description", "labels", "_lock")
+
+    def __init__(self, name: str, description: str, labels: LabelsType) -> None:
+        """
+        Initialize the metric.
+
+        :param name: the name of the metric.
+        :param description: the description of the metric.
+        :param labels: the labels of the metric, as sorted key-value pairs.
+        """
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self._lock = threading.Lock()
+
+    @property
+    def labels_dict(self) -> Dict[str, str]:
+        """Get the labels as a dictionary."""
+        return dict(self.labels)
+
+    @abstractmethod
+    def get(self) -> Any:
+        """Get the current value of the metric."""
+
+
+class Counter(Metric):
+    """A monotonically increasing value."""
+
+    kind = "counter"
+
+    __slots__ = ("value",)
+
+    def __init__(self, name: str, description: str, labels: LabelsType) -> None:
+        """
+        Initialize the counter.
+
+        :param name: the name of the metric.
+        :param description: the description of the metric.
+        :param labels: the labels of the metric, as sorted key-value pairs.
+        """
+        super().__init__(name, description, labels)
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Increment the counter.
+
+        :param amount: the amount to add, must not be negative.
+        """
+        if amount < 0:
+            raise ValueError("Counters can only be incremented.")
+        with self._lock:
+            self.value += amount
+
+    def get(self) -> float:
+        """Get the current value of the counter."""
+        with self._lock:
+            return self.value
+
+
+class Gauge(Metric):
+    """A value that can go up and down, or be sampled from a function."""
+
+    kind = "gauge"
+
+    __slots__ = ("value", "_function")
+
+    def __init__(self, name: str, description: str, labels: LabelsType) -> None:
+        """
+        Initialize the gauge.
+
+        :param name: the name of the metric.
+        :param description: the description of the metric.
+        :param labels: the labels of the metric, as sorted key-value pairs.
+        """
+        super().__init__(name, description, labels)
+        self.value = 0.0
+        self._function: Optional[Callable[[], Optional[Callable[[], float]]]] = None
+
+    def set(self, value: float) -> None:
+        """
+        Set the gauge.
+
+        :param value: the new value.
+        """
+        with self._lock:
+            self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Increment the gauge.
+
+        :param amount: the amount to add.
+        """
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """
+        Decrement the gauge.
+
+        :param amount: the amount to subtract.
+        """
+        with self._lock:
+            self.value -= amount
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """
+        Sample the gauge from a function when it is read.
+
+        Bound methods are referenced weakly, so the gauge does not keep their
+        object alive; once the object is collected the gauge is dropped.
+
+        :param function: the function returning the current value.
+        """
+        if inspect.ismethod(function):
+            self._function = weakref.WeakMethod(function)
+        else:
+            self._function = lambda: function
+
+    @property
+    def is_alive(self) -> bool:
+        """Check the function sampled by the gauge, if any, still exists."""
+        return self._function is None or self._function() is not None
+
+    def get(self) -> float:
+        """Get the current value of the gauge."""
+        if self._function is None:
+            with self._lock:
+                return self.value
+        function = self._function()
+        if function is not None:
+            return function()
+        with self._lock:
+            return self.value
+
+
+class Histogram(Metric):
+    """Observations counted in buckets, along with their count and sum."""
+
+    kind = "histogram"
+
+    __slots__ = ("buckets", "bucket_counts", "count", "sum")
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labels: LabelsType,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        """
+        Initialize the histogram.
+
+        :param name: the name of the metric.
+        :param description: the description of the metric.
+        :param labels: the labels of the metric, as sorted key-value pairs.
+        :param buckets: the sorted upper bounds of the buckets.
+        """
+        super().__init__(name, description, labels)
+        self.buckets = tuple(buckets)
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        Record an observation.
+
+        :param value: the observed value.
+        """
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.bucket_counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+    def get(self) -> Dict[str, Any]:
+        """Get the cumulative bucket counts, the count and the sum."""
+        with self._lock:
+            bucket_counts = list(self.bucket_counts)
+            count = self.count
+            sum_ = self.sum
+        cumulative = []
+        total = 0
+        for bound, bucket_count in zip(self.buckets, bucket_counts):
+            total += bucket_count
+            cumulative.append((bound, total))
+        cumulative.append((float("inf"), count))
+        return {"buckets": cumulative, "count": count, "sum": sum_}
+
+
+class MetricsRegistry:
+    """Registry of the runtime metrics."""
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self.enabled = False
+        self._enabled_count = 0
+        self._tracing_started = False
+        self._metrics: Dict[Tuple[str, LabelsType], Metric] = {}
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        """
+        Enable collection of the metrics.
+
+        Each call must be paired with a call to disable; the metrics stay
+        enabled until every caller has disabled them.
+        """
+        with self._lock:
+            self._enabled_count += 1
+            self.enabled = True
+
+    def disable(self) -> None:
+        """Disable collection of the metrics, once every caller of enable has disabled them."""
+        with self._lock:
+            self._enabled_count = max(self._enabled_count - 1, 0)
+            self.enabled = self._enabled_count > 0
+
+    def clear(self) -> None:
+        """Remove all the metrics."""
+        with self._lock:
+            self._metrics.clear()
+
+    def _get_or_create(
+        self,
+        cls: Any,
+        name: str,
+        description: str,
+        labels: Dict[str, Any],
+        **kwargs: Any,
+    ) -> Any:
+        """Get a metric by name and labels, creating it if needed."""
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+        metric = self._metrics.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(key)
+                if metric is None:
+                    metric = cls(name, description, key[1], **kwargs)
+                    self._metrics[key] = metric
+        if not isinstance(metric, cls):
+            raise ValueError(f"Metric {name} is already registered as a {metric.kind}.")
+        return metric
+
+    def counter(self, name: str, description: str = "", **labels: Any) -> Counter:
+        """
+        Get a counter.
+
+        :param name: the name of the metric.
+        :param description: the description of the metric.
+        :param labels: the labels of the metric.
+        :return: the counter.
+        """
+        return self._get_or_create(Counter, name, description, labels)
+
+    def gauge(self, name: str, description: str = "", **labels: Any) -> Gauge:
+        """
+        Get a gauge.
+
+        :param name: the name of the metric.
+        :param description: the description of the metric.
+        :param labels: the labels of the metric.
+        :return: the gauge.
+        """
+        return self._get_or_create(Gauge, name, description, labels)
+
+    def histogram(
+        self,
+        name: str,
+        description: str = "",
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        **labels: Any,
+    ) -> Histogram:
+        """
+        Get a histogram.
+
+        :param name: the name of the metric.
+        :param description: the description of the metric.
+        :param buckets: the upper bounds of the buckets, used on creation.
+        :param labels: the labels of the metric.
+        :return: the histogram.
+        """
+        return self._get_or_create(
+            Histogram, name, description, labels, buckets=buckets
+        )
+
+    def collect(self) -> List[Metric]:
+        """
+        Get all the metrics.
+
+        Gauges sampling a function of a collected object are removed.
+
+        :return: the metrics, sorted by name and labels.
+        """
+        with self._lock:
+            for key, metric in list(self._metrics.items()):
+                if isinstance(metric, Gauge) and not metric.is_alive:
+                    del self._metrics[key]
+            return [self._metrics[key] for key in sorted(self._metrics)]
+
+    def snapshot(self) -> Dict[str, List[Tuple[Dict[str, str], Any]]]:
+        """
+        Get the current values of all the metrics.
+
+        :return: the labels and value of each series, by metric name.
+        """
+        result: Dict[str, List[Tuple[Dict[str, str], Any]]] = {}
+        for metric in self.collect():
+            result.setdefault(metric.name, []).append(
+                (metric.labels_dict, metric.get())
+            )
+        return result
+
+    def start_allocation_sampling(self, nframes: int = 1) -> None:
+        """
+        Start tracing memory allocations with tracemalloc.
+
+        Tracing slows down allocations, so it is not enabled with the registry.
+
+        :param nframes: the number of frames stored for each allocation.
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(nframes)
+            self._tracing_started = True
+        self.gauge(
+            "aea_traced_memory_bytes", "Memory allocated since tracing started."
+        ).set_function(_get_traced_memory)
+
+    def stop_allocation_sampling(self) -> None:
+        """Stop tracing memory allocations, if the tracing was started by the registry."""
+        if self._tracing_started:
+            tracemalloc.stop()
+            self._tracing_started = False
+
+    @staticmethod
+    def get_allocations(limit: int = 10) -> List[Tuple[str, int, int]]:
+        """
+        Get the source lines which allocated the most memory still in use.
+
+        :param limit: the maximum number of lines to return.
+        :return: the location, size in bytes and number of blocks of each line.
+        """
+        if not tracemalloc.is_tracing():
+            return []
+        stats = tracemalloc.take_snapshot().statistics("lineno")[:limit]
+        return [(str(stat.traceback), stat.size, stat.count) for stat in stats]
+
+
+def _get_traced_memory() -> int:
+    """Get the size of the memory blocks currently traced by tracemalloc."""
+    return tracemalloc.get_traced_memory()[0]
+
+
+metrics = MetricsRegistry()
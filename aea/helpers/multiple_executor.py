@@ -16,9 +16,11 @@
 #   limitations under the License.
 #
 # ------------------------------------------------------------------------------
-"""This module contains the helpers to run multiple stoppable tasks in different modes: async, threaded, multiprocess ."""
+"""This module contains the helpers to run multiple stoppable tasks in different modes: async, threaded, multiprocess, supervised processes."""
 import asyncio
 import logging
+import multiprocessing
+import time
 from abc import ABC, abstractmethod
 from asyncio.events import AbstractEventLoop
 from asyncio.tasks import FIRST_EXCEPTION, Task
@@ -348,6 +350,141 @@ class AsyncExecutor(AbstractMultipleExecutor):  # pragma: nocover
         return task.create_async_task(self._loop)
 
 
+class SupervisedProcessExecutor(AbstractMultipleExecutor):
+    """
+    Executor running each task in its own supervised subprocess.
+
+    A subprocess exiting with an error is restarted after a backoff delay, doubled
+    on each consecutive failure up to a maximum. Once a task failed more than the
+    allowed number of restarts in a row, it fails and the exception policy applies.
+    A subprocess which ran longer than the maximum delay before failing is
+    considered healthy, so its consecutive failures count again from zero.
+    """
+
+    DEFAULT_MAX_RESTARTS = 5
+    DEFAULT_BACKOFF_BASE = 0.5  # in seconds
+    DEFAULT_BACKOFF_MAX = 30.0  # in seconds
+    PROCESS_ALIVE_SLEEP_TIME = 0.1  # in seconds
+    PROCESS_JOIN_TIMEOUT = 20  # in seconds
+
+    def __init__(
+        self,
+        tasks: Sequence[AbstractExecutorTask],
+        task_fail_policy: ExecutorExceptionPolicies = ExecutorExceptionPolicies.propagate,
+        max_restarts: int = DEFAULT_MAX_RESTARTS,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+    ) -> None:
+        """
+        Init executor.
+
+        :param tasks: sequence of AbstractMultiprocessExecutorTask instances to run.
+        :param task_fail_policy: the exception policy of all the tasks
+        :param max_restarts: the number of consecutive restarts of a failing task before it fails.
+        :param backoff_base: the delay before the first restart of a failing task, in seconds.
+        :param backoff_max: the maximum delay before a restart, in seconds.
+        """
+        self._max_restarts = max_restarts
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._processes: Dict[AbstractExecutorTask, multiprocessing.Process] = {}
+        self._restarts: Dict[AbstractExecutorTask, int] = {}
+        super().__init__(tasks, task_fail_policy)
+
+    def _set_executor_pool(self) -> None:
+        """Do nothing, cause each task runs in a subprocess started by the executor."""
+
+    def _start_task(self, task: AbstractExecutorTask) -> TaskAwaitable:
+        """
+        Start particular task.
+
+        :param task: AbstractExecutorTask instance to start.
+        :return: awaitable object(future) to get result or exception
+        """
+        self._restarts[task] = 0
+        return self._loop.create_task(self._supervise(task))
+
+    def get_process(
+        self, task: AbstractExecutorTask
+    ) -> Optional[multiprocessing.Process]:
+        """
+        Get the subprocess running a task.
+
+        :param task: the task.
+        :return: the last subprocess started for the task, if any.
+        """
+        return self._processes.get(task)
+
+    def get_restarts(self, task: AbstractExecutorTask) -> int:
+        """
+        Get the number of times a task was restarted.
+
+        :param task: the task.
+        :return: the number of restarts.
+        """
+        return self._restarts.get(task, 0)
+
+    def _get_backoff(self, failures: int) -> float:
+        """Get the delay before restarting a task after consecutive failures."""
+        return min(self._backoff_base * 2 ** (failures - 1), self._backoff_max)
+
+    async def _supervise(self, task: AbstractExecutorTask) -> None:
+        """
+        Run a task in a subprocess, restarting it with backoff when it fails.
+
+        :param task: the task to run.
+        """
+        failures = 0
+        while True:
+            fn, args = task.start()
+            process = multiprocessing.Process(target=fn, args=tuple(args))
+            self._processes[task] = process
+            started_at = time.monotonic()
+            process.start()
+            exitcode = await self._wait_process(process)
+            if exitcode == 0 or not self._is_running:
+                return
+
+            if time.monotonic() - started_at >= self._backoff_max:
+                failures = 0
+            failures += 1
+            if failures > self._max_restarts:
+                raise RuntimeError(
+                    f"Task {task.id} exited with code {exitcode} after {self._max_restarts} restarts."
+                )
+            backoff = self._get_backoff(failures)
+            _default_logger.warning(
+                f"Task {task.id} exited with code {exitcode}, restarting in {backoff} seconds."
+            )
+            await asyncio.sleep(backoff)
+            if not self._is_running:
+                return
+            self._restarts[task] += 1
+
+    async def _wait_process(self, process: multiprocessing.Process) -> Optional[int]:
+        """
+        Wait a subprocess exits, terminating it if it does not stop in time once the executor stops.
+
+        :param process: the subprocess.
+        :return: the exit code of the subprocess.
+        """
+        stop_deadline: Optional[float] = None
+        while process.is_alive():
+            if not self._is_running:
+                stop_deadline = stop_deadline or (
+                    time.monotonic() + self.PROCESS_JOIN_TIMEOUT
+                )
+                if time.monotonic() > stop_deadline:  # pragma: nocover
+                    _default_logger.warning(
+                        f"Process {process.pid} was not stopped within timeout: {self.PROCESS_JOIN_TIMEOUT} and was terminated"
+                    )
+                    process.terminate()
+                    break
+            await asyncio.sleep(self.PROCESS_ALIVE_SLEEP_TIME)
+        process.join(self.PROCESS_JOIN_TIMEOUT)
+        return process.exitcode
+
+
 class AbstractMultipleRunner:  # pragma: nocover
     """Abstract multiple runner to create classes to launch tasks with selected mode."""
 
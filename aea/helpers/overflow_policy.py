@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2023 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the capacity limits of the envelope queues and their overflow policies."""
+
+from enum import Enum
+from typing import Any, Dict
+
+from aea.exceptions import enforce
+
+
+class OverflowPolicyEnum(Enum):
+    """Policies applied to the envelopes that find their queue full."""
+
+    block = "block"  # wait for room in the queue, which throttles the producer.
+    drop_oldest = "drop_oldest"  # drop the oldest envelope in the queue to make room.
+    drop_newest = "drop_newest"  # drop the envelope.
+    reject = "reject"  # drop the envelope and report it as rejected.
+
+
+class QueueLimit:
+    """The capacity of an envelope queue and the policy applied when it is full."""
+
+    __slots__ = ("capacity", "overflow_policy")
+
+    def __init__(
+        self,
+        capacity: int = 0,
+        overflow_policy: OverflowPolicyEnum = OverflowPolicyEnum.block,
+    ) -> None:
+        """
+        Initialize the queue limit.
+
+        :param capacity: the maximum number of envelopes in the queue, 0 for no limit.
+        :param overflow_policy: the policy applied to the envelopes that find the queue full.
+        """
+        enforce(capacity >= 0, "Queue capacity must be non negative.")
+        self.capacity = capacity
+        self.overflow_policy = overflow_policy
+
+    @property
+    def is_bounded(self) -> bool:
+        """Check whether the queue has a capacity."""
+        return self.capacity > 0
+
+    @property
+    def json(self) -> Dict[str, Any]:
+        """Get the JSON representation."""
+        return {
+            "capacity": self.capacity,
+            "overflow_policy": self.overflow_policy.value,
+        }
+
+    @classmethod
+    def from_json(cls, obj: Dict[str, Any]) -> "QueueLimit":
+        """
+        Build the queue limit from its JSON representation.
+
+        :param obj: the JSON object
+        :return: the queue limit
+        """
+        return cls(
+            capacity=int(obj.get("capacity", 0)),
+            overflow_policy=OverflowPolicyEnum(
+                obj.get("overflow_policy", OverflowPolicyEnum.block.value)
+            ),
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare with another object."""
+        return (
+            isinstance(other, QueueLimit)
+            and self.capacity == other.capacity
+            and self.overflow_policy == other.overflow_policy
+        )
+
+    def __repr__(self) -> str:
+        """Get the representation."""
+        return f"QueueLimit(capacity={self.capacity}, overflow_policy={self.overflow_policy.value})"
@@ -27,11 +27,12 @@ import struct
 import tempfile
 from abc import ABC, abstractmethod
 from asyncio import AbstractEventLoop
-from asyncio.streams import StreamWriter
+from asyncio.streams import FlowControlMixin, StreamWriter
 from shutil import rmtree
-from typing import IO, Optional
+from typing import Dict, IO, Optional
 
 from aea.exceptions import enforce
+from aea.helpers.frames import FrameWriter
 
 
 _default_logger = logging.getLogger(__name__)
@@ -41,6 +42,48 @@ PIPE_CONN_ATTEMPTS = 10
 
 TCP_SOCKET_PIPE_CLIENT_CONN_ATTEMPTS = 5
 
+UNIX_SOCKET_NAME = "aea.sock"
+
+
+class IPCChannelCounters:
+    """Throughput counters of an interprocess communication channel."""
+
+    __slots__ = (
+        "frames_written",
+        "bytes_written",
+        "writes",
+        "frames_read",
+        "bytes_read",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.frames_written = 0
+        self.bytes_written = 0
+        self.writes = 0
+        self.frames_read = 0
+        self.bytes_read = 0
+
+    @property
+    def frames_per_write(self) -> float:
+        """Get the average number of frames written together."""
+        return self.frames_written / self.writes if self.writes else 0.0
+
+    def as_dict(self) -> Dict[str, int]:
+        """Get the counters as a dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def count_write(self, frames: int, size: int) -> None:
+        """
+        Count frames written together.
+
+        :param frames: the number of frames
+        :param size: the size of their payloads, in bytes
+        """
+        self.frames_written += frames
+        self.bytes_written += size
+        self.writes += 1
+
 
 class IPCChannelClient(ABC):
     """Multi-platform interprocess communication channel for the client side."""
@@ -78,6 +121,15 @@ class IPCChannelClient(ABC):
     async def close(self) -> None:
         """Close the communication channel."""
 
+    @property
+    @abstractmethod
+    def counters(self) -> IPCChannelCounters:
+        """
+        Throughput counters of the channel.
+
+        :return: the counters
+        """
+
 
 class IPCChannel(IPCChannelClient):
     """Multi-platform interprocess communication channel."""
@@ -110,6 +162,7 @@ class PosixNamedPipeProtocol:
         out_path: str,
         logger: logging.Logger = _default_logger,
         loop: Optional[AbstractEventLoop] = None,
+        counters: Optional[IPCChannelCounters] = None,
     ) -> None:
         """
         Initialize a new posix named pipe.
@@ -118,6 +171,7 @@ class PosixNamedPipeProtocol:
         :param out_path: rendezvous point for outgoing data
         :param logger: the logger
         :param loop: the event loop
+        :param counters: the throughput counters to update
         """
 
         self.logger = logger
@@ -126,10 +180,13 @@ class PosixNamedPipeProtocol:
         self._out_path = out_path
         self._in = -1
         self._out = -1
+        self._counters = counters if counters is not None else IPCChannelCounters()
 
         self._stream_reader = None  # type: Optional[asyncio.StreamReader]
         self._reader_protocol = None  # type: Optional[asyncio.StreamReaderProtocol]
         self._fileobj = None  # type: Optional[IO[str]]
+        self._stream_writer = None  # type: Optional[StreamWriter]
+        self._frame_writer = None  # type: Optional[FrameWriter]
 
         self._connection_attempts = PIPE_CONN_ATTEMPTS
         self._connection_timeout = PIPE_CONN_TIMEOUT
@@ -179,8 +236,22 @@ class PosixNamedPipeProtocol:
             lambda: self.__reader_protocol, self._fileobj
         )
 
+        # setup writer
+        transport, protocol = await self._loop.connect_write_pipe(
+            FlowControlMixin, os.fdopen(self._out, "wb")
+        )
+        self._stream_writer = StreamWriter(transport, protocol, None, self._loop)
+        self._frame_writer = FrameWriter(
+            self._stream_writer, on_flush=self._counters.count_write
+        )
+
         return True
 
+    @property
+    def counters(self) -> IPCChannelCounters:
+        """Get the throughput counters."""
+        return self._counters
+
     @property
     def __reader_protocol(self) -> asyncio.StreamReaderProtocol:
         """Get reader protocol."""
@@ -194,10 +265,10 @@ class PosixNamedPipeProtocol:
 
         :param data: bytes to write to pipe
         """
+        if self._frame_writer is None:  # pragma: nocover
+            raise ValueError("StreamWriter not set, call connect first!")
         self.logger.debug("writing {}...".format(len(data)))
-        size = struct.pack("!I", len(data))
-        os.write(self._out, size + data)
-        await asyncio.sleep(0.0)
+        await self._frame_writer.write(data)
 
     async def read(self) -> Optional[bytes]:
         """
@@ -218,6 +289,8 @@ class PosixNamedPipeProtocol:
             data = await self._stream_reader.readexactly(size)
             if not data:  # pragma: no cover
                 return None
+            self._counters.frames_read += 1
+            self._counters.bytes_read += size
             return data
         except asyncio.IncompleteReadError as e:  # pragma: no cover
             self.logger.info(
@@ -232,14 +305,19 @@ class PosixNamedPipeProtocol:
     async def close(self) -> None:
         """Disconnect pipe."""
         self.logger.debug("closing pipe (in={})...".format(self._in_path))
-        if self._fileobj is None:
+        if (
+            self._fileobj is None
+            or self._stream_writer is None
+            or self._frame_writer is None
+        ):
             raise ValueError("Pipe not connected")  # pragma: nocover
         try:
+            await self._frame_writer.flush()
             # hack for MacOSX
             size = struct.pack("!I", 0)
-            os.write(self._out, size)
+            self._stream_writer.write(size)
 
-            os.close(self._out)
+            self._stream_writer.close()
             self._fileobj.close()
         except OSError:  # pragma: no cover
             pass
@@ -247,7 +325,7 @@ class PosixNamedPipeProtocol:
 
 
 class TCPSocketProtocol:
-    """TCP socket communication protocol."""
+    """TCP, or Unix domain, socket communication protocol."""
 
     def __init__(
         self,
@@ -255,6 +333,7 @@ class TCPSocketProtocol:
         writer: asyncio.StreamWriter,
         logger: logging.Logger = _default_logger,
         loop: Optional[AbstractEventLoop] = None,
+        counters: Optional[IPCChannelCounters] = None,
     ) -> None:
         """
         Initialize the tcp socket protocol.
@@ -263,18 +342,26 @@ class TCPSocketProtocol:
         :param writer: established asyncio writer
         :param logger: the logger
         :param loop: the event loop
+        :param counters: the throughput counters to update
         """
 
         self.logger = logger
         self.loop = loop if loop is not None else asyncio.get_event_loop()
         self._reader = reader
         self._writer = writer
+        self._counters = counters if counters is not None else IPCChannelCounters()
+        self._frame_writer = FrameWriter(writer, on_flush=self._counters.count_write)
 
     @property
     def writer(self) -> StreamWriter:
         """Get a writer associated with  protocol."""
         return self._writer
 
+    @property
+    def counters(self) -> IPCChannelCounters:
+        """Get the throughput counters."""
+        return self._counters
+
     async def write(self, data: bytes) -> None:
         """
         Write to socket.
@@ -284,9 +371,7 @@ class TCPSocketProtocol:
         if self._writer is None:
             raise ValueError("writer not set!")  # pragma: nocover
         self.logger.debug("writing {}...".format(len(data)))
-        size = struct.pack("!I", len(data))
-        self._writer.write(size + data)
-        await self._writer.drain()
+        await self._frame_writer.write(data)
 
     async def read(self) -> Optional[bytes]:
         """
@@ -307,6 +392,8 @@ class TCPSocketProtocol:
                 raise ValueError(
                     f"Incomplete Read Error! Expected size={size}, got: {len(data)}"
                 )
+            self._counters.frames_read += 1
+            self._counters.bytes_read += size
             return data
         except asyncio.IncompleteReadError as e:  # pragma: no cover
             self.logger.info(
@@ -320,6 +407,7 @@ class TCPSocketProtocol:
 
     async def close(self) -> None:
         """Disconnect socket."""
+        await self._frame_writer.flush()
         if self._writer.can_write_eof():
             self._writer.write_eof()
         await self._writer.drain()
@@ -344,6 +432,7 @@ class TCPSocketChannel(IPCChannel):
         self._server = None  # type: Optional[asyncio.AbstractServer]
         self._connected = None  # type: Optional[asyncio.Event]
         self._sock = None  # type: Optional[TCPSocketProtocol]
+        self._counters = IPCChannelCounters()
 
         s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         s.bind(("127.0.0.1", 0))
@@ -363,13 +452,8 @@ class TCPSocketChannel(IPCChannel):
             self._loop = asyncio.get_event_loop()
 
         self._connected = asyncio.Event()
-        self._server = await asyncio.start_server(
-            self._handle_connection, host="127.0.0.1", port=self._port
-        )
-        if self._server.sockets is None:
-            raise ValueError("Server sockets is None!")  # pragma: nocover
-        self._port = self._server.sockets[0].getsockname()[1]
-        self.logger.debug("socket pipe rdv point: {}".format(self._port))
+        self._server = await self._start_server()
+        self.logger.debug("socket pipe rdv point: {}".format(self.in_path))
 
         try:
             await asyncio.wait_for(self._connected.wait(), timeout)
@@ -381,6 +465,16 @@ class TCPSocketChannel(IPCChannel):
 
         return True
 
+    async def _start_server(self) -> asyncio.AbstractServer:
+        """Start the server the other end connects to."""
+        server = await asyncio.start_server(
+            self._handle_connection, host="127.0.0.1", port=self._port
+        )
+        if server.sockets is None:
+            raise ValueError("Server sockets is None!")  # pragma: nocover
+        self._port = server.sockets[0].getsockname()[1]
+        return server
+
     async def _handle_connection(
         self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
     ) -> None:
@@ -389,7 +483,7 @@ class TCPSocketChannel(IPCChannel):
             raise ValueError("Connected is None!")  # pragma: nocover
         self._connected.set()
         self._sock = TCPSocketProtocol(
-            reader, writer, logger=self.logger, loop=self._loop
+            reader, writer, logger=self.logger, loop=self._loop, counters=self._counters
         )
 
     async def write(self, data: bytes) -> None:
@@ -428,6 +522,54 @@ class TCPSocketChannel(IPCChannel):
         """Rendezvous point for outgoing communication."""
         return str(self._port)
 
+    @property
+    def counters(self) -> IPCChannelCounters:
+        """Throughput counters of the channel."""
+        return self._counters
+
+
+class UnixSocketChannel(TCPSocketChannel):
+    """Interprocess communication channel implementation using Unix domain sockets."""
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self,
+        logger: logging.Logger = _default_logger,
+        loop: Optional[AbstractEventLoop] = None,
+    ) -> None:
+        """Initialize Unix domain socket interprocess communication channel."""
+        self.logger = logger
+        self._loop = loop
+        self._server = None  # type: Optional[asyncio.AbstractServer]
+        self._connected = None  # type: Optional[asyncio.Event]
+        self._sock = None  # type: Optional[TCPSocketProtocol]
+        self._counters = IPCChannelCounters()
+
+        self._socket_dir = tempfile.mkdtemp()
+        self._path = os.path.join(self._socket_dir, UNIX_SOCKET_NAME)
+
+    async def _start_server(self) -> asyncio.AbstractServer:
+        """Start the server the other end connects to."""
+        return await asyncio.start_unix_server(  # type: ignore
+            self._handle_connection, path=self._path
+        )
+
+    async def close(self) -> None:
+        """Disconnect from channel and clean it up."""
+        try:
+            await super().close()
+        finally:
+            rmtree(self._socket_dir, ignore_errors=True)
+
+    @property
+    def in_path(self) -> str:
+        """Rendezvous point for incoming communication."""
+        return self._path
+
+    @property
+    def out_path(self) -> str:
+        """Rendezvous point for outgoing communication."""
+        return self._path
+
 
 class PosixNamedPipeChannel(IPCChannel):
     """Interprocess communication channel implementation using Posix named pipes."""
@@ -456,8 +598,13 @@ class PosixNamedPipeChannel(IPCChannel):
         os.mkfifo(self._in_path)
         os.mkfifo(self._out_path)
 
+        self._counters = IPCChannelCounters()
         self._pipe = PosixNamedPipeProtocol(
-            self._in_path, self._out_path, logger=logger, loop=loop
+            self._in_path,
+            self._out_path,
+            logger=logger,
+            loop=loop,
+            counters=self._counters,
         )
 
     async def connect(self, timeout: float = PIPE_CONN_TIMEOUT) -> bool:
@@ -504,6 +651,11 @@ class PosixNamedPipeChannel(IPCChannel):
         """Rendezvous point for outgoing communication."""
         return self._out_path
 
+    @property
+    def counters(self) -> IPCChannelCounters:
+        """Throughput counters of the channel."""
+        return self._counters
+
 
 class TCPSocketChannelClient(IPCChannelClient):
     """Interprocess communication channel client using tcp sockets."""
@@ -533,6 +685,7 @@ class TCPSocketChannelClient(IPCChannelClient):
             self._port = int(parts[1])
             self._host = parts[0]
         self._sock = None  # type: Optional[TCPSocketProtocol]
+        self._counters = IPCChannelCounters()
 
         self._attempts = TCP_SOCKET_PIPE_CLIENT_CONN_ATTEMPTS
         self._timeout = PIPE_CONN_TIMEOUT / self._attempts
@@ -550,9 +703,7 @@ class TCPSocketChannelClient(IPCChannelClient):
 
         self._timeout = timeout / TCP_SOCKET_PIPE_CLIENT_CONN_ATTEMPTS
 
-        self.logger.debug(
-            "Attempting to connect to {}:{}.....".format("127.0.0.1", self._port)
-        )
+        self.logger.debug("Attempting to connect to {}.....".format(self._address))
 
         connected = False
         while self._attempts > 0:
@@ -561,7 +712,7 @@ class TCPSocketChannelClient(IPCChannelClient):
                 self._sock = await self._open_connection()
                 connected = True
                 break
-            except ConnectionRefusedError:
+            except (ConnectionRefusedError, FileNotFoundError):
                 await asyncio.sleep(self._timeout)
             except Exception as e:  # pylint: disable=broad-except  # pragma: nocover
                 self.last_exception = e
@@ -569,12 +720,19 @@ class TCPSocketChannelClient(IPCChannelClient):
 
         return connected
 
+    @property
+    def _address(self) -> str:
+        """Get the address the client connects to."""
+        return "{}:{}".format(self._host, self._port)
+
     async def _open_connection(self) -> TCPSocketProtocol:
         reader, writer = await asyncio.open_connection(
             self._host,
             self._port,  # pylint: disable=protected-access
         )
-        return TCPSocketProtocol(reader, writer, logger=self.logger, loop=self._loop)
+        return TCPSocketProtocol(
+            reader, writer, logger=self.logger, loop=self._loop, counters=self._counters
+        )
 
     async def write(self, data: bytes) -> None:
         """
@@ -602,6 +760,51 @@ class TCPSocketChannelClient(IPCChannelClient):
             raise ValueError("Socket pipe not connected.")  # pragma: nocover
         await self._sock.close()
 
+    @property
+    def counters(self) -> IPCChannelCounters:
+        """Throughput counters of the channel."""
+        return self._counters
+
+
+class UnixSocketChannelClient(TCPSocketChannelClient):
+    """Interprocess communication channel client using Unix domain sockets."""
+
+    def __init__(  # pylint: disable=unused-argument,super-init-not-called
+        self,
+        in_path: str,
+        out_path: str,
+        logger: logging.Logger = _default_logger,
+        loop: Optional[AbstractEventLoop] = None,
+    ) -> None:
+        """
+        Initialize a Unix domain socket communication channel client.
+
+        :param in_path: rendezvous point for incoming data
+        :param out_path: rendezvous point for outgoing data
+        :param logger: the logger
+        :param loop: the event loop
+        """
+        self.logger = logger
+        self._loop = loop
+        self._path = in_path
+        self._sock = None  # type: Optional[TCPSocketProtocol]
+        self._counters = IPCChannelCounters()
+
+        self._attempts = TCP_SOCKET_PIPE_CLIENT_CONN_ATTEMPTS
+        self._timeout = PIPE_CONN_TIMEOUT / self._attempts
+        self.last_exception: Optional[Exception] = None
+
+    @property
+    def _address(self) -> str:
+        """Get the address the client connects to."""
+        return self._path
+
+    async def _open_connection(self) -> TCPSocketProtocol:
+        reader, writer = await asyncio.open_unix_connection(self._path)  # type: ignore
+        return TCPSocketProtocol(
+            reader, writer, logger=self.logger, loop=self._loop, counters=self._counters
+        )
+
 
 class PosixNamedPipeChannelClient(IPCChannelClient):
     """Interprocess communication channel client using Posix named pipes."""
@@ -628,6 +831,7 @@ class PosixNamedPipeChannelClient(IPCChannelClient):
         self._in_path = in_path
         self._out_path = out_path
         self._pipe = None  # type: Optional[PosixNamedPipeProtocol]
+        self._counters = IPCChannelCounters()
         self.last_exception: Optional[Exception] = None
 
     async def connect(self, timeout: float = PIPE_CONN_TIMEOUT) -> bool:
@@ -642,7 +846,11 @@ class PosixNamedPipeChannelClient(IPCChannelClient):
             self._loop = asyncio.get_event_loop()
 
         self._pipe = PosixNamedPipeProtocol(
-            self._in_path, self._out_path, logger=self.logger, loop=self._loop
+            self._in_path,
+            self._out_path,
+            logger=self.logger,
+            loop=self._loop,
+            counters=self._counters,
         )
         try:
             return await self._pipe.connect()
@@ -676,6 +884,11 @@ class PosixNamedPipeChannelClient(IPCChannelClient):
             raise ValueError("Pipe not connected.")  # pragma: nocover
         return await self._pipe.close()
 
+    @property
+    def counters(self) -> IPCChannelCounters:
+        """Throughput counters of the channel."""
+        return self._counters
+
 
 def make_ipc_channel(
     logger: logging.Logger = _default_logger, loop: Optional[AbstractEventLoop] = None
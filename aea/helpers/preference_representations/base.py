@@ -20,11 +20,18 @@
 """Preference representation helpers."""
 
 import math
-from typing import Dict
+from typing import Dict, Tuple
 
 from aea.exceptions import enforce
 
 
+def _good_utility(utility_param: float, quantity: int, quantity_shift: int) -> float:
+    """Compute the utility of the quantity held of a good."""
+    if quantity + quantity_shift > 0:
+        return utility_param * math.log(quantity + quantity_shift)
+    return -10000
+
+
 def logarithmic_utility(
     utility_params_by_good_id: Dict[str, float],
     quantities_by_good_id: Dict[str, int],
@@ -44,14 +51,48 @@ def logarithmic_utility(
     )
 
     goodwise_utility = [
-        utility_params_by_good_id[good_id] * math.log(quantity + quantity_shift)
-        if quantity + quantity_shift > 0
-        else -10000
+        _good_utility(utility_params_by_good_id[good_id], quantity, quantity_shift)
         for good_id, quantity in quantities_by_good_id.items()
     ]
     return sum(goodwise_utility)
 
 
+def logarithmic_utility_change(
+    utility_params_by_good_id: Dict[str, float],
+    quantities_by_good_id: Dict[str, int],
+    delta_quantities_by_good_id: Dict[str, int],
+    quantity_shift: int = 100,
+) -> Tuple[float, float]:
+    """
+    Compute agent's utility, before and after a change, of the goods whose quantities change.
+
+    Only the goods with a non-zero change are evaluated, so the cost does not depend on
+    the number of goods held. All the changed goods must be held.
+
+    :param utility_params_by_good_id: utility params by good identifier
+    :param quantities_by_good_id: quantities by good identifier
+    :param delta_quantities_by_good_id: the change in quantities by good identifier
+    :param quantity_shift: a non-negative factor to shift the quantities in the utility function (to ensure the natural logarithm can be used on the entire range of quantities)
+    :return: the utility of the changed goods before and after the change
+    """
+    enforce(
+        quantity_shift >= 0,
+        "The quantity_shift argument must be a non-negative integer.",
+    )
+
+    utility_before = 0.0
+    utility_after = 0.0
+    for good_id, delta in delta_quantities_by_good_id.items():
+        enforce(good_id in quantities_by_good_id, f"Good {good_id} is not held.")
+        if delta == 0:
+            continue
+        quantity = quantities_by_good_id[good_id]
+        utility_param = utility_params_by_good_id[good_id]
+        utility_before += _good_utility(utility_param, quantity, quantity_shift)
+        utility_after += _good_utility(utility_param, quantity + delta, quantity_shift)
+    return utility_before, utility_after
+
+
 def linear_utility(
     exchange_params_by_currency_id: Dict[str, float],
     balance_by_currency_id: Dict[str, int],
@@ -68,3 +109,34 @@ def linear_utility(
         for currency_id, balance in balance_by_currency_id.items()
     ]
     return sum(money_utility)
+
+
+def linear_utility_change(
+    exchange_params_by_currency_id: Dict[str, float],
+    balance_by_currency_id: Dict[str, int],
+    delta_balance_by_currency_id: Dict[str, int],
+) -> Tuple[float, float]:
+    """
+    Compute agent's utility, before and after a change, of the currencies whose balances change.
+
+    All the changed currencies must be held.
+
+    :param exchange_params_by_currency_id: exchange params by currency
+    :param balance_by_currency_id: balance by currency
+    :param delta_balance_by_currency_id: the change in balance by currency
+    :return: the utility of the changed currencies before and after the change
+    """
+    utility_before = 0.0
+    utility_after = 0.0
+    for currency_id, delta in delta_balance_by_currency_id.items():
+        enforce(
+            currency_id in balance_by_currency_id,
+            f"Currency {currency_id} is not held.",
+        )
+        if delta == 0:
+            continue
+        balance = balance_by_currency_id[currency_id]
+        exchange_param = exchange_params_by_currency_id[currency_id]
+        utility_before += exchange_param * balance
+        utility_after += exchange_param * (balance + delta)
+    return utility_before, utility_after
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2023 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the priority lanes of the envelope queues and their weighted-fair scheduling."""
+
+import time
+from collections import deque
+from itertools import count
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from aea.configurations.data_types import PublicId
+from aea.exceptions import enforce
+
+
+DEFAULT_LANE = "default"
+
+_Entry = Tuple[int, float, Any]
+
+
+class PriorityLane:
+    """A priority class of envelopes, selected by protocol or by skill, and its share of the dequeues."""
+
+    __slots__ = ("name", "weight", "protocols", "skills")
+
+    def __init__(
+        self,
+        name: str,
+        weight: int = 1,
+        protocols: Collection[PublicId] = (),
+        skills: Collection[PublicId] = (),
+    ) -> None:
+        """
+        Initialize the priority lane.
+
+        :param name: the name of the lane.
+        :param weight: the number of envelopes dequeued from the lane in each round, at least 1.
+        :param protocols: the protocols of the envelopes in the lane, version is ignored.
+        :param skills: the skills of the envelopes in the lane, sent between skills or of a protocol the skills handle, version is ignored.
+        """
+        enforce(
+            isinstance(weight, int) and weight >= 1,
+            f"Weight of lane {name} must be a positive integer.",
+        )
+        self.name = name
+        self.weight = weight
+        self.protocols = frozenset(protocol.to_any() for protocol in protocols)
+        self.skills = frozenset(skill.to_any() for skill in skills)
+
+    @property
+    def json(self) -> Dict[str, Any]:
+        """Get the JSON representation, without the name."""
+        result: Dict[str, Any] = {"weight": self.weight}
+        if self.protocols:
+            result["protocols"] = sorted(str(protocol) for protocol in self.protocols)
+        if self.skills:
+            result["skills"] = sorted(str(skill) for skill in self.skills)
+        return result
+
+    @classmethod
+    def from_json(cls, name: str, obj: Dict[str, Any]) -> "PriorityLane":
+        """
+        Build the priority lane from its JSON representation.
+
+        :param name: the name of the lane
+        :param obj: the JSON object
+        :return: the priority lane
+        """
+        return cls(
+            name,
+            weight=int(obj.get("weight", 1)),
+            protocols=[PublicId.from_str(p) for p in obj.get("protocols", [])],
+            skills=[PublicId.from_str(s) for s in obj.get("skills", [])],
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare with another object."""
+        return (
+            isinstance(other, PriorityLane)
+            and self.name == other.name
+            and self.weight == other.weight
+            and self.protocols == other.protocols
+            and self.skills == other.skills
+        )
+
+    def __repr__(self) -> str:
+        """Get the representation."""
+        return f"PriorityLane(name={self.name}, weight={self.weight})"
+
+
+class WeightedFairLanes:
+    """
+    Storage of a queue split in lanes, dequeued in weighted round robin.
+
+    In each round, every non-empty lane gives up to its weight of items, in the
+    order of the lanes, and the items of a lane are dequeued in arrival order.
+    So an item at the head of a lane waits for at most the sum of the weights of
+    the other lanes before it is dequeued: no lane starves, whatever the load of
+    the others.
+
+    It implements the deque operations used by queue.Queue and asyncio.Queue.
+    """
+
+    def __init__(
+        self,
+        weights: Optional[Dict[str, int]] = None,
+        on_dequeue: Optional[Callable[[str, float], None]] = None,
+    ) -> None:
+        """
+        Initialize the lanes.
+
+        :param weights: the weights of the lanes, by name, in the order of service. Defaults to the default lane alone.
+        :param on_dequeue: called with the lane and the seconds waited by each dequeued item.
+        """
+        weights = weights or {DEFAULT_LANE: 1}
+        self._names: List[str] = list(weights)
+        self._weights: List[int] = list(weights.values())
+        self._lanes: List[Deque[_Entry]] = [deque() for _ in self._names]
+        self._by_name: Dict[str, Deque[_Entry]] = dict(zip(self._names, self._lanes))
+        self._default = self._by_name.get(DEFAULT_LANE, self._lanes[-1])
+        self._on_dequeue = on_dequeue
+        self._sequence = count()
+        self._size = 0
+        self._position = 0
+        self._credit = self._weights[0]
+
+    @property
+    def names(self) -> List[str]:
+        """Get the names of the lanes."""
+        return list(self._names)
+
+    def depth(self, lane: str) -> int:
+        """
+        Get the number of items waiting in a lane.
+
+        :param lane: the name of the lane
+        :return: the number of items
+        """
+        return len(self._by_name[lane])
+
+    def append(self, item: Any, lane: str = DEFAULT_LANE) -> None:
+        """
+        Add an item at the tail of a lane.
+
+        :param item: the item
+        :param lane: the name of the lane, the default lane if unknown
+        """
+        entries = self._by_name.get(lane, self._default)
+        entries.append((next(self._sequence), time.monotonic(), item))
+        self._size += 1
+
+    def popleft(self) -> Any:
+        """
+        Remove the next item in weighted round robin.
+
+        :return: the item
+        :raises IndexError: if the lanes are empty.
+        """
+        if not self._size:
+            raise IndexError("pop from empty lanes")
+        lanes = self._lanes
+        while not lanes[self._position] or self._credit <= 0:
+            self._position = (self._position + 1) % len(lanes)
+            self._credit = self._weights[self._position]
+        self._credit -= 1
+        self._size -= 1
+        _, enqueued_at, item = lanes[self._position].popleft()
+        if self._on_dequeue is not None:
+            self._on_dequeue(
+                self._names[self._position], time.monotonic() - enqueued_at
+            )
+        return item
+
+    def remove_oldest(self, predicate: Optional[Callable[[Any], bool]] = None) -> Any:
+        """
+        Remove the item that arrived first, among the items satisfying a predicate if given.
+
+        :param predicate: the condition on the items to remove
+        :return: the item
+        :raises IndexError: if no item satisfies the predicate.
+        """
+        oldest: Optional[Tuple[int, Deque[_Entry], int]] = None
+        for entries in self._lanes:
+            for index, (sequence, _, item) in enumerate(entries):
+                if oldest is not None and sequence > oldest[0]:
+                    break
+                if predicate is None or predicate(item):
+                    oldest = (sequence, entries, index)
+                    break
+        if oldest is None:
+            raise IndexError("no item to remove")
+        _, entries, index = oldest
+        item = entries[index][2]
+        del entries[index]
+        self._size -= 1
+        return item
+
+    def __len__(self) -> int:
+        """Get the number of items."""
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the items in arrival order."""
+        entries = sorted(entry for lane in self._lanes for entry in lane)
+        return (item for _, _, item in entries)
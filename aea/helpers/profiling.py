@@ -21,7 +21,6 @@
 
 import asyncio
 import datetime
-import gc
 import logging
 import platform
 import textwrap
@@ -30,15 +29,18 @@ import time
 from collections import Counter
 from concurrent.futures._base import CancelledError
 from functools import wraps
-from typing import Any, Callable, Dict, List, Type
+from typing import Any, Callable, Dict, List, Set, Type
 
 from aea.helpers.async_utils import Runnable
+from aea.helpers.metrics import metrics
 
 
-lock = threading.Lock()
+lock = threading.RLock()
 
 _default_logger = logging.getLogger(__file__)
 
+_COUNTED_METHODS = ("__init__", "__del__")
+
 if platform.system() == "Windows":  # pragma: nocover
     import win32process  # type: ignore  # pylint: disable=import-error
 
@@ -75,7 +77,13 @@ else:
 
 
 class Profiling(Runnable):
-    """Profiling service."""
+    """
+    Profiling service.
+
+    Objects are counted by hooks on their constructors and finalizers, and the
+    runtime metrics are enabled while the service runs; producing a report
+    never scans the garbage collector.
+    """
 
     def __init__(
         self,
@@ -83,6 +91,7 @@ class Profiling(Runnable):
         objects_instances_to_count: List[Type] = None,
         objects_created_to_count: List[Type] = None,
         output_function: Callable[[str], None] = lambda x: print(x, flush=True),
+        trace_allocations: bool = False,
     ) -> None:
         """
         Init profiler.
@@ -91,6 +100,7 @@ class Profiling(Runnable):
         :param objects_instances_to_count: object to count
         :param objects_created_to_count: object created to count
         :param output_function: function to display output, one str argument.
+        :param trace_allocations: whether to report the top memory allocations with tracemalloc.
         """
         if period < 1:  # pragma: nocover
             raise ValueError("Period should be at least 1 second!")
@@ -100,33 +110,96 @@ class Profiling(Runnable):
         self._objects_instances_to_count = objects_instances_to_count or []
         self._objects_created_to_count = objects_created_to_count or []
         self._output_function = output_function
+        self._trace_allocations = trace_allocations
         self._counter: Dict[Type, int] = Counter()
+        self._present: Dict[Type, Set[int]] = {}
+        self._originals: Dict[Type, Dict[str, Any]] = {}
+
+    def start(self) -> bool:
+        """
+        Start profiling.
+
+        The counters are set before returning, so that objects created right after are counted.
+
+        :return: bool started or not.
+        """
+        if not self.is_running:
+            self.set_counters()
+        return super().start()
 
     def set_counters(self) -> None:
-        """Modify obj.__new__ to count objects created created."""
-        for obj in self._objects_created_to_count:
+        """
+        Modify obj.__init__ and obj.__del__ to count objects created and present.
+
+        The classes are modified once, until the counters are reset. The
+        initializer is hooked rather than the constructor, because a replaced
+        __new__ cannot be restored on a class.
+        """
+        with lock:
+            if self._originals:
+                return
+            for obj in set(self._objects_created_to_count) | set(
+                self._objects_instances_to_count
+            ):
+                self._originals[obj] = {
+                    name: obj.__dict__[name]
+                    for name in _COUNTED_METHODS
+                    if name in obj.__dict__
+                }
+
+        for obj in self._objects_instances_to_count:
+            self._present[obj] = set()
+
+            def make_del_fn(obj: Any) -> Callable:
+                orig_del = getattr(obj, "__del__", None)
+                present = self._present[obj]
+
+                def del_(instance: Any) -> None:
+                    with lock:
+                        present.discard(id(instance))
+                    if orig_del is not None:  # pragma: nocover
+                        orig_del(instance)
+
+                return del_
+
+            obj.__del__ = make_del_fn(obj)  # type: ignore
+
+        for obj in self._originals:
             self._counter[obj] = 0
 
             def make_fn(obj: Any) -> Callable:
-                orig_new = obj.__new__
-                # pylint: disable=protected-access  # type: ignore
-                obj_copy = obj
+                orig_init = obj.__init__
+                present = self._present.get(obj)
+
+                @wraps(orig_init)
+                def init(instance: Any, *args: Any, **kwargs: Any) -> None:
+                    with lock:
+                        self._counter[obj] += 1
+                        if present is not None:
+                            present.add(id(instance))
+                    orig_init(instance, *args, **kwargs)
 
-                @wraps(orig_new)
-                def new(*args: Any, **kwargs: Any) -> Callable:
-                    self._counter[obj_copy] += 1
-                    if orig_new is object.__new__:
-                        return orig_new(args[0])  # pragma: nocover
-                    return orig_new(*args, **kwargs)  # pragma: nocover
+                return init
 
-                return new
+            obj.__init__ = make_fn(obj)  # type: ignore
 
-            obj.__new__ = make_fn(obj)  # type: ignore
+    def reset_counters(self) -> None:
+        """Restore the obj.__init__ and obj.__del__ modified to count objects."""
+        with lock:
+            for obj, originals in self._originals.items():
+                for name in _COUNTED_METHODS:
+                    if name in originals:
+                        setattr(obj, name, originals[name])
+                    elif name in obj.__dict__:
+                        delattr(obj, name)
+            self._originals.clear()
 
     async def run(self) -> None:
         """Run profiling."""
+        metrics.enable()
         try:
-            self.set_counters()
+            if self._trace_allocations:
+                metrics.start_allocation_sampling()
             while True:
                 await asyncio.sleep(self._period)
                 self.output_profile_data()
@@ -135,6 +208,11 @@ class Profiling(Runnable):
         except Exception:  # pragma: nocover
             _default_logger.exception("Exception in Profiling")
             raise
+        finally:
+            metrics.disable()
+            if self._trace_allocations:
+                metrics.stop_allocation_sampling()
+            self.reset_counters()
 
     def output_profile_data(self) -> None:
         """Render profiling data and call output_function."""
@@ -159,9 +237,44 @@ class Profiling(Runnable):
                 [f" * {i.__name__}:  {c}" for i, c in data["objects_created"].items()]
             )
             + "\n"
+            + """Metrics:\n"""
+            + "\n".join(
+                [
+                    f" * {name}{self._format_labels(labels)}:  {self._format_metric_value(value)}"
+                    for name, series in data["metrics"].items()
+                    for labels, value in series
+                ]
+            )
+            + "\n"
         )
+        if self._trace_allocations:
+            text += (
+                """Top allocations:\n"""
+                + "\n".join(
+                    [
+                        f" * {location}:  {size / 1024:.1f} KiB in {count} blocks"
+                        for location, size, count in data["allocations"]
+                    ]
+                )
+                + "\n"
+            )
         self._output_function(text)
 
+    @staticmethod
+    def _format_labels(labels: Dict[str, str]) -> str:
+        """Format the labels of a metric for output."""
+        if not labels:
+            return ""
+        return "{" + ", ".join(f"{k}={v}" for k, v in labels.items()) + "}"
+
+    @staticmethod
+    def _format_metric_value(value: Any) -> str:
+        """Format the value of a metric for output."""
+        if isinstance(value, dict):
+            mean = value["sum"] / value["count"] if value["count"] else 0.0
+            return f"count={value['count']} mean={mean:.6f}"
+        return f"{value}"
+
     def get_profile_data(self) -> Dict:
         """Get profiling data dict."""
         return {
@@ -174,6 +287,8 @@ class Profiling(Runnable):
             },
             "objects_present": self.get_objects_instances(),
             "objects_created": self.get_objecst_created(),
+            "metrics": metrics.snapshot(),
+            "allocations": metrics.get_allocations(),
         }
 
     def get_objects_instances(self) -> Dict:
@@ -182,14 +297,12 @@ class Profiling(Runnable):
 
         with lock:
             for obj_type in self._objects_instances_to_count:
-                result[obj_type.__name__] += 0
-
-            for obj in gc.get_objects():
-                for obj_type in self._objects_instances_to_count:
-                    if isinstance(obj, obj_type):
-                        result[obj_type.__name__] += 1
+                result[obj_type.__name__] = len(self._present.get(obj_type, ()))
         return result
 
     def get_objecst_created(self) -> Dict:
         """Return dict with counted object instances created."""
-        return self._counter
+        return {
+            obj_type: self._counter[obj_type]
+            for obj_type in self._objects_created_to_count
+        }
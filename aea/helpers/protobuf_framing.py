@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2023 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains helpers to write and read the fields of protobuf messages without intermediate copies."""
+
+from functools import lru_cache
+from typing import Iterator, List, Tuple, Union
+
+from google.protobuf.message import DecodeError
+
+
+WIRE_TYPE_VARINT = 0
+WIRE_TYPE_FIXED64 = 1
+WIRE_TYPE_LENGTH_DELIMITED = 2
+WIRE_TYPE_FIXED32 = 5
+
+_FIXED_SIZES = {WIRE_TYPE_FIXED64: 8, WIRE_TYPE_FIXED32: 4}
+_MAX_VARINT_SHIFT = 64
+_UINT64_MASK = (1 << 64) - 1
+_INT32_MIN = -(1 << 31)
+_INT32_MAX = (1 << 31) - 1
+_SMALL_VARINTS = [bytes((value,)) for value in range(0x80)]
+
+FieldValue = Union[int, memoryview]
+
+
+def encode_varint(value: int) -> bytes:
+    """
+    Encode a non-negative integer as a protobuf varint.
+
+    :param value: the integer
+    :return: the encoded varint
+    """
+    if value < 0x80:
+        return _SMALL_VARINTS[value]
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def decode_varint(data: memoryview, position: int) -> Tuple[int, int]:
+    """
+    Decode a protobuf varint.
+
+    :param data: the encoded data
+    :param position: the position of the varint in the data
+    :return: the integer and the position after the varint
+    :raises DecodeError: if the varint is truncated or too long.
+    """
+    result = 0
+    shift = 0
+    end = len(data)
+    while True:
+        if position >= end:
+            raise DecodeError("Truncated varint.")
+        byte = data[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, position
+        shift += 7
+        if shift >= _MAX_VARINT_SHIFT:
+            raise DecodeError("Too many bytes when decoding varint.")
+
+
+def decode_int32(value: int) -> int:
+    """
+    Get the int32 encoded by a decoded varint.
+
+    :param value: the decoded varint
+    :return: the signed integer
+    """
+    value &= 0xFFFFFFFF
+    return value - (1 << 32) if value & 0x80000000 else value
+
+
+def decode_string(value: memoryview) -> str:
+    """
+    Decode the value of a string field.
+
+    :param value: the value of the field
+    :return: the string
+    :raises DecodeError: if the value is not valid UTF-8.
+    """
+    try:
+        return str(value, "utf-8")
+    except UnicodeDecodeError as e:
+        raise DecodeError(f"Error decoding string field: {e}") from e
+
+
+@lru_cache(maxsize=None)
+def field_key(field_number: int, wire_type: int) -> bytes:
+    """
+    Get the encoded key of a field.
+
+    :param field_number: the number of the field
+    :param wire_type: the wire type of the field
+    :return: the encoded key
+    """
+    return encode_varint((field_number << 3) | wire_type)
+
+
+class ProtobufWriter:
+    """
+    Reusable writer of protobuf messages made of int32 and length-delimited fields.
+
+    The writer keeps references to the values of the fields and copies each of
+    them once, when the message is joined. So nesting the message in the field
+    of an enclosing message only adds the key and length of that field, without
+    serializing the nested message first.
+    """
+
+    __slots__ = ("_parts", "_size")
+
+    def __init__(self) -> None:
+        """Initialize the writer."""
+        self._parts: List[bytes] = []
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Get the size of the message written so far."""
+        return self._size
+
+    def reset(self) -> None:
+        """Drop the message written so far, so that the writer can be reused."""
+        self._parts.clear()
+        self._size = 0
+
+    def write_int32(self, field_number: int, value: int) -> None:
+        """
+        Write an int32 field, skipped if zero as in proto3.
+
+        :param field_number: the number of the field
+        :param value: the value of the field
+        :raises ValueError: if the value is out of the int32 range.
+        """
+        if not value:
+            return
+        if not _INT32_MIN <= value <= _INT32_MAX:
+            raise ValueError(f"Value out of range: {value}")
+        encoded = field_key(field_number, WIRE_TYPE_VARINT) + encode_varint(
+            value & _UINT64_MASK
+        )
+        self._parts.append(encoded)
+        self._size += len(encoded)
+
+    def write_bytes(self, field_number: int, value: bytes) -> None:
+        """
+        Write a bytes field, skipped if empty as in proto3.
+
+        :param field_number: the number of the field
+        :param value: the value of the field, not copied until the message is joined
+        """
+        if not value:
+            return
+        header = field_key(field_number, WIRE_TYPE_LENGTH_DELIMITED) + encode_varint(
+            len(value)
+        )
+        self._parts.append(header)
+        self._parts.append(value)
+        self._size += len(header) + len(value)
+
+    def write_string(self, field_number: int, value: str) -> None:
+        """
+        Write a string field, skipped if empty as in proto3.
+
+        :param field_number: the number of the field
+        :param value: the value of the field
+        """
+        self.write_bytes(field_number, value.encode("utf-8"))
+
+    def wrap(self, field_number: int) -> None:
+        """
+        Turn the message written so far into the value of a message field of an enclosing message.
+
+        :param field_number: the number of the field in the enclosing message
+        """
+        header = field_key(field_number, WIRE_TYPE_LENGTH_DELIMITED) + encode_varint(
+            self._size
+        )
+        self._parts.insert(0, header)
+        self._size += len(header)
+
+    def getvalue(self) -> bytes:
+        """
+        Join the message written so far.
+
+        :return: the encoded message
+        """
+        return b"".join(self._parts)
+
+
+def iter_fields(
+    data: Union[bytes, memoryview]
+) -> Iterator[Tuple[int, int, FieldValue]]:
+    """
+    Iterate over the fields of an encoded protobuf message.
+
+    The values of length-delimited and fixed-size fields are memoryviews on the
+    data, so reading them does not copy it; varints are decoded to integers.
+
+    :param data: the encoded message
+    :yield: the field numbers, wire types and values, in the order of the data
+    :raises DecodeError: if the message is malformed.
+    """
+    view = memoryview(data)
+    if view.format != "B" or view.ndim != 1:
+        view = view.cast("B")
+    position = 0
+    end = len(view)
+    while position < end:
+        key, position = decode_varint(view, position)
+        field_number, wire_type = key >> 3, key & 0x07
+        if field_number == 0:
+            raise DecodeError("Field number 0 is invalid.")
+        value: FieldValue
+        if wire_type == WIRE_TYPE_VARINT:
+            value, position = decode_varint(view, position)
+        elif wire_type == WIRE_TYPE_LENGTH_DELIMITED:
+            size, position = decode_varint(view, position)
+            value = view[position : position + size]
+            position += size
+        elif wire_type in _FIXED_SIZES:
+            size = _FIXED_SIZES[wire_type]
+            value = view[position : position + size]
+            position += size
+        else:
+            raise DecodeError(f"Unsupported wire type {wire_type}.")
+        if position > end:
+            raise DecodeError("Truncated message.")
+        yield field_number, wire_type, value
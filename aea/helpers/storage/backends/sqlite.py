@@ -50,6 +50,20 @@ class SqliteStorageBackend(AbstractStorageBackend):
         self._lock = threading.Lock()
         self._executor = ThreadPoolExecutor(max_workers=1)
 
+    def set_executor(self, executor: ThreadPoolExecutor) -> None:
+        """
+        Run the queries on an executor shared with other backends.
+
+        The executor must have a single worker, since a connection can only be
+        used by the thread which opened it.
+
+        :param executor: the executor.
+        :raises ValueError: if the backend is connected.
+        """
+        if self._connection is not None:
+            raise ValueError("Cannot change the executor of a connected backend.")
+        self._executor = executor
+
     def _execute_sql_sync(self, query: str, args: Optional[List] = None) -> List[Tuple]:
         """
         Execute sql command and return results.
@@ -17,39 +17,39 @@
 #
 # ------------------------------------------------------------------------------
 """Helper functions related to YAML loading/dumping."""
+import hashlib
+import json
+import os
 from collections import OrderedDict
-from typing import Any, Dict, List, Optional, Sequence, TextIO
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, TextIO, Union
 
 import yaml
 from yaml import MappingNode
 
 
-class _AEAYamlLoader(yaml.SafeLoader):
+YAML_CACHE_DIR_ENV_VAR = "AEA_YAML_CACHE_DIR"
+_YAML_CACHE_FORMAT_VERSION = "2"
+_JSON_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+# the libyaml bindings are not always available, e.g. when PyYAML is built from sources
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class _AEAYamlLoader(_SafeLoader):  # type: ignore
     """
     Custom yaml.SafeLoader for the AEA framework.
 
-    It extends the default SafeLoader in two ways:
-    - loads YAML configurations while *remembering the order of the fields*;
-    - resolves the environment variables at loading time.
+    It extends the default SafeLoader so to load YAML configurations
+    while *remembering the order of the fields*. It parses with the libyaml
+    bindings (CSafeLoader) when they are available.
+
+    The environment variables are resolved by the callers, after loading.
 
     This class is for internal usage only; please use
     the public functions of the module 'yaml_load' and 'yaml_load_all'.
     """
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        """
-        Initialize the AEAYamlLoader.
-
-        It adds a YAML Loader constructor to use 'OderedDict' to load the files.
-
-        :param args: the positional arguments.
-        :param kwargs: the keyword arguments.
-        """
-        super().__init__(*args, **kwargs)
-        _AEAYamlLoader.add_constructor(
-            yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, self._construct_mapping
-        )
-
     @staticmethod
     def _construct_mapping(loader: "_AEAYamlLoader", node: MappingNode) -> OrderedDict:
         """Construct a YAML mapping with OrderedDict."""
@@ -58,6 +58,12 @@ class _AEAYamlLoader(yaml.SafeLoader):
         return object_pairs_hook(loader.construct_pairs(node))
 
 
+_AEAYamlLoader.add_constructor(
+    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG,
+    _AEAYamlLoader._construct_mapping,  # pylint: disable=protected-access
+)
+
+
 class _AEAYamlDumper(yaml.SafeDumper):
     """
     Custom yaml.SafeDumper for the AEA framework.
@@ -89,6 +95,117 @@ class _AEAYamlDumper(yaml.SafeDumper):
         )
 
 
+def _is_json_compatible(value: Any) -> bool:
+    """Check a parsed YAML value is read back unchanged from JSON, mappings as OrderedDict."""
+    if isinstance(value, _JSON_SCALAR_TYPES):
+        return True
+    if isinstance(value, list):
+        return all(_is_json_compatible(item) for item in value)
+    if isinstance(value, dict):
+        return all(
+            isinstance(key, str) and _is_json_compatible(item)
+            for key, item in value.items()
+        )
+    return False
+
+
+class _YamlCache:
+    """
+    On-disk cache of the parsed YAML files.
+
+    The entries are keyed by the hash of the YAML content, so an entry is
+    never stale: an edited file gets a new key. The cache is disabled unless
+    a directory is set, either with 'set_yaml_cache_dir' or through the
+    environment variable AEA_YAML_CACHE_DIR.
+
+    The entries are stored as JSON, so reading them cannot run code; the
+    documents with values JSON cannot represent (e.g. timestamps or non-string
+    keys) are not cached. An entry which cannot be read is parsed again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._directory: Optional[Path] = None
+        self._directory_from_env = True
+
+    @property
+    def directory(self) -> Optional[Path]:
+        """Get the cache directory, if the cache is enabled."""
+        if self._directory_from_env:
+            directory = os.environ.get(YAML_CACHE_DIR_ENV_VAR)
+            return Path(directory) if directory else None
+        return self._directory
+
+    def set_directory(self, directory: Optional[Union[str, Path]]) -> None:
+        """
+        Set the cache directory, overriding the environment variable.
+
+        :param directory: the cache directory, or None to disable the cache.
+        """
+        self._directory = Path(directory) if directory is not None else None
+        self._directory_from_env = False
+
+    def load(
+        self, stream: TextIO, kind: str, parse: Callable[[Union[str, TextIO]], Any]
+    ) -> Any:
+        """
+        Load the YAML content of a stream, from the cache if possible.
+
+        :param stream: the YAML stream.
+        :param kind: the kind of loading, part of the cache key.
+        :param parse: the function parsing the YAML content.
+        :return: the parsed content.
+        """
+        directory = self.directory
+        if directory is None:
+            return parse(stream)
+        content = stream.read()
+        digest = hashlib.sha256(
+            f"{_YAML_CACHE_FORMAT_VERSION}:{kind}:{content}".encode("utf-8")
+        ).hexdigest()
+        path = directory / f"{digest}.json"
+        try:
+            with path.open("r", encoding="utf-8") as fp:
+                return json.load(fp, object_pairs_hook=OrderedDict)
+        except Exception:  # pylint: disable=broad-except
+            pass
+        result = parse(content)
+        if not _is_json_compatible(result):
+            return result
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with tmp_path.open("w", encoding="utf-8") as fp:
+                json.dump(result, fp)
+            os.replace(tmp_path, path)
+        except (OSError, ValueError):  # pragma: nocover
+            pass
+        return result
+
+
+_yaml_cache = _YamlCache()
+
+
+def set_yaml_cache_dir(directory: Optional[Union[str, Path]]) -> None:
+    """
+    Set the directory of the cache of the parsed YAML files.
+
+    :param directory: the cache directory, or None to disable the cache.
+    """
+    _yaml_cache.set_directory(directory)
+
+
+def _parse(stream: Union[str, TextIO]) -> Dict[str, Any]:
+    """Parse a YAML document."""
+    result = yaml.load(stream, Loader=_AEAYamlLoader)  # nosec
+    return result if result is not None else {}
+
+
+def _parse_all(stream: Union[str, TextIO]) -> List[Dict[str, Any]]:
+    """Parse a multi-paged YAML document."""
+    return list(yaml.load_all(stream, Loader=_AEAYamlLoader))  # nosec
+
+
 def yaml_load(stream: TextIO) -> Dict[str, Any]:
     """
     Load a yaml from a file pointer in an ordered way.
@@ -96,8 +213,7 @@ def yaml_load(stream: TextIO) -> Dict[str, Any]:
     :param stream: file pointer to the input file.
     :return: the dictionary object with the YAML file content.
     """
-    result = yaml.load(stream, Loader=_AEAYamlLoader)  # nosec
-    return result if result is not None else {}
+    return _yaml_cache.load(stream, "load", _parse)
 
 
 def yaml_load_all(stream: TextIO) -> List[Dict[str, Any]]:
@@ -107,7 +223,7 @@ def yaml_load_all(stream: TextIO) -> List[Dict[str, Any]]:
     :param stream: file pointer to the input file.
     :return: the list of dictionary objects with the (multi-paged) YAML file content.
     """
-    return list(yaml.load_all(stream, Loader=_AEAYamlLoader))  # nosec
+    return _yaml_cache.load(stream, "load_all", _parse_all)
 
 
 def yaml_dump(data: Dict, stream: Optional[TextIO] = None) -> None:
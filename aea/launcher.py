@@ -18,13 +18,27 @@
 # ------------------------------------------------------------------------------
 """This module contains the implementation of multiple AEA configs launcher."""
 import logging
+import math
 import multiprocessing
+import os
+import time
 from asyncio.events import AbstractEventLoop
 from concurrent.futures.process import BrokenProcessPool
 from multiprocessing.synchronize import Event
 from os import PathLike
-from threading import Thread
-from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Type, Union
+from threading import Lock, Thread
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from aea.aea import AEA
 from aea.aea_builder import AEABuilder
@@ -38,14 +52,22 @@ from aea.helpers.multiple_executor import (
     AsyncExecutor,
     ExecutorExceptionPolicies,
     ProcessExecutor,
+    SupervisedProcessExecutor,
     TaskAwaitable,
     ThreadExecutor,
 )
+from aea.helpers.profiling import (
+    get_current_process_cpu_time,
+    get_current_process_memory_usage,
+)
 from aea.runtime import AsyncRuntime
 
 
 _default_logger = logging.getLogger(__name__)
 
+SHARDED_MODE = "sharded"
+DEFAULT_LOAD_REPORT_INTERVAL = 1.0  # in seconds
+
 
 def load_agent(agent_dir: Union[PathLike, str], password: Optional[str] = None) -> AEA:
     """
@@ -94,14 +116,15 @@ def _run_agent(
     import select  # pylint: disable=import-outside-toplevel
     import selectors  # pylint: disable=import-outside-toplevel
 
+    # a forked process must not use the event loop of its parent: they would share
+    # its selector and its self-pipe, so a stop requested from another thread
+    # (call_soon_threadsafe) could fail to wake the loop up.
     if hasattr(select, "kqueue"):  # pragma: nocover  # cause platform specific
         selector = selectors.SelectSelector()
         loop = asyncio.SelectorEventLoop(selector)  # type: ignore
-        asyncio.set_event_loop(loop)
-    try:
-        asyncio.get_event_loop()
-    except Exception:  # pylint: disable=broad-except
-        asyncio.set_event_loop(asyncio.new_event_loop())
+    else:
+        loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
 
     _set_logger(log_level=log_level)
 
@@ -133,6 +156,78 @@ def _run_agent(
         agent.stop()
 
 
+def _run_shard(
+    agent_dirs: Sequence[Union[PathLike, str]],
+    stop_event: Event,
+    load: Any,
+    log_level: Optional[str] = None,
+    password: Optional[str] = None,
+    report_interval: float = DEFAULT_LOAD_REPORT_INTERVAL,
+) -> None:
+    """
+    Load and run a shard of agents, each in a thread, in a dedicated process.
+
+    The CPU usage, in percent, and the memory usage, in MB, of the process are
+    written to the load array at each report interval.
+
+    :param agent_dirs: the configuration directories of the agents
+    :param stop_event: multiprocessing Event to stop the agents run.
+    :param load: the shared array to report the load of the process to.
+    :param log_level: debug level applied for AEA in subprocess
+    :param password: the password to encrypt/decrypt the private key.
+    :param report_interval: the time between two load reports, in seconds.
+    """
+    _set_logger(log_level=log_level)
+
+    launcher = AEALauncher(
+        agent_dirs,
+        "threaded",
+        fail_policy=ExecutorExceptionPolicies.propagate,
+        log_level=log_level,
+        password=password,
+    )
+    stop_lock = Lock()
+    stopped = False
+
+    def stop_launcher() -> None:
+        nonlocal stopped
+        with stop_lock:
+            if not stopped:
+                stopped = True
+                launcher.stop()
+
+    def report_load_thread() -> None:
+        cpu_time = get_current_process_cpu_time()
+        timestamp = time.monotonic()
+        try:
+            while not stop_event.wait(report_interval):
+                new_cpu_time = get_current_process_cpu_time()
+                new_timestamp = time.monotonic()
+                with load.get_lock():
+                    load[0] = (
+                        100.0 * (new_cpu_time - cpu_time) / (new_timestamp - timestamp)
+                    )
+                    load[1] = get_current_process_memory_usage()
+                cpu_time, timestamp = new_cpu_time, new_timestamp
+        except (KeyboardInterrupt, EOFError, BrokenPipeError) as e:  # pragma: nocover
+            _default_logger.debug(
+                f"Exception raised in report_load_thread {e} {type(e)}. Skip it, looks process is closed."
+            )
+        finally:
+            _default_logger.debug("_run_shard: stop event raised. call launcher.stop")
+            stop_launcher()
+
+    Thread(target=report_load_thread, daemon=True).start()
+    try:
+        if not stop_event.is_set():
+            launcher.start()
+    except KeyboardInterrupt:  # pragma: nocover
+        _default_logger.debug("_run_shard: keyboard interrupt")
+    finally:
+        _default_logger.debug("_run_shard: call launcher.stop")
+        stop_launcher()
+
+
 class AEADirTask(AbstractExecutorTask):
     """Task to run agent from agent configuration directory."""
 
@@ -250,6 +345,74 @@ class AEADirMultiprocessTask(AbstractMultiprocessExecutorTask):
             )
 
 
+class AEAShardTask(AbstractMultiprocessExecutorTask):
+    """
+    Task to run a shard of agents, from their configuration directories, in one process.
+
+    Version for supervised process executor mode.
+    """
+
+    def __init__(
+        self,
+        agent_dirs: Sequence[Union[PathLike, str]],
+        log_level: Optional[str] = None,
+        password: Optional[str] = None,
+        report_interval: float = DEFAULT_LOAD_REPORT_INTERVAL,
+    ) -> None:
+        """
+        Init aea config dirs task.
+
+        :param agent_dirs: directories with aea config.
+        :param log_level: debug level applied for AEA in subprocess
+        :param password: the password to encrypt/decrypt the private key.
+        :param report_interval: the time between two load reports of the subprocess, in seconds.
+        """
+        self._agent_dirs = tuple(agent_dirs)
+        self._stop_event = multiprocessing.Event()
+        self._load = multiprocessing.Array("d", 2)
+        self._log_level = log_level
+        self._password = password
+        self._report_interval = report_interval
+        super().__init__()
+
+    @property
+    def id(self) -> Tuple[Union[PathLike, str], ...]:
+        """Return agent_dirs."""
+        return self._agent_dirs
+
+    @property
+    def load(self) -> Dict[str, float]:
+        """Get the CPU usage, in percent, and the memory usage, in MB, last reported by the subprocess."""
+        with self._load.get_lock():
+            return {"cpu_percent": self._load[0], "memory_mb": self._load[1]}
+
+    def start(self) -> Tuple[Callable, Sequence[Any]]:
+        """Return function and arguments to call within subprocess."""
+        with self._load.get_lock():
+            self._load[:] = [0.0, 0.0]
+        return (
+            _run_shard,
+            (
+                self._agent_dirs,
+                self._stop_event,
+                self._load,
+                self._log_level,
+                self._password,
+                self._report_interval,
+            ),
+        )
+
+    def stop(self) -> None:
+        """Stop task."""
+        if not self._future:  # pragma: nocover
+            _default_logger.debug("Stop called, but no future set.")
+            return
+        if self._future.done():
+            _default_logger.debug("Stop called, but task is already done.")
+            return
+        self._stop_event.set()
+
+
 class AEALauncher(AbstractMultipleRunner):
     """Run multiple AEA instances."""
 
@@ -257,6 +420,7 @@ class AEALauncher(AbstractMultipleRunner):
         "threaded": ThreadExecutor,
         "async": AsyncExecutor,
         "multiprocess": ProcessExecutor,
+        SHARDED_MODE: SupervisedProcessExecutor,
     }
 
     def __init__(
@@ -266,23 +430,114 @@ class AEALauncher(AbstractMultipleRunner):
         fail_policy: ExecutorExceptionPolicies = ExecutorExceptionPolicies.propagate,
         log_level: Optional[str] = None,
         password: Optional[str] = None,
+        agents_per_shard: Optional[int] = None,
+        max_restarts: int = SupervisedProcessExecutor.DEFAULT_MAX_RESTARTS,
     ) -> None:
         """
         Init AEALauncher.
 
+        In sharded mode, the agents are packed in shards, each run by one
+        subprocess with the agents in threads. By default, there is one shard per
+        CPU. A shard exiting with an error is restarted with backoff, up to
+        max_restarts consecutive times.
+
         :param agent_dirs: sequence of AEA config directories.
         :param mode: executor name to use.
         :param fail_policy: one of ExecutorExceptionPolicies to be used with Executor
         :param log_level: debug level applied for AEA in subprocesses
         :param password: the password to encrypt/decrypt the private key.
+        :param agents_per_shard: the number of agents per shard, in sharded mode.
+        :param max_restarts: the number of consecutive restarts of a failing shard, in sharded mode.
         """
+        if agents_per_shard is not None and agents_per_shard < 1:
+            raise ValueError("The number of agents per shard must be at least one.")
         self._agent_dirs = agent_dirs
         self._log_level = log_level
         self._password = password
+        self._agents_per_shard = agents_per_shard or max(
+            1, math.ceil(len(agent_dirs) / (os.cpu_count() or 1))
+        )
+        self._max_restarts = max_restarts
+        self._shards: List[AEAShardTask] = []
         super().__init__(mode=mode, fail_policy=fail_policy)
 
+    @property
+    def agents_per_shard(self) -> int:
+        """Get the number of agents per shard, by default to have one shard per CPU."""
+        return self._agents_per_shard
+
+    @property
+    def shards_load(self) -> List[Dict[str, Any]]:
+        """
+        Get the agents, the process id, the number of restarts and the load of each shard.
+
+        :return: the state of each shard, in sharded mode.
+        """
+        if self._mode != SHARDED_MODE:
+            raise ValueError("Shards are only available in sharded mode.")
+        executor = cast(SupervisedProcessExecutor, self._executor)
+        result = []
+        for shard in self._shards:
+            process = executor.get_process(shard)
+            result.append(
+                {
+                    "agents": list(shard.id),
+                    "pid": process.pid if process is not None else None,
+                    "is_alive": process is not None and process.is_alive(),
+                    "restarts": executor.get_restarts(shard),
+                    **shard.load,
+                }
+            )
+        return result
+
+    @property
+    def failed(self) -> Sequence[Any]:
+        """Return sequence of the failed agents."""
+        return self._get_agent_dirs(super().failed)
+
+    @property
+    def not_failed(self) -> Sequence[Any]:
+        """Return sequence of the agents which did not fail."""
+        return self._get_agent_dirs(super().not_failed)
+
+    def _get_agent_dirs(self, task_ids: Sequence[Any]) -> Sequence[Any]:
+        """Get the agent directories of the tasks, unpacking the shards."""
+        if self._mode != SHARDED_MODE:
+            return task_ids
+        return [agent_dir for task_id in task_ids for agent_dir in task_id]
+
+    def _make_executor(
+        self, mode: str, fail_policy: ExecutorExceptionPolicies
+    ) -> AbstractMultipleExecutor:
+        """
+        Make an executor instance to run agents with.
+
+        :param mode: executor mode to use.
+        :param fail_policy: one of ExecutorExceptionPolicies to be used with Executor
+
+        :return: aea executor instance
+        """
+        if mode != SHARDED_MODE:
+            return super()._make_executor(mode, fail_policy)
+        return SupervisedProcessExecutor(
+            tasks=self._make_tasks(),
+            task_fail_policy=fail_policy,
+            max_restarts=self._max_restarts,
+        )
+
     def _make_tasks(self) -> Sequence[AbstractExecutorTask]:
         """Make tasks to run with executor."""
+        if self._mode == SHARDED_MODE:
+            size = self.agents_per_shard
+            self._shards = [
+                AEAShardTask(
+                    self._agent_dirs[i : i + size],
+                    log_level=self._log_level,
+                    password=self._password,
+                )
+                for i in range(0, len(self._agent_dirs), size)
+            ]
+            return self._shards
         if self._mode == "multiprocess":
             return [
                 AEADirMultiprocessTask(
@@ -19,19 +19,30 @@
 """Mail module abstract base classes."""
 
 import logging
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union, cast
 from urllib.parse import urlparse
 
 from aea.common import Address
 from aea.configurations.base import PublicId
 from aea.exceptions import enforce
+from aea.helpers.protobuf_framing import (
+    ProtobufWriter,
+    WIRE_TYPE_LENGTH_DELIMITED,
+    WIRE_TYPE_VARINT,
+    decode_int32,
+    decode_string,
+    iter_fields,
+)
 from aea.mail import base_pb2
 from aea.protocols.base import Message
 
 
 _default_logger = logging.getLogger(__name__)
 
+_EMPTY_VALUE = memoryview(b"")
+
 
 class URI:
     """URI following RFC3986."""
@@ -197,7 +208,25 @@ class EnvelopeSerializer(ABC):
 
 
 class ProtobufEnvelopeSerializer(EnvelopeSerializer):
-    """Envelope serializer using Protobuf."""
+    """
+    Envelope serializer using Protobuf.
+
+    The envelope is framed field by field, following the Envelope message of base.proto,
+    so the message is copied once into the encoded envelope, and the fields are read
+    from the encoded envelope without copying it.
+    """
+
+    TO_FIELD = base_pb2.Envelope.DESCRIPTOR.fields_by_name["to"].number
+    SENDER_FIELD = base_pb2.Envelope.DESCRIPTOR.fields_by_name["sender"].number
+    PROTOCOL_ID_FIELD = base_pb2.Envelope.DESCRIPTOR.fields_by_name[
+        "protocol_id"
+    ].number
+    MESSAGE_FIELD = base_pb2.Envelope.DESCRIPTOR.fields_by_name["message"].number
+    URI_FIELD = base_pb2.Envelope.DESCRIPTOR.fields_by_name["uri"].number
+
+    def __init__(self) -> None:
+        """Initialize the serializer."""
+        self._local = threading.local()
 
     def encode(self, envelope: "Envelope") -> bytes:
         """
@@ -206,16 +235,34 @@ class ProtobufEnvelopeSerializer(EnvelopeSerializer):
         :param envelope: the envelope to encode
         :return: the encoded envelope
         """
-        envelope_pb = base_pb2.Envelope()
-        envelope_pb.to = envelope.to
-        envelope_pb.sender = envelope.sender
-        envelope_pb.protocol_id = str(envelope.protocol_specification_id)
-        envelope_pb.message = envelope.message_bytes
-        if envelope.context is not None and envelope.context.uri is not None:
-            envelope_pb.uri = str(envelope.context.uri)
+        writer = getattr(self._local, "writer", None)
+        if writer is None:
+            writer = self._local.writer = ProtobufWriter()
+        try:
+            self.write(writer, envelope)
+            return writer.getvalue()
+        finally:
+            writer.reset()
 
-        envelope_bytes = envelope_pb.SerializeToString()
-        return envelope_bytes
+    @classmethod
+    def write(cls, writer: ProtobufWriter, envelope: "Envelope") -> None:
+        """
+        Write the fields of the envelope.
+
+        The writer can then wrap the envelope in an enclosing message, without encoding it first.
+
+        :param writer: the writer
+        :param envelope: the envelope to write
+        """
+        message = envelope.message_bytes
+        writer.write_string(cls.TO_FIELD, envelope.to)
+        writer.write_string(cls.SENDER_FIELD, envelope.sender)
+        writer.write_string(
+            cls.PROTOCOL_ID_FIELD, str(envelope.protocol_specification_id)
+        )
+        writer.write_bytes(cls.MESSAGE_FIELD, message)
+        if envelope.context is not None and envelope.context.uri is not None:
+            writer.write_string(cls.URI_FIELD, str(envelope.context.uri))
 
     def decode(self, envelope_bytes: bytes) -> "Envelope":
         """
@@ -223,19 +270,23 @@ class ProtobufEnvelopeSerializer(EnvelopeSerializer):
 
         The default serializer doesn't decode the message field.
 
-        :param envelope_bytes: the encoded envelope
+        :param envelope_bytes: the encoded envelope, as bytes or as a memoryview on a larger buffer
         :return: the envelope
         """
-        envelope_pb = base_pb2.Envelope()
-        envelope_pb.ParseFromString(envelope_bytes)
-
-        to = envelope_pb.to  # pylint: disable=no-member
-        sender = envelope_pb.sender  # pylint: disable=no-member
-        raw_protocol_id = envelope_pb.protocol_id  # pylint: disable=no-member
+        fields: Dict[int, memoryview] = {}
+        for field_number, wire_type, value in iter_fields(envelope_bytes):
+            if wire_type == WIRE_TYPE_LENGTH_DELIMITED:
+                fields[field_number] = cast(memoryview, value)
+
+        to = decode_string(fields.get(self.TO_FIELD, _EMPTY_VALUE))
+        sender = decode_string(fields.get(self.SENDER_FIELD, _EMPTY_VALUE))
+        raw_protocol_id = decode_string(
+            fields.get(self.PROTOCOL_ID_FIELD, _EMPTY_VALUE)
+        )
         protocol_specification_id = PublicId.from_str(raw_protocol_id)
-        message = envelope_pb.message  # pylint: disable=no-member
+        message = bytes(fields.get(self.MESSAGE_FIELD, _EMPTY_VALUE))
 
-        uri_raw = envelope_pb.uri  # pylint: disable=no-member
+        uri_raw = decode_string(fields.get(self.URI_FIELD, _EMPTY_VALUE))
         if uri_raw != "":  # empty string means this field is not set in proto3
             uri = URI(uri_raw=uri_raw)
             context = EnvelopeContext(uri=uri)
@@ -260,6 +311,80 @@ class ProtobufEnvelopeSerializer(EnvelopeSerializer):
 DefaultEnvelopeSerializer = ProtobufEnvelopeSerializer
 
 
+_MESSAGE_FIELDS = base_pb2.Message.DESCRIPTOR.fields_by_name
+_DIALOGUE_MESSAGE_FIELDS = base_pb2.DialogueMessage.DESCRIPTOR.fields_by_name
+_BODY_FIELD = _MESSAGE_FIELDS["body"].number
+_DIALOGUE_MESSAGE_FIELD = _MESSAGE_FIELDS["dialogue_message"].number
+_MESSAGE_ID_FIELD = _DIALOGUE_MESSAGE_FIELDS["message_id"].number
+_STARTER_REFERENCE_FIELD = _DIALOGUE_MESSAGE_FIELDS["dialogue_starter_reference"].number
+_RESPONDER_REFERENCE_FIELD = _DIALOGUE_MESSAGE_FIELDS[
+    "dialogue_responder_reference"
+].number
+_TARGET_FIELD = _DIALOGUE_MESSAGE_FIELDS["target"].number
+_CONTENT_FIELD = _DIALOGUE_MESSAGE_FIELDS["content"].number
+
+
+def encode_dialogue_message(
+    message_id: int, dialogue_reference: Tuple[str, str], target: int, content: bytes
+) -> bytes:
+    """
+    Encode a message of a protocol, as the dialogue message of base.proto.
+
+    The dialogue message is written around the content in one pass, so the content is copied once.
+
+    :param message_id: the message id
+    :param dialogue_reference: the dialogue reference
+    :param target: the target
+    :param content: the encoded protocol-specific content of the message
+    :return: the encoded message
+    """
+    writer = ProtobufWriter()
+    writer.write_int32(_MESSAGE_ID_FIELD, message_id)
+    writer.write_string(_STARTER_REFERENCE_FIELD, dialogue_reference[0])
+    writer.write_string(_RESPONDER_REFERENCE_FIELD, dialogue_reference[1])
+    writer.write_int32(_TARGET_FIELD, target)
+    writer.write_bytes(_CONTENT_FIELD, content)
+    writer.wrap(_DIALOGUE_MESSAGE_FIELD)
+    return writer.getvalue()
+
+
+def decode_dialogue_message(
+    message_bytes: bytes,
+) -> Tuple[int, Tuple[str, str], int, memoryview]:
+    """
+    Decode a message of a protocol, encoded as the dialogue message of base.proto.
+
+    :param message_bytes: the encoded message
+    :return: the message id, the dialogue reference, the target and the protocol-specific content, as a memoryview on the encoded message
+    """
+    dialogue_message = _EMPTY_VALUE
+    for field_number, wire_type, value in iter_fields(message_bytes):
+        if wire_type != WIRE_TYPE_LENGTH_DELIMITED:
+            continue
+        if field_number == _DIALOGUE_MESSAGE_FIELD:
+            dialogue_message = cast(memoryview, value)
+        elif field_number == _BODY_FIELD:
+            dialogue_message = _EMPTY_VALUE
+
+    message_id = target = 0
+    starter_reference = responder_reference = ""
+    content = _EMPTY_VALUE
+    for field_number, wire_type, value in iter_fields(dialogue_message):
+        if wire_type == WIRE_TYPE_VARINT:
+            if field_number == _MESSAGE_ID_FIELD:
+                message_id = decode_int32(cast(int, value))
+            elif field_number == _TARGET_FIELD:
+                target = decode_int32(cast(int, value))
+        elif wire_type == WIRE_TYPE_LENGTH_DELIMITED:
+            if field_number == _STARTER_REFERENCE_FIELD:
+                starter_reference = decode_string(cast(memoryview, value))
+            elif field_number == _RESPONDER_REFERENCE_FIELD:
+                responder_reference = decode_string(cast(memoryview, value))
+            elif field_number == _CONTENT_FIELD:
+                content = cast(memoryview, value)
+    return message_id, (starter_reference, responder_reference), target, content
+
+
 class Envelope:
     """The top level message class for agent to agent communication."""
 
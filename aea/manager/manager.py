@@ -39,6 +39,7 @@ from aea.configurations.data_types import PackageIdPrefix, PublicId
 from aea.exceptions import enforce
 from aea.helpers.io import open_file
 from aea.manager.project import AgentAlias, Project
+from aea.manager.shared import SharedAgentResources
 from aea.manager.utils import (
     get_venv_dir_for_project,
     project_check,
@@ -326,16 +327,18 @@ class AgentRunProcessTask(BaseAgentRunTask):
 ASYNC_MODE = "async"
 THREADED_MODE = "threaded"
 MULTIPROCESS_MODE = "multiprocess"
+DENSE_MODE = "dense"
 
 
 class MultiAgentManager:
     """Multi agents manager."""
 
-    MODES = [ASYNC_MODE, THREADED_MODE, MULTIPROCESS_MODE]
+    MODES = [ASYNC_MODE, THREADED_MODE, MULTIPROCESS_MODE, DENSE_MODE]
     _MODE_TASK_CLASS = {
         ASYNC_MODE: AgentRunAsyncTask,
         THREADED_MODE: AgentRunThreadTask,
         MULTIPROCESS_MODE: AgentRunProcessTask,
+        DENSE_MODE: AgentRunAsyncTask,
     }
     DEFAULT_TIMEOUT_FOR_BLOCKING_OPERATIONS = 60
     VENV_BUILD_TIMEOUT = 240
@@ -348,15 +351,21 @@ class MultiAgentManager:
         registry_path: str = DEFAULT_REGISTRY_NAME,
         auto_add_remove_project: bool = False,
         password: Optional[str] = None,
+        max_workers: Optional[int] = None,
     ) -> None:
         """
         Initialize manager.
 
+        In dense mode, the agents run on the event loop of the manager, like in
+        async mode, and moreover share one bounded thread pool for their task
+        managers, one for their decision makers, and one thread for their storages.
+
         :param working_dir: directory to store base agents.
-        :param mode: str. async or threaded
+        :param mode: str. async, threaded, multiprocess or dense
         :param registry_path: str. path to the local packages registry
         :param auto_add_remove_project: bool. add/remove project on the first agent add/last agent remove
         :param password: the password to encrypt/decrypt the private key.
+        :param max_workers: the number of threads running the tasks of the agents in dense mode.
         """
         self.working_dir = working_dir
         self._auto_add_remove_project = auto_add_remove_project
@@ -396,6 +405,9 @@ class MultiAgentManager:
         self._started_event = threading.Event()
         self._mode = mode
         self._password = password
+        self._shared_resources: Optional[SharedAgentResources] = (
+            SharedAgentResources(max_workers) if mode == DENSE_MODE else None
+        )
 
         # this flags will control whether we have already printed the warning message
         # for a certain agent
@@ -508,6 +520,9 @@ class MultiAgentManager:
         self._ensure_working_dir()
         self._last_start_status = self._load_state(local=local, remote=remote)
 
+        if self._shared_resources is not None:
+            self._shared_resources.start()
+
         self._started_event.clear()
         self._is_running = True
         self._thread = Thread(target=self._run_thread, daemon=True)
@@ -570,6 +585,9 @@ class MultiAgentManager:
         if self._thread.ident != threading.get_ident():
             self._thread.join(self.DEFAULT_TIMEOUT_FOR_BLOCKING_OPERATIONS)
 
+        if self._shared_resources is not None:
+            self._shared_resources.stop()
+
         self._thread = None
         self._warning_message_printed_for_agent = {}
         return self
@@ -900,6 +918,8 @@ class MultiAgentManager:
             task = task_cls(agent_alias, self._loop)
         else:
             agent = agent_alias.get_aea_instance()
+            if self._shared_resources is not None:
+                self._shared_resources.adopt(agent)
             task = task_cls(agent, self._loop)
 
         self._agents_tasks[agent_name] = task
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2023 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the resources shared by the agents hosted on one event loop."""
+import asyncio
+import os
+import threading
+from concurrent.futures import Future
+from concurrent.futures.thread import ThreadPoolExecutor
+from contextlib import suppress
+from multiprocessing.pool import ThreadPool
+from typing import Any, Awaitable, Coroutine, Optional, Union
+
+from aea.aea import AEA
+from aea.helpers.async_utils import ready_future
+from aea.helpers.storage.backends.sqlite import SqliteStorageBackend
+from aea.helpers.storage.generic_storage import Storage
+
+
+class _HostedStorage(Storage):
+    """A storage running on an event loop shared with other storages."""
+
+    def __init__(
+        self,
+        storage_uri: str,
+        loop: asyncio.AbstractEventLoop,
+        executor: ThreadPoolExecutor,
+    ) -> None:
+        """
+        Init storage.
+
+        :param storage_uri: configuration string for storage.
+        :param loop: the event loop shared by the storages, run by another thread.
+        :param executor: the single worker executor shared by the SQLite backends.
+        """
+        super().__init__(storage_uri, loop=loop)
+        if isinstance(self._backend, SqliteStorageBackend):
+            self._backend.set_executor(executor)
+
+    @property
+    def _host_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the event loop of the storages."""
+        if self._loop is None:  # pragma: nocover
+            raise ValueError("Loop not set!")
+        return self._loop
+
+    def _run_on_host_loop(self, coro: Coroutine) -> "Future[Any]":
+        """Run a coroutine on the event loop of the storages."""
+        return asyncio.run_coroutine_threadsafe(coro, self._host_loop)
+
+    def start(self) -> bool:
+        """
+        Start the storage on the event loop of the storages.
+
+        Return once the storage task is created, so the storage can be stopped
+        or waited for right away. Use wait_connected to wait it is connected.
+
+        :return: bool started or not.
+        """
+
+        async def start() -> bool:
+            return Storage.start(self)
+
+        with suppress(RuntimeError):
+            if asyncio.get_running_loop() is self._host_loop:  # pragma: nocover
+                return Storage.start(self)
+        return self._run_on_host_loop(start()).result()
+
+    async def wait_connected(self) -> None:
+        """
+        Wait the storage is connected, on the event loop of the storages.
+
+        :raises ValueError: if the storage stopped before it was connected.
+        """
+
+        async def wait() -> None:
+            if self._task is None:  # pragma: nocover
+                raise ValueError("Storage not started!")
+            connected = asyncio.ensure_future(Storage.wait_connected(self))
+            try:
+                await asyncio.wait(
+                    (connected, self._task), return_when=asyncio.FIRST_COMPLETED
+                )
+            finally:
+                connected.cancel()
+            if not self.is_connected:
+                raise ValueError("Storage stopped before it was connected!")
+
+        await asyncio.wrap_future(self._run_on_host_loop(wait()))
+
+    def wait_completed(
+        self, sync: bool = False, timeout: float = None, force_result: bool = False
+    ) -> Union[Coroutine, Awaitable]:
+        """
+        Wait the storage is stopped.
+
+        :param sync: bool. blocking wait
+        :param timeout: float seconds
+        :param force_result: check result even it was waited.
+
+        :return: awaitable if sync is False, otherwise None
+        """
+
+        async def wait() -> None:
+            await Storage.wait_completed(self, timeout=timeout, force_result=force_result)  # type: ignore
+
+        future = self._run_on_host_loop(wait())
+        if sync:
+            future.result(timeout)
+            return ready_future
+        return asyncio.wrap_future(future)
+
+
+class SharedAgentResources:
+    """
+    Resources shared by the agents hosted on one event loop.
+
+    The tasks of the task managers of the agents run on one bounded thread
+    pool, and their decision makers on another one, so that long tasks cannot
+    hold up the decision makers. The storages run on one thread, and the
+    queries of the SQLite storages are run by a single worker. Each agent keeps
+    its own queues, tasks and storage, so its state and its failures remain
+    its own.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        decision_maker_workers: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the shared resources.
+
+        :param max_workers: the number of threads of the task pool, by default the number of CPUs plus four.
+        :param decision_maker_workers: the number of threads of the decision maker pool, by default the number of CPUs.
+        """
+        self._max_workers = max_workers or (os.cpu_count() or 1) + 4
+        self._decision_maker_workers = decision_maker_workers or os.cpu_count() or 1
+        self._lock = threading.Lock()
+        self._task_pool: Optional[ThreadPool] = None
+        self._decision_maker_pool: Optional[ThreadPool] = None
+        self._storage_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._storage_thread: Optional[threading.Thread] = None
+        self._storage_executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def max_workers(self) -> int:
+        """Get the number of threads of the task pool."""
+        return self._max_workers
+
+    @property
+    def decision_maker_workers(self) -> int:
+        """Get the number of threads of the decision maker pool."""
+        return self._decision_maker_workers
+
+    @property
+    def is_started(self) -> bool:
+        """Check whether the shared resources are started."""
+        return self._task_pool is not None
+
+    @property
+    def task_pool(self) -> ThreadPool:
+        """Get the thread pool shared by the task managers."""
+        if self._task_pool is None:
+            raise ValueError("Shared resources not started!")
+        return self._task_pool
+
+    @property
+    def decision_maker_pool(self) -> ThreadPool:
+        """Get the thread pool shared by the decision makers."""
+        if self._decision_maker_pool is None:
+            raise ValueError("Shared resources not started!")
+        return self._decision_maker_pool
+
+    def start(self) -> None:
+        """Start the thread pools and the storage thread."""
+        with self._lock:
+            if self._task_pool is not None:
+                return
+            self._task_pool = ThreadPool(self._max_workers)
+            self._decision_maker_pool = ThreadPool(self._decision_maker_workers)
+            self._storage_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="SharedStorageBackend"
+            )
+            self._storage_loop = asyncio.new_event_loop()
+            self._storage_thread = threading.Thread(
+                target=self._storage_loop.run_forever,
+                name="SharedStorage",
+                daemon=True,
+            )
+            self._storage_thread.start()
+
+    def stop(self) -> None:
+        """Stop the thread pools and the storage thread, once the agents are stopped."""
+        with self._lock:
+            if self._task_pool is None:
+                return
+            for pool in (self._task_pool, self._decision_maker_pool):
+                if pool is not None:
+                    pool.terminate()
+                    pool.join()
+            self._task_pool = None
+            self._decision_maker_pool = None
+            if self._storage_loop is not None and self._storage_thread is not None:
+                self._storage_loop.call_soon_threadsafe(self._storage_loop.stop)
+                self._storage_thread.join()
+                self._storage_loop.close()
+            self._storage_loop = None
+            self._storage_thread = None
+            if self._storage_executor is not None:
+                self._storage_executor.shutdown()
+            self._storage_executor = None
+
+    def adopt(self, agent: AEA) -> None:
+        """
+        Set an agent, before it runs, to use the shared resources.
+
+        :param agent: the agent.
+        """
+        runtime = agent.runtime
+        runtime.task_manager.set_pool(self.task_pool)
+        runtime.decision_maker.set_pool(self.decision_maker_pool)
+        if agent.storage_uri and runtime.storage is not None:
+            runtime.set_storage(self._make_storage(agent.storage_uri))
+
+    def _make_storage(self, storage_uri: str) -> Storage:
+        """Make a storage running on the shared storage thread."""
+        if self._storage_loop is None or self._storage_executor is None:
+            raise ValueError("Shared resources not started!")
+        return _HostedStorage(storage_uri, self._storage_loop, self._storage_executor)
+
+    def __enter__(self) -> "SharedAgentResources":
+        """Start the shared resources."""
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Stop the shared resources."""
+        self.stop()
@@ -21,15 +21,20 @@ import asyncio
 import queue
 import threading
 from asyncio.events import AbstractEventLoop
+from collections import defaultdict, deque
+from concurrent.futures import Future
 from concurrent.futures._base import CancelledError
 from concurrent.futures._base import TimeoutError as FuturesTimeoutError
 from contextlib import suppress
+from functools import partial
 from typing import (
     Any,
     Callable,
     Collection,
+    Deque,
     Dict,
     List,
+    NamedTuple,
     Optional,
     Sequence,
     Tuple,
@@ -42,9 +47,17 @@ from aea.configurations.base import PublicId
 from aea.connections.base import Connection, ConnectionStates
 from aea.exceptions import enforce
 from aea.helpers.async_friendly_queue import AsyncFriendlyQueue
-from aea.helpers.async_utils import AsyncState, Runnable, ThreadedAsyncRunner
+from aea.helpers.async_utils import (
+    AnotherThreadTask,
+    AsyncState,
+    Runnable,
+    ThreadedAsyncRunner,
+)
 from aea.helpers.exception_policy import ExceptionPolicyEnum
 from aea.helpers.logging import WithLogger, get_logger
+from aea.helpers.metrics import metrics
+from aea.helpers.overflow_policy import OverflowPolicyEnum, QueueLimit
+from aea.helpers.priority_lanes import DEFAULT_LANE, PriorityLane, WeightedFairLanes
 from aea.mail.base import AEAConnectionError, Empty, Envelope, EnvelopeContext
 from aea.protocols.base import Message, Protocol
 
@@ -79,12 +92,194 @@ class MultiplexerStatus(AsyncState):
         return self.get() == ConnectionStates.disconnecting
 
 
+class _ReceivedEnvelope(NamedTuple):
+    """An envelope and the connection it was received from."""
+
+    envelope: Envelope
+    connection_id: PublicId
+
+
+class InboxQueue(AsyncFriendlyQueue):
+    """
+    Queue of the received envelopes.
+
+    It counts the envelopes waiting from each connection, so that a connection can
+    be given a capacity of its own within the capacity of the queue, and it keeps
+    the envelopes in priority lanes, dequeued in weighted round robin.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        connection_capacities: Optional[Dict[PublicId, int]] = None,
+        lanes: Optional[WeightedFairLanes] = None,
+        get_lane: Optional[Callable[[Envelope], str]] = None,
+    ) -> None:
+        """
+        Initialize the queue.
+
+        :param maxsize: the capacity of the queue, 0 for no limit.
+        :param connection_capacities: the capacities of the connections, by connection id without version.
+        :param lanes: the priority lanes of the envelopes, the default lane alone if None.
+        :param get_lane: get the lane of an envelope, the default lane if None.
+        """
+        self._lanes = lanes if lanes is not None else WeightedFairLanes()
+        self._get_lane = get_lane
+        super().__init__(maxsize)
+        self._connection_capacities = connection_capacities or {}
+        self._sources: Dict[int, PublicId] = {}
+        self._counts: Dict[PublicId, int] = defaultdict(int)
+
+    @property
+    def lanes(self) -> WeightedFairLanes:
+        """Get the priority lanes of the envelopes."""
+        return self._lanes
+
+    def put_received(self, envelope: Envelope, connection_id: PublicId) -> None:
+        """
+        Put an envelope received from a connection, without waiting.
+
+        :param envelope: the envelope
+        :param connection_id: the id of the connection, without version
+        :raises queue.Full: if the queue is full.
+        """
+        self.put_nowait(_ReceivedEnvelope(envelope, connection_id))
+
+    def count(self, connection_id: PublicId) -> int:
+        """
+        Get the number of envelopes waiting from a connection.
+
+        :param connection_id: the id of the connection, without version
+        :return: the number of envelopes
+        """
+        return self._counts.get(connection_id, 0)
+
+    def is_full_for(self, connection_id: PublicId) -> bool:
+        """
+        Check whether the queue has no room for an envelope from a connection.
+
+        :param connection_id: the id of the connection, without version
+        :return: whether the queue, or the share of the connection, is full
+        """
+        capacity = self._connection_capacities.get(connection_id, 0)
+        return self.full() or 0 < capacity <= self.count(connection_id)
+
+    async def async_wait_room_for(self, connection_id: PublicId) -> None:
+        """
+        Wait for room for an envelope from a connection.
+
+        :param connection_id: the id of the connection, without version
+        """
+        await self.async_wait_until(lambda: not self.is_full_for(connection_id))
+
+    def drop_oldest(
+        self, connection_id: Optional[PublicId] = None
+    ) -> Optional[Envelope]:
+        """
+        Remove the oldest envelope, from a connection if given and any.
+
+        :param connection_id: the id of the connection, without version
+        :return: the envelope removed, if any
+        """
+        with self.mutex:
+            predicate = None
+            if connection_id is not None and self.count(connection_id) > 0:
+                predicate = (  # noqa: E731
+                    lambda item: self._sources.get(id(item)) == connection_id
+                )
+            try:
+                envelope = self._lanes.remove_oldest(predicate)
+            except IndexError:
+                return None
+            self._forget(envelope)
+            self.unfinished_tasks -= 1
+            self.not_full.notify()
+        self._notify_get_waiters()
+        return envelope
+
+    def _init(self, maxsize: int) -> None:
+        """Initialize the storage of the queue with the priority lanes."""
+        self.queue = self._lanes  # type: ignore
+
+    def _put(self, item: Any) -> None:
+        """Put an item in its lane, recording the connection of the received envelopes."""
+        if isinstance(item, _ReceivedEnvelope):
+            self._sources[id(item.envelope)] = item.connection_id
+            self._counts[item.connection_id] += 1
+            item = item.envelope
+        lane = self._get_lane(item) if self._get_lane is not None else DEFAULT_LANE
+        self._lanes.append(item, lane)
+
+    def _get(self) -> Any:
+        """Get an item, forgetting its connection."""
+        item = super()._get()  # type: ignore
+        self._forget(item)
+        return item
+
+    def _forget(self, item: Any) -> None:
+        """Forget the connection of an item."""
+        connection_id = self._sources.pop(id(item), None)
+        if connection_id is not None:
+            self._counts[connection_id] -= 1
+
+
+class OutboxQueue(asyncio.Queue):
+    """Queue of the envelopes to send, kept in priority lanes dequeued in weighted round robin."""
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        lanes: Optional[WeightedFairLanes] = None,
+        get_lane: Optional[Callable[[Envelope], str]] = None,
+    ) -> None:
+        """
+        Initialize the queue.
+
+        :param maxsize: the capacity of the queue, 0 for no limit.
+        :param lanes: the priority lanes of the envelopes, the default lane alone if None.
+        :param get_lane: get the lane of an envelope, the default lane if None.
+        """
+        self._lanes = lanes if lanes is not None else WeightedFairLanes()
+        self._get_lane = get_lane
+        super().__init__(maxsize)
+
+    @property
+    def lanes(self) -> WeightedFairLanes:
+        """Get the priority lanes of the envelopes."""
+        return self._lanes
+
+    def drop_oldest(self) -> Optional[Envelope]:
+        """
+        Remove the envelope that was put first.
+
+        :return: the envelope removed
+        :raises IndexError: if the queue is empty.
+        """
+        envelope = self._lanes.remove_oldest()
+        self._wakeup_next(self._putters)  # type: ignore
+        return envelope
+
+    def _init(self, maxsize: int) -> None:
+        """Initialize the storage of the queue with the priority lanes."""
+        self._queue = self._lanes
+
+    def _put(self, item: Any) -> None:
+        """Put an item in its lane, the stop token in the default lane."""
+        lane = (
+            self._get_lane(item)
+            if item is not None and self._get_lane is not None
+            else DEFAULT_LANE
+        )
+        self._lanes.append(item, lane)
+
+
 class AsyncMultiplexer(Runnable, WithLogger):
     """This class can handle multiple connections at once."""
 
     DISCONNECT_TIMEOUT = 5
     CONNECT_TIMEOUT = 60
     SEND_TIMEOUT = 60
+    PUT_TIMEOUT = 60
 
     _lock: asyncio.Lock
 
@@ -99,6 +294,14 @@ class AsyncMultiplexer(Runnable, WithLogger):
         default_routing: Optional[Dict[PublicId, PublicId]] = None,
         default_connection: Optional[PublicId] = None,
         protocols: Optional[List[Union[Protocol, Message]]] = None,
+        inbox_limit: Optional[QueueLimit] = None,
+        outbox_limit: Optional[QueueLimit] = None,
+        connection_limits: Optional[Dict[PublicId, QueueLimit]] = None,
+        envelope_rejected_callback: Optional[Callable[[Envelope], None]] = None,
+        priority_lanes: Optional[Sequence[PriorityLane]] = None,
+        get_skill_protocols: Optional[
+            Callable[[PublicId], Collection[PublicId]]
+        ] = None,
     ) -> None:
         """
         Initialize the connection multiplexer.
@@ -114,10 +317,17 @@ class AsyncMultiplexer(Runnable, WithLogger):
         :param default_routing: default routing map
         :param default_connection: default connection
         :param protocols: protocols used
+        :param inbox_limit: the capacity and overflow policy of the queue of the received envelopes.
+        :param outbox_limit: the capacity and overflow policy of the queue of the envelopes to send.
+        :param connection_limits: the capacity and overflow policy of the envelopes received from a connection, by connection id.
+        :param envelope_rejected_callback: called with the received envelopes rejected because the inbox is full.
+        :param priority_lanes: the priority lanes of the envelopes in the inbox and outbox. The envelopes of no lane go to the default lane, of weight 1 unless given.
+        :param get_skill_protocols: get the protocols handled by a skill, by skill id without version, to select the envelopes of the skill lanes.
         """
         self._exception_policy: ExceptionPolicyEnum = exception_policy
         logger = get_logger(__name__, agent_name)
         WithLogger.__init__(self, logger=logger)
+        self._agent_name = agent_name
         Runnable.__init__(self, loop=loop, threaded=threaded)
 
         self._connections: List[Connection] = []
@@ -153,8 +363,29 @@ class AsyncMultiplexer(Runnable, WithLogger):
         }
         self._routing_helper: Dict[Address, PublicId] = {}
 
-        self._in_queue = AsyncFriendlyQueue()  # type: AsyncFriendlyQueue
-        self._out_queue = None  # type: Optional[asyncio.Queue]
+        self._inbox_limit = inbox_limit or QueueLimit()
+        self._outbox_limit = outbox_limit or QueueLimit()
+        self._connection_limits = {
+            connection_id.to_any(): limit
+            for connection_id, limit in (connection_limits or {}).items()
+        }
+        self._envelope_rejected_callback = envelope_rejected_callback
+        self._get_skill_protocols = get_skill_protocols
+        self._setup_priority_lanes(priority_lanes or [])
+        self._in_queue = InboxQueue(
+            self._inbox_limit.capacity,
+            {
+                connection_id: limit.capacity
+                for connection_id, limit in self._connection_limits.items()
+            },
+            WeightedFairLanes(
+                self._lane_weights, partial(self._on_lane_dequeue, "inbox")
+            ),
+            self._get_lane,
+        )  # type: InboxQueue
+        self._out_queue = None  # type: Optional[OutboxQueue]
+        self._outbox_held: Deque[Tuple[Envelope, asyncio.Future]] = deque()
+        self._outbox_release_task = None  # type: Optional[asyncio.Task]
 
         self._recv_loop_task = None  # type: Optional[asyncio.Task]
         self._send_loop_task = None  # type: Optional[asyncio.Task]
@@ -170,12 +401,12 @@ class AsyncMultiplexer(Runnable, WithLogger):
         return self._default_connection
 
     @property
-    def in_queue(self) -> AsyncFriendlyQueue:
+    def in_queue(self) -> InboxQueue:
         """Get the in queue."""
         return self._in_queue
 
     @property
-    def out_queue(self) -> asyncio.Queue:
+    def out_queue(self) -> OutboxQueue:
         """Get the out queue."""
         if self._out_queue is None:  # pragma: nocover
             raise ValueError("Accessing out queue before loop is started.")
@@ -303,7 +534,13 @@ class AsyncMultiplexer(Runnable, WithLogger):
         self.logger.debug("Multiplexer connecting...")
         self._connection_consistency_checks()
         self._set_default_connection_if_none()
-        self._out_queue = asyncio.Queue()
+        self._out_queue = OutboxQueue(
+            self._outbox_limit.capacity,
+            WeightedFairLanes(
+                self._lane_weights, partial(self._on_lane_dequeue, "outbox")
+            ),
+            self._get_lane,
+        )
 
         async with self._lock:
             if self.connection_status.is_connected:
@@ -318,6 +555,8 @@ class AsyncMultiplexer(Runnable, WithLogger):
                 else:  # pragma: nocover
                     raise AEAConnectionError("Failed to connect the multiplexer.")
 
+                if metrics.enabled:
+                    self._register_queue_gauges()
                 self._recv_loop_task = self._loop.create_task(self._receiving_loop())
                 self._send_loop_task = self._loop.create_task(self._send_loop())
                 self.logger.debug("Multiplexer connected and running.")
@@ -334,6 +573,28 @@ class AsyncMultiplexer(Runnable, WithLogger):
                     f"Failed to connect the multiplexer: Error: {repr(e)}"
                 ) from e
 
+    def _register_queue_gauges(self) -> None:
+        """Sample the depth of the inbox and outbox queues in the runtime metrics."""
+        metrics.gauge(
+            "aea_inbox_depth",
+            "Envelopes waiting in the inbox.",
+            agent=self._agent_name,
+        ).set_function(self._get_inbox_depth)
+        metrics.gauge(
+            "aea_outbox_depth",
+            "Envelopes waiting in the outbox.",
+            agent=self._agent_name,
+        ).set_function(self._get_outbox_depth)
+
+    def _get_inbox_depth(self) -> int:
+        """Get the number of envelopes in the inbox queue."""
+        return self.in_queue.qsize()
+
+    def _get_outbox_depth(self) -> int:
+        """Get the number of envelopes in the outbox queue, or held until it has room."""
+        depth = self._out_queue.qsize() if self._out_queue is not None else 0
+        return depth + len(self._outbox_held)
+
     async def disconnect(self) -> None:
         """Disconnect the multiplexer."""
         self.logger.debug("Multiplexer disconnecting...")
@@ -368,9 +629,22 @@ class AsyncMultiplexer(Runnable, WithLogger):
 
         self.logger.debug("Stopping send loop...")
 
+        if self._outbox_release_task:
+            self._outbox_release_task.cancel()
+            with suppress(Exception, asyncio.CancelledError):
+                await self._outbox_release_task
+        self._outbox_release_task = None
+        if self._outbox_held:
+            self.logger.warning(
+                f"Dropping {len(self._outbox_held)} envelopes held until the outbox had room."
+            )
+        while self._outbox_held:
+            self._outbox_held.popleft()[1].cancel()
+
         if self._send_loop_task:
             # send a 'stop' token (a None value) to wake up the coroutine waiting for outgoing envelopes.
-            await self.out_queue.put(None)
+            with suppress(asyncio.QueueFull):
+                self.out_queue.put_nowait(None)
             self._send_loop_task.cancel()
             with suppress(Exception, asyncio.CancelledError):
                 await self._send_loop_task
@@ -515,7 +789,8 @@ class AsyncMultiplexer(Runnable, WithLogger):
         """Process incoming envelopes."""
         self.logger.debug("Starting receving loop...")
         task_to_connection = {
-            asyncio.ensure_future(conn.receive()): conn for conn in self.connections
+            asyncio.ensure_future(self._receive(conn)): conn
+            for conn in self.connections
         }
 
         try:
@@ -527,14 +802,11 @@ class AsyncMultiplexer(Runnable, WithLogger):
                 # process completed receiving tasks.
                 for task in done:
                     connection = task_to_connection.pop(task)
-                    envelope = task.result()
-                    if envelope is not None:
-                        self._update_routing_helper(envelope, connection)
-                        self.in_queue.put_nowait(envelope)
+                    task.result()
 
                     # reinstantiate receiving task, but only if the connection is still up.
                     if connection.is_connected:
-                        new_task = asyncio.ensure_future(connection.receive())
+                        new_task = asyncio.ensure_future(self._receive(connection))
                         task_to_connection[new_task] = connection
 
         except asyncio.CancelledError:  # pragma: nocover
@@ -549,6 +821,75 @@ class AsyncMultiplexer(Runnable, WithLogger):
                 t.cancel()
             self.logger.debug("Receiving loop terminated.")
 
+    async def _receive(self, connection: Connection) -> None:
+        """
+        Receive an envelope from a connection and put it in the inbox.
+
+        When the inbox has no room for the envelope, the overflow policy of the
+        connection, or else of the inbox, applies. With the block policy, the
+        connection is not read again until the envelope is in the inbox.
+
+        :param connection: the connection
+        """
+        envelope = await connection.receive()
+        if envelope is None:
+            return
+        self._update_routing_helper(envelope, connection)
+        if metrics.enabled:
+            metrics.counter(
+                "aea_envelopes_received_total",
+                "Envelopes received, by connection.",
+                agent=self._agent_name,
+                connection=connection.connection_id,
+            ).inc()
+
+        connection_id = connection.connection_id.to_any()
+        policy = self._connection_limits.get(
+            connection_id, self._inbox_limit
+        ).overflow_policy
+        while True:
+            if self.in_queue.is_full_for(connection_id):
+                if policy == OverflowPolicyEnum.block:
+                    await self.in_queue.async_wait_room_for(connection_id)
+                elif policy == OverflowPolicyEnum.drop_oldest:
+                    dropped = self.in_queue.drop_oldest(connection_id)
+                    if dropped is not None:
+                        self._on_overflow(dropped, connection_id, policy)
+                else:
+                    self._on_overflow(envelope, connection_id, policy)
+                    return
+            with suppress(queue.Full):
+                self.in_queue.put_received(envelope, connection_id)
+                return
+
+    def _on_overflow(
+        self, envelope: Envelope, queue_id: Any, policy: OverflowPolicyEnum
+    ) -> None:
+        """
+        Handle an envelope dropped from, or not put in, a full queue.
+
+        :param envelope: the envelope
+        :param queue_id: the id of the connection, or the name of the queue, that overflowed
+        :param policy: the overflow policy applied
+        """
+        if metrics.enabled:
+            metrics.counter(
+                "aea_envelopes_dropped_total",
+                "Envelopes dropped from, or not put in, full queues.",
+                agent=self._agent_name,
+                queue=queue_id,
+                policy=policy.value,
+            ).inc()
+        if (
+            policy == OverflowPolicyEnum.reject
+            and self._envelope_rejected_callback is not None
+        ):
+            self._envelope_rejected_callback(envelope)
+            return
+        self.logger.warning(
+            f"Queue {queue_id} full, dropping envelope ({policy.value}): {envelope}"
+        )
+
     async def _send(self, envelope: Envelope) -> None:
         """
         Send an envelope.
@@ -578,6 +919,14 @@ class AsyncMultiplexer(Runnable, WithLogger):
             await asyncio.wait_for(connection.send(envelope), timeout=self.SEND_TIMEOUT)
         except Exception as e:  # pylint: disable=broad-except
             self._handle_exception(self._send, e)
+            return
+        if metrics.enabled:
+            metrics.counter(
+                "aea_envelopes_sent_total",
+                "Envelopes sent, by connection.",
+                agent=self._agent_name,
+                connection=connection.connection_id,
+            ).inc()
 
     def _get_connection_id_from_envelope(
         self, envelope: Envelope, envelope_protocol_id: PublicId
@@ -714,10 +1063,14 @@ class AsyncMultiplexer(Runnable, WithLogger):
 
         Notice that the output queue is an asyncio.Queue which uses an event loop
         running on a different thread than the one used in this function.
+        With the block policy, wait until the envelope is in the outbox.
 
         :param envelope: the envelope to be sent.
         """
-        await self.out_queue.put(envelope)
+        if self._must_hold():
+            await asyncio.shield(self._hold(envelope))
+            return
+        self._put_nowait(envelope)
 
     def put(self, envelope: Envelope) -> None:
         """
@@ -725,13 +1078,224 @@ class AsyncMultiplexer(Runnable, WithLogger):
 
         Notice that the output queue is an asyncio.Queue which uses an event loop
         running on a different thread than the one used in this function.
+        When the outbox is bounded, a call from another thread waits, for at most
+        PUT_TIMEOUT seconds, for the envelope to be queued, and so for room in the
+        outbox with the block policy.
+        A call from the thread of the event loop cannot wait: with the block
+        policy, an envelope that finds the outbox full is held, after the ones
+        already held, and put in the outbox as soon as there is room.
 
         :param envelope: the envelope to be sent.
         """
-        if self._threaded:
-            self._loop.call_soon_threadsafe(self.out_queue.put_nowait, envelope)
+        if not self._threaded or self._is_loop_thread():
+            self._put_nowait(envelope)
+        elif self._outbox_limit.is_bounded:
+            self._wait_queued(
+                asyncio.run_coroutine_threadsafe(self._put(envelope), self._loop)
+            )
         else:
+            self._loop.call_soon_threadsafe(self.out_queue.put_nowait, envelope)
+
+    def _wait_queued(self, future: Union[Future, AnotherThreadTask]) -> None:
+        """
+        Wait for an envelope put from another thread to be queued.
+
+        A stopped event loop cannot queue the envelope, so it is not waited for;
+        it is queued once the loop runs again.
+
+        :param future: the future of the put, running in the event loop.
+        :raises AEAConnectionError: if the envelope is not queued within PUT_TIMEOUT seconds,
+            e.g. because the multiplexer is disconnecting. The envelope is still queued once there is room.
+        """
+        if not self._loop.is_running():
+            return
+        try:
+            future.result(self.PUT_TIMEOUT)
+        except FuturesTimeoutError:
+            raise AEAConnectionError(
+                f"Envelope not queued within {self.PUT_TIMEOUT} seconds, the outbox is full (multiplexer connected: {self.is_connected})."
+            ) from None
+
+    def _put_nowait(self, envelope: Envelope) -> None:
+        """
+        Schedule an envelope for sending it, without waiting for room in the outbox.
+
+        With the block policy, an envelope that finds the outbox full is held
+        until there is room.
+
+        :param envelope: the envelope to be sent.
+        :raises asyncio.QueueFull: if the outbox is full and the policy is reject.
+        """
+        if self._must_hold():
+            self._hold(envelope)
+            return
+        if not self.out_queue.full():
             self.out_queue.put_nowait(envelope)
+            return
+        policy = self._outbox_limit.overflow_policy
+        if policy == OverflowPolicyEnum.reject:
+            raise asyncio.QueueFull(f"Outbox full, cannot put envelope: {envelope}")
+        if policy == OverflowPolicyEnum.drop_oldest:
+            dropped = self.out_queue.drop_oldest()
+            self.out_queue.put_nowait(envelope)
+            envelope = dropped
+        self._on_overflow(envelope, "outbox", policy)
+
+    def _must_hold(self) -> bool:
+        """
+        Check whether a new envelope must wait for room in the outbox, with the block policy.
+
+        The envelopes held keep their order: the next ones wait behind them.
+
+        :return: whether the envelope must be held.
+        """
+        return self._outbox_limit.overflow_policy == OverflowPolicyEnum.block and (
+            bool(self._outbox_held) or self.out_queue.full()
+        )
+
+    def _hold(self, envelope: Envelope) -> asyncio.Future:
+        """
+        Hold an envelope until there is room for it in the outbox.
+
+        :param envelope: the envelope to be sent.
+        :return: a future done once the envelope is in the outbox.
+        """
+        queued = self._loop.create_future()
+        self._outbox_held.append((envelope, queued))
+        if self._outbox_release_task is None or self._outbox_release_task.done():
+            self._outbox_release_task = self._loop.create_task(
+                self._release_held_envelopes()
+            )
+        return queued
+
+    async def _release_held_envelopes(self) -> None:
+        """Put the held envelopes in the outbox, in order, as it gets room."""
+        while self._outbox_held:
+            envelope, queued = self._outbox_held[0]
+            await self.out_queue.put(envelope)
+            self._outbox_held.popleft()
+            if not queued.done():
+                queued.set_result(None)
+
+    def _setup_priority_lanes(self, priority_lanes: Sequence[PriorityLane]) -> None:
+        """
+        Set up the priority lanes, served from the heaviest to the lightest in each round.
+
+        :param priority_lanes: the priority lanes.
+        """
+        lanes = list(priority_lanes)
+        if DEFAULT_LANE not in {lane.name for lane in lanes}:
+            lanes.append(PriorityLane(DEFAULT_LANE))
+        lanes.sort(key=lambda lane: -lane.weight)
+        self._lane_weights: Dict[str, int] = {}
+        self._protocol_lanes: Dict[PublicId, str] = {}
+        self._skill_lanes: Dict[PublicId, str] = {}
+        self._specification_id_to_lane: Dict[PublicId, str] = {}
+        for lane in lanes:
+            enforce(
+                lane.name not in self._lane_weights,
+                f"Priority lane {lane.name} defined twice.",
+            )
+            self._lane_weights[lane.name] = lane.weight
+            for ids, lane_by_id in (
+                (lane.protocols, self._protocol_lanes),
+                (lane.skills, self._skill_lanes),
+            ):
+                for public_id in ids:
+                    enforce(
+                        public_id not in lane_by_id,
+                        f"{public_id} is in priority lanes {lane_by_id.get(public_id)} and {lane.name}.",
+                    )
+                    lane_by_id[public_id] = lane.name
+
+    def update_skill_lanes(self) -> None:
+        """
+        Select again the lanes of the protocols handled by the skills.
+
+        To be called when the skills change, as the lane of a protocol is
+        selected once, on its first envelope.
+        """
+        self._specification_id_to_lane = {}
+
+    def _get_lane(self, envelope: Envelope) -> str:
+        """
+        Get the priority lane of an envelope.
+
+        An envelope between two skills goes to the lane of the skill it is sent
+        from or to. The other envelopes go to the lane of their protocol, else
+        to the lane of a skill handling their protocol, the heaviest one if
+        several do.
+
+        :param envelope: the envelope.
+        :return: the name of the lane.
+        """
+        if self._skill_lanes:
+            for address in (envelope.to, envelope.sender):
+                public_id = PublicId.try_from_str(address)
+                if public_id is not None and public_id.to_any() in self._skill_lanes:
+                    return self._skill_lanes[public_id.to_any()]
+        if not self._protocol_lanes and (
+            not self._skill_lanes or self._get_skill_protocols is None
+        ):
+            return DEFAULT_LANE
+        specification_id = envelope.protocol_specification_id
+        lane = self._specification_id_to_lane.get(specification_id)
+        if lane is None:
+            protocol_id = (
+                envelope.message.protocol_id
+                if isinstance(envelope.message, Message)
+                else self._specification_id_to_protocol_id.get(specification_id)
+            )
+            lane = (
+                self._get_protocol_lane(protocol_id)
+                if protocol_id is not None
+                else DEFAULT_LANE
+            )
+            self._specification_id_to_lane[specification_id] = lane
+        return lane
+
+    def _get_protocol_lane(self, protocol_id: PublicId) -> str:
+        """
+        Get the priority lane of the envelopes of a protocol: its lane, else the lane of a skill handling it.
+
+        :param protocol_id: the protocol id.
+        :return: the name of the lane.
+        """
+        protocol_id = protocol_id.to_any()
+        lane = self._protocol_lanes.get(protocol_id)
+        if lane is not None:
+            return lane
+        if self._get_skill_protocols is not None:
+            # the skill lanes are ordered from the heaviest
+            for skill_id, skill_lane in self._skill_lanes.items():
+                skill_protocols = self._get_skill_protocols(skill_id)
+                if protocol_id in {p.to_any() for p in skill_protocols}:
+                    return skill_lane
+        return DEFAULT_LANE
+
+    def _on_lane_dequeue(self, queue_name: str, lane: str, waited: float) -> None:
+        """
+        Record the time an envelope waited in its lane.
+
+        :param queue_name: the name of the queue.
+        :param lane: the name of the lane.
+        :param waited: the seconds the envelope waited.
+        """
+        if metrics.enabled:
+            metrics.histogram(
+                "aea_lane_wait_seconds",
+                "Seconds waited by the envelopes in the queues, by priority lane.",
+                agent=self._agent_name,
+                queue=queue_name,
+                lane=lane,
+            ).observe(waited)
+
+    def _is_loop_thread(self) -> bool:
+        """Check whether the event loop of the multiplexer runs in the current thread."""
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
 
     def _setup(
         self,
@@ -851,7 +1415,9 @@ class Multiplexer(AsyncMultiplexer):
 
         :param envelope: the envelope to be sent.
         """
-        self._thread_runner.call(super()._put(envelope))  # .result(240)
+        future = self._thread_runner.call(super()._put(envelope))
+        if self._outbox_limit.is_bounded and not self._is_loop_thread():
+            self._wait_queued(future)
 
 
 class InBox:
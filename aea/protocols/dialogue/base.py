@@ -46,6 +46,7 @@ from typing import (
 from aea.common import Address
 from aea.exceptions import AEAEnforceError, enforce
 from aea.helpers.base import cached_property
+from aea.helpers.metrics import metrics
 from aea.helpers.storage.generic_storage import SyncCollection
 from aea.protocols.base import Message
 from aea.skills.base import SkillComponent
@@ -1990,6 +1991,13 @@ class Dialogues:
             role=role,
         )
         self._dialogues_storage.add(dialogue)
+        if metrics.enabled:
+            metrics.counter(
+                "aea_dialogues_created_total",
+                "Dialogues created, by protocol.",
+                address=self.self_address,
+                protocol=self._message_class.protocol_id,
+            ).inc()
         return dialogue
 
     @staticmethod
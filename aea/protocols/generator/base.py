@@ -1625,7 +1625,7 @@ class ProtocolGenerator:
         cls_str += self.indent + "from typing import Any, Dict, cast\n\n"
         cls_str += (
             self.indent
-            + "from aea.mail.base_pb2 import DialogueMessage, Message as ProtobufMessage\n"
+            + "from aea.mail.base import decode_dialogue_message, encode_dialogue_message\n"
         )
         cls_str += MESSAGE_IMPORT + "\n"
         cls_str += SERIALIZER_IMPORT + "\n\n"
@@ -1672,24 +1672,11 @@ class ProtocolGenerator:
         cls_str += self.indent + "msg = cast({}Message, msg)\n".format(
             self.protocol_specification_in_camel_case
         )
-        cls_str += self.indent + "message_pb = ProtobufMessage()\n"
-        cls_str += self.indent + "dialogue_message_pb = DialogueMessage()\n"
         cls_str += self.indent + "{}_msg = {}_pb2.{}Message()\n\n".format(
             self.protocol_specification.name,
             self.protocol_specification.name,
             self.protocol_specification_in_camel_case,
         )
-        cls_str += self.indent + "dialogue_message_pb.message_id = msg.message_id\n"
-        cls_str += self.indent + "dialogue_reference = msg.dialogue_reference\n"
-        cls_str += (
-            self.indent
-            + "dialogue_message_pb.dialogue_starter_reference = dialogue_reference[0]\n"
-        )
-        cls_str += (
-            self.indent
-            + "dialogue_message_pb.dialogue_responder_reference = dialogue_reference[1]\n"
-        )
-        cls_str += self.indent + "dialogue_message_pb.target = msg.target\n\n"
         cls_str += self.indent + "performative_id = msg.performative\n"
         counter = 1
         for performative, contents in self.spec.speech_acts.items():
@@ -1729,14 +1716,10 @@ class ProtocolGenerator:
 
         cls_str += (
             self.indent
-            + "dialogue_message_pb.content = {}_msg.SerializeToString()\n\n".format(
+            + "message_bytes = encode_dialogue_message(msg.message_id, msg.dialogue_reference, msg.target, {}_msg.SerializeToString())\n".format(
                 self.protocol_specification.name,
             )
         )
-        cls_str += (
-            self.indent + "message_pb.dialogue_message.CopyFrom(dialogue_message_pb)\n"
-        )
-        cls_str += self.indent + "message_bytes = message_pb.SerializeToString()\n"
         cls_str += self.indent + "return message_bytes\n"
         self._change_indent(-1)
 
@@ -1753,24 +1736,17 @@ class ProtocolGenerator:
             self.protocol_specification_in_camel_case
         )
         cls_str += self.indent + '"""\n'
-        cls_str += self.indent + "message_pb = ProtobufMessage()\n"
         cls_str += self.indent + "{}_pb = {}_pb2.{}Message()\n".format(
             self.protocol_specification.name,
             self.protocol_specification.name,
             self.protocol_specification_in_camel_case,
         )
-        cls_str += self.indent + "message_pb.ParseFromString(obj)\n"
-        cls_str += self.indent + "message_id = message_pb.dialogue_message.message_id\n"
         cls_str += (
             self.indent
-            + "dialogue_reference = (message_pb.dialogue_message.dialogue_starter_reference, message_pb.dialogue_message.dialogue_responder_reference)\n"
+            + "message_id, dialogue_reference, target, content_buffer = decode_dialogue_message(obj)\n\n"
         )
-        cls_str += self.indent + "target = message_pb.dialogue_message.target\n\n"
-        cls_str += (
-            self.indent
-            + "{}_pb.ParseFromString(message_pb.dialogue_message.content)\n".format(
-                self.protocol_specification.name
-            )
+        cls_str += self.indent + "{}_pb.ParseFromString(content_buffer)\n".format(
+            self.protocol_specification.name
         )
         cls_str += (
             self.indent
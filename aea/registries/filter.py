@@ -44,6 +44,7 @@ class Filter(WithLogger):
         WithLogger.__init__(self, logger=logger)
         self._resources = resources
         self._decision_maker_out_queue = decision_maker_out_queue
+        self._new_components_notifications = AsyncFriendlyQueue()
 
     @property
     def resources(self) -> Resources:
@@ -90,10 +91,24 @@ class Filter(WithLogger):
         return active_behaviour
 
     def handle_new_handlers_and_behaviours(self) -> None:
-        """Handle the messages from the decision maker."""
+        """Register the new handlers and behaviours added to the skills."""
         self._handle_new_behaviours()
         self._handle_new_handlers()
 
+    def notify_new_components(self) -> None:
+        """
+        Notify that skills have new handlers or behaviours to register.
+
+        It can be called from any thread. Notifications made while one is
+        waiting are merged, as a single registration handles them all.
+        """
+        if self._new_components_notifications.empty():
+            self._new_components_notifications.put(True)
+
+    async def get_new_components_notification(self) -> bool:
+        """Wait for skills to have new handlers or behaviours to register."""
+        return await self._new_components_notifications.async_get()
+
     async def get_internal_message(self) -> Optional[Message]:
         """Get a message from decision_maker_out_queue."""
         return await self.decision_maker_out_queue.async_get()
@@ -133,6 +133,14 @@ class BaseRuntime(Runnable, WithLogger):
             default_routing=multiplexer_options.get("default_routing"),
             default_connection=multiplexer_options.get("default_connection"),
             protocols=multiplexer_options.get("protocols", []),
+            inbox_limit=multiplexer_options.get("inbox_limit"),
+            outbox_limit=multiplexer_options.get("outbox_limit"),
+            connection_limits=multiplexer_options.get("connection_limits"),
+            envelope_rejected_callback=multiplexer_options.get(
+                "envelope_rejected_callback"
+            ),
+            priority_lanes=multiplexer_options.get("priority_lanes"),
+            get_skill_protocols=multiplexer_options.get("get_skill_protocols"),
         )
 
     @staticmethod
@@ -237,6 +245,14 @@ class BaseRuntime(Runnable, WithLogger):
             decision_maker_handler=decision_maker_handler
         )
 
+    def set_storage(self, storage: Optional[Storage]) -> None:
+        """
+        Set the storage, in place of the one made for the agent storage uri.
+
+        :param storage: the storage, or None to run without storage.
+        """
+        self._storage = storage
+
     def _teardown(self) -> None:
         """Tear down runtime."""
         self.logger.debug("[{}]: Runtime teardown...".format(self._agent.name))
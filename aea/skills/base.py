@@ -22,6 +22,7 @@ import inspect
 import logging
 import queue
 import re
+import time
 import types
 from abc import ABC, abstractmethod
 from copy import copy
@@ -29,7 +30,7 @@ from logging import Logger
 from pathlib import Path
 from queue import Queue
 from types import SimpleNamespace
-from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union, cast
 
 from aea.common import Address
 from aea.components.base import Component, load_aea_package
@@ -52,6 +53,7 @@ from aea.exceptions import (
 )
 from aea.helpers.base import _get_aea_logger_name_prefix, load_module
 from aea.helpers.logging import AgentLoggerAdapter
+from aea.helpers.metrics import metrics
 from aea.helpers.storage.generic_storage import Storage
 from aea.mail.base import Envelope, EnvelopeContext
 from aea.multiplexer import MultiplexerStatus, OutBox
@@ -62,6 +64,32 @@ from aea.skills.tasks import TaskManager
 _default_logger = logging.getLogger(__name__)
 
 
+class _NewComponentsQueue(queue.Queue):
+    """Queue of the new components of a skill, which notifies the agent of each component put."""
+
+    def __init__(self, on_put: Callable[[], None]) -> None:
+        """
+        Initialize the queue.
+
+        :param on_put: called after each component is put.
+        """
+        super().__init__()
+        self._on_put = on_put
+
+    def put(
+        self, item: Any, block: bool = True, timeout: Optional[float] = None
+    ) -> None:
+        """
+        Put a component into the queue and notify the agent.
+
+        :param item: the component
+        :param block: similar to queue.Queue.put
+        :param timeout: similar to queue.Queue.put
+        """
+        super().put(item, block, timeout)
+        self._on_put()
+
+
 class SkillContext:
     """This class implements the context of a skill."""
 
@@ -81,8 +109,12 @@ class SkillContext:
         self._skill = skill  # type: Optional[Skill]
 
         self._is_active = True  # type: bool
-        self._new_behaviours_queue = queue.Queue()  # type: Queue
-        self._new_handlers_queue = queue.Queue()  # type: Queue
+        self._new_behaviours_queue = _NewComponentsQueue(
+            self._notify_new_components
+        )  # type: Queue
+        self._new_handlers_queue = _NewComponentsQueue(
+            self._notify_new_components
+        )  # type: Queue
         self._logger: Optional[Logger] = None
 
     @property
@@ -107,6 +139,11 @@ class SkillContext:
         """Set the agent context."""
         self._agent_context = agent_context
 
+    def _notify_new_components(self) -> None:
+        """Notify the agent that the skill has new components, if the agent context is set."""
+        if self._agent_context is not None:
+            self._agent_context.notify_new_components()
+
     @property
     def shared_state(self) -> Dict[str, Any]:
         """Get the shared state dictionary."""
@@ -138,6 +175,9 @@ class SkillContext:
                 self.skill_id, self._is_active
             )
         )
+        if value:
+            # the behaviours of a skill activated late are yet to be scheduled
+            self._notify_new_components()
 
     @property
     def new_behaviours(self) -> "Queue[Behaviour]":
@@ -418,6 +458,7 @@ class Behaviour(AbstractBehaviour, ABC):
 
     def act_wrapper(self) -> None:
         """Wrap the call of the action. This method must be called only by the framework."""
+        start_time = time.perf_counter() if metrics.enabled else None
         try:
             self.act()
         except _StopRuntime:
@@ -427,6 +468,14 @@ class Behaviour(AbstractBehaviour, ABC):
             raise AEAActException(
                 f"An error occurred during act of behaviour {self.context.skill_id}/{type(self).__name__}:\n{e_str}"
             )
+        finally:
+            if start_time is not None:
+                metrics.histogram(
+                    "aea_behaviour_act_seconds",
+                    "Execution time of behaviour acts.",
+                    skill=self.skill_id,
+                    behaviour=self.name,
+                ).observe(time.perf_counter() - start_time)
 
     @classmethod
     def parse_module(  # pylint: disable=arguments-differ,arguments-renamed
@@ -477,6 +526,7 @@ class Handler(SkillComponent, ABC):
 
     def handle_wrapper(self, message: Message) -> None:
         """Wrap the call of the handler. This method must be called only by the framework."""
+        start_time = time.perf_counter() if metrics.enabled else None
         try:
             self.handle(message)
         except _StopRuntime:
@@ -486,6 +536,14 @@ class Handler(SkillComponent, ABC):
             raise AEAHandleException(
                 f"An error occurred during handle of handler {self.context.skill_id}/{type(self).__name__}:\n{e_str}"
             )
+        finally:
+            if start_time is not None:
+                metrics.histogram(
+                    "aea_handler_handle_seconds",
+                    "Execution time of handlers.",
+                    skill=self.skill_id,
+                    handler=self.name,
+                ).observe(time.perf_counter() - start_time)
 
     @classmethod
     def parse_module(  # pylint: disable=arguments-differ,arguments-renamed
@@ -165,6 +165,7 @@ class TaskManager(WithLogger):
         self._task_enqueued_counter = 0
         self._results_by_task_id = {}  # type: Dict[int, Any]
         self._pool_mode = pool_mode
+        self._shared_pool = None  # type: Optional[Pool]
 
     @property
     def is_started(self) -> bool:
@@ -184,6 +185,20 @@ class TaskManager(WithLogger):
         """
         return self._nb_workers
 
+    def set_pool(self, pool: Optional[Pool]) -> None:
+        """
+        Run the tasks on a pool shared with other task managers.
+
+        The shared pool is not terminated when the task manager stops.
+
+        :param pool: the pool, or None to let the task manager create its own.
+        :raises ValueError: if the task manager is running.
+        """
+        with self._lock:
+            if not self._stopped:
+                raise ValueError("Cannot change the pool of a running task manager.")
+            self._shared_pool = pool
+
     def enqueue_task(
         self,
         func: Callable,
@@ -263,6 +278,9 @@ class TaskManager(WithLogger):
         if self._pool:
             self.logger.debug("Pool was already started!")
             return
+        if self._shared_pool is not None:
+            self._pool = self._shared_pool
+            return
         pool_cls = self.POOL_MODES.get(self._pool_mode)
         if not pool_cls:  # pragma: nocover
             raise ValueError(f"Mode: `{self._pool_mode}` is not supported")
@@ -281,6 +299,9 @@ class TaskManager(WithLogger):
             return
 
         self._pool = cast(Pool, self._pool)
+        if self._pool is self._shared_pool:
+            self._pool = None
+            return
         self._pool.terminate()
         self._pool.join()
         self._pool = None
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2023 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Agents per GB and per core, hosted densely or each on its own thread."""
+import asyncio
+import os
+import threading
+import time
+from typing import Any, List, Optional, Tuple, Union
+
+import click
+import psutil  # type: ignore
+
+from aea.aea import AEA
+from aea.aea_builder import AEABuilder
+from aea.configurations.base import SkillConfig
+from aea.configurations.constants import DEFAULT_LEDGER
+from aea.manager.manager import AgentRunAsyncTask, AgentRunThreadTask
+from aea.manager.shared import SharedAgentResources
+from aea.skills.base import Skill, SkillContext
+from aea.skills.behaviours import TickerBehaviour
+from benchmark.checks.utils import get_mem_usage_in_mb  # noqa: I100
+from benchmark.checks.utils import (
+    multi_run,
+    number_of_runs_deco,
+    output_format_deco,
+    print_results,
+)
+
+
+DENSE_MODE = "dense"
+THREADED_MODE = "threaded"
+
+
+class WorkingBehaviour(TickerBehaviour):
+    """Behaviour storing a counter and running a task on every tick."""
+
+    def setup(self) -> None:
+        """Set up the behaviour."""
+        self.ticks = 0  # pylint: disable=attribute-defined-outside-init
+
+    def act(self) -> None:
+        """Make an action."""
+        self.ticks += 1
+        collection = self.context.storage.get_sync_collection("benchmark")
+        collection.put("ticks", {"ticks": self.ticks})
+        self.context.task_manager.enqueue_task(sum, args=((self.ticks, 1),))
+
+    def teardown(self) -> None:
+        """Tear down the behaviour."""
+
+
+def make_agent(name: str, tick_interval: float) -> AEA:
+    """Make an agent with a working behaviour and an in-memory storage."""
+    builder = AEABuilder()
+    builder.set_name(name)
+    builder.add_private_key(DEFAULT_LEDGER)
+    builder.set_storage_uri("sqlite://:memory:")
+    skill_context = SkillContext()
+    behaviour = WorkingBehaviour(
+        name="behaviour", skill_context=skill_context, tick_interval=tick_interval
+    )
+    skill = Skill(
+        SkillConfig(name="benchmark_skill", author="fetchai"),
+        skill_context=skill_context,
+        handlers={},
+        behaviours={"behaviour": behaviour},
+    )
+    builder.add_component_instance(skill)
+    agent = builder.build()
+    skill_context.set_agent_context(agent.context)
+    return agent
+
+
+def get_cpu_time() -> float:
+    """Get the user and system CPU time of the current process in seconds."""
+    cpu_times = psutil.Process(os.getpid()).cpu_times()
+    return cpu_times.user + cpu_times.system
+
+
+async def _run(
+    mode: str, num_of_agents: int, duration: float, tick_interval: float
+) -> Tuple[float, float, int]:
+    """Run the agents and measure the memory, the CPU time and the threads used."""
+    loop = asyncio.get_event_loop()
+    shared: Optional[SharedAgentResources] = None
+    if mode == DENSE_MODE:
+        shared = SharedAgentResources()
+        shared.start()
+
+    mem_before = get_mem_usage_in_mb()
+    tasks: List[AgentRunAsyncTask] = []
+    for i in range(num_of_agents):
+        agent = make_agent(f"agent_{i}", tick_interval)
+        if shared is not None:
+            shared.adopt(agent)
+            tasks.append(AgentRunAsyncTask(agent, loop))
+        else:
+            tasks.append(AgentRunThreadTask(agent, loop))
+    for task in tasks:
+        task.start()
+
+    while not all(task.agent.runtime.is_running for task in tasks):
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(tick_interval)
+
+    cpu_before = get_cpu_time()
+    start_time = time.time()
+    await asyncio.sleep(duration)
+    cpu_time = get_cpu_time() - cpu_before
+    elapsed = time.time() - start_time
+    mem_usage = get_mem_usage_in_mb() - mem_before
+    num_of_threads = threading.active_count()
+
+    for task in tasks:
+        task.stop()
+    await asyncio.gather(*(task.wait() for task in tasks), return_exceptions=True)
+    if shared is not None:
+        shared.stop()
+    return mem_usage, cpu_time / elapsed, num_of_threads
+
+
+def run(
+    mode: str, num_of_agents: int, duration: float, tick_interval: float
+) -> List[Tuple[str, Union[int, float]]]:
+    """Check the density of the agents hosted in the given mode."""
+    if mode not in (DENSE_MODE, THREADED_MODE):
+        raise ValueError(f"Unsupported mode {mode}")
+    mem_usage, cores_used, num_of_threads = asyncio.new_event_loop().run_until_complete(
+        _run(mode, num_of_agents, duration, tick_interval)
+    )
+    mem_per_agent = max(mem_usage, 1e-6) / num_of_agents
+    cores_per_agent = max(cores_used, 1e-6) / num_of_agents
+    return [
+        ("Mem usage(Mb)", mem_usage),
+        ("Mem per agent(Mb)", mem_per_agent),
+        ("Cores used", cores_used),
+        ("Threads", num_of_threads),
+        ("Agents per GB", 1024 / mem_per_agent),
+        ("Agents per core", 1 / cores_per_agent),
+    ]
+
+
+@click.command()
+@click.option("--mode", default=DENSE_MODE, help="Hosting mode: dense or threaded.")
+@click.option("--num_of_agents", default=50, help="Amount of agents to run.")
+@click.option("--duration", default=3.0, help="Measurement time in seconds.")
+@click.option("--tick_interval", default=0.1, help="Behaviour tick in seconds.")
+@number_of_runs_deco
+@output_format_deco
+def main(
+    mode: str,
+    num_of_agents: int,
+    duration: float,
+    tick_interval: float,
+    number_of_runs: int,
+    output_format: str,
+) -> Any:
+    """Run test."""
+    parameters = {
+        "Mode": mode,
+        "Number of agents": num_of_agents,
+        "Duration(seconds)": duration,
+        "Tick interval(seconds)": tick_interval,
+        "Number of runs": number_of_runs,
+    }
+
+    def result_fn() -> List[Tuple[str, Any, Any, Any]]:
+        return multi_run(
+            int(number_of_runs),
+            run,
+            (mode, num_of_agents, duration, tick_interval),
+        )
+
+    return print_results(output_format, parameters, result_fn)
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2023 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Round-trip throughput of the envelope serialization, for the main protocols."""
+import time
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+import click
+
+from aea.mail.base import Envelope
+from aea.protocols.base import Message
+from benchmark.checks.utils import (  # noqa: I100
+    multi_run,
+    number_of_runs_deco,
+    output_format_deco,
+    print_results,
+)
+
+from packages.fetchai.connections.p2p_libp2p.connection import NodeClient
+from packages.fetchai.protocols.default.message import DefaultMessage
+from packages.fetchai.protocols.fipa.message import FipaMessage
+from packages.fetchai.protocols.http.message import HttpMessage
+from packages.fetchai.protocols.oef_search.custom_types import AgentsInfo
+from packages.fetchai.protocols.oef_search.message import OefSearchMessage
+
+
+SENDER = "sender_address"
+TO = "to_address"
+
+
+def make_default_message(payload_size: int) -> Message:
+    """Make a default message with a payload of the given size."""
+    return DefaultMessage(
+        performative=DefaultMessage.Performative.BYTES,
+        content=b"x" * payload_size,
+    )
+
+
+def make_fipa_message(payload_size: int) -> Message:
+    """Make a fipa message with a payload of the given size."""
+    return FipaMessage(
+        performative=FipaMessage.Performative.INFORM,
+        dialogue_reference=("starter", "responder"),
+        message_id=2,
+        target=1,
+        info={"data": "x" * payload_size},
+    )
+
+
+def make_http_message(payload_size: int) -> Message:
+    """Make an http message with a payload of the given size."""
+    return HttpMessage(
+        performative=HttpMessage.Performative.REQUEST,
+        method="POST",
+        url="http://localhost:8000/",
+        version="1.1",
+        headers="Content-Type: application/octet-stream",
+        body=b"x" * payload_size,
+    )
+
+
+def make_oef_search_message(payload_size: int) -> Message:
+    """Make an oef search message with a payload of the given size."""
+    return OefSearchMessage(
+        performative=OefSearchMessage.Performative.SEARCH_RESULT,
+        agents=("agent",),
+        agents_info=AgentsInfo({"agent": {"data": "x" * payload_size}}),
+    )
+
+
+MESSAGE_MAKERS: Dict[str, Callable[[int], Message]] = {
+    "default": make_default_message,
+    "fipa": make_fipa_message,
+    "http": make_http_message,
+    "oef_search": make_oef_search_message,
+}
+
+
+def run(
+    protocol: str, payload_size: int, acn: bool, num_of_envelopes: int
+) -> List[Tuple[str, Union[int, float]]]:
+    """Check the time to encode and decode the envelopes, message included."""
+    message = MESSAGE_MAKERS[protocol](payload_size)
+    envelope = Envelope(to=TO, sender=SENDER, message=message)
+    serializer = type(message).serializer
+
+    start_time = time.time()
+    for _ in range(num_of_envelopes):
+        if acn:
+            buf = NodeClient.make_acn_envelope_message(envelope)
+            decoded = Envelope.decode(NodeClient.get_acn_envelope(buf))
+        else:
+            decoded = Envelope.decode(envelope.encode())
+        serializer.decode(decoded.message)
+    elapsed = time.time() - start_time
+
+    return [
+        ("Time(seconds)", elapsed),
+        ("rate(envelopes/second)", num_of_envelopes / elapsed),
+    ]
+
+
+@click.command()
+@click.option(
+    "--protocol",
+    default="default",
+    type=click.Choice(list(MESSAGE_MAKERS)),
+    help="Protocol of the enveloped messages.",
+)
+@click.option("--payload_size", default=1024, help="Size of the message payload.")
+@click.option(
+    "--acn",
+    is_flag=True,
+    default=False,
+    help="Wrap the envelopes in ACN messages, as the libp2p connections do.",
+)
+@click.option("--num_of_envelopes", default=10000, help="Amount of envelopes.")
+@number_of_runs_deco
+@output_format_deco
+def main(
+    protocol: str,
+    payload_size: int,
+    acn: bool,
+    num_of_envelopes: int,
+    number_of_runs: int,
+    output_format: str,
+) -> Any:
+    """Run test."""
+    parameters = {
+        "Protocol": protocol,
+        "Payload size": payload_size,
+        "ACN": acn,
+        "Number of envelopes": num_of_envelopes,
+        "Number of runs": number_of_runs,
+    }
+
+    def result_fn() -> List[Tuple[str, Any, Any, Any]]:
+        return multi_run(
+            int(number_of_runs),
+            run,
+            (protocol, payload_size, acn, num_of_envelopes),
+        )
+
+    return print_results(output_format, parameters, result_fn)
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2023 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Envelope throughput of the agent loop, with and without batched inbox draining."""
+import time
+from threading import Thread
+from typing import Any, List, Tuple, Union
+
+import click
+
+from aea.protocols.base import Message
+from aea.registries.resources import Resources
+from aea.skills.base import Handler
+from benchmark.checks.utils import make_agent  # noqa: I100
+from benchmark.checks.utils import (
+    make_envelope,
+    make_skill,
+    multi_run,
+    number_of_runs_deco,
+    output_format_deco,
+    print_results,
+    wait_for_condition,
+)
+
+from packages.fetchai.protocols.default.message import DefaultMessage
+
+
+class CountingHandler(Handler):
+    """Handler counting the handled messages."""
+
+    SUPPORTED_PROTOCOL = DefaultMessage.protocol_id
+
+    def setup(self) -> None:
+        """Set up the handler."""
+        self.count = 0  # pylint: disable=attribute-defined-outside-init
+
+    def teardown(self) -> None:
+        """Tear down the handler."""
+
+    def handle(self, message: Message) -> None:
+        """Count the message."""
+        self.count += 1
+
+
+def run(
+    runtime_mode: str, batch_size: int, num_of_envelopes: int
+) -> List[Tuple[str, Union[int, float]]]:
+    """Check the time the agent loop takes to handle the envelopes waiting in the inbox."""
+    # pylint: disable=import-outside-toplevel,unused-import
+    # import manually due to some lazy imports in decision_maker
+    import aea.decision_maker.default  # noqa: F401
+
+    agent = make_agent(runtime_mode=runtime_mode, resources=Resources())
+    agent.max_reactions = batch_size
+    skill = make_skill(agent, handlers={"test": CountingHandler})
+    agent.resources.add_skill(skill)
+    handler = skill.handlers["test"]
+    envelopes = [
+        make_envelope("sender", agent.identity.address) for _ in range(num_of_envelopes)
+    ]
+
+    t = Thread(target=agent.start, daemon=True)
+    t.start()
+    wait_for_condition(lambda: agent.is_running, timeout=5)
+    wait_for_condition(lambda: hasattr(handler, "count"), timeout=5)
+
+    in_queue = agent.runtime.multiplexer.in_queue
+    start_time = time.time()
+    for envelope in envelopes:
+        in_queue.put(envelope)
+    wait_for_condition(lambda: handler.count == num_of_envelopes, timeout=60)
+    elapsed = time.time() - start_time
+
+    agent.stop()
+    t.join(5)
+    return [
+        ("Time(seconds)", elapsed),
+        ("rate(envelopes/second)", num_of_envelopes / elapsed),
+    ]
+
+
+@click.command()
+@click.option(
+    "--runtime_mode", default="async", help="Runtime mode: async or threaded."
+)
+@click.option(
+    "--batch_size",
+    default=20,
+    help="Envelopes handled per wakeup of the agent loop (max_reactions), 1 for no batching.",
+)
+@click.option("--num_of_envelopes", default=10000, help="Amount of envelopes.")
+@number_of_runs_deco
+@output_format_deco
+def main(
+    runtime_mode: str,
+    batch_size: int,
+    num_of_envelopes: int,
+    number_of_runs: int,
+    output_format: str,
+) -> Any:
+    """Run test."""
+    parameters = {
+        "Runtime mode": runtime_mode,
+        "Batch size": batch_size,
+        "Number of envelopes": num_of_envelopes,
+        "Number of runs": number_of_runs,
+    }
+
+    def result_fn() -> List[Tuple[str, Any, Any, Any]]:
+        return multi_run(
+            int(number_of_runs),
+            run,
+            (runtime_mode, batch_size, num_of_envelopes),
+        )
+
+    return print_results(output_format, parameters, result_fn)
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2023 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""TAC controller game generation time check."""
+import time
+from typing import Any, List, Optional, Tuple, Union
+
+import click
+import numpy as np
+
+from benchmark.checks.utils import (
+    multi_run,
+    number_of_runs_deco,
+    output_format_deco,
+    print_results,
+)
+
+from packages.fetchai.skills.tac_control.helpers import (
+    array_to_dicts,
+    determine_scaling_factor,
+    generate_equilibrium_prices_and_holdings_array,
+    generate_good_endowments_array,
+    generate_utility_params_array,
+)
+
+
+MONEY_ENDOWMENT = 2000000
+BASE_GOOD_ENDOWMENT = 2
+LOWER_BOUND_FACTOR = 1
+UPPER_BOUND_FACTOR = 3
+
+
+def run(
+    num_of_agents: int, num_of_goods: int, seed: Optional[int]
+) -> List[Tuple[str, Union[int, float]]]:
+    """Check the time taken to generate the endowments, preferences and equilibrium of a game."""
+    agent_addresses = [f"agent_{i}" for i in range(num_of_agents)]
+    good_ids = [str(i) for i in range(num_of_goods)]
+    scaling_factor = determine_scaling_factor(MONEY_ENDOWMENT)
+    rng = np.random.default_rng(seed)
+
+    start_time = time.time()
+    endowments = generate_good_endowments_array(
+        num_of_agents,
+        num_of_goods,
+        BASE_GOOD_ENDOWMENT,
+        LOWER_BOUND_FACTOR,
+        UPPER_BOUND_FACTOR,
+        rng,
+    )
+    endowments_time = time.time() - start_time
+
+    start_time = time.time()
+    utility_params = generate_utility_params_array(
+        num_of_agents, num_of_goods, scaling_factor, rng
+    )
+    utility_params_time = time.time() - start_time
+
+    start_time = time.time()
+    (
+        eq_prices,
+        eq_good_holdings,
+        eq_currency_holdings,
+    ) = generate_equilibrium_prices_and_holdings_array(
+        endowments,
+        utility_params,
+        np.full(num_of_agents, MONEY_ENDOWMENT),
+        scaling_factor,
+    )
+    equilibrium_time = time.time() - start_time
+
+    start_time = time.time()
+    array_to_dicts(agent_addresses, good_ids, endowments)
+    array_to_dicts(agent_addresses, good_ids, utility_params)
+    dict(zip(good_ids, eq_prices.tolist()))
+    array_to_dicts(agent_addresses, good_ids, eq_good_holdings)
+    array_to_dicts(agent_addresses, ["FET"], eq_currency_holdings.reshape(-1, 1))
+    dicts_time = time.time() - start_time
+
+    total_time = endowments_time + utility_params_time + equilibrium_time + dicts_time
+    return [
+        ("Endowments(ms)", endowments_time * 1000),
+        ("Utility params(ms)", utility_params_time * 1000),
+        ("Equilibrium(ms)", equilibrium_time * 1000),
+        ("Dict views(ms)", dicts_time * 1000),
+        ("Total(ms)", total_time * 1000),
+    ]
+
+
+@click.command()
+@click.option("--num_of_agents", default=1000, help="Amount of agents.")
+@click.option("--num_of_goods", default=100, help="Amount of goods.")
+@click.option("--seed", default=None, type=int, help="Seed of the game generation.")
+@number_of_runs_deco
+@output_format_deco
+def main(
+    num_of_agents: int,
+    num_of_goods: int,
+    seed: Optional[int],
+    number_of_runs: int,
+    output_format: str,
+) -> Any:
+    """Run test."""
+    parameters = {
+        "Number of agents": num_of_agents,
+        "Number of goods": num_of_goods,
+        "Seed": seed,
+        "Number of runs": number_of_runs,
+    }
+
+    def result_fn() -> List[Tuple[str, Any, Any, Any]]:
+        return multi_run(
+            int(number_of_runs),
+            run,
+            (num_of_agents, num_of_goods, seed),
+        )
+
+    return print_results(output_format, parameters, result_fn)
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
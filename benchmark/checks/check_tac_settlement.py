@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2023 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""TAC controller settlement and scoring throughput check."""
+import random
+import time
+from typing import Any, Dict, List, Tuple, Union
+
+import click
+
+from benchmark.checks.utils import (
+    multi_run,
+    number_of_runs_deco,
+    output_format_deco,
+    print_results,
+)
+
+from packages.fetchai.skills.tac_control.game import (
+    AgentState,
+    Settlement,
+    Transaction,
+    Transactions,
+)
+
+
+SETTLEMENT_MODE = "settlement"
+AGENT_STATES_MODE = "agent_states"
+CURRENCY_ID = "FET"
+
+
+def make_agent_states(num_of_agents: int, num_of_goods: int) -> Dict[str, AgentState]:
+    """Make the initial states of the agents."""
+    good_ids = [str(i) for i in range(num_of_goods)]
+    return {
+        f"agent_{i}": AgentState(
+            f"agent_{i}",
+            {CURRENCY_ID: 10000},
+            {CURRENCY_ID: 1.0},
+            {good_id: random.randint(5, 20) for good_id in good_ids},  # nosec
+            {good_id: random.random() for good_id in good_ids},  # nosec
+        )
+        for i in range(num_of_agents)
+    }
+
+
+def make_transactions(
+    num_of_agents: int, num_of_goods: int, num_of_transactions: int
+) -> List[Transaction]:
+    """Make transactions of a few goods between random pairs of agents."""
+    transactions = []
+    for i in range(num_of_transactions):
+        sender, counterparty = random.sample(range(num_of_agents), 2)
+        good_ids = random.sample(range(num_of_goods), min(3, num_of_goods))
+        sign = random.choice((-1, 1))  # nosec
+        transactions.append(
+            Transaction(
+                "fetchai",
+                f"agent_{sender}",
+                f"agent_{counterparty}",
+                {CURRENCY_ID: -sign * random.randint(1, 10)},  # nosec
+                {str(good_id): sign for good_id in good_ids},
+                True,
+                str(i),
+                {CURRENCY_ID: 1},
+                "sender_signature",
+                "counterparty_signature",
+            )
+        )
+    return transactions
+
+
+def settle_with_agent_states(
+    agent_states: Dict[str, AgentState], transactions: List[Transaction]
+) -> int:
+    """Settle the transactions one by one on copies of the agent states."""
+    settled = 0
+    for tx in transactions:
+        sender_state = agent_states[tx.sender_address]
+        counterparty_state = agent_states[tx.counterparty_address]
+        if sender_state.is_consistent_transaction(
+            tx
+        ) and counterparty_state.is_consistent_transaction(tx):
+            agent_states[tx.sender_address] = sender_state.apply([tx])
+            agent_states[tx.counterparty_address] = counterparty_state.apply([tx])
+            settled += 1
+    return settled
+
+
+def run(
+    mode: str,
+    num_of_agents: int,
+    num_of_goods: int,
+    num_of_transactions: int,
+    batch_size: int,
+) -> List[Tuple[str, Union[int, float]]]:
+    """Check the settlement and scoring of the transactions of a game."""
+    if mode not in (SETTLEMENT_MODE, AGENT_STATES_MODE):
+        raise ValueError(f"Unsupported mode {mode}")
+    agent_states = make_agent_states(num_of_agents, num_of_goods)
+    transactions = make_transactions(num_of_agents, num_of_goods, num_of_transactions)
+
+    start_time = time.time()
+    if mode == SETTLEMENT_MODE:
+        settlement = Settlement(agent_states)
+        log = Transactions()
+        for i in range(0, len(transactions), batch_size):
+            batch = transactions[i : i + batch_size]
+            is_settled = settlement.settle(batch)
+            log.add_batch([tx for tx, settled in zip(batch, is_settled) if settled])
+        settled = len(log.confirmed)
+        settle_time = time.time() - start_time
+
+        start_time = time.time()
+        settlement.get_scores()
+    else:
+        settled = settle_with_agent_states(agent_states, transactions)
+        settle_time = time.time() - start_time
+
+        start_time = time.time()
+        {
+            agent_address: agent_state.get_score()
+            for agent_address, agent_state in agent_states.items()
+        }
+    score_time = time.time() - start_time
+
+    return [
+        ("Settled transactions", settled),
+        ("Settle time(seconds)", settle_time),
+        ("Transactions per second", len(transactions) / settle_time),
+        ("Scoring time(ms)", score_time * 1000),
+    ]
+
+
+@click.command()
+@click.option(
+    "--mode", default=SETTLEMENT_MODE, help="Mode: settlement or agent_states."
+)
+@click.option("--num_of_agents", default=200, help="Amount of agents.")
+@click.option("--num_of_goods", default=50, help="Amount of goods.")
+@click.option(
+    "--num_of_transactions", default=5000, help="Amount of transactions to settle."
+)
+@click.option("--batch_size", default=100, help="Transactions settled at once.")
+@number_of_runs_deco
+@output_format_deco
+def main(
+    mode: str,
+    num_of_agents: int,
+    num_of_goods: int,
+    num_of_transactions: int,
+    batch_size: int,
+    number_of_runs: int,
+    output_format: str,
+) -> Any:
+    """Run test."""
+    parameters = {
+        "Mode": mode,
+        "Number of agents": num_of_agents,
+        "Number of goods": num_of_goods,
+        "Number of transactions": num_of_transactions,
+        "Batch size": batch_size,
+        "Number of runs": number_of_runs,
+    }
+
+    def result_fn() -> List[Tuple[str, Any, Any, Any]]:
+        return multi_run(
+            int(number_of_runs),
+            run,
+            (mode, num_of_agents, num_of_goods, num_of_transactions, batch_size),
+        )
+
+    return print_results(output_format, parameters, result_fn)
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
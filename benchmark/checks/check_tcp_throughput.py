@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2023 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""TCP connection loopback throughput check."""
+import asyncio
+import socket
+import time
+from typing import Any, List, Tuple, Union
+
+import click
+
+from aea.configurations.base import ConnectionConfig
+from aea.identity.base import Identity
+from benchmark.checks.utils import (
+    make_envelope,
+    multi_run,
+    number_of_runs_deco,
+    output_format_deco,
+    print_results,
+)
+
+from packages.fetchai.connections.tcp.tcp_client import TCPClientConnection
+from packages.fetchai.connections.tcp.tcp_server import TCPServerConnection
+from packages.fetchai.protocols.default.message import DefaultMessage
+
+
+HOST = "127.0.0.1"
+SERVER_ADDRESS = "server"
+CLIENT_ADDRESS = "client"
+
+
+def get_free_port() -> int:
+    """Get a free local TCP port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind((HOST, 0))
+        return s.getsockname()[1]
+
+
+def make_connection(cls: Any, address: str, port: int) -> Any:
+    """Make a TCP connection of the given class."""
+    configuration = ConnectionConfig(
+        address=HOST, port=port, connection_id=cls.connection_id
+    )
+    return cls(
+        configuration=configuration,
+        data_dir=".tmp",
+        identity=Identity(address, address, f"public_key_for_{address}"),
+    )
+
+
+async def _run(
+    num_of_envelopes: int, payload_size: int, concurrency: int
+) -> Tuple[float, int]:
+    """Send envelopes from the client to the server and time their delivery."""
+    port = get_free_port()
+    server = make_connection(TCPServerConnection, SERVER_ADDRESS, port)
+    client = make_connection(TCPClientConnection, CLIENT_ADDRESS, port)
+    await server.connect()
+    await client.connect()
+    while not server.connections:
+        await asyncio.sleep(0.001)
+
+    message = DefaultMessage(
+        dialogue_reference=("", ""),
+        message_id=1,
+        target=0,
+        performative=DefaultMessage.Performative.BYTES,
+        content=b"x" * payload_size,
+    )
+    envelope = make_envelope(CLIENT_ADDRESS, SERVER_ADDRESS, message)
+    envelope_size = len(envelope.encode())
+
+    async def produce(amount: int) -> None:
+        for _ in range(amount):
+            await client.send(envelope)
+
+    async def consume() -> None:
+        received = 0
+        while received < num_of_envelopes:
+            if await server.receive() is not None:
+                received += 1
+
+    start_time = time.time()
+    consumer = asyncio.ensure_future(consume())
+    await asyncio.gather(
+        *(produce(num_of_envelopes // concurrency) for _ in range(concurrency)),
+        produce(num_of_envelopes % concurrency),
+    )
+    await consumer
+    elapsed = time.time() - start_time
+
+    await client.disconnect()
+    await server.disconnect()
+    return elapsed, envelope_size
+
+
+def run(
+    num_of_envelopes: int, payload_size: int, concurrency: int
+) -> List[Tuple[str, Union[int, float]]]:
+    """Check loopback throughput of the TCP connection."""
+    elapsed, envelope_size = asyncio.new_event_loop().run_until_complete(
+        _run(num_of_envelopes, payload_size, concurrency)
+    )
+    return [
+        ("envelopes sent", num_of_envelopes),
+        ("envelope size(bytes)", envelope_size),
+        ("duration(seconds)", elapsed),
+        ("rate(envelopes/second)", num_of_envelopes / elapsed),
+        ("throughput(MB/second)", num_of_envelopes * envelope_size / elapsed / 2**20),
+    ]
+
+
+@click.command()
+@click.option("--num_of_envelopes", default=10000, help="Envelopes to send.")
+@click.option("--payload_size", default=1024, help="Message payload in bytes.")
+@click.option("--concurrency", default=16, help="Concurrent senders.")
+@number_of_runs_deco
+@output_format_deco
+def main(
+    num_of_envelopes: int,
+    payload_size: int,
+    concurrency: int,
+    number_of_runs: int,
+    output_format: str,
+) -> Any:
+    """Run test."""
+    parameters = {
+        "Envelopes": num_of_envelopes,
+        "Payload size": payload_size,
+        "Concurrency": concurrency,
+        "Number of runs": number_of_runs,
+    }
+
+    def result_fn() -> List[Tuple[str, Any, Any, Any]]:
+        return multi_run(
+            int(number_of_runs),
+            run,
+            (num_of_envelopes, payload_size, concurrency),
+        )
+
+    return print_results(output_format, parameters, result_fn)
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
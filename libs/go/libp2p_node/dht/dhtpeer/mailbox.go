@@ -1,12 +1,15 @@
 package dhtpeer
 
 import (
+	"bytes"
 	"context"
 	"crypto/tls"
+	"encoding/binary"
 	"io/ioutil"
 	acn "libp2p_node/acn"
 	aea "libp2p_node/aea"
 	"net/http"
+	"strconv"
 	"strings"
 	"sync"
 	"time"
@@ -15,6 +18,15 @@ import (
 	"google.golang.org/protobuf/proto"
 )
 
+const (
+	// default number of envelopes returned by /get_envelopes
+	defaultEnvelopesBatchSize = 100
+	// maximum time a /get_envelopes request is held waiting for envelopes
+	maxEnvelopesWait = 30 * time.Second
+	// header of /send_envelopes responses with the number of envelopes routed
+	envelopesRoutedHeader = "Envelopes-Routed"
+)
+
 func (mailboxServer *MailboxServer) apiRegister(res http.ResponseWriter, req *http.Request) {
 	var data []byte
 	var body []byte
@@ -77,6 +89,8 @@ func (mailboxServer *MailboxServer) apiRegister(res http.ResponseWriter, req *ht
 	mailboxServer.agentRecords[addr] = record
 	mailboxServer.sessions[uuid] = addr
 	mailboxServer.envelopes[addr] = make([]*aea.Envelope, 0)
+	mailboxServer.notifyEnvelopes(addr)
+	mailboxServer.notify[addr] = make(chan struct{})
 	mailboxServer.lock.Unlock()
 
 	res.WriteHeader(200)
@@ -117,6 +131,8 @@ func (mailboxServer *MailboxServer) apiUnregister(res http.ResponseWriter, req *
 	delete(mailboxServer.agentRecords, addr)
 	delete(mailboxServer.sessions, sessionId)
 	delete(mailboxServer.envelopes, addr)
+	mailboxServer.notifyEnvelopes(addr)
+	delete(mailboxServer.notify, addr)
 	mailboxServer.lock.Unlock()
 
 }
@@ -237,6 +253,222 @@ func (mailboxServer *MailboxServer) apiGetEnvelope(res http.ResponseWriter, req
 	}
 }
 
+// sessionAddress returns the agent address of the session of a request
+func (mailboxServer *MailboxServer) sessionAddress(req *http.Request) (string, bool) {
+	session_header, exists := req.Header["Session-Id"]
+	if !exists {
+		return "", false
+	}
+	mailboxServer.lock.Lock()
+	defer mailboxServer.lock.Unlock()
+	addr, exists := mailboxServer.sessions[session_header[0]]
+	return addr, exists
+}
+
+// notifyEnvelopes wakes up all the /get_envelopes requests waiting for envelopes for addr.
+// The caller must hold the lock.
+func (mailboxServer *MailboxServer) notifyEnvelopes(addr string) {
+	if notify, exists := mailboxServer.notify[addr]; exists {
+		close(notify)
+		mailboxServer.notify[addr] = make(chan struct{})
+	}
+}
+
+// takeEnvelopes removes up to max envelopes from the front of the queue of addr
+func (mailboxServer *MailboxServer) takeEnvelopes(addr string, max int) []*aea.Envelope {
+	mailboxServer.lock.Lock()
+	defer mailboxServer.lock.Unlock()
+	envelopesList, exists := mailboxServer.envelopes[addr]
+	if !exists {
+		// the address was unregistered meanwhile
+		return nil
+	}
+	if len(envelopesList) < max {
+		max = len(envelopesList)
+	}
+	mailboxServer.envelopes[addr] = envelopesList[max:]
+	return envelopesList[:max:max]
+}
+
+// requeueEnvelopes puts back envelopes that were not delivered at the front of the queue of addr
+func (mailboxServer *MailboxServer) requeueEnvelopes(addr string, envelopes []*aea.Envelope) {
+	if len(envelopes) == 0 {
+		return
+	}
+	mailboxServer.lock.Lock()
+	defer mailboxServer.lock.Unlock()
+	envelopesList, exists := mailboxServer.envelopes[addr]
+	if !exists {
+		// the address was unregistered meanwhile
+		return
+	}
+	mailboxServer.envelopes[addr] = append(envelopes, envelopesList...)
+	mailboxServer.notifyEnvelopes(addr)
+}
+
+// apiGetEnvelopes returns up to 'max' envelopes, each prefixed with its size.
+// If there are none, the request is held until an envelope arrives or 'wait' seconds pass.
+// Several requests can wait for the same address: all of them are woken up,
+// and the envelopes go to the first one to take them.
+// Envelopes that could not be written to the response are put back in the queue.
+func (mailboxServer *MailboxServer) apiGetEnvelopes(res http.ResponseWriter, req *http.Request) {
+	var err error
+
+	if req.Method != "GET" {
+		res.WriteHeader(400)
+		_, err = res.Write([]byte("invalid method"))
+		ignore(err)
+		return
+	}
+
+	addr, exists := mailboxServer.sessionAddress(req)
+	if !exists {
+		res.WriteHeader(400)
+		_, err = res.Write([]byte("invalid session_id header"))
+		ignore(err)
+		return
+	}
+
+	max := defaultEnvelopesBatchSize
+	if value := req.URL.Query().Get("max"); value != "" {
+		max, err = strconv.Atoi(value)
+		if err != nil || max < 1 {
+			res.WriteHeader(400)
+			_, err = res.Write([]byte("invalid max"))
+			ignore(err)
+			return
+		}
+	}
+	wait := time.Duration(0)
+	if value := req.URL.Query().Get("wait"); value != "" {
+		seconds, err := strconv.ParseFloat(value, 64)
+		if err != nil || seconds < 0 {
+			res.WriteHeader(400)
+			_, err = res.Write([]byte("invalid wait"))
+			ignore(err)
+			return
+		}
+		wait = time.Duration(seconds * float64(time.Second))
+		if wait > maxEnvelopesWait {
+			wait = maxEnvelopesWait
+		}
+	}
+
+	mailboxServer.lock.Lock()
+	pending := len(mailboxServer.envelopes[addr])
+	notify := mailboxServer.notify[addr]
+	mailboxServer.lock.Unlock()
+
+	if pending == 0 && wait > 0 && notify != nil {
+		timer := time.NewTimer(wait)
+		select {
+		case <-notify:
+		case <-timer.C:
+		case <-req.Context().Done():
+		}
+		timer.Stop()
+	}
+
+	if req.Context().Err() != nil {
+		// the client has gone away, leave the envelopes in the queue
+		return
+	}
+
+	envelopes := mailboxServer.takeEnvelopes(addr, max)
+	var buf bytes.Buffer
+	size := make([]byte, 4)
+	for _, envelope := range envelopes {
+		data, err := proto.Marshal(envelope)
+		if err != nil {
+			mailboxServer.requeueEnvelopes(addr, envelopes)
+			res.WriteHeader(500)
+			_, err = res.Write([]byte(err.Error()))
+			ignore(err)
+			return
+		}
+		binary.BigEndian.PutUint32(size, uint32(len(data)))
+		buf.Write(size)
+		buf.Write(data)
+	}
+	res.WriteHeader(200)
+	_, err = res.Write(buf.Bytes())
+	if err != nil {
+		mailboxServer.requeueEnvelopes(addr, envelopes)
+	}
+}
+
+// apiSendEnvelopes routes envelopes, each prefixed with its size.
+// Envelopes are routed in order, and routing stops at the first failure.
+// The response carries the number of envelopes routed in the Envelopes-Routed header,
+// so that the client resends only the envelopes that were not routed.
+func (mailboxServer *MailboxServer) apiSendEnvelopes(res http.ResponseWriter, req *http.Request) {
+	var err error
+	if req.Method != "POST" {
+		res.WriteHeader(400)
+		_, err = res.Write([]byte("invalid method"))
+		ignore(err)
+		return
+	}
+
+	if _, exists := mailboxServer.sessionAddress(req); !exists {
+		res.WriteHeader(400)
+		_, err = res.Write([]byte("invalid session_id header"))
+		ignore(err)
+		return
+	}
+
+	body, err := ioutil.ReadAll(req.Body)
+	if err != nil {
+		res.WriteHeader(400)
+		_, err = res.Write([]byte(err.Error()))
+		ignore(err)
+		return
+	}
+	envelopes := make([]*aea.Envelope, 0)
+	for len(body) > 0 {
+		if len(body) < 4 {
+			res.WriteHeader(400)
+			_, err = res.Write([]byte("invalid envelopes batch"))
+			ignore(err)
+			return
+		}
+		size := binary.BigEndian.Uint32(body[:4])
+		if uint64(len(body)-4) < uint64(size) {
+			res.WriteHeader(400)
+			_, err = res.Write([]byte("invalid envelopes batch"))
+			ignore(err)
+			return
+		}
+		envelope := &aea.Envelope{}
+		err = proto.Unmarshal(body[4:4+size], envelope)
+		if err != nil {
+			res.WriteHeader(400)
+			_, err = res.Write([]byte(err.Error()))
+			ignore(err)
+			return
+		}
+		envelopes = append(envelopes, envelope)
+		body = body[4+size:]
+	}
+	if len(envelopes) == 0 {
+		res.WriteHeader(400)
+		_, err = res.Write([]byte("Empty body"))
+		ignore(err)
+		return
+	}
+	for index, envelope := range envelopes {
+		err = mailboxServer.dhtPeer.RouteEnvelope(envelope)
+		if err != nil {
+			res.Header().Set(envelopesRoutedHeader, strconv.Itoa(index))
+			res.WriteHeader(400)
+			_, err = res.Write([]byte(err.Error()))
+			ignore(err)
+			return
+		}
+	}
+	res.Header().Set(envelopesRoutedHeader, strconv.Itoa(len(envelopes)))
+}
+
 type MailboxServer struct {
 	addr           string
 	dhtPeer        *DHTPeer
@@ -244,6 +476,7 @@ type MailboxServer struct {
 	sessions       map[string]string
 	agentRecords   map[string]*acn.AgentRecord
 	envelopes      map[string]([]*aea.Envelope)
+	notify         map[string](chan struct{})
 	lock           sync.RWMutex
 	envelopesLimit int
 	cert           *tls.Certificate
@@ -256,6 +489,7 @@ func (mailboxServer *MailboxServer) start() {
 	mailboxServer.envelopes = map[string][]*aea.Envelope{}
 	mailboxServer.agentRecords = map[string]*acn.AgentRecord{}
 	mailboxServer.sessions = map[string]string{}
+	mailboxServer.notify = map[string](chan struct{}){}
 	mailboxServer.lock = sync.RWMutex{}
 	mailboxServer.envelopesLimit = 1000
 	mailboxServer.cert, mailboxServer.signature = mailboxServer.dhtPeer.GetCertAndSignature()
@@ -265,6 +499,8 @@ func (mailboxServer *MailboxServer) start() {
 	mux.HandleFunc("/unregister", mailboxServer.apiUnregister)
 	mux.HandleFunc("/get_envelope", mailboxServer.apiGetEnvelope)
 	mux.HandleFunc("/send_envelope", mailboxServer.apiSendEnvelope)
+	mux.HandleFunc("/get_envelopes", mailboxServer.apiGetEnvelopes)
+	mux.HandleFunc("/send_envelopes", mailboxServer.apiSendEnvelopes)
 	mux.HandleFunc("/ssl_signature", mailboxServer.apiGetSignature)
 
 	tlsConfig := &tls.Config{Certificates: []tls.Certificate{*mailboxServer.cert}}
@@ -317,6 +553,8 @@ func (mailboxServer *MailboxServer) RouteEnvelope(envelope *aea.Envelope) bool {
 	}
 
 	mailboxServer.envelopes[target] = append(envelopesList, envelope)
+	// wake up the pending /get_envelopes requests, if any
+	mailboxServer.notifyEnvelopes(target)
 
 	linfo().Msgf("route to %s. added to queue!", target)
 	return true
@@ -21,10 +21,11 @@
 
 import asyncio
 import logging
+import os
 from asyncio import CancelledError
 from asyncio.events import AbstractEventLoop
 from concurrent.futures.thread import ThreadPoolExecutor
-from typing import Any, Callable, Dict, Optional, Tuple, Union, cast
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union, cast
 
 import gym
 
@@ -45,6 +46,8 @@ _default_logger = logging.getLogger("aea.packages.fetchai.connections.gym")
 
 PUBLIC_ID = PublicId.from_str("fetchai/gym:0.20.6")
 
+Feedback = Tuple[Any, float, bool, Any]
+
 
 class GymDialogues(BaseGymDialogues):
     """The dialogues class keeps track of all gym dialogues."""
@@ -77,22 +80,65 @@ class GymDialogues(BaseGymDialogues):
 
 
 class GymChannel:
-    """A wrapper of the gym environment."""
+    """
+    A wrapper of the gym environments.
+
+    With more than one environment, the channel steps them as a batch: the
+    action of an 'act' message is the sequence of the actions of the
+    environments, and the 'percept' reply carries the observations in
+    'observation' and the rewards, dones and infos in 'info', under the keys
+    'rewards', 'dones' and 'infos'. Its 'reward' is the total reward and its
+    'done' is whether all the environments are done. As in 'gym.vector', an
+    environment which is done is reset, and the observation reported is the
+    first of its new episode.
+    """
 
     THREAD_POOL_SIZE = 3
 
-    def __init__(self, address: Address, gym_env: gym.Env):
-        """Initialize a gym channel."""
+    def __init__(
+        self,
+        address: Address,
+        gym_env: Union[gym.Env, Sequence[gym.Env]],
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Initialize a gym channel.
+
+        :param address: the address of the agent.
+        :param gym_env: the gym environment, or the environments stepped as a batch.
+        :param max_workers: the number of threads stepping the environments, by default sized to the machine.
+        """
         self.address = address
-        self.gym_env = gym_env
+        self.gym_envs: List[gym.Env] = (
+            list(gym_env) if isinstance(gym_env, Sequence) else [gym_env]
+        )
+        enforce(len(self.gym_envs) > 0, "At least one gym environment is required.")
+        if max_workers is None:
+            max_workers = max(
+                self.THREAD_POOL_SIZE, min(len(self.gym_envs), os.cpu_count() or 1)
+            )
+        self._max_workers = max_workers
         self._loop: Optional[AbstractEventLoop] = None
         self._queue: Optional[asyncio.Queue] = None
-        self._threaded_pool: ThreadPoolExecutor = ThreadPoolExecutor(
-            self.THREAD_POOL_SIZE
-        )
+        self._threaded_pool: ThreadPoolExecutor = ThreadPoolExecutor(max_workers)
         self.logger: Union[logging.Logger, logging.LoggerAdapter] = _default_logger
         self._dialogues = GymDialogues()
 
+    @property
+    def gym_env(self) -> gym.Env:
+        """Get the (first) gym environment."""
+        return self.gym_envs[0]
+
+    @property
+    def num_envs(self) -> int:
+        """Get the number of gym environments."""
+        return len(self.gym_envs)
+
+    @property
+    def is_batched(self) -> bool:
+        """Check whether the environments are stepped as a batch."""
+        return self.num_envs > 1
+
     def _get_message_and_dialogue(
         self, envelope: Envelope
     ) -> Tuple[GymMessage, Optional[GymDialogue]]:
@@ -137,13 +183,66 @@ class GymChannel:
             raise ValueError("This protocol is not valid for gym.")
         await self.handle_gym_message(envelope)
 
-    async def _run_in_executor(
-        self, fn: Callable, *args: Any
-    ) -> Tuple[Any, float, bool, Dict]:
+    async def _run_in_executor(self, fn: Callable, *args: Any) -> Any:
         if self._loop is None:  # pragma: nocover
             raise ValueError("Loop not set!")
         return await self._loop.run_in_executor(self._threaded_pool, fn, *args)
 
+    async def _map_in_executor(self, fn: Callable, *iterables: Sequence) -> List:
+        """
+        Apply a function to each environment, in chunks run by the workers.
+
+        Each worker runs a contiguous chunk of the environments, so a batch
+        costs one thread handoff per worker rather than per environment.
+
+        :param fn: the function, called with an environment and the items of the iterables at its index.
+        :param iterables: the sequences of arguments, one item per environment.
+        :return: the results, in the order of the environments.
+        """
+        nb_chunks = min(self._max_workers, self.num_envs)
+        bounds = [self.num_envs * i // nb_chunks for i in range(nb_chunks + 1)]
+
+        def run_chunk(start: int, end: int) -> List:
+            return [
+                fn(self.gym_envs[i], *(items[i] for items in iterables))
+                for i in range(start, end)
+            ]
+
+        chunks = await asyncio.gather(
+            *(
+                self._run_in_executor(run_chunk, start, end)
+                for start, end in zip(bounds[:-1], bounds[1:])
+            )
+        )
+        return [result for chunk in chunks for result in chunk]
+
+    @staticmethod
+    def _step_env(env: gym.Env, action: Any) -> Feedback:
+        """Step an environment of a batch, resetting it when it is done."""
+        observation, reward, done, info = env.step(action)
+        if done:
+            observation = env.reset()
+        return observation, reward, done, info
+
+    async def _step(self, action: Any) -> Feedback:
+        """
+        Step the environments.
+
+        :param action: the action, or the sequence of the actions of a batch.
+        :return: the observation, reward, done and info.
+        """
+        if not self.is_batched:
+            return await self._run_in_executor(self.gym_env.step, action)
+
+        enforce(
+            isinstance(action, Sequence) and len(action) == self.num_envs,
+            f"Expected a sequence of {self.num_envs} actions, got {action!r}.",
+        )
+        results = await self._map_in_executor(self._step_env, action)
+        observations, rewards, dones, infos = (list(values) for values in zip(*results))
+        info = {"rewards": rewards, "dones": dones, "infos": infos}
+        return observations, float(sum(rewards)), all(dones), info
+
     async def handle_gym_message(self, envelope: Envelope) -> None:
         """
         Forward a message to gym.
@@ -165,9 +264,7 @@ class GymChannel:
             action = gym_message.action.any
             step_id = gym_message.step_id
 
-            observation, reward, done, info = await self._run_in_executor(
-                self.gym_env.step, action
-            )
+            observation, reward, done, info = await self._step(action)
 
             msg = dialogue.reply(
                 performative=GymMessage.Performative.PERCEPT,
@@ -179,14 +276,17 @@ class GymChannel:
                 step_id=step_id,
             )
         elif gym_message.performative == GymMessage.Performative.RESET:
-            await self._run_in_executor(self.gym_env.reset)
+            await self._map_in_executor(lambda env: env.reset())
+            content = {"reset": "success"}
+            if self.is_batched:
+                content["num_envs"] = str(self.num_envs)
             msg = dialogue.reply(
                 performative=GymMessage.Performative.STATUS,
                 target_message=gym_message,
-                content={"reset": "success"},
+                content=content,
             )
         elif gym_message.performative == GymMessage.Performative.CLOSE:
-            await self._run_in_executor(self.gym_env.close)
+            await self._map_in_executor(lambda env: env.close())
             return
         envelope = Envelope(
             to=msg.to,
@@ -218,11 +318,15 @@ class GymConnection(Connection):
 
     connection_id = PUBLIC_ID
 
-    def __init__(self, gym_env: Optional[gym.Env] = None, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        gym_env: Optional[Union[gym.Env, Sequence[gym.Env]]] = None,
+        **kwargs: Any,
+    ) -> None:
         """
         Initialize a connection to a local gym environment.
 
-        :param gym_env: the gym environment (this cannot be loaded by AEA loader).
+        :param gym_env: the gym environment, or the environments stepped as a batch (this cannot be loaded by AEA loader).
         :param kwargs: the keyword arguments of the parent class.
         """
         super().__init__(**kwargs)
@@ -231,8 +335,14 @@ class GymConnection(Connection):
             if gym_env_package is None:  # pragma: nocover
                 raise ValueError("`env` must be set in configuration!")
             gym_env_class = locate(gym_env_package)
-            gym_env = gym_env_class()
-        self.channel = GymChannel(self.address, gym_env)
+            num_envs = cast(int, self.configuration.config.get("num_envs") or 1)
+            gym_env = (
+                gym_env_class()
+                if num_envs == 1
+                else [gym_env_class() for _ in range(num_envs)]
+            )
+        max_workers = cast(Optional[int], self.configuration.config.get("max_workers"))
+        self.channel = GymChannel(self.address, gym_env, max_workers=max_workers)
         self._connection = None  # type: Optional[asyncio.Queue]
 
     async def connect(self) -> None:
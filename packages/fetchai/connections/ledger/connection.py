@@ -20,8 +20,7 @@
 """Scaffold connection and channel."""
 import asyncio
 from asyncio import Task
-from collections import deque
-from typing import Any, Deque, Dict, List, Optional, cast
+from typing import Any, Dict, Optional, Set, Tuple, cast
 
 from aea.connections.base import Connection, ConnectionStates
 from aea.mail.base import Envelope
@@ -49,19 +48,21 @@ class LedgerConnection(Connection):
 
         self._ledger_dispatcher: Optional[LedgerApiRequestDispatcher] = None
         self._contract_dispatcher: Optional[ContractApiRequestDispatcher] = None
-        self._event_new_receiving_task: Optional[asyncio.Event] = None
+        self._response_queue: Optional[
+            asyncio.Queue[Tuple[asyncio.Future, Envelope]]
+        ] = None
 
-        self.receiving_tasks: List[asyncio.Future] = []
-        self.task_to_request: Dict[asyncio.Future, Envelope] = {}
-        self.done_tasks: Deque[asyncio.Future] = deque()
+        self.receiving_tasks: Set[asyncio.Future] = set()
         self.api_configs = self.configuration.config.get(
             "ledger_apis", {}
         )  # type: Dict[str, Dict[str, str]]
 
     @property
-    def event_new_receiving_task(self) -> asyncio.Event:
-        """Get the event to notify the 'receive' method of new receiving tasks."""
-        return cast(asyncio.Event, self._event_new_receiving_task)
+    def response_queue(self) -> "asyncio.Queue[Tuple[asyncio.Future, Envelope]]":
+        """Get the queue of completed requests, in order of completion."""
+        return cast(
+            "asyncio.Queue[Tuple[asyncio.Future, Envelope]]", self._response_queue
+        )
 
     async def connect(self) -> None:
         """Set up the connection."""
@@ -83,7 +84,7 @@ class LedgerConnection(Connection):
             api_configs=self.api_configs,
             logger=self.logger,
         )
-        self._event_new_receiving_task = asyncio.Event()
+        self._response_queue = asyncio.Queue()
 
         self.state = ConnectionStates.connected
 
@@ -94,12 +95,13 @@ class LedgerConnection(Connection):
 
         self.state = ConnectionStates.disconnecting
 
-        for task in self.receiving_tasks:
+        for task in list(self.receiving_tasks):
             if not task.cancelled():  # pragma: nocover
                 task.cancel()
+        self.receiving_tasks.clear()
         self._ledger_dispatcher = None
         self._contract_dispatcher = None
-        self._event_new_receiving_task = None
+        self._response_queue = None
 
         self.state = ConnectionStates.disconnected
 
@@ -110,9 +112,22 @@ class LedgerConnection(Connection):
         :param envelope: the envelope to send.
         """
         task = self._schedule_request(envelope)
-        self.receiving_tasks.append(task)
-        self.task_to_request[task] = envelope
-        self.event_new_receiving_task.set()
+        self.receiving_tasks.add(task)
+        task.add_done_callback(
+            lambda done_task: self._on_task_done(done_task, envelope)
+        )
+
+    def _on_task_done(self, task: asyncio.Future, request: Envelope) -> None:
+        """
+        Push a completed request task onto the response queue.
+
+        :param task: the done task.
+        :param request: the request envelope the task was scheduled for.
+        """
+        self.receiving_tasks.discard(task)
+        if task.cancelled() or self._response_queue is None:
+            return
+        self._response_queue.put_nowait((task, request))
 
     def _schedule_request(self, envelope: Envelope) -> Task:
         """
@@ -146,41 +161,25 @@ class LedgerConnection(Connection):
         """
         Receive an envelope. Blocking.
 
+        Responses are returned in the order in which their requests complete.
+
         :param args: positional arguments
         :param kwargs: keyword arguments
         :return: the envelope received, or None.
         """
-        # if there are done tasks, return the result
-        if len(self.done_tasks) > 0:  # pragma: nocover
-            done_task = self.done_tasks.pop()
-            return self._handle_done_task(done_task)
-
-        if len(self.receiving_tasks) == 0:
-            self.event_new_receiving_task.clear()
-            await self.event_new_receiving_task.wait()
-
-        # wait for completion of at least one receiving task
-        done, _ = await asyncio.wait(
-            self.receiving_tasks, return_when=asyncio.FIRST_COMPLETED
-        )
-
-        # pick one done task
-        done_task = done.pop()
-
-        # update done tasks
-        self.done_tasks.extend([*done])
-
-        return self._handle_done_task(done_task)
+        done_task, request = await self.response_queue.get()
+        return self._handle_done_task(done_task, request)
 
-    def _handle_done_task(self, task: asyncio.Future) -> Optional[Envelope]:
+    def _handle_done_task(
+        self, task: asyncio.Future, request: Envelope
+    ) -> Optional[Envelope]:
         """
         Process a done receiving task.
 
         :param task: the done task.
+        :param request: the request envelope the task was scheduled for.
         :return: the response envelope.
         """
-        request = self.task_to_request.pop(task)
-        self.receiving_tasks.remove(task)
         response_message: Optional[Message] = task.result()
 
         response_envelope = None
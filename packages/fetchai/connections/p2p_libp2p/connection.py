@@ -38,7 +38,12 @@ from aea.helpers.acn.agent_record import AgentRecord
 from aea.helpers.acn.uri import Uri
 from aea.helpers.multiaddr.base import MultiAddr
 from aea.helpers.pipe import IPCChannel, TCPSocketChannel
-from aea.mail.base import Envelope
+from aea.helpers.protobuf_framing import (
+    ProtobufWriter,
+    WIRE_TYPE_LENGTH_DELIMITED,
+    iter_fields,
+)
+from aea.mail.base import Envelope, ProtobufEnvelopeSerializer
 
 from packages.fetchai.connections.p2p_libp2p.consts import LIBP2P_NODE_MODULE_NAME
 from packages.fetchai.protocols.acn import acn_pb2
@@ -66,6 +71,19 @@ LIBP2P_SUCCESS_MESSAGE = "Peer running in "
 
 POR_DEFAULT_SERVICE_ID = "acn"
 
+ACN_AEA_ENVELOPE_FIELD = acn_pb2.AcnMessage.DESCRIPTOR.fields_by_name[
+    "aea_envelope"
+].number
+
+ACN_ENVELOPE_FIELD = acn_pb2.AcnMessage.Aea_Envelope_Performative.DESCRIPTOR.fields_by_name[  # type: ignore
+    "envelope"
+].number
+
+ACN_PERFORMATIVE_FIELDS = frozenset(
+    field.number
+    for field in acn_pb2.AcnMessage.DESCRIPTOR.oneofs_by_name["performative"].fields
+)
+
 
 def _ip_all_private_or_all_public(addrs: List[str]) -> bool:
     if len(addrs) == 0:
@@ -170,13 +188,39 @@ class NodeClient:
 
     @staticmethod
     def make_acn_envelope_message(envelope: Envelope) -> bytes:
-        """Make acn message with envelope in."""
-        acn_msg = acn_pb2.AcnMessage()
-        performative = acn_pb2.AcnMessage.Aea_Envelope_Performative()  # type: ignore
-        performative.envelope = envelope.encode()
-        acn_msg.aea_envelope.CopyFrom(performative)  # pylint: disable=no-member
-        buf = acn_msg.SerializeToString()
-        return buf
+        """Make acn message with envelope in, encoding the envelope and the acn message in one pass."""
+        writer = ProtobufWriter()
+        ProtobufEnvelopeSerializer.write(writer, envelope)
+        writer.wrap(ACN_ENVELOPE_FIELD)
+        writer.wrap(ACN_AEA_ENVELOPE_FIELD)
+        return writer.getvalue()
+
+    @staticmethod
+    def get_acn_envelope(buf: bytes) -> Optional[memoryview]:
+        """
+        Get the envelope in an acn message, without copying it.
+
+        :param buf: the acn message
+        :return: the encoded envelope, or None if the acn message is not an envelope.
+        """
+        envelope: Optional[memoryview] = None
+        for field_number, wire_type, value in iter_fields(buf):
+            if (
+                field_number == ACN_AEA_ENVELOPE_FIELD
+                and wire_type == WIRE_TYPE_LENGTH_DELIMITED
+            ):
+                envelope = memoryview(b"")
+                for nested_number, nested_wire_type, nested_value in iter_fields(
+                    cast(memoryview, value)
+                ):
+                    if (
+                        nested_number == ACN_ENVELOPE_FIELD
+                        and nested_wire_type == WIRE_TYPE_LENGTH_DELIMITED
+                    ):
+                        envelope = cast(memoryview, nested_value)
+            elif field_number in ACN_PERFORMATIVE_FIELDS:
+                envelope = None
+        return envelope
 
     async def read_envelope(self) -> Optional[Envelope]:
         """Read envelope from the node."""
@@ -187,8 +231,10 @@ class NodeClient:
                 return None
 
             try:
-                acn_msg = acn_pb2.AcnMessage()
-                acn_msg.ParseFromString(buf)
+                envelope_buf = self.get_acn_envelope(buf)
+                if envelope_buf is None:
+                    acn_msg = acn_pb2.AcnMessage()
+                    acn_msg.ParseFromString(buf)
 
             except Exception as e:
                 await self.write_acn_status_error(
@@ -197,11 +243,9 @@ class NodeClient:
                 )
                 raise ValueError(f"Error parsing acn message: {e}") from e
 
-            performative = acn_msg.WhichOneof("performative")
-            if performative == "aea_envelope":  # pragma: nocover
-                aea_envelope = acn_msg.aea_envelope  # pylint: disable=no-member
+            if envelope_buf is not None:  # pragma: nocover
                 try:
-                    envelope = Envelope.decode(aea_envelope.envelope)
+                    envelope = Envelope.decode(envelope_buf)
                     await self.write_acn_status_ok()
                     return envelope
                 except Exception as e:
@@ -211,7 +255,8 @@ class NodeClient:
                     )
                     raise
 
-            elif performative == "status":
+            performative = acn_msg.WhichOneof("performative")
+            if performative == "status":
                 if self._wait_status is not None:
                     self._wait_status.set_result(
                         acn_msg.status.body  # pylint: disable=no-member
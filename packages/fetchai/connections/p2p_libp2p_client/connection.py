@@ -27,7 +27,7 @@ from asyncio import CancelledError
 from asyncio.events import AbstractEventLoop
 from asyncio.streams import StreamWriter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, cast
 
 from asn1crypto import x509  # type: ignore
 from ecdsa.curves import SECP256k1
@@ -42,7 +42,12 @@ from aea.exceptions import enforce
 from aea.helpers.acn.agent_record import AgentRecord
 from aea.helpers.acn.uri import Uri
 from aea.helpers.pipe import IPCChannelClient, TCPSocketChannelClient, TCPSocketProtocol
-from aea.mail.base import Envelope
+from aea.helpers.protobuf_framing import (
+    ProtobufWriter,
+    WIRE_TYPE_LENGTH_DELIMITED,
+    iter_fields,
+)
+from aea.mail.base import Envelope, ProtobufEnvelopeSerializer
 
 from packages.fetchai.protocols.acn import acn_pb2
 from packages.fetchai.protocols.acn.message import AcnMessage
@@ -66,6 +71,19 @@ POR_DEFAULT_SERVICE_ID = "acn"
 
 ACN_CURRENT_VERSION = "0.1.0"
 
+ACN_AEA_ENVELOPE_FIELD = acn_pb2.AcnMessage.DESCRIPTOR.fields_by_name[
+    "aea_envelope"
+].number
+
+ACN_ENVELOPE_FIELD = acn_pb2.AcnMessage.Aea_Envelope_Performative.DESCRIPTOR.fields_by_name[  # type: ignore
+    "envelope"
+].number
+
+ACN_PERFORMATIVE_FIELDS = frozenset(
+    field.number
+    for field in acn_pb2.AcnMessage.DESCRIPTOR.oneofs_by_name["performative"].fields
+)
+
 
 class NodeClient:
     """Client to communicate with node using ipc channel(pipe)."""
@@ -86,13 +104,39 @@ class NodeClient:
 
     @staticmethod
     def make_acn_envelope_message(envelope: Envelope) -> bytes:
-        """Make acn message with envelope in."""
-        acn_msg = acn_pb2.AcnMessage()
-        performative = acn_pb2.AcnMessage.Aea_Envelope_Performative()  # type: ignore
-        performative.envelope = envelope.encode()
-        acn_msg.aea_envelope.CopyFrom(performative)  # pylint: disable=no-member
-        buf = acn_msg.SerializeToString()
-        return buf
+        """Make acn message with envelope in, encoding the envelope and the acn message in one pass."""
+        writer = ProtobufWriter()
+        ProtobufEnvelopeSerializer.write(writer, envelope)
+        writer.wrap(ACN_ENVELOPE_FIELD)
+        writer.wrap(ACN_AEA_ENVELOPE_FIELD)
+        return writer.getvalue()
+
+    @staticmethod
+    def get_acn_envelope(buf: bytes) -> Optional[memoryview]:
+        """
+        Get the envelope in an acn message, without copying it.
+
+        :param buf: the acn message
+        :return: the encoded envelope, or None if the acn message is not an envelope.
+        """
+        envelope: Optional[memoryview] = None
+        for field_number, wire_type, value in iter_fields(buf):
+            if (
+                field_number == ACN_AEA_ENVELOPE_FIELD
+                and wire_type == WIRE_TYPE_LENGTH_DELIMITED
+            ):
+                envelope = memoryview(b"")
+                for nested_number, nested_wire_type, nested_value in iter_fields(
+                    cast(memoryview, value)
+                ):
+                    if (
+                        nested_number == ACN_ENVELOPE_FIELD
+                        and nested_wire_type == WIRE_TYPE_LENGTH_DELIMITED
+                    ):
+                        envelope = cast(memoryview, nested_value)
+            elif field_number in ACN_PERFORMATIVE_FIELDS:
+                envelope = None
+        return envelope
 
     async def write_acn_status_ok(self) -> None:
         """Send acn status ok."""
@@ -170,8 +214,10 @@ class NodeClient:
                 return None
 
             try:
-                acn_msg = acn_pb2.AcnMessage()
-                acn_msg.ParseFromString(buf)
+                envelope_buf = self.get_acn_envelope(buf)
+                if envelope_buf is None:
+                    acn_msg = acn_pb2.AcnMessage()
+                    acn_msg.ParseFromString(buf)
 
             except Exception as e:  # pragma: nocover
                 await self.write_acn_status_error(
@@ -180,11 +226,9 @@ class NodeClient:
                 )
                 raise ValueError(f"Error parsing acn message: {e}") from e
 
-            performative = acn_msg.WhichOneof("performative")
-            if performative == "aea_envelope":  # pragma: nocover
-                aea_envelope = acn_msg.aea_envelope  # pylint: disable=no-member
+            if envelope_buf is not None:  # pragma: nocover
                 try:
-                    envelope = Envelope.decode(aea_envelope.envelope)
+                    envelope = Envelope.decode(envelope_buf)
                     await self.write_acn_status_ok()
                     return envelope
                 except Exception as e:
@@ -194,7 +238,8 @@ class NodeClient:
                     )
                     raise
 
-            elif performative == "status":
+            performative = acn_msg.WhichOneof("performative")
+            if performative == "status":
                 if self._wait_status is not None:
                     self._wait_status.set_result(
                         acn_msg.status.body  # pylint: disable=no-member
@@ -669,7 +714,9 @@ class TCPSocketChannelClientTLS(TCPSocketChannelClient):
             self._port,
             ssl=ssl_ctx,
         )
-        return TCPSocketProtocol(reader, writer, logger=self.logger, loop=self._loop)
+        return TCPSocketProtocol(
+            reader, writer, logger=self.logger, loop=self._loop, counters=self._counters
+        )
 
     def _verify_session_key_signature(
         self, signature: bytes, session_pub_key: bytes
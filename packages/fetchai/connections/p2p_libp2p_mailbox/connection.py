@@ -23,10 +23,12 @@ import logging
 import random
 import re
 import ssl
+import struct
 from asyncio import CancelledError
 from asyncio.streams import StreamWriter
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, cast
+from typing import Any, Deque, Dict, List, Optional, Tuple, cast
 from urllib.parse import urlparse
 
 import aiohttp
@@ -67,18 +69,48 @@ POR_DEFAULT_SERVICE_ID = "acn"
 
 ACN_CURRENT_VERSION = "0.1.0"
 
+ENVELOPES_ROUTED_HEADER = "Envelopes-Routed"
+
+
+class EnvelopesNotSentError(ValueError):
+    """Exception raised when only the first envelopes of a batch were sent."""
+
+    def __init__(self, message: str, sent: int) -> None:
+        """
+        Initialize the exception.
+
+        :param message: the error message.
+        :param sent: the number of envelopes of the batch that were sent.
+        """
+        super().__init__(message)
+        self.sent = sent
+
 
 class NodeClient:
-    """Client to communicate with node using ipc channel(pipe)."""
+    """
+    Client to communicate with the mailbox service of a node over HTTPS.
+
+    Requests share a keep-alive session, so the TLS handshake is done once.
+    Envelopes are sent and retrieved in batches, and retrieval requests are
+    held by the node until envelopes arrive (long polling). Nodes without the
+    batch endpoints are served one envelope per request, polling periodically.
+    """
 
     NO_ENVELOPES_SLEEP_TIME: float = 2.0
+    LONG_POLL_TIMEOUT: float = 20.0
+    REQUEST_TIMEOUT: float = 30.0
+    MAX_BATCH_SIZE: int = 100
 
     def __init__(self, node_uri: Uri, node_por: AgentRecord) -> None:
         """Set node client with pipe."""
         self.node_uri = node_uri
         self.agent_record = node_por
         self._session_token: Optional[str] = None
-        self.ssl_ctx = Optional[ssl.SSLContext]
+        self.ssl_ctx: Optional[ssl.SSLContext] = None
+        self._url_prefix = f"https://{self.node_uri}"
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        self._batch_api_supported: Optional[bool] = None
+        self._received: Deque[Envelope] = deque()
 
     async def connect(self) -> bool:
         """Connect to node with pipe."""
@@ -91,31 +123,68 @@ class NodeClient:
 
     async def send_envelope(self, envelope: Envelope) -> None:
         """Send envelope to node."""
+        await self.send_envelopes([envelope])
+
+    async def send_envelopes(self, envelopes: List[Envelope]) -> None:
+        """
+        Send envelopes to node, in a single request if the node supports it.
+
+        The node routes the envelopes in order and stops at the first failure.
+        If it reports how many envelopes were routed, EnvelopesNotSentError is
+        raised, so that only the envelopes not routed are sent again.
+
+        :param envelopes: the envelopes to send, in order.
+        """
         if not self._session_token:  # pragma: nocover
             raise ValueError("not connected!")
 
-        envelope_data = envelope.encode()
-        # send here
-        response, _ = await self._perform_http_request(
-            method="POST",
-            url="/send_envelope",
-            data=envelope_data,
-            headers={"Session-Id": self._session_token},
-        )
+        if self._batch_api_supported is not False:
+            response, data = await self._perform_http_request(
+                method="POST",
+                url="/send_envelopes",
+                data=_encode_envelopes_batch(envelopes),
+                headers={"Session-Id": self._session_token},
+            )
+            if response.status != 404:
+                self._batch_api_supported = True
+                if response.status != 200:
+                    message = f"Bad response code: {response.status} {data!r}"
+                    routed = response.headers.get(ENVELOPES_ROUTED_HEADER)
+                    if routed is not None and routed.isdigit():
+                        raise EnvelopesNotSentError(message, int(routed))
+                    raise ValueError(message)
+                return
+            self._batch_api_supported = False
 
-        if response.status != 200:  # pragma: nocover
-            text = await response.text()
-            raise ValueError(f"Bad response code: {response.status} {text}")
+        for sent, envelope in enumerate(envelopes):
+            response, data = await self._perform_http_request(
+                method="POST",
+                url="/send_envelope",
+                data=envelope.encode(),
+                headers={"Session-Id": self._session_token},
+            )
+            if response.status != 200:  # pragma: nocover
+                raise EnvelopesNotSentError(
+                    f"Bad response code: {response.status} {data!r}", sent
+                )
 
     async def _perform_http_request(
         self, method: str, url: str, **kwargs: Any
     ) -> Tuple[ClientResponse, bytes]:
-        async with aiohttp.ClientSession() as session:
-            async with session.request(
-                method, url=f"https://{self.node_uri}{url}", ssl=self.ssl_ctx, **kwargs
-            ) as response:
-                data = await response.read()
-                return response, data
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(ssl=self.ssl_ctx),
+                timeout=aiohttp.ClientTimeout(
+                    total=None,
+                    sock_connect=self.REQUEST_TIMEOUT,
+                    sock_read=self.REQUEST_TIMEOUT,
+                ),
+            )
+        async with self._http_session.request(
+            method, url=f"{self._url_prefix}{url}", **kwargs
+        ) as response:
+            data = await response.read()
+            return response, data
 
     def make_agent_record(self) -> AcnMessage.AgentRecord:  # type: ignore
         """Make acn agent record."""
@@ -131,9 +200,48 @@ class NodeClient:
 
     async def read_envelope(self) -> Optional[Envelope]:
         """Read envelope from the mailbox node."""
+        while not self._received:
+            self._received.extend(await self.read_envelopes())
+        return self._received.popleft()
+
+    def take_received(self, node_client: "NodeClient") -> None:
+        """
+        Take the envelopes another client retrieved but did not return yet.
+
+        :param node_client: the client replaced by this one.
+        """
+        self._received.extend(node_client._received)
+        node_client._received.clear()
+
+    async def read_envelopes(self) -> List[Envelope]:
+        """
+        Read the envelopes available in the mailbox, waiting for at least one.
+
+        :return: the envelopes, in order.
+        """
         while True:
             if not self._session_token:  # pragma: nocover
                 raise ValueError("Client not registered!")
+            if self._batch_api_supported is not False:
+                response, data = await self._perform_http_request(
+                    "GET",
+                    "/get_envelopes",
+                    params={
+                        "max": str(self.MAX_BATCH_SIZE),
+                        "wait": str(self.LONG_POLL_TIMEOUT),
+                    },
+                    headers={"Session-Id": self._session_token},
+                )
+                if response.status != 404:
+                    self._batch_api_supported = True
+                    if response.status != 200:  # pragma: nocover
+                        raise ValueError(f"Bad response code: {response.status}")
+                    envelopes = _decode_envelopes_batch(data)
+                    if envelopes:
+                        return envelopes
+                    continue
+                self._batch_api_supported = False
+
             response, data = await self._perform_http_request(
                 "GET", "/get_envelope", headers={"Session-Id": self._session_token}
             )
@@ -144,8 +252,7 @@ class NodeClient:
                 await asyncio.sleep(self.NO_ENVELOPES_SLEEP_TIME)
                 continue
 
-            envelope = Envelope.decode(data)
-            return envelope
+            return [Envelope.decode(data)]
 
     async def register(self) -> None:
         """Register agent on the remote node."""
@@ -169,17 +276,46 @@ class NodeClient:
         self._session_token = token
 
     async def close(self) -> None:
-        """Close node connection."""
-        if not self._session_token:  # pragma: nocover
-            raise ValueError("not connected!")
-
-        response, _ = await self._perform_http_request(
-            "GET", "/unregister", headers={"Session-Id": self._session_token}
-        )
-        if response.status != 200:  # pragma: nocover
-            raise ValueError(f"Bad response code: {response.status}")
-
-        self._session_token = None
+        """Close node connection, unregistering from the node if registered."""
+        try:
+            if self._session_token:
+                response, _ = await self._perform_http_request(
+                    "GET", "/unregister", headers={"Session-Id": self._session_token}
+                )
+                if response.status != 200:  # pragma: nocover
+                    raise ValueError(f"Bad response code: {response.status}")
+        finally:
+            self._session_token = None
+            if self._http_session is not None:
+                await self._http_session.close()
+                self._http_session = None
+
+
+def _encode_envelopes_batch(envelopes: List[Envelope]) -> bytes:
+    """Encode envelopes, each prefixed with its size as a 32-bit big-endian integer."""
+    parts = []
+    for envelope in envelopes:
+        data = envelope.encode()
+        parts.append(struct.pack("!I", len(data)))
+        parts.append(data)
+    return b"".join(parts)
+
+
+def _decode_envelopes_batch(data: bytes) -> List[Envelope]:
+    """Decode envelopes, each prefixed with its size as a 32-bit big-endian integer."""
+    envelopes = []
+    view = memoryview(data)
+    offset = 0
+    while offset < len(data):
+        if offset + 4 > len(data):
+            raise ValueError("Incomplete envelopes batch.")
+        (size,) = struct.unpack_from("!I", data, offset)
+        offset += 4
+        if offset + size > len(data):
+            raise ValueError("Incomplete envelopes batch.")
+        envelopes.append(Envelope.decode(view[offset : offset + size]))
+        offset += size
+    return envelopes
 
 
 class P2PLibp2pMailboxConnection(Connection):
@@ -290,13 +426,18 @@ class P2PLibp2pMailboxConnection(Connection):
             return
         try:
             while self.is_connected:
-                envelope = await self._send_queue.get()
-                await self._send_envelope_with_node_client(envelope)
+                envelopes = [await self._send_queue.get()]
+                while (
+                    not self._send_queue.empty()
+                    and len(envelopes) < NodeClient.MAX_BATCH_SIZE
+                ):
+                    envelopes.append(self._send_queue.get_nowait())
+                await self._send_envelopes_with_node_client(envelopes)
         except asyncio.CancelledError:  # pylint: disable=try-except-raise
             raise  # pragma: nocover
         except Exception:  # pylint: disable=broad-except # pragma: nocover
             self.logger.exception(
-                f"Failed to send an envelope {envelope}. Stop connection."
+                f"Failed to send envelopes {envelopes}. Stop connection."
             )
             await asyncio.shield(self.disconnect())
 
@@ -315,6 +456,24 @@ class P2PLibp2pMailboxConnection(Connection):
             await self._perform_connection_to_node()
             await self._node_client.send_envelope(envelope)
 
+    async def _send_envelopes_with_node_client(self, envelopes: List[Envelope]) -> None:
+        """Send envelopes with node client, reconnect and retry on fail."""
+        if not self._node_client:  # pragma: nocover
+            raise ValueError("Connection not connected to node!")
+
+        for envelope in envelopes:
+            self._ensure_valid_envelope_for_external_comms(envelope)
+        try:
+            await self._node_client.send_envelopes(envelopes)
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.exception(
+                "Exception raised on message send. Try reconnect and send again."
+            )
+            if isinstance(e, EnvelopesNotSentError):
+                envelopes = envelopes[e.sent :]
+            await self._perform_connection_to_node()
+            await self._node_client.send_envelopes(envelopes)
+
     async def connect(self) -> None:
         """Set up the connection."""
         if self.is_connected:  # pragma: nocover
@@ -347,7 +506,16 @@ class P2PLibp2pMailboxConnection(Connection):
                         str(self.node_uri), attempt + 1
                     )
                 )
+                previous_client = self._node_client
                 self._node_client = NodeClient(self.node_uri, self.node_por)
+                if previous_client is not None:
+                    self._node_client.take_received(previous_client)
+                    try:
+                        await previous_client.close()
+                    except Exception as e:  # pylint: disable=broad-except
+                        self.logger.warning(
+                            f"Failed to close the previous node client: {e}"
+                        )
                 await self._setup_connection()
 
                 self.logger.info(
@@ -454,9 +622,10 @@ class P2PLibp2pMailboxConnection(Connection):
         if not self._node_client:  # pragma: nocover
             raise ValueError("Connection not connected to node!")
 
+        node_client = self._node_client
         try:
             self.logger.debug("Waiting for messages...")
-            envelope = await self._node_client.read_envelope()
+            envelope = await node_client.read_envelope()
             return envelope
         except ConnectionError as e:  # pragma: nocover
             self.logger.error(f"Connection error: {e}. Try to reconnect and read again")
@@ -470,8 +639,10 @@ class P2PLibp2pMailboxConnection(Connection):
             self.logger.exception(f"On envelope read: {e}")
 
         try:
-            self.logger.debug("Read envelope retry! Reconnect first!")
-            await self._perform_connection_to_node()
+            if self._node_client is node_client:
+                self.logger.debug("Read envelope retry! Reconnect first!")
+                await self._perform_connection_to_node()
+            # else already reconnected, e.g. on send, closing the client read from
             envelope = await self._node_client.read_envelope()
             return envelope  # pragma: no cover
         except Exception:  # pragma: no cover  # pylint: disable=broad-except
@@ -24,11 +24,15 @@ import logging
 from typing import Any, Dict, Optional, Tuple, Union, cast
 
 import aioprometheus  # type: ignore
+from aioprometheus.histogram import (
+    Histogram as PrometheusHistogramValue,  # type: ignore
+)
 
 from aea.common import Address
 from aea.configurations.base import PublicId
 from aea.connections.base import Connection, ConnectionStates
 from aea.exceptions import enforce
+from aea.helpers.metrics import Counter, Histogram, metrics
 from aea.mail.base import Envelope, Message
 from aea.protocols.dialogue.base import Dialogue as BaseDialogue
 
@@ -43,6 +47,7 @@ PUBLIC_ID = PublicId.from_str("fetchai/prometheus:0.9.6")
 
 DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 9090
+DEFAULT_RUNTIME_METRICS_INTERVAL = 5.0
 VALID_UPDATE_FUNCS = {"inc", "dec", "add", "sub", "set", "observe"}
 VALID_METRIC_TYPES = {"Counter", "Gauge", "Histogram", "Summary"}
 
@@ -86,6 +91,7 @@ class PrometheusChannel:
         host: str,
         port: int,
         logger: Union[logging.Logger, logging.LoggerAdapter],
+        runtime_metrics_interval: Optional[float] = None,
     ):
         """
         Initialize a prometheus channel.
@@ -94,6 +100,7 @@ class PrometheusChannel:
         :param host: The host at which to expose the metrics.
         :param port: The port at which to expose the metrics.
         :param logger: The logger.
+        :param runtime_metrics_interval: The interval in seconds between exports of the framework runtime metrics, None to not export them.
         """
         self.address = address
         self.metrics = {}  # type: Dict[str, aioprometheus.Collector]
@@ -104,6 +111,9 @@ class PrometheusChannel:
         self._host = host
         self._port = port
         self._service = aioprometheus.Service()
+        self._runtime_metrics_interval = runtime_metrics_interval
+        self._runtime_metrics = {}  # type: Dict[str, aioprometheus.Collector]
+        self._export_task: Optional[asyncio.Task] = None
 
     def _get_message_and_dialogue(
         self, envelope: Envelope
@@ -133,6 +143,64 @@ class PrometheusChannel:
         self._loop = asyncio.get_event_loop()
         self._queue = asyncio.Queue()
         await self._service.start(addr=self._host, port=self._port)
+        if self._runtime_metrics_interval is not None:
+            metrics.enable()
+            self._export_task = self._loop.create_task(self._export_runtime_metrics())
+
+    async def _export_runtime_metrics(self) -> None:
+        """Periodically copy the framework runtime metrics to prometheus."""
+        while True:
+            await asyncio.sleep(cast(float, self._runtime_metrics_interval))
+            try:
+                self.update_runtime_metrics()
+            except Exception as e:  # pylint: disable=broad-except  # pragma: nocover
+                self.logger.warning(f"Failed to export runtime metrics: {e}")
+
+    def _get_runtime_collector(
+        self, name: str, collector_type: Any, description: str, **kwargs: Any
+    ) -> aioprometheus.Collector:
+        """Get the prometheus collector of a runtime metric, registering it if needed."""
+        collector = self._runtime_metrics.get(name)
+        if collector is None:
+            collector = collector_type(name, description, **kwargs)
+            self._service.register(collector)
+            self._runtime_metrics[name] = collector
+        return collector
+
+    def update_runtime_metrics(self) -> None:
+        """Set the prometheus collectors to the current framework runtime metrics."""
+        for metric in metrics.collect():
+            labels = metric.labels_dict
+            if isinstance(metric, Histogram):
+                self._update_runtime_histogram(metric, labels)
+                continue
+            collector_type = (
+                aioprometheus.Counter
+                if isinstance(metric, Counter)
+                else aioprometheus.Gauge
+            )
+            collector = self._get_runtime_collector(
+                metric.name, collector_type, metric.description
+            )
+            collector.set(labels, metric.get())
+
+    def _update_runtime_histogram(
+        self, metric: Histogram, labels: Dict[str, str]
+    ) -> None:
+        """Set a prometheus histogram to the buckets, count and sum of a runtime histogram."""
+        value = metric.get()
+        collector = self._get_runtime_collector(
+            metric.name,
+            aioprometheus.Histogram,
+            metric.description,
+            buckets=metric.buckets,
+        )
+        aggregate = PrometheusHistogramValue(*metric.buckets)
+        for bound, count in value["buckets"]:
+            aggregate.buckets[bound] = count
+        aggregate.observations = value["count"]
+        aggregate.sum = value["sum"]
+        collector.set_value(labels, aggregate)
 
     async def send(self, envelope: Envelope) -> None:
         """
@@ -257,6 +325,10 @@ class PrometheusChannel:
 
     async def disconnect(self) -> None:
         """Disconnect."""
+        if self._export_task is not None:
+            self._export_task.cancel()
+            self._export_task = None
+            metrics.disable()
         if self._queue is not None:
             await self._queue.put(None)
             self._queue = None
@@ -282,8 +354,22 @@ class PrometheusConnection(Connection):
 
         self.host = cast(str, self.configuration.config.get("host", DEFAULT_HOST))
         self.port = cast(int, self.configuration.config.get("port", DEFAULT_PORT))
+        runtime_metrics_interval = (
+            cast(
+                float,
+                self.configuration.config.get(
+                    "runtime_metrics_interval", DEFAULT_RUNTIME_METRICS_INTERVAL
+                ),
+            )
+            if self.configuration.config.get("export_runtime_metrics", False)
+            else None
+        )
         self.channel = PrometheusChannel(
-            self.address, self.host, self.port, self.logger
+            self.address,
+            self.host,
+            self.port,
+            self.logger,
+            runtime_metrics_interval,
         )
 
     async def connect(self) -> None:
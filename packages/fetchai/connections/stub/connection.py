@@ -18,15 +18,19 @@
 # ------------------------------------------------------------------------------
 """This module contains the stub connection."""
 import asyncio
+import ctypes
+import ctypes.util
 import logging
 import os
 import re
+import sys
 import typing
 from asyncio import CancelledError
 from asyncio.tasks import Task
 from concurrent.futures.thread import ThreadPoolExecutor
+from contextlib import suppress
 from pathlib import Path
-from typing import Any, AsyncIterable, List, Optional
+from typing import Any, AsyncIterable, List, Optional, cast
 
 from aea.configurations.base import PublicId
 from aea.configurations.constants import (
@@ -46,6 +50,30 @@ SEPARATOR = b","
 
 PUBLIC_ID = PublicId.from_str("fetchai/stub:0.21.3")
 
+IN_MODIFY = 0x00000002
+
+
+def _make_inotify_fd(path: Path) -> Optional[int]:
+    """
+    Make a non-blocking inotify file descriptor watching a file for modifications.
+
+    :param path: the path of the file to watch.
+    :return: the file descriptor, or None if inotify is not available.
+    """
+    if not sys.platform.startswith("linux"):  # pragma: nocover
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:  # pragma: nocover
+            return None
+        if libc.inotify_add_watch(fd, os.fsencode(path), IN_MODIFY) < 0:
+            os.close(fd)  # pragma: nocover
+            return None  # pragma: nocover
+        return fd
+    except (OSError, AttributeError):  # pragma: nocover
+        return None
+
 
 class StubConnection(Connection):
     r"""A stub connection.
@@ -62,6 +90,9 @@ class StubConnection(Connection):
         recipient_agent,sender_agent,default,{"type": "bytes", "content": "aGVsbG8="}
 
     The connection detects new messages by watchdogging the input file looking for new lines.
+    On Linux it is woken up by inotify when the input file changes; elsewhere it polls the
+    file with a backoff that grows while the file is idle. Data is read incrementally from
+    the last read offset, and the file is truncated only once a large amount of it has been consumed.
 
     To post a message on the input file, you can use e.g.
 
@@ -82,6 +113,8 @@ class StubConnection(Connection):
     )
 
     read_delay = 0.001
+    max_read_delay = 0.1
+    compact_threshold = 2**20
 
     def __init__(self, **kwargs: Any):
         """Initialize a stub connection."""
@@ -109,6 +142,10 @@ class StubConnection(Connection):
 
         self.in_queue = None  # type: Optional[asyncio.Queue]
 
+        self._input_offset = 0
+        self._inotify_fd: Optional[int] = None
+        self._input_changed: Optional[asyncio.Event] = None
+
         self._read_envelopes_task: Optional[Task] = None
         self._write_pool = ThreadPoolExecutor(
             max_workers=1, thread_name_prefix="stub_connection_writer_"
@@ -131,29 +168,96 @@ class StubConnection(Connection):
         if self.output_file:
             self.output_file.close()
 
-    async def _file_read_and_trunc(self, delay: float = 0.001) -> AsyncIterable[bytes]:
+    def _start_watching_input(self) -> None:
+        """Subscribe to modification events of the input file, if supported."""
+        fd = _make_inotify_fd(self.input_file_path)
+        if fd is None:  # pragma: nocover
+            return
+        try:
+            self.loop.add_reader(fd, self._on_input_changed)
+        except NotImplementedError:  # pragma: nocover
+            os.close(fd)
+            return
+        self._inotify_fd = fd
+        self._input_changed = asyncio.Event()
+
+    def _stop_watching_input(self) -> None:
+        """Unsubscribe from modification events of the input file."""
+        if self._inotify_fd is None:
+            return
+        self.loop.remove_reader(self._inotify_fd)
+        os.close(self._inotify_fd)
+        self._inotify_fd = None
+        self._input_changed = None
+
+    def _on_input_changed(self) -> None:
+        """Consume pending inotify events and wake up the reader."""
+        with suppress(BlockingIOError):
+            while os.read(cast(int, self._inotify_fd), 4096):
+                pass
+        if self._input_changed is not None:
+            self._input_changed.set()
+
+    def _read_new_data(self) -> bytes:
+        """
+        Read the data appended to the input file since the last read.
+
+        :return: the bytes read.
+        """
+        input_file = cast(typing.IO, self.input_file)
+        with lock_file(input_file):
+            if os.fstat(input_file.fileno()).st_size < self._input_offset:
+                # truncated by someone else
+                self._input_offset = 0
+            input_file.seek(self._input_offset)
+            data = input_file.read()
+            self._input_offset += len(data)
+            if self._input_offset >= self.compact_threshold:
+                input_file.truncate(0)
+                input_file.seek(0)
+                self._input_offset = 0
+        return data
+
+    def _drop_consumed_input(self) -> None:
+        """Remove the data already read from the input file, keeping the data appended since."""
+        input_file = cast(typing.IO, self.input_file)
+        with lock_file(input_file):
+            if os.fstat(input_file.fileno()).st_size < self._input_offset:
+                # truncated by someone else
+                self._input_offset = 0
+            input_file.seek(self._input_offset)
+            unread = input_file.read()
+            input_file.seek(0)
+            input_file.write(unread)
+            input_file.truncate()
+            input_file.flush()
+        self._input_offset = 0
+
+    async def _file_read(self) -> AsyncIterable[bytes]:
         """
-        Generate input file read chunks and truncate data already read.
+        Generate the chunks of data appended to the input file.
 
-        :param delay: float, delay on empty read.
         :yield: async generator return file read bytes.
         """
         if not self.input_file:  # pragma: nocover
             raise ValueError("Input file not opened! Call Connection.connect first.")
 
+        delay = self.read_delay
         while True:
             if self.input_file.closed:  # pragma: nocover
                 return
-            with lock_file(self.input_file):
-                data = self.input_file.read()
-                if data:
-                    self.input_file.truncate(0)
-                    self.input_file.seek(0)
+            if self._input_changed is not None:
+                self._input_changed.clear()
 
+            data = self._read_new_data()
             if data:
+                delay = self.read_delay
                 yield data
+            elif self._input_changed is not None:
+                await self._input_changed.wait()
             else:
                 await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_read_delay)
 
     async def read_envelopes(self) -> None:
         """Read envelopes from input file, decode and put into in_queue."""
@@ -162,7 +266,7 @@ class StubConnection(Connection):
             raise ValueError("Input queue not initialized.")
 
         self.logger.debug("Read messages!")
-        async for data in self._file_read_and_trunc(delay=self.read_delay):
+        async for data in self._file_read():
             lines = self._split_messages(data)
             for line in lines:
                 envelope = envelope_from_bytes(line, SEPARATOR, self.logger)
@@ -209,6 +313,8 @@ class StubConnection(Connection):
         with self._connect_context():
             self.in_queue = asyncio.Queue()
             self._open_files()
+            self._input_offset = 0
+            self._start_watching_input()
             self._read_envelopes_task = self.loop.create_task(self.read_envelopes())
 
     async def _stop_read_envelopes(self) -> None:
@@ -246,8 +352,11 @@ class StubConnection(Connection):
 
         self.state = ConnectionStates.disconnecting
         await self._stop_read_envelopes()
+        self._stop_watching_input()
         self._write_pool.shutdown(wait=True)  # wait write operation to complete
         self.in_queue.put_nowait(None)
+        # so the envelopes delivered are not read again on the next connect
+        self._drop_consumed_input()
         self._close_files()
         self.state = ConnectionStates.disconnected
 
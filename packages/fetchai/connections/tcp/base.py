@@ -20,12 +20,14 @@
 """Base classes for TCP communication."""
 import logging
 import struct
+import weakref
 from abc import ABC, abstractmethod
-from asyncio import CancelledError, StreamReader, StreamWriter
-from typing import Any, Optional
+from asyncio import CancelledError, IncompleteReadError, StreamReader, StreamWriter
+from typing import Any, MutableMapping, Optional
 
 from aea.configurations.base import PublicId
 from aea.connections.base import Connection, ConnectionStates
+from aea.helpers.frames import FrameWriter
 from aea.mail.base import Envelope
 
 
@@ -33,6 +35,8 @@ _default_logger = logging.getLogger("aea.packages.fetchai.connections.tcp")
 
 PUBLIC_ID = PublicId.from_str("fetchai/tcp:0.17.3")
 
+FRAME_HEADER = struct.Struct("I")
+
 
 class TCPConnection(Connection, ABC):
     """Abstract TCP connection."""
@@ -52,6 +56,9 @@ class TCPConnection(Connection, ABC):
         # for the client, the server address/port
         self.host = host
         self.port = port
+        self._frame_writers: MutableMapping[
+            StreamWriter, FrameWriter
+        ] = weakref.WeakKeyDictionary()
 
     @abstractmethod
     async def setup(self) -> None:
@@ -95,26 +102,25 @@ class TCPConnection(Connection, ABC):
         self.state = ConnectionStates.disconnected
 
     async def _recv(self, reader: StreamReader) -> Optional[bytes]:
-        """Receive bytes."""
-        data = await reader.read(len(struct.pack("I", 0)))
-        if not self.is_connected:
+        """Receive a frame, or None if the stream was closed."""
+        try:
+            header = await reader.readexactly(FRAME_HEADER.size)
+            if not self.is_connected:
+                return None
+            (nbytes,) = FRAME_HEADER.unpack(header)
+            return await reader.readexactly(nbytes)
+        except IncompleteReadError:
             return None
-        nbytes = struct.unpack("I", data)[0]
-        nbytes_read = 0
-        data = b""
-        while nbytes_read < nbytes:
-            data += await reader.read(nbytes - nbytes_read)
-            nbytes_read = len(data)
-        return data
 
     async def _send(self, writer: StreamWriter, data: bytes) -> None:
         self.logger.debug("[{}] Send a message".format(self.address))
-        nbytes = struct.pack("I", len(data))
-        self.logger.debug("#bytes: {!r}".format(nbytes))
+        self.logger.debug("#bytes: {}".format(len(data)))
+        frame_writer = self._frame_writers.get(writer)
+        if frame_writer is None:
+            frame_writer = FrameWriter(writer, header=FRAME_HEADER)
+            self._frame_writers[writer] = frame_writer
         try:
-            writer.write(nbytes)
-            writer.write(data)
-            await writer.drain()
+            await frame_writer.write(data)
         except CancelledError:
             return None
 
@@ -93,12 +93,17 @@ class TCPServerConnection(TCPConnection):
 
             # take the first
             task = next(iter(done))
+            address = self._read_tasks_to_address.pop(task)
             envelope_bytes = task.result()
             if envelope_bytes is None:  # pragma: no cover
-                self.logger.debug("[{}]: No data received.")
+                self.logger.debug(
+                    "[{}]: Connection closed by {}.".format(self.address, address)
+                )
+                connection = self.connections.pop(address, None)
+                if connection is not None:
+                    connection[1].close()
                 return None
             envelope = Envelope.decode(envelope_bytes)
-            address = self._read_tasks_to_address.pop(task)
             reader = self.connections[address][0]
             new_task = asyncio.ensure_future(self._recv(reader), loop=self.loop)
             self._read_tasks_to_address[new_task] = address
@@ -22,8 +22,7 @@
 # pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
 from typing import Any, Dict, cast
 
-from aea.mail.base_pb2 import DialogueMessage
-from aea.mail.base_pb2 import Message as ProtobufMessage
+from aea.mail.base import decode_dialogue_message, encode_dialogue_message
 from aea.protocols.base import Message, Serializer
 
 from packages.fetchai.protocols.contract_api import contract_api_pb2
@@ -48,16 +47,8 @@ class ContractApiSerializer(Serializer):
         :return: the bytes.
         """
         msg = cast(ContractApiMessage, msg)
-        message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
         contract_api_msg = contract_api_pb2.ContractApiMessage()
 
-        dialogue_message_pb.message_id = msg.message_id
-        dialogue_reference = msg.dialogue_reference
-        dialogue_message_pb.dialogue_starter_reference = dialogue_reference[0]
-        dialogue_message_pb.dialogue_responder_reference = dialogue_reference[1]
-        dialogue_message_pb.target = msg.target
-
         performative_id = msg.performative
         if performative_id == ContractApiMessage.Performative.GET_DEPLOY_TRANSACTION:
             performative = contract_api_pb2.ContractApiMessage.Get_Deploy_Transaction_Performative()  # type: ignore
@@ -140,10 +131,12 @@ class ContractApiSerializer(Serializer):
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
-        dialogue_message_pb.content = contract_api_msg.SerializeToString()
-
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
-        message_bytes = message_pb.SerializeToString()
+        message_bytes = encode_dialogue_message(
+            msg.message_id,
+            msg.dialogue_reference,
+            msg.target,
+            contract_api_msg.SerializeToString(),
+        )
         return message_bytes
 
     @staticmethod
@@ -154,17 +147,15 @@ class ContractApiSerializer(Serializer):
         :param obj: the bytes object.
         :return: the 'ContractApi' message.
         """
-        message_pb = ProtobufMessage()
         contract_api_pb = contract_api_pb2.ContractApiMessage()
-        message_pb.ParseFromString(obj)
-        message_id = message_pb.dialogue_message.message_id
-        dialogue_reference = (
-            message_pb.dialogue_message.dialogue_starter_reference,
-            message_pb.dialogue_message.dialogue_responder_reference,
-        )
-        target = message_pb.dialogue_message.target
-
-        contract_api_pb.ParseFromString(message_pb.dialogue_message.content)
+        (
+            message_id,
+            dialogue_reference,
+            target,
+            content_buffer,
+        ) = decode_dialogue_message(obj)
+
+        contract_api_pb.ParseFromString(content_buffer)
         performative = contract_api_pb.WhichOneof("performative")
         performative_id = ContractApiMessage.Performative(str(performative))
         performative_content = {}  # type: Dict[str, Any]
@@ -22,8 +22,7 @@
 # pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
 from typing import Any, Dict, cast
 
-from aea.mail.base_pb2 import DialogueMessage
-from aea.mail.base_pb2 import Message as ProtobufMessage
+from aea.mail.base import decode_dialogue_message, encode_dialogue_message
 from aea.protocols.base import Message, Serializer
 
 from packages.fetchai.protocols.default import default_pb2
@@ -43,16 +42,8 @@ class DefaultSerializer(Serializer):
         :return: the bytes.
         """
         msg = cast(DefaultMessage, msg)
-        message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
         default_msg = default_pb2.DefaultMessage()
 
-        dialogue_message_pb.message_id = msg.message_id
-        dialogue_reference = msg.dialogue_reference
-        dialogue_message_pb.dialogue_starter_reference = dialogue_reference[0]
-        dialogue_message_pb.dialogue_responder_reference = dialogue_reference[1]
-        dialogue_message_pb.target = msg.target
-
         performative_id = msg.performative
         if performative_id == DefaultMessage.Performative.BYTES:
             performative = default_pb2.DefaultMessage.Bytes_Performative()  # type: ignore
@@ -74,10 +65,12 @@ class DefaultSerializer(Serializer):
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
-        dialogue_message_pb.content = default_msg.SerializeToString()
-
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
-        message_bytes = message_pb.SerializeToString()
+        message_bytes = encode_dialogue_message(
+            msg.message_id,
+            msg.dialogue_reference,
+            msg.target,
+            default_msg.SerializeToString(),
+        )
         return message_bytes
 
     @staticmethod
@@ -88,17 +81,15 @@ class DefaultSerializer(Serializer):
         :param obj: the bytes object.
         :return: the 'Default' message.
         """
-        message_pb = ProtobufMessage()
         default_pb = default_pb2.DefaultMessage()
-        message_pb.ParseFromString(obj)
-        message_id = message_pb.dialogue_message.message_id
-        dialogue_reference = (
-            message_pb.dialogue_message.dialogue_starter_reference,
-            message_pb.dialogue_message.dialogue_responder_reference,
-        )
-        target = message_pb.dialogue_message.target
-
-        default_pb.ParseFromString(message_pb.dialogue_message.content)
+        (
+            message_id,
+            dialogue_reference,
+            target,
+            content_buffer,
+        ) = decode_dialogue_message(obj)
+
+        default_pb.ParseFromString(content_buffer)
         performative = default_pb.WhichOneof("performative")
         performative_id = DefaultMessage.Performative(str(performative))
         performative_content = {}  # type: Dict[str, Any]
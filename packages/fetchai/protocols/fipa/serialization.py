@@ -22,8 +22,7 @@
 # pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
 from typing import Any, Dict, cast
 
-from aea.mail.base_pb2 import DialogueMessage
-from aea.mail.base_pb2 import Message as ProtobufMessage
+from aea.mail.base import decode_dialogue_message, encode_dialogue_message
 from aea.protocols.base import Message, Serializer
 
 from packages.fetchai.protocols.fipa import fipa_pb2
@@ -43,16 +42,8 @@ class FipaSerializer(Serializer):
         :return: the bytes.
         """
         msg = cast(FipaMessage, msg)
-        message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
         fipa_msg = fipa_pb2.FipaMessage()
 
-        dialogue_message_pb.message_id = msg.message_id
-        dialogue_reference = msg.dialogue_reference
-        dialogue_message_pb.dialogue_starter_reference = dialogue_reference[0]
-        dialogue_message_pb.dialogue_responder_reference = dialogue_reference[1]
-        dialogue_message_pb.target = msg.target
-
         performative_id = msg.performative
         if performative_id == FipaMessage.Performative.CFP:
             performative = fipa_pb2.FipaMessage.Cfp_Performative()  # type: ignore
@@ -94,10 +85,12 @@ class FipaSerializer(Serializer):
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
-        dialogue_message_pb.content = fipa_msg.SerializeToString()
-
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
-        message_bytes = message_pb.SerializeToString()
+        message_bytes = encode_dialogue_message(
+            msg.message_id,
+            msg.dialogue_reference,
+            msg.target,
+            fipa_msg.SerializeToString(),
+        )
         return message_bytes
 
     @staticmethod
@@ -108,17 +101,15 @@ class FipaSerializer(Serializer):
         :param obj: the bytes object.
         :return: the 'Fipa' message.
         """
-        message_pb = ProtobufMessage()
         fipa_pb = fipa_pb2.FipaMessage()
-        message_pb.ParseFromString(obj)
-        message_id = message_pb.dialogue_message.message_id
-        dialogue_reference = (
-            message_pb.dialogue_message.dialogue_starter_reference,
-            message_pb.dialogue_message.dialogue_responder_reference,
-        )
-        target = message_pb.dialogue_message.target
-
-        fipa_pb.ParseFromString(message_pb.dialogue_message.content)
+        (
+            message_id,
+            dialogue_reference,
+            target,
+            content_buffer,
+        ) = decode_dialogue_message(obj)
+
+        fipa_pb.ParseFromString(content_buffer)
         performative = fipa_pb.WhichOneof("performative")
         performative_id = FipaMessage.Performative(str(performative))
         performative_content = {}  # type: Dict[str, Any]
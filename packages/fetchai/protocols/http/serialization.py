@@ -22,8 +22,7 @@
 # pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
 from typing import Any, Dict, cast
 
-from aea.mail.base_pb2 import DialogueMessage
-from aea.mail.base_pb2 import Message as ProtobufMessage
+from aea.mail.base import decode_dialogue_message, encode_dialogue_message
 from aea.protocols.base import Message, Serializer
 
 from packages.fetchai.protocols.http import http_pb2
@@ -42,16 +41,8 @@ class HttpSerializer(Serializer):
         :return: the bytes.
         """
         msg = cast(HttpMessage, msg)
-        message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
         http_msg = http_pb2.HttpMessage()
 
-        dialogue_message_pb.message_id = msg.message_id
-        dialogue_reference = msg.dialogue_reference
-        dialogue_message_pb.dialogue_starter_reference = dialogue_reference[0]
-        dialogue_message_pb.dialogue_responder_reference = dialogue_reference[1]
-        dialogue_message_pb.target = msg.target
-
         performative_id = msg.performative
         if performative_id == HttpMessage.Performative.REQUEST:
             performative = http_pb2.HttpMessage.Request_Performative()  # type: ignore
@@ -82,10 +73,12 @@ class HttpSerializer(Serializer):
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
-        dialogue_message_pb.content = http_msg.SerializeToString()
-
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
-        message_bytes = message_pb.SerializeToString()
+        message_bytes = encode_dialogue_message(
+            msg.message_id,
+            msg.dialogue_reference,
+            msg.target,
+            http_msg.SerializeToString(),
+        )
         return message_bytes
 
     @staticmethod
@@ -96,17 +89,15 @@ class HttpSerializer(Serializer):
         :param obj: the bytes object.
         :return: the 'Http' message.
         """
-        message_pb = ProtobufMessage()
         http_pb = http_pb2.HttpMessage()
-        message_pb.ParseFromString(obj)
-        message_id = message_pb.dialogue_message.message_id
-        dialogue_reference = (
-            message_pb.dialogue_message.dialogue_starter_reference,
-            message_pb.dialogue_message.dialogue_responder_reference,
-        )
-        target = message_pb.dialogue_message.target
-
-        http_pb.ParseFromString(message_pb.dialogue_message.content)
+        (
+            message_id,
+            dialogue_reference,
+            target,
+            content_buffer,
+        ) = decode_dialogue_message(obj)
+
+        http_pb.ParseFromString(content_buffer)
         performative = http_pb.WhichOneof("performative")
         performative_id = HttpMessage.Performative(str(performative))
         performative_content = {}  # type: Dict[str, Any]
@@ -22,8 +22,7 @@
 # pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
 from typing import Any, Dict, cast
 
-from aea.mail.base_pb2 import DialogueMessage
-from aea.mail.base_pb2 import Message as ProtobufMessage
+from aea.mail.base import decode_dialogue_message, encode_dialogue_message
 from aea.protocols.base import Message, Serializer
 
 from packages.fetchai.protocols.ledger_api import ledger_api_pb2
@@ -51,16 +50,8 @@ class LedgerApiSerializer(Serializer):
         :return: the bytes.
         """
         msg = cast(LedgerApiMessage, msg)
-        message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
         ledger_api_msg = ledger_api_pb2.LedgerApiMessage()
 
-        dialogue_message_pb.message_id = msg.message_id
-        dialogue_reference = msg.dialogue_reference
-        dialogue_message_pb.dialogue_starter_reference = dialogue_reference[0]
-        dialogue_message_pb.dialogue_responder_reference = dialogue_reference[1]
-        dialogue_message_pb.target = msg.target
-
         performative_id = msg.performative
         if performative_id == LedgerApiMessage.Performative.GET_BALANCE:
             performative = ledger_api_pb2.LedgerApiMessage.Get_Balance_Performative()  # type: ignore
@@ -148,10 +139,12 @@ class LedgerApiSerializer(Serializer):
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
-        dialogue_message_pb.content = ledger_api_msg.SerializeToString()
-
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
-        message_bytes = message_pb.SerializeToString()
+        message_bytes = encode_dialogue_message(
+            msg.message_id,
+            msg.dialogue_reference,
+            msg.target,
+            ledger_api_msg.SerializeToString(),
+        )
         return message_bytes
 
     @staticmethod
@@ -162,17 +155,15 @@ class LedgerApiSerializer(Serializer):
         :param obj: the bytes object.
         :return: the 'LedgerApi' message.
         """
-        message_pb = ProtobufMessage()
         ledger_api_pb = ledger_api_pb2.LedgerApiMessage()
-        message_pb.ParseFromString(obj)
-        message_id = message_pb.dialogue_message.message_id
-        dialogue_reference = (
-            message_pb.dialogue_message.dialogue_starter_reference,
-            message_pb.dialogue_message.dialogue_responder_reference,
-        )
-        target = message_pb.dialogue_message.target
-
-        ledger_api_pb.ParseFromString(message_pb.dialogue_message.content)
+        (
+            message_id,
+            dialogue_reference,
+            target,
+            content_buffer,
+        ) = decode_dialogue_message(obj)
+
+        ledger_api_pb.ParseFromString(content_buffer)
         performative = ledger_api_pb.WhichOneof("performative")
         performative_id = LedgerApiMessage.Performative(str(performative))
         performative_content = {}  # type: Dict[str, Any]
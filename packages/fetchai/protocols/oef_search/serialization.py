@@ -22,8 +22,7 @@
 # pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
 from typing import Any, Dict, cast
 
-from aea.mail.base_pb2 import DialogueMessage
-from aea.mail.base_pb2 import Message as ProtobufMessage
+from aea.mail.base import decode_dialogue_message, encode_dialogue_message
 from aea.protocols.base import Message, Serializer
 
 from packages.fetchai.protocols.oef_search import oef_search_pb2
@@ -48,16 +47,8 @@ class OefSearchSerializer(Serializer):
         :return: the bytes.
         """
         msg = cast(OefSearchMessage, msg)
-        message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
         oef_search_msg = oef_search_pb2.OefSearchMessage()
 
-        dialogue_message_pb.message_id = msg.message_id
-        dialogue_reference = msg.dialogue_reference
-        dialogue_message_pb.dialogue_starter_reference = dialogue_reference[0]
-        dialogue_message_pb.dialogue_responder_reference = dialogue_reference[1]
-        dialogue_message_pb.target = msg.target
-
         performative_id = msg.performative
         if performative_id == OefSearchMessage.Performative.REGISTER_SERVICE:
             performative = oef_search_pb2.OefSearchMessage.Register_Service_Performative()  # type: ignore
@@ -96,10 +87,12 @@ class OefSearchSerializer(Serializer):
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
-        dialogue_message_pb.content = oef_search_msg.SerializeToString()
-
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
-        message_bytes = message_pb.SerializeToString()
+        message_bytes = encode_dialogue_message(
+            msg.message_id,
+            msg.dialogue_reference,
+            msg.target,
+            oef_search_msg.SerializeToString(),
+        )
         return message_bytes
 
     @staticmethod
@@ -110,17 +103,15 @@ class OefSearchSerializer(Serializer):
         :param obj: the bytes object.
         :return: the 'OefSearch' message.
         """
-        message_pb = ProtobufMessage()
         oef_search_pb = oef_search_pb2.OefSearchMessage()
-        message_pb.ParseFromString(obj)
-        message_id = message_pb.dialogue_message.message_id
-        dialogue_reference = (
-            message_pb.dialogue_message.dialogue_starter_reference,
-            message_pb.dialogue_message.dialogue_responder_reference,
-        )
-        target = message_pb.dialogue_message.target
-
-        oef_search_pb.ParseFromString(message_pb.dialogue_message.content)
+        (
+            message_id,
+            dialogue_reference,
+            target,
+            content_buffer,
+        ) = decode_dialogue_message(obj)
+
+        oef_search_pb.ParseFromString(content_buffer)
         performative = oef_search_pb.WhichOneof("performative")
         performative_id = OefSearchMessage.Performative(str(performative))
         performative_content = {}  # type: Dict[str, Any]
@@ -22,8 +22,7 @@
 # pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
 from typing import Any, Dict, cast
 
-from aea.mail.base_pb2 import DialogueMessage
-from aea.mail.base_pb2 import Message as ProtobufMessage
+from aea.mail.base import decode_dialogue_message, encode_dialogue_message
 from aea.protocols.base import Message, Serializer
 
 from packages.fetchai.protocols.prometheus import prometheus_pb2
@@ -42,16 +41,8 @@ class PrometheusSerializer(Serializer):
         :return: the bytes.
         """
         msg = cast(PrometheusMessage, msg)
-        message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
         prometheus_msg = prometheus_pb2.PrometheusMessage()
 
-        dialogue_message_pb.message_id = msg.message_id
-        dialogue_reference = msg.dialogue_reference
-        dialogue_message_pb.dialogue_starter_reference = dialogue_reference[0]
-        dialogue_message_pb.dialogue_responder_reference = dialogue_reference[1]
-        dialogue_message_pb.target = msg.target
-
         performative_id = msg.performative
         if performative_id == PrometheusMessage.Performative.ADD_METRIC:
             performative = prometheus_pb2.PrometheusMessage.Add_Metric_Performative()  # type: ignore
@@ -87,10 +78,12 @@ class PrometheusSerializer(Serializer):
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
-        dialogue_message_pb.content = prometheus_msg.SerializeToString()
-
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
-        message_bytes = message_pb.SerializeToString()
+        message_bytes = encode_dialogue_message(
+            msg.message_id,
+            msg.dialogue_reference,
+            msg.target,
+            prometheus_msg.SerializeToString(),
+        )
         return message_bytes
 
     @staticmethod
@@ -101,17 +94,15 @@ class PrometheusSerializer(Serializer):
         :param obj: the bytes object.
         :return: the 'Prometheus' message.
         """
-        message_pb = ProtobufMessage()
         prometheus_pb = prometheus_pb2.PrometheusMessage()
-        message_pb.ParseFromString(obj)
-        message_id = message_pb.dialogue_message.message_id
-        dialogue_reference = (
-            message_pb.dialogue_message.dialogue_starter_reference,
-            message_pb.dialogue_message.dialogue_responder_reference,
-        )
-        target = message_pb.dialogue_message.target
-
-        prometheus_pb.ParseFromString(message_pb.dialogue_message.content)
+        (
+            message_id,
+            dialogue_reference,
+            target,
+            content_buffer,
+        ) = decode_dialogue_message(obj)
+
+        prometheus_pb.ParseFromString(content_buffer)
         performative = prometheus_pb.WhichOneof("performative")
         performative_id = PrometheusMessage.Performative(str(performative))
         performative_content = {}  # type: Dict[str, Any]
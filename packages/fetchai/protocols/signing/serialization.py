@@ -22,8 +22,7 @@
 # pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
 from typing import Any, Dict, cast
 
-from aea.mail.base_pb2 import DialogueMessage
-from aea.mail.base_pb2 import Message as ProtobufMessage
+from aea.mail.base import decode_dialogue_message, encode_dialogue_message
 from aea.protocols.base import Message, Serializer
 
 from packages.fetchai.protocols.signing import signing_pb2
@@ -50,16 +49,8 @@ class SigningSerializer(Serializer):
         :return: the bytes.
         """
         msg = cast(SigningMessage, msg)
-        message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
         signing_msg = signing_pb2.SigningMessage()
 
-        dialogue_message_pb.message_id = msg.message_id
-        dialogue_reference = msg.dialogue_reference
-        dialogue_message_pb.dialogue_starter_reference = dialogue_reference[0]
-        dialogue_message_pb.dialogue_responder_reference = dialogue_reference[1]
-        dialogue_message_pb.target = msg.target
-
         performative_id = msg.performative
         if performative_id == SigningMessage.Performative.SIGN_TRANSACTION:
             performative = signing_pb2.SigningMessage.Sign_Transaction_Performative()  # type: ignore
@@ -95,10 +86,12 @@ class SigningSerializer(Serializer):
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
-        dialogue_message_pb.content = signing_msg.SerializeToString()
-
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
-        message_bytes = message_pb.SerializeToString()
+        message_bytes = encode_dialogue_message(
+            msg.message_id,
+            msg.dialogue_reference,
+            msg.target,
+            signing_msg.SerializeToString(),
+        )
         return message_bytes
 
     @staticmethod
@@ -109,17 +102,15 @@ class SigningSerializer(Serializer):
         :param obj: the bytes object.
         :return: the 'Signing' message.
         """
-        message_pb = ProtobufMessage()
         signing_pb = signing_pb2.SigningMessage()
-        message_pb.ParseFromString(obj)
-        message_id = message_pb.dialogue_message.message_id
-        dialogue_reference = (
-            message_pb.dialogue_message.dialogue_starter_reference,
-            message_pb.dialogue_message.dialogue_responder_reference,
-        )
-        target = message_pb.dialogue_message.target
-
-        signing_pb.ParseFromString(message_pb.dialogue_message.content)
+        (
+            message_id,
+            dialogue_reference,
+            target,
+            content_buffer,
+        ) = decode_dialogue_message(obj)
+
+        signing_pb.ParseFromString(content_buffer)
         performative = signing_pb.WhichOneof("performative")
         performative_id = SigningMessage.Performative(str(performative))
         performative_content = {}  # type: Dict[str, Any]
@@ -22,8 +22,7 @@
 # pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
 from typing import Any, Dict, cast
 
-from aea.mail.base_pb2 import DialogueMessage
-from aea.mail.base_pb2 import Message as ProtobufMessage
+from aea.mail.base import decode_dialogue_message, encode_dialogue_message
 from aea.protocols.base import Message, Serializer
 
 from packages.fetchai.protocols.tac import tac_pb2
@@ -43,16 +42,8 @@ class TacSerializer(Serializer):
         :return: the bytes.
         """
         msg = cast(TacMessage, msg)
-        message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
         tac_msg = tac_pb2.TacMessage()
 
-        dialogue_message_pb.message_id = msg.message_id
-        dialogue_reference = msg.dialogue_reference
-        dialogue_message_pb.dialogue_starter_reference = dialogue_reference[0]
-        dialogue_message_pb.dialogue_responder_reference = dialogue_reference[1]
-        dialogue_message_pb.target = msg.target
-
         performative_id = msg.performative
         if performative_id == TacMessage.Performative.REGISTER:
             performative = tac_pb2.TacMessage.Register_Performative()  # type: ignore
@@ -136,10 +127,12 @@ class TacSerializer(Serializer):
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
-        dialogue_message_pb.content = tac_msg.SerializeToString()
-
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
-        message_bytes = message_pb.SerializeToString()
+        message_bytes = encode_dialogue_message(
+            msg.message_id,
+            msg.dialogue_reference,
+            msg.target,
+            tac_msg.SerializeToString(),
+        )
         return message_bytes
 
     @staticmethod
@@ -150,17 +143,15 @@ class TacSerializer(Serializer):
         :param obj: the bytes object.
         :return: the 'Tac' message.
         """
-        message_pb = ProtobufMessage()
         tac_pb = tac_pb2.TacMessage()
-        message_pb.ParseFromString(obj)
-        message_id = message_pb.dialogue_message.message_id
-        dialogue_reference = (
-            message_pb.dialogue_message.dialogue_starter_reference,
-            message_pb.dialogue_message.dialogue_responder_reference,
-        )
-        target = message_pb.dialogue_message.target
+        (
+            message_id,
+            dialogue_reference,
+            target,
+            content_buffer,
+        ) = decode_dialogue_message(obj)
 
-        tac_pb.ParseFromString(message_pb.dialogue_message.content)
+        tac_pb.ParseFromString(content_buffer)
         performative = tac_pb.WhichOneof("performative")
         performative_id = TacMessage.Performative(str(performative))
         performative_content = {}  # type: Dict[str, Any]
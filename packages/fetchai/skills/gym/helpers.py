@@ -61,6 +61,7 @@ class ProxyEnv(gym.Env):
         self._is_rl_agent_trained = False
         self._step_count = 0
         self._active_dialogue = None  # type: Optional[GymDialogue]
+        self._num_envs = 1
         self.gym_address = str(GYM_CONNECTION_PUBLIC_ID)
 
     @property
@@ -80,6 +81,11 @@ class ProxyEnv(gym.Env):
         """Get queue."""
         return self._queue
 
+    @property
+    def num_envs(self) -> int:
+        """Get the number of environments stepped as a batch by the gym connection."""
+        return self._num_envs
+
     @property
     def is_rl_agent_trained(self) -> bool:
         """Get training status."""
@@ -97,6 +103,10 @@ class ProxyEnv(gym.Env):
         - The envelope is decoded with _decode_percept to a message.
         - The message is converted into the standard observation, reward, done and info via _message_to_percept
 
+        When the gym connection steps a batch of environments, the action is the
+        list of the actions of the environments, and the observations, rewards,
+        dones and infos are returned as lists, as in 'gym.vector'.
+
         :param action: the action sent to the step method (e.g. the output of an RL algorithm)
         :return: a Tuple containing the Feedback of Observation, Reward, Done and Info
         """
@@ -116,7 +126,12 @@ class ProxyEnv(gym.Env):
             )
 
         if gym_msg.step_id == step_id:
-            observation, reward, done, info = self._message_to_percept(gym_msg)
+            if self._num_envs > 1:
+                observation, reward, done, info = self._message_to_batch_percept(
+                    gym_msg
+                )
+            else:
+                observation, reward, done, info = self._message_to_percept(gym_msg)
         else:
             raise ValueError(
                 "Unexpected step id! expected={}, actual={}".format(
@@ -154,6 +169,7 @@ class ProxyEnv(gym.Env):
                     GymMessage.Performative.STATUS, response_msg.performative
                 )
             )
+        self._num_envs = int(response_msg.content.get("num_envs", 1))
 
     def close(self) -> None:
         """Close the environment."""
@@ -202,6 +218,18 @@ class ProxyEnv(gym.Env):
 
         return observation, reward, done, info
 
+    @staticmethod
+    def _message_to_batch_percept(message: Message) -> Feedback:
+        """
+        Transform the message received from a batch of gym environments into observations, rewards, dones, infos.
+
+        :param message: the message received as a response to the actions performed in apply_action.
+        :return: the lists of the feedback (observation, reward, done, info) of each environment.
+        """
+        msg = cast(GymMessage, message)
+        batch = msg.info.any
+        return msg.observation.any, batch["rewards"], batch["dones"], batch["infos"]
+
 
 class RLAgent(ABC):
     """Abstract RL Agent."""
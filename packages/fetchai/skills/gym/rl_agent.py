@@ -179,11 +179,19 @@ class MyRLAgent(RLAgent):
 
         proxy_env.reset()
         while action_counter < nb_steps:
-            action = self._pick_an_action()
-            obs, reward, done, info = proxy_env.step(action)
-            self._update_model(obs, reward, done, info, action)
-            action_counter += 1
-            if action_counter % 10 == 0:
+            if proxy_env.num_envs > 1:
+                actions = [self._pick_an_action() for _ in range(proxy_env.num_envs)]
+                observations, rewards, dones, infos = proxy_env.step(actions)
+                for feedback in zip(observations, rewards, dones, infos, actions):
+                    self._update_model(*feedback)
+                action, reward = actions[-1], rewards[-1]
+                action_counter += proxy_env.num_envs
+            else:
+                action = self._pick_an_action()
+                obs, reward, done, info = proxy_env.step(action)
+                self._update_model(obs, reward, done, info, action)
+                action_counter += 1
+            if action_counter % 10 < proxy_env.num_envs:
                 self.logger.info(
                     "Action: step_id='{}' action='{}' reward='{}'".format(
                         action_counter, action, reward
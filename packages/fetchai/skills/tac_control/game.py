@@ -23,7 +23,9 @@ import copy
 import datetime
 import pprint
 from enum import Enum
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Set, Tuple, cast
+
+import numpy as np
 
 from aea.common import Address
 from aea.crypto.ledger_apis import LedgerApis
@@ -44,12 +46,13 @@ from aea.skills.base import Model
 
 from packages.fetchai.protocols.tac.message import TacMessage
 from packages.fetchai.skills.tac_control.helpers import (
+    array_to_dicts,
     determine_scaling_factor,
     generate_currency_endowments,
-    generate_equilibrium_prices_and_holdings,
+    generate_equilibrium_prices_and_holdings_array,
     generate_exchange_params,
-    generate_good_endowments,
-    generate_utility_params,
+    generate_good_endowments_array,
+    generate_utility_params_array,
 )
 from packages.fetchai.skills.tac_control.parameters import Parameters
 
@@ -67,6 +70,11 @@ UtilityParams = Dict[GoodId, Parameter]
 EquilibriumCurrencyHoldings = Dict[CurrencyId, EquilibriumQuantity]
 EquilibriumGoodHoldings = Dict[GoodId, EquilibriumQuantity]
 
+QUANTITY_SHIFT = 100  # the default quantity shift of logarithmic_utility
+NON_POSITIVE_QUANTITY_UTILITY = -10000.0
+# the buyer and seller rows, the currency column, the price, the good columns and the quantities
+Transfer = Tuple[int, int, int, int, List[int], List[int]]
+
 
 class Phase(Enum):
     """This class defines the phases of the game."""
@@ -654,26 +662,48 @@ class AgentState:
 
 
 class Transactions:
-    """Class managing the transactions."""
+    """
+    Class managing the transactions.
+
+    Confirmed transactions are appended to a log, and the positions in the log
+    of the transactions of each agent are indexed by agent.
+    """
 
     def __init__(self) -> None:
         """Instantiate the transaction class."""
-        self._confirmed = {}  # type: Dict[datetime.datetime, Transaction]
-        self._confirmed_per_agent = (
-            {}
-        )  # type: Dict[Address, Dict[datetime.datetime, Transaction]]
+        self._confirmed = []  # type: List[Transaction]
+        self._timestamps = []  # type: List[datetime.datetime]
+        self._indexes_per_agent = {}  # type: Dict[Address, List[int]]
 
     @property
-    def confirmed(self) -> Dict[datetime.datetime, Transaction]:
-        """Get the confirmed transactions."""
+    def confirmed(self) -> List[Transaction]:
+        """Get the confirmed transactions, in the order they were confirmed."""
         return self._confirmed
 
     @property
-    def confirmed_per_agent(
-        self,
-    ) -> Dict[Address, Dict[datetime.datetime, Transaction]]:
+    def timestamps(self) -> List[datetime.datetime]:
+        """Get the confirmation time of each confirmed transaction."""
+        return self._timestamps
+
+    @property
+    def confirmed_per_agent(self) -> Dict[Address, List[Transaction]]:
         """Get the confirmed transactions by agent."""
-        return self._confirmed_per_agent
+        return {
+            agent_address: [self._confirmed[index] for index in indexes]
+            for agent_address, indexes in self._indexes_per_agent.items()
+        }
+
+    def get_confirmed_for_agent(self, agent_address: Address) -> List[Transaction]:
+        """
+        Get the confirmed transactions of an agent.
+
+        :param agent_address: the address of the agent
+        :return: the transactions the agent took part in, in the order they were confirmed
+        """
+        return [
+            self._confirmed[index]
+            for index in self._indexes_per_agent.get(agent_address, [])
+        ]
 
     def add(self, transaction: Transaction) -> None:
         """
@@ -681,14 +711,304 @@ class Transactions:
 
         :param transaction: the transaction
         """
+        self.add_batch([transaction])
+
+    def add_batch(self, transactions: List[Transaction]) -> None:
+        """
+        Add transactions confirmed together.
+
+        :param transactions: the transactions, in the order they were settled
+        """
         now = datetime.datetime.now()
-        self._confirmed[now] = transaction
-        if self._confirmed_per_agent.get(transaction.sender_address) is None:
-            self._confirmed_per_agent[transaction.sender_address] = {}
-        self._confirmed_per_agent[transaction.sender_address][now] = transaction
-        if self._confirmed_per_agent.get(transaction.counterparty_address) is None:
-            self._confirmed_per_agent[transaction.counterparty_address] = {}
-        self._confirmed_per_agent[transaction.counterparty_address][now] = transaction
+        for transaction in transactions:
+            index = len(self._confirmed)
+            self._confirmed.append(transaction)
+            self._timestamps.append(now)
+            self._indexes_per_agent.setdefault(transaction.sender_address, []).append(
+                index
+            )
+            if transaction.counterparty_address != transaction.sender_address:
+                self._indexes_per_agent.setdefault(
+                    transaction.counterparty_address, []
+                ).append(index)
+
+
+class Settlement:
+    """
+    Class settling the transactions of the game.
+
+    The holdings of the agents are kept in dense arrays, with a row per agent
+    and a column per good or currency, so transactions are checked and applied
+    in place and the scores of all the agents are computed at once.
+    """
+
+    def __init__(self, agent_states: Dict[Address, AgentState]) -> None:
+        """
+        Instantiate the settlement from the states of the agents.
+
+        :param agent_states: the state of each agent, all holding the same goods and currencies.
+        """
+        states = list(agent_states.values())
+        self._agent_addresses = list(agent_states.keys())
+        self._currency_ids = (
+            list(states[0].amount_by_currency_id.keys()) if states else []
+        )
+        self._good_ids = list(states[0].quantities_by_good_id.keys()) if states else []
+        enforce(
+            all(
+                state.amount_by_currency_id.keys() == set(self._currency_ids)
+                and state.quantities_by_good_id.keys() == set(self._good_ids)
+                for state in states
+            ),
+            "All agents must hold the same goods and currencies.",
+        )
+        self._agent_index = {
+            agent_address: index
+            for index, agent_address in enumerate(self._agent_addresses)
+        }
+        self._currency_index = {
+            currency_id: index for index, currency_id in enumerate(self._currency_ids)
+        }
+        self._good_index = {
+            good_id: index for index, good_id in enumerate(self._good_ids)
+        }
+        shape = (len(states), len(self._currency_ids))
+        self._amounts = np.zeros(shape, dtype=np.int64)
+        self._exchange_params = np.zeros(shape, dtype=np.float64)
+        shape = (len(states), len(self._good_ids))
+        self._quantities = np.zeros(shape, dtype=np.int64)
+        self._utility_params = np.zeros(shape, dtype=np.float64)
+        for row, state in enumerate(states):
+            amounts = state.amount_by_currency_id
+            exchange_params = state.exchange_params_by_currency_id
+            quantities = state.quantities_by_good_id
+            utility_params = state.utility_params_by_good_id
+            for column, currency_id in enumerate(self._currency_ids):
+                self._amounts[row, column] = amounts[currency_id]
+                self._exchange_params[row, column] = exchange_params[currency_id]
+            for column, good_id in enumerate(self._good_ids):
+                self._quantities[row, column] = quantities[good_id]
+                self._utility_params[row, column] = utility_params[good_id]
+        self._updated_agents = set()  # type: Set[Address]
+
+    @property
+    def agent_addresses(self) -> List[Address]:
+        """Get the addresses of the agents, in the order of the rows."""
+        return self._agent_addresses
+
+    def get_agent_state(self, agent_address: Address) -> AgentState:
+        """
+        Get the current state of an agent.
+
+        :param agent_address: the address of the agent.
+        :return: the agent state.
+        """
+        row = self._agent_index[agent_address]
+        return AgentState(
+            agent_address,
+            dict(zip(self._currency_ids, self._amounts[row].tolist())),
+            dict(zip(self._currency_ids, self._exchange_params[row].tolist())),
+            dict(zip(self._good_ids, self._quantities[row].tolist())),
+            dict(zip(self._good_ids, self._utility_params[row].tolist())),
+        )
+
+    def pop_updated_agents(self) -> Set[Address]:
+        """
+        Get the agents whose holdings changed since the last call.
+
+        :return: the addresses of the agents.
+        """
+        updated_agents = self._updated_agents
+        self._updated_agents = set()
+        return updated_agents
+
+    def _get_transfer(self, tx: Transaction) -> Optional[Transfer]:
+        """
+        Get the transfer of a transaction, if it is well formed.
+
+        The rules are the ones of AgentState.is_consistent_transaction: the
+        transaction must use a single currency, exchange some wealth and have
+        one party pay for the goods the other party gives.
+
+        :param tx: the transaction
+        :return: the buyer, seller, currency, price, goods and quantities, or None
+        """
+        sender = self._agent_index.get(tx.sender_address)
+        counterparty = self._agent_index.get(tx.counterparty_address)
+        if sender is None or counterparty is None or not tx.is_single_currency:
+            return None
+        currency_id, amount = next(iter(tx.amount_by_currency_id.items()))
+        currency = self._currency_index.get(currency_id)
+        quantities_by_good_id = tx.quantities_by_good_id
+        good_indexes = [
+            self._good_index.get(good_id) for good_id in quantities_by_good_id
+        ]
+        if currency is None or None in good_indexes:
+            return None
+        goods = cast(List[int], good_indexes)
+        quantities = list(quantities_by_good_id.values())
+        if amount == 0 and not any(quantities):
+            # reject the transaction when there is no wealth exchange
+            return None
+        if amount <= 0 and all(quantity >= 0 for quantity in quantities):
+            # sender is buyer, counterparty is seller
+            return sender, counterparty, currency, -amount, goods, quantities
+        if amount >= 0 and all(quantity <= 0 for quantity in quantities):
+            # sender is seller, counterparty is buyer
+            return (
+                counterparty,
+                sender,
+                currency,
+                amount,
+                goods,
+                [-quantity for quantity in quantities],
+            )
+        return None
+
+    def is_consistent_transaction(self, tx: Transaction) -> bool:
+        """
+        Check if the transaction is consistent with the holdings of both parties.
+
+        :param tx: the transaction
+        :return: True if the transaction is legal wrt the current holdings, False otherwise.
+        """
+        transfer = self._get_transfer(tx)
+        if transfer is None:
+            return False
+        buyer, seller, currency, price, goods, quantities = transfer
+        return bool(
+            self._amounts[buyer, currency] >= price
+            and (self._quantities[seller, goods] >= quantities).all()
+        )
+
+    def apply(self, tx: Transaction) -> None:
+        """
+        Apply a transaction to the holdings of both parties.
+
+        :param tx: the transaction.
+        """
+        enforce(self.is_consistent_transaction(tx), "Inconsistent transaction.")
+        self.settle([tx])
+
+    def settle(self, transactions: List[Transaction]) -> List[bool]:
+        """
+        Settle a batch of transactions, in order.
+
+        Each transaction is checked against the holdings left by the previous
+        ones, and inconsistent transactions are skipped. Transactions between
+        different agents do not affect each other, so the batch is split in
+        rounds in which every agent takes part in at most one transaction, and
+        the transactions of a round are checked and applied at once.
+
+        :param transactions: the transactions.
+        :return: whether each transaction was settled.
+        """
+        settled = [False] * len(transactions)
+        transfers = []  # type: List[Transfer]
+        positions = []  # type: List[int]
+        rounds = []  # type: List[List[int]]
+        last_round_by_agent = {}  # type: Dict[int, int]
+        for position, tx in enumerate(transactions):
+            transfer = self._get_transfer(tx)
+            if transfer is None:
+                continue
+            buyer, seller = transfer[0], transfer[1]
+            round_ = (
+                max(
+                    last_round_by_agent.get(buyer, -1),
+                    last_round_by_agent.get(seller, -1),
+                )
+                + 1
+            )
+            if round_ == len(rounds):
+                rounds.append([])
+            rounds[round_].append(len(transfers))
+            last_round_by_agent[buyer] = last_round_by_agent[seller] = round_
+            transfers.append(transfer)
+            positions.append(position)
+
+        for indexes in rounds:
+            for index in self._settle_round([transfers[i] for i in indexes]):
+                settled[positions[indexes[index]]] = True
+        return settled
+
+    def _settle_round(self, transfers: List[Transfer]) -> List[int]:
+        """
+        Check and apply transfers between different agents.
+
+        :param transfers: the transfers.
+        :return: the indexes of the applied transfers.
+        """
+        buyers, sellers, currencies, prices, goods, quantities = zip(*transfers)
+        buyers_, sellers_, currencies_, prices_ = (
+            np.array(buyers),
+            np.array(sellers),
+            np.array(currencies),
+            np.array(prices, dtype=np.int64),
+        )
+        counts = [len(goods_) for goods_ in goods]
+        entry_transfers = np.repeat(np.arange(len(transfers)), counts)
+        entry_goods = np.fromiter(
+            (good for goods_ in goods for good in goods_),
+            dtype=np.int64,
+            count=len(entry_transfers),
+        )
+        entry_quantities = np.fromiter(
+            (quantity for quantities_ in quantities for quantity in quantities_),
+            dtype=np.int64,
+            count=len(entry_transfers),
+        )
+
+        is_covered = self._amounts[buyers_, currencies_] >= prices_
+        is_short = (
+            self._quantities[sellers_[entry_transfers], entry_goods] < entry_quantities
+        )
+        is_covered &= (
+            np.bincount(entry_transfers[is_short], minlength=len(transfers)) == 0
+        )
+        applied = np.flatnonzero(is_covered)
+        if len(applied) == 0:
+            return []
+
+        np.add.at(
+            self._amounts, (buyers_[applied], currencies_[applied]), -prices_[applied]
+        )
+        np.add.at(
+            self._amounts, (sellers_[applied], currencies_[applied]), prices_[applied]
+        )
+        is_applied_entry = is_covered[entry_transfers]
+        entry_transfers = entry_transfers[is_applied_entry]
+        entry_goods = entry_goods[is_applied_entry]
+        entry_quantities = entry_quantities[is_applied_entry]
+        np.add.at(
+            self._quantities, (buyers_[entry_transfers], entry_goods), entry_quantities
+        )
+        np.add.at(
+            self._quantities,
+            (sellers_[entry_transfers], entry_goods),
+            -entry_quantities,
+        )
+        for index in applied.tolist():
+            self._updated_agents.add(self._agent_addresses[buyers[index]])
+            self._updated_agents.add(self._agent_addresses[sellers[index]])
+        return applied.tolist()
+
+    def get_scores(self) -> Dict[Address, float]:
+        """
+        Compute the score of every agent.
+
+        The score is computed as in AgentState.get_score.
+
+        :return: the score of each agent.
+        """
+        shifted_quantities = self._quantities + QUANTITY_SHIFT
+        goods_scores = np.where(
+            shifted_quantities > 0,
+            self._utility_params * np.log(np.maximum(shifted_quantities, 1)),
+            NON_POSITIVE_QUANTITY_UTILITY,
+        ).sum(axis=1)
+        money_scores = (self._exchange_params * self._amounts).sum(axis=1)
+        return dict(zip(self._agent_addresses, (goods_scores + money_scores).tolist()))
 
 
 class Registration:
@@ -738,6 +1058,7 @@ class Game(Model):
         self._initialization = None  # type: Optional[Initialization]
         self._initial_agent_states = None  # type: Optional[Dict[str, AgentState]]
         self._current_agent_states = None  # type: Optional[Dict[str, AgentState]]
+        self._settlement = None  # type: Optional[Settlement]
         self._transactions = Transactions()
         self._already_minted_agents = []  # type: List[str]
         self._is_allowed_to_mint = True
@@ -785,8 +1106,20 @@ class Game(Model):
         """Get current state of each agent."""
         if self._current_agent_states is None:
             raise AEAEnforceError("Call create before calling current_agent_states.")
+        if self._settlement is not None:
+            for agent_address in self._settlement.pop_updated_agents():
+                self._current_agent_states[
+                    agent_address
+                ] = self._settlement.get_agent_state(agent_address)
         return self._current_agent_states
 
+    @property
+    def settlement(self) -> Settlement:
+        """Get the settlement of the transactions, set up from the current agent states."""
+        if self._settlement is None:
+            self._settlement = Settlement(self.current_agent_states)
+        return self._settlement
+
     @property
     def transactions(self) -> Transactions:
         """Get the transactions."""
@@ -832,44 +1165,65 @@ class Game(Model):
         )
 
         scaling_factor = determine_scaling_factor(parameters.money_endowment)
+        rng = np.random.default_rng(parameters.seed)
+        agent_addresses = list(self.conf.agent_addr_to_name.keys())
+        currency_ids = list(self.conf.currency_id_to_name.keys())
+        good_ids = list(self.conf.good_id_to_name.keys())
+        enforce(len(currency_ids) == 1, "Cannot have more than one currency.")
 
         agent_addr_to_currency_endowments = generate_currency_endowments(
-            list(self.conf.agent_addr_to_name.keys()),
-            list(self.conf.currency_id_to_name.keys()),
+            agent_addresses,
+            currency_ids,
             parameters.money_endowment,
         )
 
         agent_addr_to_exchange_params = generate_exchange_params(
-            list(self.conf.agent_addr_to_name.keys()),
-            list(self.conf.currency_id_to_name.keys()),
+            agent_addresses,
+            currency_ids,
         )
 
-        agent_addr_to_good_endowments = generate_good_endowments(
-            list(self.conf.agent_addr_to_name.keys()),
-            list(self.conf.good_id_to_name.keys()),
+        good_endowments = generate_good_endowments_array(
+            len(agent_addresses),
+            len(good_ids),
             parameters.base_good_endowment,
             parameters.lower_bound_factor,
             parameters.upper_bound_factor,
+            rng,
         )
 
-        agent_addr_to_utility_params = generate_utility_params(
-            list(self.conf.agent_addr_to_name.keys()),
-            list(self.conf.good_id_to_name.keys()),
+        utility_params = generate_utility_params_array(
+            len(agent_addresses),
+            len(good_ids),
             scaling_factor,
+            rng,
         )
 
         (
-            good_id_to_eq_prices,
-            agent_addr_to_eq_good_holdings,
-            agent_addr_to_eq_currency_holdings,
-        ) = generate_equilibrium_prices_and_holdings(
-            agent_addr_to_good_endowments,
-            agent_addr_to_utility_params,
-            agent_addr_to_currency_endowments,
-            agent_addr_to_exchange_params,
+            eq_prices,
+            eq_good_holdings,
+            eq_currency_holdings,
+        ) = generate_equilibrium_prices_and_holdings_array(
+            good_endowments,
+            utility_params,
+            np.full(len(agent_addresses), parameters.money_endowment),
             scaling_factor,
         )
 
+        # dict views of the arrays
+        agent_addr_to_good_endowments = array_to_dicts(
+            agent_addresses, good_ids, good_endowments
+        )
+        agent_addr_to_utility_params = array_to_dicts(
+            agent_addresses, good_ids, utility_params
+        )
+        good_id_to_eq_prices = dict(zip(good_ids, eq_prices.tolist()))
+        agent_addr_to_eq_good_holdings = array_to_dicts(
+            agent_addresses, good_ids, eq_good_holdings
+        )
+        agent_addr_to_eq_currency_holdings = array_to_dicts(
+            agent_addresses, currency_ids, eq_currency_holdings.reshape(-1, 1)
+        )
+
         self._initialization = Initialization(
             agent_addr_to_currency_endowments,
             agent_addr_to_exchange_params,
@@ -907,11 +1261,13 @@ class Game(Model):
             )
             for agent_addr in self.conf.agent_addr_to_name.keys()
         )
+        self._settlement = None
 
     @property
     def holdings_summary(self) -> str:
         """Get holdings summary (a string representing the holdings for every agent)."""
         result = "\n" + "Current good & money allocation & score: \n"
+        scores = self.settlement.get_scores()
         for agent_addr, agent_state in self.current_agent_states.items():
             result = (
                 result + "- " + self.conf.agent_addr_to_name[agent_addr] + ":" + "\n"
@@ -932,7 +1288,7 @@ class Game(Model):
                     + str(amount)
                     + "\n"
                 )
-            result += "    score: " + str(round(agent_state.get_score(), 2)) + "\n"
+            result += "    score: " + str(round(scores[agent_addr], 2)) + "\n"
         result = result + "\n"
         return result
 
@@ -987,11 +1343,8 @@ class Game(Model):
         :return: True if the transaction is valid, False otherwise.
         :raises: AEAEnforceError: if the data in the transaction are not allowed (e.g. negative amount).
         """
-        sender_state = self.current_agent_states[tx.sender_address]
-        counterparty_state = self.current_agent_states[tx.counterparty_address]
         result = tx.has_matching_signatures()
-        result = result and sender_state.is_consistent_transaction(tx)
-        result = result and counterparty_state.is_consistent_transaction(tx)
+        result = result and self.settlement.is_consistent_transaction(tx)
         return result
 
     def settle_transaction(self, tx: Transaction) -> None:
@@ -1004,17 +1357,26 @@ class Game(Model):
         if self._current_agent_states is None:
             raise AEAEnforceError("Call create before calling current_agent_states.")
         enforce(self.is_transaction_valid(tx), "Transaction is not valid.")
-        sender_state = self.current_agent_states[tx.sender_address]
-        counterparty_state = self.current_agent_states[tx.counterparty_address]
+        self.settlement.apply(tx)
+        self.transactions.add(tx)
 
-        new_sender_state = sender_state.apply([tx])
-        new_counterparty_state = counterparty_state.apply([tx])
+    def settle_transactions(self, txs: List[Transaction]) -> List[Transaction]:
+        """
+        Settle a batch of transactions, in order.
 
-        self.transactions.add(tx)
-        self._current_agent_states.update({tx.sender_address: new_sender_state})
-        self._current_agent_states.update(
-            {tx.counterparty_address: new_counterparty_state}
-        )
+        Transactions which are not signed by both parties, or which are not
+        consistent with the holdings left by the previous ones, are skipped.
+
+        :param txs: the game transactions.
+        :return: the settled transactions.
+        """
+        if self._current_agent_states is None:
+            raise AEAEnforceError("Call create before calling current_agent_states.")
+        signed_txs = [tx for tx in txs if tx.has_matching_signatures()]
+        is_settled = self.settlement.settle(signed_txs)
+        settled_txs = [tx for tx, settled in zip(signed_txs, is_settled) if settled]
+        self.transactions.add_batch(settled_txs)
+        return settled_txs
 
     def get_location_description(self) -> Description:
         """
@@ -20,8 +20,7 @@
 
 """This module contains the helpers methods for the controller agent."""
 
-import random
-from typing import Dict, List, Tuple, cast
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -127,12 +126,67 @@ def determine_scaling_factor(money_endowment: int) -> float:
     return scaling_factor
 
 
+def array_to_dicts(
+    agent_addresses: List[str], ids: List[str], array: np.ndarray
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Get the dict view of a matrix of shape (nb_agents, nb_ids).
+
+    :param agent_addresses: the addresses of the agents, one per row
+    :param ids: the ids, one per column
+    :param array: the matrix
+    :return: the dict of each agent, from id to value.
+    """
+    return {
+        agent_addr: dict(zip(ids, row))
+        for agent_addr, row in zip(agent_addresses, array.tolist())
+    }
+
+
+def generate_good_endowments_array(
+    nb_agents: int,
+    nb_goods: int,
+    base_amount: int,
+    uniform_lower_bound_factor: int,
+    uniform_upper_bound_factor: int,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """
+    Compute good endowments per agent. That is, a matrix of shape (nb_agents, nb_goods).
+
+    :param nb_agents: the number of agents
+    :param nb_goods: the number of goods
+    :param base_amount: the base amount of instances per good
+    :param uniform_lower_bound_factor: the lower bound of the uniform distribution for the sampling of the good instance number.
+    :param uniform_upper_bound_factor: the upper bound of the uniform distribution for the sampling of the good instance number.
+    :param rng: the random generator, seeded from fresh entropy if not provided.
+    :return: the endowments matrix.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    instances_per_good = _sample_nb_instances(
+        nb_agents,
+        nb_goods,
+        base_amount,
+        uniform_lower_bound_factor,
+        uniform_upper_bound_factor,
+        rng,
+    )
+    # each agent receives at least base amount of each good, and the additional
+    # instances of each good are assigned uniformly at random to create differences
+    additional_instances = np.maximum(instances_per_good - base_amount * nb_agents, 0)
+    additional_assignment = rng.multinomial(
+        additional_instances, np.full(nb_agents, 1.0 / nb_agents)
+    )
+    return base_amount + additional_assignment.T
+
+
 def generate_good_endowments(
     agent_addresses: List[str],
     good_ids: List[str],
     base_amount: int,
     uniform_lower_bound_factor: int,
     uniform_upper_bound_factor: int,
+    rng: Optional[np.random.Generator] = None,
 ) -> Dict[str, Dict[str, int]]:
     """
     Compute good endowments per agent. That is, a matrix of shape (nb_agents, nb_goods).
@@ -142,31 +196,55 @@ def generate_good_endowments(
     :param base_amount: the base amount of instances per good
     :param uniform_lower_bound_factor: the lower bound of the uniform distribution for the sampling of the good instance number.
     :param uniform_upper_bound_factor: the upper bound of the uniform distribution for the sampling of the good instance number.
+    :param rng: the random generator, seeded from fresh entropy if not provided.
     :return: the endowments matrix.
     """
-    # sample good instances
-    nb_agents = len(agent_addresses)
-    instances_per_good = _sample_good_instances(
-        nb_agents,
-        good_ids,
+    endowments = generate_good_endowments_array(
+        len(agent_addresses),
+        len(good_ids),
         base_amount,
         uniform_lower_bound_factor,
         uniform_upper_bound_factor,
+        rng,
+    )
+    return array_to_dicts(agent_addresses, good_ids, endowments)
+
+
+def generate_utility_params_array(
+    nb_agents: int,
+    nb_goods: int,
+    scaling_factor: float,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """
+    Compute the preference matrix. That is, a generic element e_ij is the utility of good j for agent i.
+
+    :param nb_agents: the number of agents
+    :param nb_goods: the number of goods
+    :param scaling_factor: a scaling factor for all the utility params generated.
+    :param rng: the random generator, seeded from fresh entropy if not provided.
+    :return: the preference matrix.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    decimals = 4 if nb_goods < 100 else 8
+    random_integers = rng.integers(1, 101, size=(nb_agents, nb_goods), endpoint=True)
+    normalized_fractions = np.round(
+        random_integers / random_integers.sum(axis=1, keepdims=True), decimals
     )
-    # each agent receives at least base amount of each good
-    base_assignment = {good_id: base_amount for good_id in good_ids}
-    endowments = {agent_addr: base_assignment for agent_addr in agent_addresses}
-    # randomly assign additional goods to create differences
-    for good_id in good_ids:
-        for _ in range(instances_per_good[good_id] - (base_amount * nb_agents)):
-            idx = random.randint(0, nb_agents - 1)  # nosec
-            agent_addr = agent_addresses[idx]
-            endowments[agent_addr][good_id] += 1
-    return endowments
+    # make the fractions of each agent sum to one despite the rounding
+    if nb_goods > 0:
+        normalized_fractions[:, -1] = np.round(
+            1.0 - normalized_fractions[:, :-1].sum(axis=1), decimals
+        )
+    # scale the utility params
+    return normalized_fractions * scaling_factor
 
 
 def generate_utility_params(
-    agent_addresses: List[str], good_ids: List[str], scaling_factor: float
+    agent_addresses: List[str],
+    good_ids: List[str],
+    scaling_factor: float,
+    rng: Optional[np.random.Generator] = None,
 ) -> Dict[str, Dict[str, float]]:
     """
     Compute the preference matrix. That is, a generic element e_ij is the utility of good j for agent i.
@@ -174,30 +252,38 @@ def generate_utility_params(
     :param agent_addresses: the agent addresses
     :param good_ids: the list of good ids
     :param scaling_factor: a scaling factor for all the utility params generated.
+    :param rng: the random generator, seeded from fresh entropy if not provided.
     :return: the preference matrix.
     """
-    decimals = 4 if len(good_ids) < 100 else 8
-    utility_function_params = {}  # type: Dict[str, Dict[str, float]]
-    for agent_addr in agent_addresses:
-        random_integers = [
-            random.randint(1, 101) for _ in range(len(good_ids))  # nosec
-        ]
-        total = sum(random_integers)
-        normalized_fractions = [
-            round(i / float(total), decimals) for i in random_integers
-        ]
-        if not sum(normalized_fractions) == 1.0:  # pragma: no cover
-            normalized_fractions[-1] = round(
-                1.0 - sum(normalized_fractions[0:-1]), decimals
-            )
-        # scale the utility params
-        params = {
-            good_id: param * scaling_factor
-            for good_id, param in zip(good_ids, normalized_fractions)
-        }
-        utility_function_params[agent_addr] = params
-
-    return utility_function_params
+    utility_params = generate_utility_params_array(
+        len(agent_addresses), len(good_ids), scaling_factor, rng
+    )
+    return array_to_dicts(agent_addresses, good_ids, utility_params)
+
+
+def _sample_nb_instances(
+    nb_agents: int,
+    nb_goods: int,
+    base_amount: int,
+    uniform_lower_bound_factor: int,
+    uniform_upper_bound_factor: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    Sample the number of instances of each good.
+
+    :param nb_agents: the number of agents
+    :param nb_goods: the number of goods
+    :param base_amount: the base amount of instances per good
+    :param uniform_lower_bound_factor: the lower bound factor of a uniform distribution
+    :param uniform_upper_bound_factor: the upper bound factor of a uniform distribution
+    :param rng: the random generator.
+    :return: the number of instances of each good.
+    """
+    a = base_amount * nb_agents + nb_agents * uniform_lower_bound_factor
+    b = base_amount * nb_agents + nb_agents * uniform_upper_bound_factor
+    # Return random integers in range [a, b]
+    return np.rint(rng.uniform(a, b, size=nb_goods)).astype(np.int64)
 
 
 def _sample_good_instances(
@@ -206,6 +292,7 @@ def _sample_good_instances(
     base_amount: int,
     uniform_lower_bound_factor: int,
     uniform_upper_bound_factor: int,
+    rng: Optional[np.random.Generator] = None,
 ) -> Dict[str, int]:
     """
     Sample the number of instances for a good.
@@ -215,13 +302,18 @@ def _sample_good_instances(
     :param base_amount: the base amount of instances per good
     :param uniform_lower_bound_factor: the lower bound factor of a uniform distribution
     :param uniform_upper_bound_factor: the upper bound factor of a uniform distribution
+    :param rng: the random generator, seeded from fresh entropy if not provided.
     :return: the number of instances I sampled.
     """
-    a = base_amount * nb_agents + nb_agents * uniform_lower_bound_factor
-    b = base_amount * nb_agents + nb_agents * uniform_upper_bound_factor
-    # Return random integer in range [a, b]
-    nb_instances = {good_id: round(np.random.uniform(a, b)) for good_id in good_ids}
-    return nb_instances
+    nb_instances = _sample_nb_instances(
+        nb_agents,
+        len(good_ids),
+        base_amount,
+        uniform_lower_bound_factor,
+        uniform_upper_bound_factor,
+        rng if rng is not None else np.random.default_rng(),
+    )
+    return dict(zip(good_ids, nb_instances.tolist()))
 
 
 def generate_currency_endowments(
@@ -254,6 +346,39 @@ def generate_exchange_params(
     return {agent_addr: exchange_params for agent_addr in agent_addresses}
 
 
+def generate_equilibrium_prices_and_holdings_array(
+    endowments: np.ndarray,
+    utility_params: np.ndarray,
+    currency_endowments: np.ndarray,
+    scaling_factor: float,
+    quantity_shift: int = QUANTITY_SHIFT,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the competitive equilibrium prices and allocation.
+
+    :param endowments: the good endowments, of shape (nb_agents, nb_goods)
+    :param utility_params: the utility function params (already scaled), of shape (nb_agents, nb_goods)
+    :param currency_endowments: the money endowment of each agent, of shape (nb_agents,)
+    :param scaling_factor: a scaling factor for all the utility params generated.
+    :param quantity_shift: a factor to shift the quantities in the utility function (to ensure the natural logarithm can be used on the entire range of quantities)
+    :return: the equilibrium prices, of shape (nb_goods,), good holdings, of shape (nb_agents, nb_goods), and money holdings, of shape (nb_agents,)
+    """
+    nb_agents = endowments.shape[0]
+    endowments_by_good = np.sum(endowments, axis=0)
+    scaled_params_by_good = np.sum(utility_params, axis=0)
+    eq_prices = np.divide(
+        scaled_params_by_good,
+        quantity_shift * nb_agents + endowments_by_good,
+    )
+    eq_good_holdings = np.divide(utility_params, eq_prices) - quantity_shift
+    eq_currency_holdings = (
+        np.dot(endowments + quantity_shift, eq_prices)
+        + currency_endowments
+        - scaling_factor
+    )
+    return eq_prices, eq_good_holdings, eq_currency_holdings
+
+
 def generate_equilibrium_prices_and_holdings(  # pylint: disable=unused-argument
     agent_addr_to_good_endowments: Dict[str, Dict[str, int]],
     agent_addr_to_utility_params: Dict[str, Dict[str, float]],
@@ -273,77 +398,58 @@ def generate_equilibrium_prices_and_holdings(  # pylint: disable=unused-argument
     :param quantity_shift: a factor to shift the quantities in the utility function (to ensure the natural logarithm can be used on the entire range of quantities)
     :return: the lists of equilibrium prices, equilibrium good holdings and equilibrium money holdings
     """
-    # create ordered lists
-    agent_addresses = []  # type: List[str]
-    good_ids = []  # type: List[str]
-    good_ids_to_idx = {}  # type: Dict[str, int]
-    good_endowments_l = []  # type: List[List[int]]
-    utility_params_l = []  # type: List[List[float]]
-    currency_endowment_l = []  # type: List[int]
-    count = 0
+    agent_addresses = list(agent_addr_to_good_endowments.keys())
+    good_ids = (
+        list(agent_addr_to_good_endowments[agent_addresses[0]].keys())
+        if agent_addresses
+        else []
+    )
     currency_id = ""
     for agent_addr, good_endowment in agent_addr_to_good_endowments.items():
-        agent_addresses.append(agent_addr)
         enforce(
             len(agent_addr_to_currency_endowments[agent_addr].values()) == 1,
             "Cannot have more than one currency.",
         )
-        currency_endowment_l.append(
-            list(agent_addr_to_currency_endowments[agent_addr].values())[0]
-        )
-        currency_id = list(agent_addr_to_currency_endowments[agent_addr].keys())[0]
+        currency_id = next(iter(agent_addr_to_currency_endowments[agent_addr].keys()))
         enforce(
             len(good_endowment.keys())
             == len(agent_addr_to_utility_params[agent_addr].keys()),
             "Good endowments and utility params inconsistent.",
         )
-        temp_g_e = [0] * len(good_endowment.keys())
-        temp_u_p = [0.0] * len(agent_addr_to_utility_params[agent_addr].keys())
-        idx = 0
-        for good_id, quantity in good_endowment.items():
-            if count == 0:
-                good_ids.append(good_id)
-                good_ids_to_idx[good_id] = idx
-                idx += 1
-            temp_g_e[good_ids_to_idx[good_id]] = quantity
-            temp_u_p[good_ids_to_idx[good_id]] = agent_addr_to_utility_params[
-                agent_addr
-            ][good_id]
-        count += 1
-        good_endowments_l.append(temp_g_e)
-        utility_params_l.append(temp_u_p)
-
-    # maths
-    endowments_a = np.array(good_endowments_l, dtype=int)  # type: ignore
-    scaled_utility_params_a = np.array(  # type: ignore
-        utility_params_l, dtype=float  # type: ignore
-    )  # note, they are already scaled
-    endowments_by_good = np.sum(endowments_a, axis=0)
-    scaled_params_by_good = np.sum(scaled_utility_params_a, axis=0)
-    eq_prices = np.divide(
-        scaled_params_by_good,
-        quantity_shift * len(agent_addresses) + endowments_by_good,
+
+    endowments = np.array(
+        [
+            [agent_addr_to_good_endowments[agent_addr][good_id] for good_id in good_ids]
+            for agent_addr in agent_addresses
+        ],
+        dtype=int,
+    ).reshape(len(agent_addresses), len(good_ids))
+    utility_params = np.array(
+        [
+            [agent_addr_to_utility_params[agent_addr][good_id] for good_id in good_ids]
+            for agent_addr in agent_addresses
+        ],
+        dtype=float,
+    ).reshape(len(agent_addresses), len(good_ids))
+    currency_endowments = np.array(
+        [
+            next(iter(agent_addr_to_currency_endowments[agent_addr].values()))
+            for agent_addr in agent_addresses
+        ],
+        dtype=float,
     )
-    eq_good_holdings = np.divide(scaled_utility_params_a, eq_prices) - quantity_shift
-    eq_currency_holdings = (
-        np.transpose(np.dot(eq_prices, np.transpose(endowments_a + quantity_shift)))
-        + currency_endowment_l
-        - scaling_factor
+    (
+        eq_prices,
+        eq_good_holdings,
+        eq_currency_holdings,
+    ) = generate_equilibrium_prices_and_holdings_array(
+        endowments, utility_params, currency_endowments, scaling_factor, quantity_shift
     )
 
     # back to dicts
-    eq_prices_dict = {
-        good_id: cast(float, eq_price)
-        for good_id, eq_price in zip(good_ids, eq_prices.tolist())
-    }
-    eq_good_holdings_dict = {
-        agent_addr: {good_id: cast(float, v) for good_id, v in zip(good_ids, egh)}
-        for agent_addr, egh in zip(agent_addresses, eq_good_holdings.tolist())
-    }
-    eq_currency_holdings_dict = {
-        agent_addr: {currency_id: cast(float, eq_currency_holding)}
-        for agent_addr, eq_currency_holding in zip(
-            agent_addresses, eq_currency_holdings.tolist()
-        )
-    }
+    eq_prices_dict = dict(zip(good_ids, eq_prices.tolist()))
+    eq_good_holdings_dict = array_to_dicts(agent_addresses, good_ids, eq_good_holdings)
+    eq_currency_holdings_dict = array_to_dicts(
+        agent_addresses, [currency_id], eq_currency_holdings.reshape(-1, 1)
+    )
     return eq_prices_dict, eq_good_holdings_dict, eq_currency_holdings_dict
@@ -85,6 +85,7 @@ class Parameters(Model):
         self._upper_bound_factor = kwargs.pop(
             "upper_bound_factor", DEFAULT_UPPER_BOUND_FACTOR
         )  # type: int
+        self._seed = kwargs.pop("seed", None)  # type: Optional[int]
         registration_start_time = kwargs.pop(
             "registration_start_time", DEFAULT_REGISTRATION_START_TIME
         )  # type: str
@@ -276,6 +277,11 @@ class Parameters(Model):
         """Upper bound of a uniform distribution."""
         return self._upper_bound_factor
 
+    @property
+    def seed(self) -> Optional[int]:
+        """Seed of the random generation of the game, if it must be reproducible."""
+        return self._seed
+
     @property
     def registration_start_time(self) -> datetime.datetime:
         """TAC registration start time."""
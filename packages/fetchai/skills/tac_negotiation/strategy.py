@@ -442,9 +442,21 @@ class Strategy(Model):
         preferences = cast(
             Preferences, self.context.decision_maker_handler_context.preferences
         )
-        for good_id, quantity in good_id_to_quantities.items():
-            if is_seller and quantity == 0:
-                continue
+        candidate_good_ids = [
+            good_id
+            for good_id, quantity in good_id_to_quantities.items()
+            if not (is_seller and quantity == 0)
+        ]
+        # a candidate changes the holdings of a single good, by one unit
+        marginal_utilities = preferences.marginal_utilities(
+            ownership_state=ownership_state_after_locks,
+            deltas_quantities_by_good_id=[
+                {good_id: -1 if is_seller else 1} for good_id in candidate_good_ids
+            ],
+        )
+        for good_id, marginal_utility_from_delta_good_holdings in zip(
+            candidate_good_ids, marginal_utilities
+        ):
             proposal_dict = copy.copy(nil_proposal_dict)
             proposal_dict[good_id] = 1
             proposal = build_goods_description(
@@ -453,17 +465,6 @@ class Strategy(Model):
                 ledger_id=self.ledger_id,
                 is_supply=is_seller,
             )
-            if is_seller:
-                delta_quantities_by_good_id = {
-                    good_id: quantity * -1
-                    for good_id, quantity in proposal_dict.items()
-                }  # type: Dict[str, int]
-            else:
-                delta_quantities_by_good_id = proposal_dict
-            marginal_utility_from_delta_good_holdings = preferences.marginal_utility(
-                ownership_state=ownership_state_after_locks,
-                delta_quantities_by_good_id=delta_quantities_by_good_id,
-            )
             switch = -1 if is_seller else 1
             breakeven_price_rounded = (
                 round(marginal_utility_from_delta_good_holdings) * switch
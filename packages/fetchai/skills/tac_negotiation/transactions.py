@@ -19,9 +19,10 @@
 
 """This module contains a class to manage transactions."""
 
+import copy
 import datetime
 from collections import defaultdict, deque
-from typing import Any, Deque, Dict, List, Tuple, cast
+from typing import Any, Deque, Dict, List, Optional, Tuple, cast
 
 from aea.decision_maker.gop import OwnershipState
 from aea.exceptions import enforce
@@ -33,6 +34,7 @@ from packages.fetchai.skills.tac_negotiation.dialogues import FipaDialogue
 
 
 MessageId = int
+Delta = Tuple[Dict[str, int], Dict[str, int]]
 
 
 class Transactions(Model):
@@ -54,6 +56,9 @@ class Transactions(Model):
         self._locked_txs = {}  # type: Dict[str, Terms]
         self._locked_txs_as_buyer = {}  # type: Dict[str, Terms]
         self._locked_txs_as_seller = {}  # type: Dict[str, Terms]
+        # the sums of the currency amounts and good quantities of the locks, by role
+        self._locked_delta_as_buyer = ({}, {})  # type: Delta
+        self._locked_delta_as_seller = ({}, {})  # type: Delta
 
         self._last_update_for_transactions = (
             deque()
@@ -86,9 +91,7 @@ class Transactions(Model):
         )  # type: List[str]
         for transaction_id in confirmed_tx_ids:
             # remove (safely) the associated pending proposal (if present)
-            self._locked_txs.pop(transaction_id, None)
-            self._locked_txs_as_buyer.pop(transaction_id, None)
-            self._locked_txs_as_seller.pop(transaction_id, None)
+            self._remove_locked_tx(transaction_id)
 
     def cleanup_pending_transactions(self) -> None:
         """Remove all the pending messages (i.e. either proposals or acceptances) that have been stored for an amount of time longer than the timeout."""
@@ -112,9 +115,7 @@ class Transactions(Model):
             )
 
             # remove (safely) the associated pending proposal (if present)
-            self._locked_txs.pop(transaction_id, None)
-            self._locked_txs_as_buyer.pop(transaction_id, None)
-            self._locked_txs_as_seller.pop(transaction_id, None)
+            self._remove_locked_tx(transaction_id)
 
             # check the next transaction, if present
             if len(queue) == 0:
@@ -224,8 +225,10 @@ class Transactions(Model):
         self._locked_txs[transaction_id] = terms
         if as_seller:
             self._locked_txs_as_seller[transaction_id] = terms
+            self._update_locked_delta(self._locked_delta_as_seller, terms, 1)
         else:
             self._locked_txs_as_buyer[transaction_id] = terms
+            self._update_locked_delta(self._locked_delta_as_buyer, terms, 1)
 
     def pop_locked_tx(self, terms: Terms) -> Terms:
         """
@@ -239,27 +242,64 @@ class Transactions(Model):
             transaction_id in self._locked_txs,
             "Cannot find this transaction in the list of locked transactions.",
         )
-        terms = self._locked_txs.pop(transaction_id)
-        self._locked_txs_as_buyer.pop(transaction_id, None)
-        self._locked_txs_as_seller.pop(transaction_id, None)
+        return cast(Terms, self._remove_locked_tx(transaction_id))
+
+    def _remove_locked_tx(self, transaction_id: str) -> Optional[Terms]:
+        """
+        Remove (safely) a lock, and its contribution to the ownership state after locks.
+
+        :param transaction_id: the transaction id
+        :return: the terms of the lock, if present
+        """
+        terms = self._locked_txs.pop(transaction_id, None)
+        terms_as_buyer = self._locked_txs_as_buyer.pop(transaction_id, None)
+        if terms_as_buyer is not None:
+            self._update_locked_delta(self._locked_delta_as_buyer, terms_as_buyer, -1)
+        terms_as_seller = self._locked_txs_as_seller.pop(transaction_id, None)
+        if terms_as_seller is not None:
+            self._update_locked_delta(self._locked_delta_as_seller, terms_as_seller, -1)
         return terms
 
+    @staticmethod
+    def _update_locked_delta(delta: Delta, terms: Terms, sign: int) -> None:
+        """
+        Add the amounts and quantities of a lock to (or, with a negative sign, remove them from) a delta.
+
+        :param delta: the currency amounts and good quantities of the locks
+        :param terms: the terms of the lock
+        :param sign: 1 to add the lock, -1 to remove it
+        """
+        for holdings, terms_holdings in zip(
+            delta, (terms.amount_by_currency_id, terms.quantities_by_good_id)
+        ):
+            for key, value in terms_holdings.items():
+                new_value = holdings.get(key, 0) + sign * value
+                if new_value == 0:
+                    holdings.pop(key, None)
+                else:
+                    holdings[key] = new_value
+
     def ownership_state_after_locks(self, is_seller: bool) -> OwnershipState:
         """
         Apply all the locks to the current ownership state of the agent.
 
         This assumes, that all the locked transactions will be successful.
+        The sums of the locks are maintained as they are added and removed, so
+        this does not depend on the number of locks.
 
         :param is_seller: Boolean indicating the role of the agent.
         :return: the agent state with the locks applied to current state
         """
-        all_terms = (
-            list(self._locked_txs_as_seller.values())
-            if is_seller
-            else list(self._locked_txs_as_buyer.values())
+        delta_amount_by_currency_id, delta_quantities_by_good_id = (
+            self._locked_delta_as_seller if is_seller else self._locked_delta_as_buyer
         )
         ownership_state = cast(
             OwnershipState, self.context.decision_maker_handler_context.ownership_state
         )
-        ownership_state_after_locks = ownership_state.apply_transactions(all_terms)
+        ownership_state_after_locks = copy.copy(ownership_state)
+        if delta_amount_by_currency_id or delta_quantities_by_good_id:
+            ownership_state_after_locks.apply_delta(
+                delta_amount_by_currency_id=delta_amount_by_currency_id,
+                delta_quantities_by_good_id=delta_quantities_by_good_id,
+            )
         return ownership_state_after_locks
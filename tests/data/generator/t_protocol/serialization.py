@@ -22,8 +22,7 @@
 # pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
 from typing import Any, Dict, cast
 
-from aea.mail.base_pb2 import DialogueMessage
-from aea.mail.base_pb2 import Message as ProtobufMessage
+from aea.mail.base import decode_dialogue_message, encode_dialogue_message
 from aea.protocols.base import Message, Serializer
 
 from tests.data.generator.t_protocol import t_protocol_pb2
@@ -49,16 +48,8 @@ class TProtocolSerializer(Serializer):
         :return: the bytes.
         """
         msg = cast(TProtocolMessage, msg)
-        message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
         t_protocol_msg = t_protocol_pb2.TProtocolMessage()
 
-        dialogue_message_pb.message_id = msg.message_id
-        dialogue_reference = msg.dialogue_reference
-        dialogue_message_pb.dialogue_starter_reference = dialogue_reference[0]
-        dialogue_message_pb.dialogue_responder_reference = dialogue_reference[1]
-        dialogue_message_pb.target = msg.target
-
         performative_id = msg.performative
         if performative_id == TProtocolMessage.Performative.PERFORMATIVE_CT:
             performative = t_protocol_pb2.TProtocolMessage.Performative_Ct_Performative()  # type: ignore
@@ -336,10 +327,12 @@ class TProtocolSerializer(Serializer):
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
-        dialogue_message_pb.content = t_protocol_msg.SerializeToString()
-
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
-        message_bytes = message_pb.SerializeToString()
+        message_bytes = encode_dialogue_message(
+            msg.message_id,
+            msg.dialogue_reference,
+            msg.target,
+            t_protocol_msg.SerializeToString(),
+        )
         return message_bytes
 
     @staticmethod
@@ -350,17 +343,15 @@ class TProtocolSerializer(Serializer):
         :param obj: the bytes object.
         :return: the 'TProtocol' message.
         """
-        message_pb = ProtobufMessage()
         t_protocol_pb = t_protocol_pb2.TProtocolMessage()
-        message_pb.ParseFromString(obj)
-        message_id = message_pb.dialogue_message.message_id
-        dialogue_reference = (
-            message_pb.dialogue_message.dialogue_starter_reference,
-            message_pb.dialogue_message.dialogue_responder_reference,
-        )
-        target = message_pb.dialogue_message.target
+        (
+            message_id,
+            dialogue_reference,
+            target,
+            content_buffer,
+        ) = decode_dialogue_message(obj)
 
-        t_protocol_pb.ParseFromString(message_pb.dialogue_message.content)
+        t_protocol_pb.ParseFromString(content_buffer)
         performative = t_protocol_pb.WhichOneof("performative")
         performative_id = TProtocolMessage.Performative(str(performative))
         performative_content = {}  # type: Dict[str, Any]
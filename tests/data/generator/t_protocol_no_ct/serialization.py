@@ -22,8 +22,7 @@
 # pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
 from typing import Any, Dict, cast
 
-from aea.mail.base_pb2 import DialogueMessage
-from aea.mail.base_pb2 import Message as ProtobufMessage
+from aea.mail.base import decode_dialogue_message, encode_dialogue_message
 from aea.protocols.base import Message, Serializer
 
 from tests.data.generator.t_protocol_no_ct import t_protocol_no_ct_pb2
@@ -42,16 +41,8 @@ class TProtocolNoCtSerializer(Serializer):
         :return: the bytes.
         """
         msg = cast(TProtocolNoCtMessage, msg)
-        message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
         t_protocol_no_ct_msg = t_protocol_no_ct_pb2.TProtocolNoCtMessage()
 
-        dialogue_message_pb.message_id = msg.message_id
-        dialogue_reference = msg.dialogue_reference
-        dialogue_message_pb.dialogue_starter_reference = dialogue_reference[0]
-        dialogue_message_pb.dialogue_responder_reference = dialogue_reference[1]
-        dialogue_message_pb.target = msg.target
-
         performative_id = msg.performative
         if performative_id == TProtocolNoCtMessage.Performative.PERFORMATIVE_PT:
             performative = t_protocol_no_ct_pb2.TProtocolNoCtMessage.Performative_Pt_Performative()  # type: ignore
@@ -289,10 +280,12 @@ class TProtocolNoCtSerializer(Serializer):
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
-        dialogue_message_pb.content = t_protocol_no_ct_msg.SerializeToString()
-
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
-        message_bytes = message_pb.SerializeToString()
+        message_bytes = encode_dialogue_message(
+            msg.message_id,
+            msg.dialogue_reference,
+            msg.target,
+            t_protocol_no_ct_msg.SerializeToString(),
+        )
         return message_bytes
 
     @staticmethod
@@ -303,17 +296,15 @@ class TProtocolNoCtSerializer(Serializer):
         :param obj: the bytes object.
         :return: the 'TProtocolNoCt' message.
         """
-        message_pb = ProtobufMessage()
         t_protocol_no_ct_pb = t_protocol_no_ct_pb2.TProtocolNoCtMessage()
-        message_pb.ParseFromString(obj)
-        message_id = message_pb.dialogue_message.message_id
-        dialogue_reference = (
-            message_pb.dialogue_message.dialogue_starter_reference,
-            message_pb.dialogue_message.dialogue_responder_reference,
-        )
-        target = message_pb.dialogue_message.target
+        (
+            message_id,
+            dialogue_reference,
+            target,
+            content_buffer,
+        ) = decode_dialogue_message(obj)
 
-        t_protocol_no_ct_pb.ParseFromString(message_pb.dialogue_message.content)
+        t_protocol_no_ct_pb.ParseFromString(content_buffer)
         performative = t_protocol_no_ct_pb.WhichOneof("performative")
         performative_id = TProtocolNoCtMessage.Performative(str(performative))
         performative_content = {}  # type: Dict[str, Any]
@@ -25,19 +25,20 @@ from pathlib import Path
 from threading import Thread
 from typing import Callable
 from unittest.case import TestCase
-from unittest.mock import MagicMock, PropertyMock, patch
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import pytest
 
 import aea  # noqa: F401
 from aea.aea import AEA
 from aea.aea_builder import AEABuilder
-from aea.configurations.base import SkillConfig
+from aea.configurations.base import PublicId, SkillConfig
 from aea.configurations.constants import DEFAULT_LEDGER, DEFAULT_PRIVATE_KEY_FILE
 from aea.crypto.wallet import Wallet
 from aea.exceptions import AEAActException, AEAException, AEAHandleException
 from aea.helpers.base import cd
 from aea.helpers.exception_policy import ExceptionPolicyEnum
+from aea.helpers.overflow_policy import OverflowPolicyEnum, QueueLimit
 from aea.identity.base import Identity
 from aea.mail.base import Envelope
 from aea.protocols.base import Protocol
@@ -619,6 +620,94 @@ class TestContextNamespace:
             assert skill.skill_context.namespace.key2 == 2
 
 
+def test_handler_fills_outbox_in_async_runtime():
+    """Test a handler filling the outbox, on the thread of the agent loop, with the block policy."""
+    builder = AEABuilder()
+    builder.set_name("MyAgent")
+    builder.add_private_key(DEFAULT_LEDGER, FETCHAI_PRIVATE_KEY_PATH)
+    builder.set_runtime_mode("async")
+    builder.set_queue_limits(outbox_limit=QueueLimit(1, OverflowPolicyEnum.block))
+    contents = [b"%d" % i for i in range(5)]
+
+    def handler_func(handler) -> None:
+        for content in contents:
+            message = DefaultMessage(
+                dialogue_reference=("", ""),
+                message_id=1,
+                target=0,
+                performative=DefaultMessage.Performative.BYTES,
+                content=content,
+            )
+            message.to = "counterparty"
+            message.sender = handler.context.agent_address
+            handler.context.outbox.put_message(message)
+
+    skill_context = SkillContext()
+    handler_cls = make_handler_cls_from_funcion(handler_func)
+    handler = handler_cls(name="handler", skill_context=skill_context)
+    test_skill = Skill(
+        SkillConfig(name="test_skill", author="fetchai"),
+        skill_context=skill_context,
+        handlers={"handler": handler},
+    )
+    skill_context._skill = test_skill
+    builder.add_component_instance(test_skill)
+    agent = builder.build()
+    skill_context.set_agent_context(agent.context)
+    multiplexer = agent.runtime.multiplexer
+
+    with patch.object(multiplexer, "_send", new_callable=AsyncMock) as send:
+        with run_in_thread(agent.start, timeout=20, on_exit=agent.stop):
+            wait_for_condition(lambda: agent.is_running, timeout=10)
+            AeaTool(agent).put_inbox(AeaTool.dummy_envelope())
+            wait_for_condition(
+                lambda: send.await_count == len(contents),
+                timeout=10,
+                error_msg="The envelopes put by the handler are not all sent.",
+            )
+            assert agent.is_running
+        sent = [call.args[0].message.content for call in send.await_args_list]
+    assert sent == contents
+
+
+def test_get_skill_protocols():
+    """Test the protocols of a skill are the ones handled by its handlers."""
+    builder = AEABuilder()
+    builder.set_name("MyAgent")
+    builder.add_private_key(DEFAULT_LEDGER, FETCHAI_PRIVATE_KEY_PATH)
+    skill_context = SkillContext()
+    handler_cls = make_handler_cls_from_funcion(lambda handler: None)
+    test_skill = Skill(
+        SkillConfig(name="test_skill", author="fetchai"),
+        skill_context=skill_context,
+        handlers={"handler": handler_cls(name="handler", skill_context=skill_context)},
+    )
+    skill_context._skill = test_skill
+    builder.add_component_instance(test_skill)
+    agent = builder.build()
+
+    assert agent._get_skill_protocols(PublicId.from_str("fetchai/test_skill:any")) == [
+        DefaultMessage.protocol_id
+    ]
+    assert (
+        agent._get_skill_protocols(PublicId.from_str("fetchai/other_skill:any")) == []
+    )
+
+
+def test_new_components_update_skill_lanes():
+    """Test the skill lanes of the multiplexer are updated when new components are notified."""
+    builder = AEABuilder()
+    builder.set_name("MyAgent")
+    builder.add_private_key(DEFAULT_LEDGER, FETCHAI_PRIVATE_KEY_PATH)
+    agent = builder.build()
+
+    with patch.object(
+        agent.runtime.multiplexer, "update_skill_lanes"
+    ) as update_skill_lanes_mock:
+        agent._handle_new_components(None)
+    update_skill_lanes_mock.assert_called_once()
+
+
 def test_start_stop_and_start_stop_again():
     """Tests AEA can be started/stopped twice."""
     agent_name = "MyAgent"
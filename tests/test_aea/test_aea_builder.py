@@ -54,6 +54,7 @@ from aea.exceptions import AEAEnforceError, AEAException, AEAWalletNoAddressExce
 from aea.helpers.base import cd
 from aea.helpers.exception_policy import ExceptionPolicyEnum
 from aea.helpers.install_dependency import call_pip
+from aea.helpers.overflow_policy import OverflowPolicyEnum, QueueLimit
 from aea.protocols.base import Protocol
 from aea.registries.resources import Resources
 from aea.skills.base import Skill
@@ -521,6 +522,8 @@ def test_set_from_config_default():
     agent_configuration.error_handler = {}
     agent_configuration.skill_exception_policy = ExceptionPolicyEnum.just_log
     agent_configuration.connection_exception_policy = ExceptionPolicyEnum.just_log
+    agent_configuration.queue_limits = {}
+    agent_configuration.priority_lanes = {}
     agent_configuration._default_connection = None
     agent_configuration.connection_private_key_paths_dict = {"fetchai": None}
     agent_configuration.ledger_apis_dict = {"fetchai": None}
@@ -563,6 +566,8 @@ def test_set_from_config_custom():
     }
     agent_configuration.skill_exception_policy = ExceptionPolicyEnum.just_log
     agent_configuration.connection_exception_policy = ExceptionPolicyEnum.just_log
+    agent_configuration.queue_limits = {}
+    agent_configuration.priority_lanes = {}
     agent_configuration._default_connection = None
     agent_configuration.connection_private_key_paths_dict = {"fetchai": None}
     agent_configuration.ledger_apis_dict = {"fetchai": None}
@@ -594,6 +599,22 @@ def test_set_from_config_custom():
         assert builder._load_error_handler_class() is not None
 
 
+def test_set_queue_limits_from_config():
+    """Test the queue limits are set from the agent configuration."""
+    builder = AEABuilder()
+    builder._set_queue_limits_from_config(
+        {
+            "inbox": {"capacity": 100, "overflow_policy": "reject"},
+            "connections": {"fetchai/stub": {"capacity": 10}},
+        }
+    )
+    assert builder._inbox_limit == QueueLimit(100, OverflowPolicyEnum.reject)
+    assert builder._outbox_limit is None
+    assert builder._connection_limits == {
+        PublicId.from_str("fetchai/stub"): QueueLimit(10, OverflowPolicyEnum.block)
+    }
+
+
 def test_load_abstract_component():
     """Test abstract component loading."""
     resources = Resources()
@@ -20,6 +20,7 @@
 import asyncio
 import datetime
 import logging
+import time
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
 from unittest.mock import MagicMock, Mock, patch
 
@@ -243,6 +244,86 @@ class TestAsyncAgentLoop:
         agent_loop.stop()
         agent_loop.wait_completed(sync=True)
 
+    @pytest.mark.asyncio
+    async def test_message_sources_served_in_turn(self):
+        """Test an internal message is not processed after all the waiting envelopes."""
+        handler = CountHandler.make()
+        handler.setup()
+        agent = self.FAKE_AGENT_CLASS(handlers=[handler])
+        agent_loop = self.AGENT_LOOP_CLASS(agent)
+        agent.runtime.agent_loop = agent_loop
+        handled_envelopes = []
+        agent.filter.handle_internal_message.side_effect = (
+            lambda message: handled_envelopes.append(handler.counter)
+        )
+        for _ in range(100):
+            agent.put_inbox("msg")
+        agent.put_internal_message("msg")
+
+        agent_loop.start()
+        try:
+            await wait_for_condition_async(lambda: handler.counter == 100, timeout=5)
+            assert len(handled_envelopes) == 1
+            assert handled_envelopes[0] < 10
+        finally:
+            agent_loop.stop()
+            await agent_loop.wait_completed()
+
+    @pytest.mark.asyncio
+    async def test_messages_handled_in_batches(self):
+        """Test the waiting envelopes are handled in batches of max reactions."""
+        handler = CountHandler.make()
+        handler.setup()
+        agent = self.FAKE_AGENT_CLASS(handlers=[handler])
+        agent.max_reactions = 20
+        agent_loop = self.AGENT_LOOP_CLASS(agent)
+        agent.runtime.agent_loop = agent_loop
+        handled_envelopes = []
+        agent.filter.handle_internal_message.side_effect = (
+            lambda message: handled_envelopes.append(handler.counter)
+        )
+        for _ in range(100):
+            agent.put_inbox("msg")
+        agent.put_internal_message("msg")
+
+        agent_loop.start()
+        try:
+            await wait_for_condition_async(lambda: handler.counter == 100, timeout=5)
+            assert len(handled_envelopes) == 1
+            assert 20 <= handled_envelopes[0] < 100
+        finally:
+            agent_loop.stop()
+            await agent_loop.wait_completed()
+
+    @pytest.mark.asyncio
+    async def test_message_batch_time_budget(self):
+        """Test a batch of envelopes ends when its time budget is spent."""
+        handler = CountHandler.make()
+        handler.setup()
+        agent = self.FAKE_AGENT_CLASS(handlers=[handler])
+        agent.max_reactions = 100
+        agent_loop = self.AGENT_LOOP_CLASS(agent)
+        agent.runtime.agent_loop = agent_loop
+        handled_envelopes = []
+        agent.filter.handle_internal_message.side_effect = (
+            lambda message: handled_envelopes.append(handler.counter)
+        )
+        for _ in range(100):
+            agent.put_inbox("msg")
+        agent.put_internal_message("msg")
+
+        agent_loop.start()
+        try:
+            with patch.object(agent_loop, "MESSAGE_BATCH_TIME_BUDGET", 0):
+                await wait_for_condition_async(
+                    lambda: handler.counter == 100, timeout=5
+                )
+            assert len(handled_envelopes) == 1
+            assert handled_envelopes[0] < 10
+        finally:
+            agent_loop.stop()
+            await agent_loop.wait_completed()
+
     def test_behaviour_act(self):
         """Test behaviour act called by schedule."""
         tick_interval = 0.1
@@ -278,20 +359,45 @@ class TestAsyncAgentLoop:
         await agent_loop.wait_completed()
 
     def test_new_behaviours(self):
-        """Test new behaviours are added."""
+        """Test new behaviours are registered and scheduled when notified, not polled."""
+        tick_interval = 0.1
+        behaviour = CountBehaviour.make(tick_interval=tick_interval)
+        behaviour.setup()
         agent = self.FAKE_AGENT_CLASS()
         agent_loop = self.AGENT_LOOP_CLASS(agent, threaded=True)
-        agent_loop.NEW_BEHAVIOURS_PROCESS_SLEEP = 0.5
         agent.runtime.agent_loop = agent_loop
 
         agent_loop.start()
         wait_for_condition(lambda: agent_loop.is_running, timeout=10)
+        time.sleep(tick_interval * 2)
+        assert agent.filter.handle_new_handlers_and_behaviours.call_count == 0
+
+        agent.behaviours.append(behaviour)
+        agent.filter.notify_new_components()
         wait_for_condition(
-            lambda: agent.filter.handle_new_handlers_and_behaviours.call_count >= 2,
-            timeout=agent_loop.NEW_BEHAVIOURS_PROCESS_SLEEP * 3,
+            lambda: agent.filter.handle_new_handlers_and_behaviours.call_count == 1,
+            timeout=2,
         )
+        wait_for_condition(lambda: behaviour.counter >= 1, timeout=tick_interval * 3)
+        agent_loop.stop()
+        agent_loop.wait_completed(sync=True)
+
+    def test_no_periodic_tasks_registered_on_stop(self):
+        """Test the periodic tasks are not registered once the loop is stopping."""
+        agent = self.FAKE_AGENT_CLASS()
+        agent_loop = self.AGENT_LOOP_CLASS(agent, threaded=True)
+        agent.runtime.agent_loop = agent_loop
+
+        agent_loop.start()
+        wait_for_condition(lambda: agent_loop.is_running, timeout=10)
         agent_loop.stop()
         agent_loop.wait_completed(sync=True)
+        assert agent_loop.state == AgentLoopStates.stopped
+        assert not agent_loop._periodic_tasks
+
+        agent.behaviours.append(CountBehaviour.make())
+        agent_loop.update_periodic_tasks()
+        assert not agent_loop._periodic_tasks
 
     @pytest.mark.asyncio
     async def test_behaviour_exception(self):
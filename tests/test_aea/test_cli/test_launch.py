@@ -309,6 +309,28 @@ class TestLaunchMultithreaded(BaseLaunchTestCase):
             )
 
 
+class TestLaunchSharded(BaseLaunchTestCase):
+    """Test that the command 'aea launch <agent_names> --sharded' works as expected."""
+
+    def test_exit_code_equal_to_zero(self):
+        """Assert that the exit code is equal to zero (i.e. success)."""
+        with self._cli_launch(
+            [self.agent_name_1, self.agent_name_2], ["--sharded"]
+        ) as process_launch:
+            process_launch.expect_all(
+                [
+                    f"[{self.agent_name_1}] Start processing messages",
+                    f"[{self.agent_name_2}] Start processing messages",
+                ],
+                timeout=DEFAULT_EXPECT_TIMEOUT,
+            )
+            process_launch.control_c()
+            process_launch.expect_all(
+                ["Exit cli. code: 0"],
+                timeout=DEFAULT_EXPECT_TIMEOUT,
+            )
+
+
 class TestLaunchOneAgent(BaseLaunchTestCase):
     """Test that the command 'aea launch <agent_name>' works as expected."""
 
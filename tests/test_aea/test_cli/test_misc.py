@@ -18,6 +18,8 @@
 # ------------------------------------------------------------------------------
 
 """This test module contains the tests for the `aea` sub-commands."""
+import subprocess  # nosec
+import sys
 
 import aea
 from aea.cli import cli
@@ -99,3 +101,20 @@ Commands:
   upgrade              Upgrade the packages of the agent.
 """
     )
+
+
+def test_commands_imported_lazily():
+    """Test that the sub-commands are imported only when they are invoked."""
+    code = (
+        "import sys\n"
+        "from aea.cli.core import cli\n"
+        "assert 'aea.cli.generate' not in sys.modules\n"
+        "assert 'aea.cli.scaffold' not in sys.modules\n"
+        "assert 'pkg_resources' not in sys.modules\n"
+        "cli(['--version'], standalone_mode=False)\n"
+        "assert 'aea.cli.generate' not in sys.modules\n"
+    )
+    result = subprocess.run(  # nosec
+        [sys.executable, "-c", code], capture_output=True, check=False
+    )
+    assert result.returncode == 0, result.stderr.decode()
@@ -33,7 +33,9 @@ from click.testing import CliRunner
 from jsonschema import ValidationError
 from yaml import YAMLError
 
+from aea.cli.freeze import freeze
 from aea.cli.utils.click_utils import (
+    LazyGroup,
     MutuallyExclusiveOption,
     PublicIdParameter,
     password_option,
@@ -547,6 +549,36 @@ def test_mutually_exclusive_usage_error():
         opt.handle_parse_result(MagicMock(), {"arg1": None, "arg2": None}, [])
 
 
+def test_lazy_group():
+    """Test LazyGroup loads a command only when it is used."""
+    loaded = []
+
+    @click.command()
+    def plugin_command():
+        """Plugin command."""
+
+    def load_plugin(plugin):
+        loaded.append(plugin)
+        return plugin_command
+
+    group = LazyGroup(lazy_commands={"freeze": "aea.cli.freeze:freeze"})
+    group.add_lazy_command("dummy", lambda: click.Command("dummy"))
+    group.add_lazy_plugins(iter(["plugin"]), load_plugin)
+    ctx = click.Context(group)
+
+    assert group.commands == {}
+    assert group.get_command(ctx, "dummy").name == "dummy"
+    assert list(group.commands) == ["dummy"]
+    assert loaded == []
+
+    assert group.get_command(ctx, "plugin-command") is plugin_command
+    assert loaded == ["plugin"]
+    assert group.list_commands(ctx) == ["dummy", "freeze", "plugin-command"]
+    assert group.get_command(ctx, "missing") is None
+
+    assert group.load_all_commands()["freeze"] is freeze
+
+
 @mock.patch("aea.cli.utils.config.get_or_create_cli_config", return_value={})
 def test_set_cli_author_negative(*_mocks):
     """Test set_cli_author, negative case."""
@@ -18,12 +18,20 @@
 # ------------------------------------------------------------------------------
 
 """This module contains tests for aea/components/base.py"""
+import importlib
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from unittest import mock
 
 import pytest
 
-from aea.components.base import Component, load_aea_package
+from aea.components.base import (
+    Component,
+    get_import_manifest,
+    load_aea_package,
+    perform_load_aea_package,
+)
 from aea.configurations.base import ConnectionConfig, ProtocolConfig
 
 from tests.conftest import ROOT_DIR
@@ -112,3 +120,108 @@ def test_load_aea_package_twice():
     from packages.fetchai.connections.http_client.connection import HTTPClientConnection
 
     assert BaseHTTPCLientConnection is HTTPClientConnection
+
+
+def test_import_manifest_from_fingerprint():
+    """Test the import manifest is read from the fingerprint, without walking the package."""
+    directory = Path(ROOT_DIR) / "packages" / "fetchai" / "connections" / "http_client"
+    fingerprint = {
+        "__init__.py": "hash",
+        "connection.py": "hash",
+        "missing/__init__.py": "hash",
+    }
+    with mock.patch.object(Path, "rglob") as rglob_mock:
+        assert get_import_manifest(directory, fingerprint) == [Path(".")]
+    rglob_mock.assert_not_called()
+    assert get_import_manifest(directory, {}) == [Path(".")]
+
+
+def test_load_aea_package_with_lazy_subpackage(tmp_path):
+    """Test the subpackages are executed only when they are first used."""
+    (tmp_path / "__init__.py").write_text("")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "__init__.py").write_text(
+        "from pathlib import Path\nPath(__file__).with_name('loaded').touch()\nVALUE = 42\n"
+    )
+    loaded_marker = tmp_path / "sub" / "loaded"
+    fingerprint = {"__init__.py": "hash", "sub/__init__.py": "hash"}
+    import_path = "packages.author.skills.lazy_skill.sub"
+
+    with mock.patch.object(Path, "rglob") as rglob_mock:
+        perform_load_aea_package(
+            tmp_path, "author", "skills", "lazy_skill", fingerprint=fingerprint
+        )
+    rglob_mock.assert_not_called()
+    try:
+        assert import_path in sys.modules
+        assert not loaded_marker.exists()
+        assert sys.modules[import_path].VALUE == 42
+        assert loaded_marker.exists()
+
+        loaded_marker.unlink()
+        perform_load_aea_package(
+            tmp_path, "author", "skills", "lazy_skill", lazy_subpackages=False
+        )
+        assert loaded_marker.exists()
+    finally:
+        sys.modules.pop(import_path, None)
+        sys.modules.pop("packages.author.skills.lazy_skill", None)
+
+
+def test_load_aea_package_lazy_subpackage_from_threads(tmp_path):
+    """Test a lazy subpackage first used from several threads is executed once, before any of them uses it."""
+    (tmp_path / "__init__.py").write_text("")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "__init__.py").write_text(
+        "import time\nfrom pathlib import Path\n"
+        "with Path(__file__).with_name('loads').open('a') as f:\n    f.write('x')\n"
+        "time.sleep(0.2)\nVALUE = 42\n"
+    )
+    import_path = "packages.author.skills.threaded_skill.sub"
+    try:
+        perform_load_aea_package(
+            tmp_path,
+            "author",
+            "skills",
+            "threaded_skill",
+            fingerprint={"__init__.py": "hash", "sub/__init__.py": "hash"},
+        )
+        module = sys.modules[import_path]
+        with ThreadPoolExecutor(4) as executor:
+            values = list(executor.map(lambda _: module.VALUE, range(4)))
+        assert values == [42] * 4
+        assert (tmp_path / "sub" / "loads").read_text() == "x"
+    finally:
+        sys.modules.pop(import_path, None)
+        sys.modules.pop("packages.author.skills.threaded_skill", None)
+
+
+def test_load_aea_package_subpackage_missing_from_manifest(tmp_path):
+    """Test a subpackage missing from the manifest is imported normally, not kept from a previous load."""
+    (tmp_path / "__init__.py").write_text("")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "__init__.py").write_text("VALUE = 1\n")
+    import_path = "packages.author.skills.stale_skill.sub"
+    try:
+        perform_load_aea_package(
+            tmp_path,
+            "author",
+            "skills",
+            "stale_skill",
+            fingerprint={"__init__.py": "hash", "sub/__init__.py": "hash"},
+        )
+        assert sys.modules[import_path].VALUE == 1
+
+        (tmp_path / "sub" / "__init__.py").write_text("VALUE = 2\n")
+        perform_load_aea_package(
+            tmp_path,
+            "author",
+            "skills",
+            "stale_skill",
+            fingerprint={"__init__.py": "hash"},
+        )
+        assert import_path not in sys.modules
+        assert importlib.import_module(import_path).VALUE == 2
+    finally:
+        sys.modules.pop(import_path, None)
+        sys.modules.pop("packages.author.skills.stale_skill", None)
@@ -17,11 +17,17 @@
 #
 # ------------------------------------------------------------------------------
 """This module contains the tests for the aea.configurations.validation module."""
+import json
+
+import pytest
+
 from aea.configurations.validation import (
+    ConfigValidator,
     SAME_MARK,
     filter_data,
     validate_data_with_pattern,
 )
+from aea.exceptions import AEAValidationError
 
 
 def test_compare_data_pattern():
@@ -72,3 +78,40 @@ def test_filter_data():
         3: {2: 3},
         0: 0,
     }
+
+
+def test_validators_are_shared():
+    """Test the validators of a schema are compiled once and shared."""
+    validator = ConfigValidator("skill-config_schema.json")
+    other = ConfigValidator("skill-config_schema.json")
+    env_vars_friendly = ConfigValidator("skill-config_schema.json", True)
+    assert validator._validator is other._validator
+    assert validator._validator is not env_vars_friendly._validator
+    assert "$ref" not in json.dumps(validator._validator.schema)
+    assert validator.required_fields == other.required_fields
+    assert validator.required_fields is not other.required_fields
+
+
+def test_shared_validator_reports_referenced_schema_errors():
+    """Test the errors from the referenced schemas are still reported."""
+    validator = ConfigValidator("connection-config_schema.json")
+    with pytest.raises(AEAValidationError, match="'not a name' does not match"):
+        validator.validate(
+            {
+                "name": "not a name",
+                "author": "fetchai",
+                "version": "0.1.0",
+                "type": "connection",
+                "license": "Apache-2.0",
+                "aea_version": ">=1.0.0",
+                "fingerprint": {},
+                "fingerprint_ignore_patterns": [],
+                "connections": [],
+                "protocols": [],
+                "class_name": "MyConnection",
+                "config": {},
+                "excluded_protocols": [],
+                "restricted_to_protocols": [],
+                "dependencies": {},
+            }
+        )
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2023 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the tests for the crypto/plugin module."""
+
+import pytest
+from importlib_metadata import EntryPoint
+
+from aea.configurations.constants import CRYPTO_PLUGIN_GROUP
+from aea.crypto.plugin import Plugin
+from aea.exceptions import AEAPluginError
+
+
+def test_plugin():
+    """Test a plugin is read from its entry point."""
+    entry_point = EntryPoint(
+        name="fetchai", value="aea_ledger_fetchai:FetchAICrypto", group=""
+    )
+    plugin = Plugin(CRYPTO_PLUGIN_GROUP, entry_point)
+    assert plugin.name == "fetchai"
+    assert plugin.attr == "FetchAICrypto"
+    assert plugin.entry_point_path == "aea_ledger_fetchai:FetchAICrypto"
+
+
+@pytest.mark.parametrize(
+    "value,error",
+    [
+        ("aea_ledger_fetchai", "does not refer to an attribute"),
+        ("aea_ledger_fetchai:crypto.FetchAICrypto", "Nested attributes"),
+    ],
+)
+def test_plugin_entry_point_errors(value, error):
+    """Test the entry points not referring to a single attribute are rejected."""
+    entry_point = EntryPoint(name="fetchai", value=value, group="")
+    with pytest.raises(AEAPluginError, match=error):
+        Plugin(CRYPTO_PLUGIN_GROUP, entry_point)
@@ -19,6 +19,9 @@
 
 """This module contains tests for decision_maker."""
 
+from multiprocessing.pool import ThreadPool
+from unittest import mock
+
 import pytest
 from aea_ledger_cosmos import CosmosCrypto
 from aea_ledger_ethereum import EthereumCrypto
@@ -45,6 +48,7 @@ from packages.fetchai.protocols.signing.dialogues import (
 )
 from packages.fetchai.protocols.signing.message import SigningMessage
 
+from tests.common.utils import wait_for_condition
 from tests.conftest import (
     COSMOS_PRIVATE_KEY_PATH,
     ETHEREUM_PRIVATE_KEY_PATH,
@@ -90,6 +94,8 @@ class BaseTestDecisionMaker:
 
     decision_maker_handler_cls = DecisionMakerHandler
     decision_maker_cls = DecisionMaker
+    decision_maker_handler_config = {}
+    shared_pool_size = 0
 
     @classmethod
     def setup(cls):
@@ -108,11 +114,13 @@ class BaseTestDecisionMaker:
             public_keys=cls.wallet.public_keys,
             default_address_key=FetchAICrypto.identifier,
         )
-        cls.config = {}
+        cls.config = dict(cls.decision_maker_handler_config)
         cls.decision_maker_handler = cls.decision_maker_handler_cls(
             identity=cls.identity, wallet=cls.wallet, config=cls.config
         )
         cls.decision_maker = cls.decision_maker_cls(cls.decision_maker_handler)
+        cls.pool = ThreadPool(cls.shared_pool_size) if cls.shared_pool_size else None
+        cls.decision_maker.set_pool(cls.pool)
 
         cls.tx_sender_addr = "agent_1"
         cls.tx_counterparty_addr = "pk"
@@ -484,7 +492,124 @@ class BaseTestDecisionMaker:
     def teardown(cls):
         """Tear the tests down."""
         cls.decision_maker.stop()
+        if cls.pool is not None:
+            cls.pool.terminate()
+            cls.pool.join()
 
 
 class TestDecisionMaker(BaseTestDecisionMaker):
     """Run test for default decision maker."""
+
+
+class TestDecisionMakerWithWorkers(BaseTestDecisionMaker):
+    """Run test for default decision maker with a pool of workers."""
+
+    decision_maker_handler_config = {DecisionMaker.NUM_WORKERS_CONFIG_KEY: 4}
+
+    def test_num_workers(self):
+        """Test the workers are started."""
+        assert self.decision_maker.num_workers == 4
+        assert len(self.decision_maker._workers) == 4
+        assert all(worker.is_alive() for worker in self.decision_maker._workers)
+
+    def test_handle_many_dialogues(self):
+        """Test messages of many dialogues are all handled."""
+        message = b"0x11f3f9487724404e3a1fb7252a322656b90ba0455a2ca5fcdcbe6eeee5f8126d"
+        signing_dialogues = SigningDialogues(
+            str(PublicId("author", "a_skill", "0.1.0"))
+        )
+        num_dialogues = 20
+        for _ in range(num_dialogues):
+            signing_msg = SigningMessage(
+                performative=SigningMessage.Performative.SIGN_MESSAGE,
+                dialogue_reference=signing_dialogues.new_self_initiated_dialogue_reference(),
+                terms=Terms(
+                    ledger_id=FetchAICrypto.identifier,
+                    sender_address="pk1",
+                    counterparty_address="pk2",
+                    amount_by_currency_id={"FET": -1},
+                    is_sender_payable_tx_fee=True,
+                    quantities_by_good_id={"good_id": 10},
+                    nonce="transaction nonce",
+                ),
+                raw_message=RawMessage(FetchAICrypto.identifier, message),
+            )
+            signing_dialogue = signing_dialogues.create_with_message(
+                "decision_maker", signing_msg
+            )
+            assert signing_dialogue is not None
+            self.decision_maker.message_in_queue.put_nowait(signing_msg)
+
+        for _ in range(num_dialogues):
+            signing_msg_response = self.decision_maker.message_out_queue.get(timeout=2)
+            recovered_dialogue = signing_dialogues.update(signing_msg_response)
+            assert recovered_dialogue is not None
+            assert (
+                signing_msg_response.performative
+                == SigningMessage.Performative.SIGNED_MESSAGE
+            )
+
+
+class TestDecisionMakerOnSharedPool(BaseTestDecisionMaker):
+    """Run test for default decision maker on a shared thread pool."""
+
+    shared_pool_size = 2
+
+    def test_no_dedicated_thread(self):
+        """Test the decision maker does not start threads of its own."""
+        assert self.decision_maker.pool is self.pool
+        assert self.decision_maker._thread is None
+        assert self.decision_maker._workers == []
+        with pytest.raises(ValueError, match="running decision maker"):
+            self.decision_maker.set_pool(None)
+
+    test_handle_many_dialogues = TestDecisionMakerWithWorkers.test_handle_many_dialogues
+
+    def test_handler_error_does_not_stop_draining(self):
+        """Test an error of the handler is logged and the next messages are handled."""
+        with mock.patch.object(
+            DecisionMakerHandler, "handle", side_effect=[ValueError, None]
+        ) as mock_handle:
+            with mock.patch.object(self.decision_maker.logger, "exception") as mock_log:
+                self.decision_maker.message_in_queue.put(mock.MagicMock(spec=Message))
+                self.decision_maker.message_in_queue.put(mock.MagicMock(spec=Message))
+                wait_for_condition(lambda: mock_handle.call_count == 2, timeout=2)
+                self.decision_maker.stop()
+        assert mock_handle.call_count == 2
+        mock_log.assert_called_once()
+        self.decision_maker.start()
+
+
+def test_decision_maker_workers_not_thread_safe():
+    """Test a handler which is not thread safe is run sequentially."""
+    wallet = Wallet({FetchAICrypto.identifier: FETCHAI_PRIVATE_KEY_PATH})
+    identity = Identity(
+        "test", address=wallet.addresses[FetchAICrypto.identifier], public_key=""
+    )
+    decision_maker_handler = DecisionMakerHandler(
+        identity=identity,
+        wallet=wallet,
+        config={DecisionMaker.NUM_WORKERS_CONFIG_KEY: 2},
+    )
+    with mock.patch.object(DecisionMakerHandler, "is_thread_safe", False):
+        with mock.patch.object(
+            decision_maker_handler.logger, "warning"
+        ) as mock_warning:
+            decision_maker = DecisionMaker(decision_maker_handler)
+    mock_warning.assert_called_once()
+    assert decision_maker.num_workers == 1
+
+
+def test_decision_maker_bad_num_workers():
+    """Test a non positive number of workers is rejected."""
+    wallet = Wallet({FetchAICrypto.identifier: FETCHAI_PRIVATE_KEY_PATH})
+    identity = Identity(
+        "test", address=wallet.addresses[FetchAICrypto.identifier], public_key=""
+    )
+    decision_maker_handler = DecisionMakerHandler(
+        identity=identity,
+        wallet=wallet,
+        config={DecisionMaker.NUM_WORKERS_CONFIG_KEY: 0},
+    )
+    with pytest.raises(ValueError, match="must be a positive integer"):
+        DecisionMaker(decision_maker_handler)
@@ -20,6 +20,7 @@
 """This module contains tests for decision_maker."""
 
 import copy
+from unittest import mock
 
 import pytest
 from aea_ledger_ethereum import EthereumCrypto
@@ -136,6 +137,42 @@ def test_marginal_utility():
     assert marginal_utility is not None, "Marginal utility must not be none."
 
 
+def test_marginal_utilities():
+    """Test the marginal utilities of many candidate changes match the full utility differences."""
+    good_holdings = {f"good_{i}": i % 7 for i in range(200)}
+    utility_params = {f"good_{i}": 1.0 + i / 100 for i in range(200)}
+    preferences = Preferences()
+    preferences.set(
+        utility_params_by_good_id=utility_params,
+        exchange_params_by_currency_id={"FET": 10.0},
+    )
+    ownership_state = OwnershipState()
+    ownership_state.set(
+        amount_by_currency_id={"FET": 100}, quantities_by_good_id=good_holdings
+    )
+    deltas = [{good_id: 1} for good_id in good_holdings] + [
+        {good_id: -1 for good_id in good_holdings}
+    ]
+    current_score = preferences.logarithmic_utility(good_holdings)
+    expected = [
+        preferences.logarithmic_utility(
+            {
+                good_id: quantity + delta.get(good_id, 0)
+                for good_id, quantity in good_holdings.items()
+            }
+        )
+        - current_score
+        for delta in deltas
+    ]
+    with mock.patch.object(copy, "copy") as copy_mock:
+        marginal_utilities = preferences.marginal_utilities(ownership_state, deltas)
+    copy_mock.assert_not_called()
+    assert marginal_utilities == pytest.approx(expected)
+    assert marginal_utilities[3] == preferences.marginal_utility(
+        ownership_state=ownership_state, delta_quantities_by_good_id=deltas[3]
+    )
+
+
 def test_score_diff_from_transaction():
     """Test the difference between the scores."""
     good_holdings = {"good_id": 2}
@@ -101,3 +101,19 @@ def test_send_no_active_handler_2():
             f"Cannot handle envelope: {reason}. Sender={envelope_mock.sender}, to={envelope_mock.sender}."
         )
     assert count + 1 == handler.no_active_handler_count
+
+
+def test_send_envelope_rejected():
+    """Test the send_envelope_rejected method."""
+    handler = ErrorHandler()
+    envelope_mock = Mock()
+    envelope_mock.sender = "2"
+    envelope_mock.to = "3"
+    count = handler.envelope_rejected_count
+    reason = "reason"
+    with patch.object(_default_logger, "warning") as mock_logger:
+        handler.send_envelope_rejected(envelope_mock, reason, _default_logger)
+        mock_logger.assert_any_call(
+            f"Rejected envelope: {reason}. Sender={envelope_mock.sender}, to={envelope_mock.to}."
+        )
+    assert count + 1 == handler.envelope_rejected_count
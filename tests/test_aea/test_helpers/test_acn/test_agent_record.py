@@ -18,11 +18,18 @@
 # ------------------------------------------------------------------------------
 """This module contains the tests for acn helper module."""
 
+import datetime
+from unittest.mock import patch
+
 import pytest
 
 from aea.configurations.constants import DEFAULT_LEDGER
 from aea.crypto.registries import make_crypto
-from aea.helpers.acn.agent_record import AgentRecord
+from aea.helpers.acn.agent_record import (
+    AgentRecord,
+    _VerifiedRecordsCache,
+    _verified_records_cache,
+)
 from aea.helpers.base import CertRequest
 
 from tests.conftest import _process_cert
@@ -93,3 +100,68 @@ def test_agent_record(change_directory):
         match="Invalid signature for provided representative_public_key and agent address!",
     ):
         AgentRecord.from_cert_request(cert, agent_key_1.address, peer_public_key_2)
+
+
+def test_agent_record_verified_once(change_directory):
+    """Test a record within its validity period is only verified once."""
+    agent_key = make_crypto(DEFAULT_LEDGER)
+    peer_public_key = make_crypto(DEFAULT_LEDGER).public_key
+    today = datetime.date.today()
+    cert = CertRequest(
+        peer_public_key,
+        "test_service",
+        DEFAULT_LEDGER,
+        str(today - datetime.timedelta(days=1)),
+        str(today + datetime.timedelta(days=2)),
+        "{public_key}",
+        "test_acn_cert.txt",
+    )
+    _process_cert(agent_key, cert, change_directory)
+    _verified_records_cache.clear()
+
+    with patch.object(
+        AgentRecord, "_recover_public_key", wraps=lambda: agent_key.public_key
+    ) as mock_recover:
+        for _ in range(3):
+            agent_record = AgentRecord.from_cert_request(
+                cert, agent_key.address, peer_public_key
+            )
+            assert agent_record.public_key == agent_key.public_key
+    mock_recover.assert_called_once()
+
+    # a record signed for another agent is still verified, and rejected
+    with pytest.raises(ValueError, match="Invalid signature"):
+        AgentRecord.from_cert_request(
+            cert, make_crypto(DEFAULT_LEDGER).address, peer_public_key
+        )
+    _verified_records_cache.clear()
+
+
+def test_verified_records_cache():
+    """Test the cache honours the validity period and its size."""
+    cache = _VerifiedRecordsCache(max_size=2)
+    key_1 = ("ledger", "address_1", "signature", b"message")
+    key_2 = ("ledger", "address_2", "signature", b"message")
+    key_3 = ("ledger", "address_3", "signature", b"message")
+
+    # not valid yet, or not valid anymore
+    cache.add(key_1, "public_key", not_before=10, not_after=20, now=5)
+    cache.add(key_1, "public_key", not_before=10, not_after=20, now=20)
+    assert len(cache) == 0
+
+    cache.add(key_1, "public_key_1", not_before=10, not_after=20, now=15)
+    assert cache.get(key_1, now=15) == "public_key_1"
+    assert cache.get(key_1, now=5) is None
+    assert cache.get(key_1, now=20) is None
+    assert len(cache) == 0
+
+    cache.add(key_1, "public_key_1", not_before=10, not_after=20, now=15)
+    cache.add(key_2, "public_key_2", not_before=10, not_after=20, now=15)
+    assert cache.get(key_1, now=15) == "public_key_1"
+    cache.add(key_3, "public_key_3", not_before=10, not_after=20, now=15)
+    assert len(cache) == 2
+    assert cache.get(key_2, now=15) is None
+    assert cache.get(key_1, now=15) == "public_key_1"
+
+    cache.clear()
+    assert len(cache) == 0
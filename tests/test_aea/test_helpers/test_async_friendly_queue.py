@@ -49,6 +49,20 @@ async def test_asyncio_loop() -> None:
     assert await sq.async_get() == item
 
 
+@pytest.mark.asyncio
+async def test_async_put_waits_for_room() -> None:
+    """Test AsyncFriendlyQueue.async_put waits until an item is removed from a full queue."""
+    sq = AsyncFriendlyQueue(maxsize=1)
+    sq.put_nowait("first")
+    put_task = asyncio.ensure_future(sq.async_put("second"))
+    await asyncio.sleep(0.01)
+    assert not put_task.done()
+
+    assert sq.get_nowait() == "first"
+    await asyncio.wait_for(put_task, 1)
+    assert sq.get_nowait() == "second"
+
+
 def test_many_threads_with_asyncio() -> None:
     """Test AsyncFriendlyQueue wuth multiple asyncio event loop consumers in different threads."""
     sq = AsyncFriendlyQueue()
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2023 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the tests for the helpers/fingerprint module."""
+import json
+import os
+from unittest import mock
+
+from aea.helpers.fingerprint import (
+    FINGERPRINT_CACHE_FILE_ENV_VAR,
+    FingerprintCache,
+    compute_file_hashes,
+    fingerprint_cache,
+)
+from aea.helpers.ipfs.base import IPFSHashOnly
+
+
+def _make_files(directory, number):
+    """Make files with different contents, last modified a minute ago."""
+    files = []
+    for i in range(number):
+        file = directory / f"file_{i}.txt"
+        file.write_text(f"content {i}\n")
+        one_minute_ago = file.stat().st_mtime - 60
+        os.utime(file, (one_minute_ago, one_minute_ago))
+        files.append(file)
+    return files
+
+
+def test_compute_file_hashes(tmp_path):
+    """Test the hashes are computed in order, serially or in parallel."""
+    files = _make_files(tmp_path, 8)
+    expected = [IPFSHashOnly().get(str(file)) for file in files]
+    fingerprint_cache.clear()
+    assert compute_file_hashes(files, max_workers=4) == expected
+    fingerprint_cache.clear()
+    assert compute_file_hashes(files, max_workers=1) == expected
+
+
+def test_unchanged_files_are_not_read(tmp_path):
+    """Test the hashes of unchanged files are taken from the cache."""
+    files = _make_files(tmp_path, 3)
+    fingerprint_cache.clear()
+    expected = compute_file_hashes(files)
+    with mock.patch.object(IPFSHashOnly, "get") as get_mock:
+        assert compute_file_hashes(files) == expected
+    get_mock.assert_not_called()
+
+
+def test_changed_files_are_hashed_again(tmp_path):
+    """Test a file is hashed again when its size or modification time changes."""
+    (file,) = _make_files(tmp_path, 1)
+    fingerprint_cache.clear()
+    (old_hash,) = compute_file_hashes([file])
+    mtime = file.stat().st_mtime
+    file.write_text("content X\n")
+    os.utime(file, (mtime, mtime))
+    assert file.stat().st_size == len("content 0\n")
+    # the change cannot be detected with the same size and modification time
+    assert compute_file_hashes([file]) == [old_hash]
+
+    os.utime(file, (mtime + 1, mtime + 1))
+    (new_hash,) = compute_file_hashes([file])
+    assert new_hash != old_hash
+    assert new_hash == IPFSHashOnly().get(str(file))
+
+
+def test_recently_modified_files_are_not_cached(tmp_path):
+    """Test the files modified too recently to be detected are not cached."""
+    file = tmp_path / "file.txt"
+    file.write_text("content")
+    cache = FingerprintCache()
+    cache.set(file, FingerprintCache._stat(file), "hash")
+    assert cache.get(file)[0] is None
+
+
+def test_cache_file(tmp_path):
+    """Test the cache is persisted to the cache file and loaded from it."""
+    files = _make_files(tmp_path, 2)
+    cache_file = tmp_path / "cache" / "fingerprints.json"
+    cache = FingerprintCache(cache_file)
+    stat = FingerprintCache._stat(files[0])
+    cache.set(files[0], stat, "hash")
+    cache.save()
+    assert json.loads(cache_file.read_text()) == {
+        str(files[0].absolute()): [*stat, "hash"]
+    }
+
+    other_cache = FingerprintCache(cache_file)
+    other_cache.load()
+    assert other_cache.get(files[0])[0] == "hash"
+    assert other_cache.get(files[1])[0] is None
+
+
+def test_cache_file_from_env(tmp_path):
+    """Test the cache file is read from the environment by default."""
+    cache = FingerprintCache()
+    with mock.patch.dict(
+        "os.environ", {FINGERPRINT_CACHE_FILE_ENV_VAR: str(tmp_path / "cache.json")}
+    ):
+        assert cache.cache_file == tmp_path / "cache.json"
+    with mock.patch.dict("os.environ", {FINGERPRINT_CACHE_FILE_ENV_VAR: ""}):
+        assert cache.cache_file is None
+
+
+def test_corrupted_cache_file(tmp_path):
+    """Test a corrupted cache file is ignored."""
+    (file,) = _make_files(tmp_path, 1)
+    cache_file = tmp_path / "fingerprints.json"
+    cache_file.write_text("{not json")
+    cache = FingerprintCache(cache_file)
+    cache.load()
+    assert cache.get(file)[0] is None
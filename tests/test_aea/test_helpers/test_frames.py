@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2023 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the tests for the frame writer."""
+import asyncio
+import struct
+from asyncio import CancelledError
+from typing import List, Tuple
+
+import pytest
+
+from aea.helpers.frames import FRAME_HEADER, FrameWriter
+
+
+class _StreamWriterStub:
+    """Stream writer whose drains wait until they are released."""
+
+    def __init__(self) -> None:
+        """Initialize the stream writer."""
+        self.writes: List[bytes] = []
+        self.drains: List[asyncio.Future] = []
+
+    def writelines(self, data: List[bytes]) -> None:
+        """Record a write."""
+        self.writes.append(b"".join(data))
+
+    async def drain(self) -> None:
+        """Wait until the drain is released."""
+        drain = asyncio.get_event_loop().create_future()
+        self.drains.append(drain)
+        await drain
+
+    async def wait_drains(self, count: int) -> None:
+        """Wait until a number of drains have started."""
+        while len(self.drains) < count:
+            await asyncio.sleep(0)
+
+
+def _frame(data: bytes, header: struct.Struct = FRAME_HEADER) -> bytes:
+    return header.pack(len(data)) + data
+
+
+@pytest.mark.asyncio
+async def test_frame_writer_coalesces_frames_queued_during_drain():
+    """Test the frames queued while a drain is in progress are written together."""
+    stream_writer = _StreamWriterStub()
+    flushes: List[Tuple[int, int]] = []
+    frame_writer = FrameWriter(
+        stream_writer, on_flush=lambda *args: flushes.append(args)
+    )
+
+    first = asyncio.ensure_future(frame_writer.write(b"first"))
+    await stream_writer.wait_drains(1)
+    others = [
+        asyncio.ensure_future(frame_writer.write(data))
+        for data in (b"second", b"third")
+    ]
+    await asyncio.sleep(0)
+    assert frame_writer.pending == 2
+    assert not first.done()
+
+    stream_writer.drains[0].set_result(None)
+    await first
+    assert not any(other.done() for other in others)
+    await stream_writer.wait_drains(2)
+    stream_writer.drains[1].set_result(None)
+    await asyncio.gather(*others)
+    assert stream_writer.writes == [
+        _frame(b"first"),
+        _frame(b"second") + _frame(b"third"),
+    ]
+    assert flushes == [(1, 5), (2, 11)]
+    assert frame_writer.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_frame_writer_header():
+    """Test the frame header is the one given."""
+    stream_writer = _StreamWriterStub()
+    header = struct.Struct("<H")
+    frame_writer = FrameWriter(stream_writer, header=header)
+
+    write = asyncio.ensure_future(frame_writer.write(b"data"))
+    await stream_writer.wait_drains(1)
+    stream_writer.drains[0].set_result(None)
+    await write
+    assert stream_writer.writes == [_frame(b"data", header)]
+
+
+@pytest.mark.asyncio
+async def test_frame_writer_cancelled_write_does_not_cancel_flush():
+    """Test cancelling a writer does not cancel the flush of the other frames."""
+    stream_writer = _StreamWriterStub()
+    frame_writer = FrameWriter(stream_writer)
+
+    cancelled = asyncio.ensure_future(frame_writer.write(b"cancelled"))
+    other = asyncio.ensure_future(frame_writer.write(b"other"))
+    await stream_writer.wait_drains(1)
+    cancelled.cancel()
+    with pytest.raises(CancelledError):
+        await cancelled
+
+    stream_writer.drains[0].set_result(None)
+    await other
+    assert stream_writer.writes == [_frame(b"cancelled") + _frame(b"other")]
+
+
+@pytest.mark.asyncio
+async def test_frame_writer_error_raised_to_its_batch():
+    """Test an error raised while flushing is raised to the writers of the failed batch only."""
+    stream_writer = _StreamWriterStub()
+    flushes: List[Tuple[int, int]] = []
+    frame_writer = FrameWriter(
+        stream_writer, on_flush=lambda *args: flushes.append(args)
+    )
+
+    failed = [asyncio.ensure_future(frame_writer.write(data)) for data in (b"a", b"b")]
+    await stream_writer.wait_drains(1)
+    later = asyncio.ensure_future(frame_writer.write(b"c"))
+    await asyncio.sleep(0)
+    stream_writer.drains[0].set_exception(ConnectionResetError("reset"))
+    results = await asyncio.gather(*failed, return_exceptions=True)
+    assert all(isinstance(result, ConnectionResetError) for result in results)
+
+    await stream_writer.wait_drains(2)
+    stream_writer.drains[1].set_result(None)
+    await later
+    assert flushes == [(1, 1)]
+
+
+@pytest.mark.asyncio
+async def test_frame_writer_flush():
+    """Test flush waits until the queued frames are written, without raising their errors."""
+    stream_writer = _StreamWriterStub()
+    frame_writer = FrameWriter(stream_writer)
+    await frame_writer.flush()
+
+    write = asyncio.ensure_future(frame_writer.write(b"data"))
+    await stream_writer.wait_drains(1)
+    flush = asyncio.ensure_future(frame_writer.flush())
+    await asyncio.sleep(0)
+    assert not flush.done()
+    stream_writer.drains[0].set_exception(ConnectionResetError("reset"))
+    await flush
+    with pytest.raises(ConnectionResetError):
+        await write
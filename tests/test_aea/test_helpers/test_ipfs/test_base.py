@@ -52,3 +52,13 @@ def test_hash_for_big_file():
     data = b"1" * int(IPFSHashOnly.DEFAULT_CHUNK_SIZE * 1.5)
     my_hash = IPFSHashOnly._generate_hash(data)
     assert my_hash == VALID_HASH
+
+
+def test_hash_for_big_file_with_windows_line_endings(tmp_path):
+    """Check a big file is hashed in chunks as if it had Unix line endings."""
+    data = b"1" * (IPFSHashOnly.DEFAULT_CHUNK_SIZE - 1) + b"\r\n" + b"2\r\n" * 100000
+    file = tmp_path / "file.txt"
+    file.write_bytes(data)
+    assert IPFSHashOnly().get(str(file)) == IPFSHashOnly._generate_hash(
+        data.replace(b"\r\n", b"\n")
+    )
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2023 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the tests for the helpers/metrics module."""
+import gc
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from aea.helpers.metrics import Metric, MetricsRegistry, metrics
+from aea.mail.base import Envelope
+from aea.multiplexer import Multiplexer
+
+from packages.fetchai.protocols.default.message import DefaultMessage
+
+from tests.common.utils import wait_for_condition
+from tests.conftest import _make_dummy_connection
+
+
+def test_counter():
+    """Test the counter is incremented and cannot decrease."""
+    registry = MetricsRegistry()
+    counter = registry.counter("requests", "some requests", path="/")
+    counter.inc()
+    counter.inc(2)
+    assert registry.counter("requests", path="/") is counter
+    assert counter.get() == 3
+    with pytest.raises(ValueError, match="Counters can only be incremented."):
+        counter.inc(-1)
+
+
+def test_gauge():
+    """Test the gauge goes up and down."""
+    registry = MetricsRegistry()
+    gauge = registry.gauge("depth")
+    gauge.set(5)
+    gauge.inc()
+    gauge.dec(2)
+    assert gauge.get() == 4
+    gauge.set_function(lambda: 42)
+    assert gauge.get() == 42
+
+
+def test_gauge_function_weakly_referenced():
+    """Test a gauge sampling a bound method is dropped with its object."""
+
+    class Sized:
+        def size(self) -> int:
+            return 7
+
+    registry = MetricsRegistry()
+    sized = Sized()
+    registry.gauge("size").set_function(sized.size)
+    assert registry.snapshot() == {"size": [({}, 7)]}
+
+    del sized
+    gc.collect()
+    assert registry.snapshot() == {}
+
+
+def test_histogram():
+    """Test observations are counted in their buckets."""
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency", buckets=(0.1, 1.0), handler="h")
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+    assert histogram.get() == {
+        "buckets": [(0.1, 2), (1.0, 3), (float("inf"), 4)],
+        "count": 4,
+        "sum": 2.65,
+    }
+    assert histogram.labels_dict == {"handler": "h"}
+
+
+def test_metric_is_abstract():
+    """Test the base metric cannot be instantiated."""
+    with pytest.raises(TypeError):
+        Metric("name", "", ())  # type: ignore  # pylint: disable=abstract-class-instantiated
+
+
+def test_concurrent_updates():
+    """Test the updates from several threads are not lost."""
+    registry = MetricsRegistry()
+    counter = registry.counter("counter")
+    gauge = registry.gauge("gauge")
+    histogram = registry.histogram("histogram", buckets=(1.0,))
+
+    def update() -> None:
+        for _ in range(1000):
+            counter.inc()
+            gauge.inc()
+            gauge.dec(2)
+            histogram.observe(0.5)
+
+    with ThreadPoolExecutor(8) as executor:
+        for future in [executor.submit(update) for _ in range(8)]:
+            future.result()
+
+    assert counter.get() == 8000
+    assert gauge.get() == -8000
+    assert histogram.get()["count"] == 8000
+    assert histogram.get()["buckets"][0] == (1.0, 8000)
+
+
+def test_metric_kind_conflict():
+    """Test a name cannot be registered with two kinds of metric."""
+    registry = MetricsRegistry()
+    registry.counter("name")
+    with pytest.raises(ValueError, match="already registered as a counter"):
+        registry.gauge("name")
+
+
+def test_snapshot_and_clear():
+    """Test the snapshot groups the series by metric name."""
+    registry = MetricsRegistry()
+    registry.counter("sent", connection="a").inc()
+    registry.counter("sent", connection="b").inc(2)
+    assert registry.snapshot() == {
+        "sent": [({"connection": "a"}, 1), ({"connection": "b"}, 2)]
+    }
+    registry.clear()
+    assert registry.snapshot() == {}
+
+
+def test_allocation_sampling():
+    """Test the top allocations are reported while tracing."""
+    registry = MetricsRegistry()
+    assert registry.get_allocations() == []
+    registry.start_allocation_sampling()
+    try:
+        data = [bytearray(1024) for _ in range(100)]
+        allocations = registry.get_allocations(limit=5)
+        assert 0 < len(allocations) <= 5
+        assert registry.gauge("aea_traced_memory_bytes").get() > 0
+        del data
+    finally:
+        registry.stop_allocation_sampling()
+    assert not tracemalloc.is_tracing()
+
+
+def test_allocation_sampling_keeps_existing_tracing():
+    """Test the tracing is not stopped if it was started before the sampling."""
+    registry = MetricsRegistry()
+    tracemalloc.start()
+    try:
+        registry.start_allocation_sampling()
+        registry.stop_allocation_sampling()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_enable_is_paired_with_disable():
+    """Test the metrics stay enabled until every caller has disabled them."""
+    registry = MetricsRegistry()
+    registry.enable()
+    registry.enable()
+    registry.disable()
+    assert registry.enabled
+    registry.disable()
+    assert not registry.enabled
+    registry.disable()
+    assert not registry.enabled
+    registry.enable()
+    assert registry.enabled
+
+
+def test_multiplexer_metrics():
+    """Test the multiplexer counts the envelopes routed and samples its queues."""
+    metrics.clear()
+    metrics.enable()
+    multiplexer = Multiplexer([_make_dummy_connection()], agent_name="metrics_agent")
+    try:
+        multiplexer.connect()
+        message = DefaultMessage(
+            dialogue_reference=("", ""),
+            message_id=1,
+            target=0,
+            performative=DefaultMessage.Performative.BYTES,
+            content=b"hello",
+        )
+        multiplexer.put(Envelope(to="receiver", sender="sender", message=message))
+        wait_for_condition(lambda: not multiplexer.in_queue.empty(), timeout=5)
+
+        snapshot = metrics.snapshot()
+        labels = {"agent": "metrics_agent", "connection": "fetchai/dummy:0.1.0"}
+        assert snapshot["aea_envelopes_sent_total"] == [(labels, 1)]
+        assert snapshot["aea_envelopes_received_total"] == [(labels, 1)]
+        assert snapshot["aea_inbox_depth"] == [({"agent": "metrics_agent"}, 1)]
+        assert snapshot["aea_outbox_depth"] == [({"agent": "metrics_agent"}, 0)]
+    finally:
+        multiplexer.disconnect()
+        metrics.disable()
+        metrics.clear()
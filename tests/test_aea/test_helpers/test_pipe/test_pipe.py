@@ -18,16 +18,21 @@
 # ------------------------------------------------------------------------------
 """Tests for the pipe module."""
 import asyncio
+import os
 from threading import Thread
+from unittest.mock import patch
 
 import pytest
 
 from aea.helpers.pipe import (
     IPCChannelClient,
+    IPCChannelCounters,
     PosixNamedPipeChannel,
     PosixNamedPipeChannelClient,
     TCPSocketChannel,
     TCPSocketChannelClient,
+    UnixSocketChannel,
+    UnixSocketChannelClient,
     make_ipc_channel,
     make_ipc_channel_client,
 )
@@ -136,6 +141,85 @@ class TestAEAHelperTCPSocketChannel:
         assert connected is False
 
 
+@pytest.mark.asyncio
+class TestAEAHelperCoalescedWrites:
+    """Test that the frames written concurrently are coalesced."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_coalesced(self):
+        """Test the frames written in a loop iteration are written together, in order."""
+        pipe = TCPSocketChannel()
+        connected = asyncio.ensure_future(pipe.connect())
+        client_pipe = TCPSocketChannelClient(pipe.out_path, pipe.in_path)
+        client = Thread(target=_run_echo_service, args=[client_pipe])
+        client.start()
+
+        try:
+            assert await connected, "Failed to connect pipe"
+
+            messages = [str(i).encode() * (i + 1) for i in range(100)]
+            await asyncio.gather(*(pipe.write(message) for message in messages))
+            received = [await pipe.read() for _ in messages]
+
+            assert received == messages, "Echoed messages differ"
+            counters = pipe.counters
+            assert counters.frames_written == len(messages)
+            assert counters.bytes_written == sum(map(len, messages))
+            assert counters.frames_read == len(messages)
+            assert counters.bytes_read == counters.bytes_written
+            assert counters.writes == 1
+            assert counters.frames_per_write == len(messages)
+        finally:
+            await pipe.close()
+            client.join()
+
+    @pytest.mark.asyncio
+    async def test_write_error_propagated(self):
+        """Test the connection errors are raised to the writers."""
+        pipe = TCPSocketChannel()
+        connected = asyncio.ensure_future(pipe.connect())
+        client_pipe = TCPSocketChannelClient(pipe.out_path, pipe.in_path)
+        client = Thread(target=_run_echo_service, args=[client_pipe])
+        client.start()
+
+        try:
+            assert await connected, "Failed to connect pipe"
+            writer = pipe._sock.writer
+            with patch.object(
+                writer, "writelines", side_effect=ConnectionResetError("reset")
+            ):
+                results = await asyncio.gather(
+                    pipe.write(b"first"),
+                    pipe.write(b"second"),
+                    return_exceptions=True,
+                )
+            assert all(isinstance(r, ConnectionResetError) for r in results)
+            assert pipe.counters.frames_written == 0
+
+            await pipe.write(b"hello")
+            assert await pipe.read() == b"hello"
+        finally:
+            await pipe.close()
+            client.join()
+
+
+def test_counters():
+    """Test the counters of a channel."""
+    counters = IPCChannelCounters()
+    assert counters.frames_per_write == 0.0
+    counters.frames_written = 6
+    counters.bytes_written = 60
+    counters.writes = 2
+    assert counters.frames_per_write == 3.0
+    assert counters.as_dict() == {
+        "frames_written": 6,
+        "bytes_written": 60,
+        "writes": 2,
+        "frames_read": 0,
+        "bytes_read": 0,
+    }
+
+
 def make_future(result) -> asyncio.Future:
     """Make future for value."""
     f = asyncio.Future()  # type: ignore
@@ -177,3 +261,48 @@ class TestAEAHelperPosixNamedPipeChannel:
         finally:
             await pipe.close()
             client.join()
+
+
+@skip_test_windows
+@pytest.mark.asyncio
+class TestAEAHelperUnixSocketChannel:
+    """Test that UnixSocketChannel work properly"""
+
+    @pytest.mark.asyncio
+    async def test_connection_communication(self):
+        """Test connection communication."""
+        pipe = UnixSocketChannel()
+        assert (
+            pipe.in_path is not None and pipe.out_path is not None
+        ), "UnixSocketChannel not properly setup"
+
+        connected = asyncio.ensure_future(pipe.connect())
+
+        client_pipe = UnixSocketChannelClient(pipe.out_path, pipe.in_path)
+
+        client = Thread(target=_run_echo_service, args=[client_pipe])
+        client.start()
+
+        try:
+            assert await connected, "Failed to connect pipe"
+
+            message = b"hello"
+            await pipe.write(message)
+            received = await pipe.read()
+
+            assert received == message, "Echoed message differs"
+            assert pipe.counters.frames_written == 1
+            assert pipe.counters.frames_read == 1
+        finally:
+            await pipe.close()
+            client.join()
+        assert not os.path.exists(pipe.in_path)
+
+    @pytest.mark.asyncio
+    async def test_connection_refused(self):
+        """Test connection refused."""
+        pipe = UnixSocketChannel()
+        client_pipe = UnixSocketChannelClient(pipe.out_path, pipe.in_path)
+
+        connected = await client_pipe.connect(timeout=0.1)
+        assert connected is False
@@ -19,9 +19,14 @@
 
 """This module contains the tests for the preference representations helper module."""
 
+import pytest
+
+from aea.exceptions import AEAEnforceError
 from aea.helpers.preference_representations.base import (
     linear_utility,
+    linear_utility_change,
     logarithmic_utility,
+    logarithmic_utility_change,
 )
 
 
@@ -45,3 +50,43 @@ def test_linear_utility():
         )
         > 0
     ), "Utility should be positive."
+
+
+def test_logarithmic_utility_change():
+    """Test the logarithmic utility change only evaluates the changed goods."""
+    utility_params_by_good_id = {"good_1": 0.2, "good_2": 0.8, "good_3": 0.5}
+    quantities_by_good_id = {"good_1": 2, "good_2": 1, "good_3": -100}
+    delta_quantities_by_good_id = {"good_1": 3, "good_2": 0}
+    before, after = logarithmic_utility_change(
+        utility_params_by_good_id, quantities_by_good_id, delta_quantities_by_good_id
+    )
+    new_quantities_by_good_id = {**quantities_by_good_id, "good_1": 5}
+    assert after - before == pytest.approx(
+        logarithmic_utility(utility_params_by_good_id, new_quantities_by_good_id)
+        - logarithmic_utility(utility_params_by_good_id, quantities_by_good_id)
+    )
+    assert before == logarithmic_utility({"good_1": 0.2}, {"good_1": 2})
+
+    with pytest.raises(AEAEnforceError, match="must be a non-negative integer"):
+        logarithmic_utility_change({}, {}, {}, quantity_shift=-1)
+    with pytest.raises(AEAEnforceError, match="Good good_4 is not held."):
+        logarithmic_utility_change(
+            utility_params_by_good_id, quantities_by_good_id, {"good_4": 1}
+        )
+
+
+def test_linear_utility_change():
+    """Test the linear utility change only evaluates the changed currencies."""
+    exchange_params_by_currency_id = {"cur_1": 0.2, "cur_2": 0.8}
+    balance_by_currency_id = {"cur_1": 20, "cur_2": 100}
+    before, after = linear_utility_change(
+        exchange_params_by_currency_id,
+        balance_by_currency_id,
+        {"cur_1": -5, "cur_2": 0},
+    )
+    assert (before, after) == (0.2 * 20, 0.2 * 15)
+
+    with pytest.raises(AEAEnforceError, match="Currency cur_3 is not held."):
+        linear_utility_change(
+            exchange_params_by_currency_id, balance_by_currency_id, {"cur_3": 10}
+        )
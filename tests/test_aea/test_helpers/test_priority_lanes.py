@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2023 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the tests for the priority lanes."""
+
+import pytest
+
+from aea.configurations.data_types import PublicId
+from aea.exceptions import AEAEnforceError
+from aea.helpers.priority_lanes import DEFAULT_LANE, PriorityLane, WeightedFairLanes
+
+
+def test_weighted_round_robin():
+    """Test the lanes give up to their weight of items in each round."""
+    lanes = WeightedFairLanes({"high": 3, "low": 1})
+    for i in range(6):
+        lanes.append(f"low{i}", "low")
+        lanes.append(f"high{i}", "high")
+    assert len(lanes) == 12
+
+    dequeued = [lanes.popleft() for _ in range(8)]
+    assert dequeued == [
+        "high0",
+        "high1",
+        "high2",
+        "low0",
+        "high3",
+        "high4",
+        "high5",
+        "low1",
+    ]
+    assert [lanes.popleft() for _ in range(4)] == ["low2", "low3", "low4", "low5"]
+    with pytest.raises(IndexError):
+        lanes.popleft()
+
+
+def test_no_starvation():
+    """Test an item waits at most the weights of the other lanes once at the head of its lane."""
+    lanes = WeightedFairLanes({"high": 5, "low": 1})
+    for i in range(100):
+        lanes.append(i, "high")
+    lanes.append("low", "low")
+    assert [lanes.popleft() for _ in range(6)][-1] == "low"
+
+
+def test_unknown_lane():
+    """Test the items of an unknown lane go to the default lane."""
+    lanes = WeightedFairLanes({"high": 2, DEFAULT_LANE: 1})
+    lanes.append("item", "unknown")
+    assert lanes.depth(DEFAULT_LANE) == 1
+    assert lanes.names == ["high", DEFAULT_LANE]
+
+
+def test_remove_oldest_and_iteration():
+    """Test the oldest item is removed, among the items satisfying a predicate if given."""
+    waits = []
+    lanes = WeightedFairLanes(
+        {"high": 1, "low": 1}, lambda lane, waited: waits.append(lane)
+    )
+    lanes.append(1, "low")
+    lanes.append(2, "high")
+    lanes.append(3, "low")
+    lanes.append(4, "high")
+    assert list(lanes) == [1, 2, 3, 4]
+
+    assert lanes.remove_oldest(lambda item: item % 2 == 0) == 2
+    assert lanes.remove_oldest() == 1
+    assert list(lanes) == [3, 4]
+    with pytest.raises(IndexError):
+        lanes.remove_oldest(lambda item: item > 4)
+
+    assert [lanes.popleft(), lanes.popleft()] == [4, 3]
+    assert waits == ["high", "low"]
+
+
+def test_priority_lane_json():
+    """Test the JSON representation of a priority lane."""
+    lane = PriorityLane(
+        "control",
+        4,
+        protocols=[PublicId.from_str("fetchai/signing:1.1.7")],
+        skills=[PublicId.from_str("fetchai/echo")],
+    )
+    assert lane.json == {
+        "weight": 4,
+        "protocols": ["fetchai/signing:any"],
+        "skills": ["fetchai/echo:any"],
+    }
+    assert PriorityLane.from_json("control", lane.json) == lane
+    assert PriorityLane.from_json("bulk", {}) == PriorityLane("bulk")
+
+    with pytest.raises(AEAEnforceError, match="must be a positive integer"):
+        PriorityLane("control", 0)
@@ -40,7 +40,33 @@ def test_profiling():
         wait_for_condition(lambda: result, timeout=20)
 
         assert "Profiling details" in result
+        assert "Metrics:" in result
+        assert p.get_objects_instances()["Message"] >= 1
     finally:
         p.stop()
         p.wait_completed(sync=True, timeout=20)
     del m
+
+
+def test_profiling_restores_counted_classes():
+    """Test the counted classes are restored on stop, and counted once when restarted."""
+
+    class Counted:
+        """A class to count."""
+
+    p = Profiling(1, [Counted], [Counted], output_function=lambda report: None)
+    for _ in range(2):
+        p.start()
+        p.set_counters()
+        wait_for_condition(lambda: p.is_running, timeout=20)
+        try:
+            instance = Counted()
+            assert p.get_objecst_created()[Counted] == 1
+            assert p.get_objects_instances()["Counted"] == 1
+            del instance
+            assert p.get_objects_instances()["Counted"] == 0
+        finally:
+            p.stop()
+            p.wait_completed(sync=True, timeout=20)
+        assert "__init__" not in Counted.__dict__
+        assert "__del__" not in Counted.__dict__
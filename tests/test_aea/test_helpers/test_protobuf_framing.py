@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2023 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the tests for the protobuf framing helpers."""
+
+import pytest
+from google.protobuf.message import DecodeError
+
+from aea.helpers.protobuf_framing import (
+    ProtobufWriter,
+    WIRE_TYPE_FIXED32,
+    WIRE_TYPE_LENGTH_DELIMITED,
+    WIRE_TYPE_VARINT,
+    decode_int32,
+    decode_varint,
+    encode_varint,
+    iter_fields,
+)
+from aea.mail import base_pb2
+
+
+@pytest.mark.parametrize("value", [0, 1, 127, 128, 300, 2**32, 2**63])
+def test_varint_round_trip(value):
+    """Test varints are decoded to the encoded value."""
+    encoded = encode_varint(value)
+    assert decode_varint(memoryview(b"\x00" + encoded), 1) == (
+        value,
+        len(encoded) + 1,
+    )
+
+
+def test_decode_varint_errors():
+    """Test truncated or too long varints are rejected."""
+    with pytest.raises(DecodeError, match="Truncated varint."):
+        decode_varint(memoryview(b"\x80\x80"), 0)
+    with pytest.raises(DecodeError, match="Too many bytes"):
+        decode_varint(memoryview(b"\xff" * 11), 0)
+
+
+def test_writer_matches_protobuf():
+    """Test the writer encodes as protobuf does, nested messages included."""
+    content = b"content" * 100
+
+    writer = ProtobufWriter()
+    writer.write_string(1, "to")
+    writer.write_string(2, "")
+    writer.write_bytes(4, content)
+    assert len(writer) == len(writer.getvalue())
+    assert (
+        writer.getvalue()
+        == base_pb2.Envelope(to="to", message=content).SerializeToString()
+    )
+
+    writer.reset()
+    writer.write_bytes(5, content)
+    writer.wrap(2)
+    message_pb = base_pb2.Message()
+    message_pb.dialogue_message.content = content  # pylint: disable=no-member
+    assert writer.getvalue() == message_pb.SerializeToString()
+    assert len(writer) == len(writer.getvalue())
+
+
+@pytest.mark.parametrize("value", [1, -1, 300, -(2**31), 2**31 - 1])
+def test_write_int32_matches_protobuf(value):
+    """Test int32 fields are encoded as protobuf does, negative values included."""
+    writer = ProtobufWriter()
+    writer.write_int32(1, value)
+    encoded = writer.getvalue()
+    assert encoded == base_pb2.DialogueMessage(message_id=value).SerializeToString()
+    [(_, _, decoded)] = iter_fields(encoded)
+    assert decode_int32(decoded) == value
+
+
+def test_write_int32_errors():
+    """Test zero is skipped and values out of range are rejected."""
+    writer = ProtobufWriter()
+    writer.write_int32(1, 0)
+    assert writer.getvalue() == b""
+    with pytest.raises(ValueError, match="Value out of range"):
+        writer.write_int32(1, 2**31)
+
+
+def test_iter_fields_views():
+    """Test the length-delimited fields are read as views on the data."""
+    data = bytearray(
+        base_pb2.DialogueMessage(
+            message_id=300, dialogue_starter_reference="a", content=b"content"
+        ).SerializeToString()
+    )
+    fields = list(iter_fields(data))
+    assert [(number, wire_type) for number, wire_type, _ in fields] == [
+        (1, WIRE_TYPE_VARINT),
+        (2, WIRE_TYPE_LENGTH_DELIMITED),
+        (5, WIRE_TYPE_LENGTH_DELIMITED),
+    ]
+    assert fields[0][2] == 300
+    content = fields[2][2]
+    assert isinstance(content, memoryview)
+    assert content.tobytes() == b"content"
+    data[-1] = ord("!")
+    assert content.tobytes() == b"conten!"
+
+
+def test_iter_fields_fixed_size():
+    """Test fixed-size fields are read as views on the data."""
+    data = bytes([(3 << 3) | WIRE_TYPE_FIXED32]) + b"\x01\x02\x03\x04"
+    [(number, wire_type, value)] = iter_fields(data)
+    assert (number, wire_type, bytes(value)) == (
+        3,
+        WIRE_TYPE_FIXED32,
+        b"\x01\x02\x03\x04",
+    )
+
+
+@pytest.mark.parametrize(
+    "data,error",
+    [
+        (b"\x22\x05abc", "Truncated message."),
+        (b"\x02\x00", "Field number 0 is invalid."),
+        (b"\x0b", "Unsupported wire type 3."),
+    ],
+)
+def test_iter_fields_errors(data, error):
+    """Test malformed messages are rejected."""
+    with pytest.raises(DecodeError, match=error):
+        list(iter_fields(data))
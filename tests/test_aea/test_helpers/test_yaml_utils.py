@@ -17,13 +17,20 @@
 #
 # ------------------------------------------------------------------------------
 """This module contains the tests for the yaml utils module."""
+import datetime
 import io
 import random
 import string
 from collections import OrderedDict
+from unittest import mock
+
+import pytest
 
 from aea.helpers.yaml_utils import (
+    YAML_CACHE_DIR_ENV_VAR,
     _AEAYamlLoader,
+    _YamlCache,
+    set_yaml_cache_dir,
     yaml_dump,
     yaml_dump_all,
     yaml_load,
@@ -59,6 +66,91 @@ def test_instantiate_loader_twice():
     assert len(loader.yaml_implicit_resolvers) == old_length
 
 
+def test_yaml_load_keeps_order():
+    """Test the mappings are loaded in the order of the fields."""
+    keys = [_generate_random_string(10) for _ in range(20)]
+    loaded_data = yaml_load(io.StringIO("\n".join(f"{key}: 1" for key in keys)))
+    assert isinstance(loaded_data, OrderedDict)
+    assert list(loaded_data.keys()) == keys
+
+
+def test_yaml_load_cache(tmp_path):
+    """Test the parsed YAML documents are cached by content."""
+    content = "a: 1\nb: [1, 2]\n---\nc: 2\n"
+    try:
+        set_yaml_cache_dir(tmp_path)
+        assert yaml_load_all(io.StringIO(content)) == [
+            {"a": 1, "b": [1, 2]},
+            {"c": 2},
+        ]
+        assert len(list(tmp_path.iterdir())) == 1
+
+        with mock.patch("yaml.load_all") as load_all_mock:
+            loaded_data = yaml_load_all(io.StringIO(content))
+        load_all_mock.assert_not_called()
+        assert loaded_data == [{"a": 1, "b": [1, 2]}, {"c": 2}]
+        assert list(loaded_data[0].keys()) == ["a", "b"]
+
+        assert yaml_load(io.StringIO(content.split("---")[0])) == {
+            "a": 1,
+            "b": [1, 2],
+        }
+        assert len(list(tmp_path.iterdir())) == 2
+    finally:
+        set_yaml_cache_dir(None)
+
+
+def test_yaml_load_cache_from_env(tmp_path):
+    """Test the cache directory is read from the environment by default."""
+    cache = _YamlCache()
+    with mock.patch.dict("os.environ", {YAML_CACHE_DIR_ENV_VAR: str(tmp_path)}):
+        assert cache.directory == tmp_path
+    with mock.patch.dict("os.environ", {YAML_CACHE_DIR_ENV_VAR: ""}):
+        assert cache.directory is None
+
+
+def test_yaml_load_cache_corrupted_entry(tmp_path):
+    """Test a corrupted cache entry is parsed again and replaced."""
+    try:
+        set_yaml_cache_dir(tmp_path)
+        yaml_load(io.StringIO("a: 1"))
+        (entry,) = tmp_path.iterdir()
+        entry.write_bytes(b"")
+        assert yaml_load(io.StringIO("a: 1")) == {"a": 1}
+        assert entry.stat().st_size > 0
+    finally:
+        set_yaml_cache_dir(None)
+
+
+@pytest.mark.parametrize(
+    "entry_content",
+    [b"", b"\xff", b"[1, ", b'{"a": 1}]'],
+    ids=["empty", "not_utf8", "truncated", "extra_data"],
+)
+def test_yaml_load_cache_unreadable_entry(tmp_path, entry_content):
+    """Test any entry which cannot be read is a cache miss."""
+    try:
+        set_yaml_cache_dir(tmp_path)
+        yaml_load(io.StringIO("a: 1"))
+        (entry,) = tmp_path.iterdir()
+        entry.write_bytes(entry_content)
+        assert yaml_load(io.StringIO("a: 1")) == {"a": 1}
+    finally:
+        set_yaml_cache_dir(None)
+
+
+def test_yaml_load_cache_skips_non_json_documents(tmp_path):
+    """Test the documents JSON cannot represent are not cached."""
+    try:
+        set_yaml_cache_dir(tmp_path)
+        assert yaml_load(io.StringIO("1: 2001-12-14")) == {
+            1: datetime.date(2001, 12, 14)
+        }
+        assert list(tmp_path.iterdir()) == []
+    finally:
+        set_yaml_cache_dir(None)
+
+
 def _generate_random_string(n: int = 100):
     return "".join(
         random.choice(string.ascii_uppercase + string.digits) for _ in range(n)  # nosec
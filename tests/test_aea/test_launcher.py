@@ -28,7 +28,7 @@ import pytest
 import yaml
 
 from aea.configurations.base import DEFAULT_AEA_CONFIG_FILE
-from aea.launcher import AEADirMultiprocessTask, AEALauncher, _run_agent
+from aea.launcher import AEADirMultiprocessTask, AEALauncher, AEAShardTask, _run_agent
 from aea.test_tools.test_cases import AEATestCaseMany
 
 from tests.common.utils import wait_for_condition
@@ -143,6 +143,78 @@ class TestProcessLauncherMode(TestThreadLauncherMode):
     RUNNER_MODE = "multiprocess"
 
 
+class TestShardedLauncherMode(TestThreadLauncherMode):
+    """Test launcher in sharded mode."""
+
+    RUNNER_MODE = "sharded"
+
+    def test_one_fails(self) -> None:
+        """Test the shard of the failing agent is restarted, then fails."""
+        try:
+            runner = AEALauncher(
+                [self.agent_name_1, self.failing_agent],
+                self.RUNNER_MODE,
+                agents_per_shard=1,
+                max_restarts=2,
+            )
+            runner._executor._backoff_base = 0.1
+            with pytest.raises(RuntimeError, match="after 2 restarts"):
+                runner.start()
+            restarts = [shard["restarts"] for shard in runner.shards_load]
+            assert restarts == [0, 2]
+        finally:
+            runner.stop()
+        assert runner.failed == [self.failing_agent]
+        assert runner.not_failed == [self.agent_name_1]
+
+    def test_shards_load(self) -> None:
+        """Test the agents are packed in shards, which report their load."""
+        runner = AEALauncher(
+            [self.agent_name_1, self.agent_name_2],
+            self.RUNNER_MODE,
+            agents_per_shard=2,
+        )
+        assert runner.agents_per_shard == 2
+        try:
+            runner.start(True)
+            wait_for_condition(
+                lambda: runner.shards_load[0]["memory_mb"] > 0, timeout=10, period=0.1
+            )
+            (shard,) = runner.shards_load
+            assert shard["agents"] == [self.agent_name_1, self.agent_name_2]
+            assert shard["is_alive"]
+            assert shard["pid"] is not None
+            assert shard["restarts"] == 0
+            assert shard["cpu_percent"] >= 0
+        finally:
+            runner.stop()
+        assert not runner.shards_load[0]["is_alive"]
+        assert runner.num_failed == 0
+
+
+def test_sharded_launcher_arguments():
+    """Test the shards are sized to the CPUs by default."""
+    with patch("os.cpu_count", return_value=2):
+        runner = AEALauncher(["a", "b", "c"], "sharded")
+    assert runner.agents_per_shard == 2
+    assert [shard["agents"] for shard in runner.shards_load] == [["a", "b"], ["c"]]
+
+    with pytest.raises(ValueError, match="must be at least one"):
+        AEALauncher(["a"], "sharded", agents_per_shard=0)
+
+    with pytest.raises(ValueError, match="only available in sharded mode"):
+        AEALauncher([], "async").shards_load
+
+
+def test_shard_task_stop():
+    """Test AEAShardTask.stop when not started."""
+    task = AEAShardTask(["some"])
+    assert task.id == ("some",)
+    assert task.load == {"cpu_percent": 0.0, "memory_mb": 0.0}
+    task.stop()
+    assert not task._stop_event.is_set()
+
+
 def test_task_stop():
     """Test AEADirMultiprocessTask.stop when not started."""
     task = AEADirMultiprocessTask("some")
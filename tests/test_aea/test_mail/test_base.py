@@ -20,12 +20,20 @@
 import unittest.mock
 
 import pytest
+from google.protobuf.message import DecodeError
 
 import aea
 from aea.configurations.base import PublicId
 from aea.exceptions import AEAEnforceError
 from aea.mail import base_pb2
-from aea.mail.base import Envelope, EnvelopeContext, ProtobufEnvelopeSerializer, URI
+from aea.mail.base import (
+    Envelope,
+    EnvelopeContext,
+    ProtobufEnvelopeSerializer,
+    URI,
+    decode_dialogue_message,
+    encode_dialogue_message,
+)
 from aea.multiplexer import InBox, Multiplexer, OutBox
 from aea.protocols.base import Message
 
@@ -272,6 +280,85 @@ def test_protobuf_envelope_serializer():
     assert actual_envelope == expected_envelope
 
 
+def test_protobuf_envelope_serializer_matches_protobuf():
+    """Test the envelope is encoded as its protobuf message, and decoded from a view."""
+    serializer = ProtobufEnvelopeSerializer()
+    envelope = Envelope(
+        to="to",
+        sender="sender",
+        protocol_specification_id=PublicId("author", "name", "0.1.0"),
+        message=b"message" * 100,
+        context=EnvelopeContext(uri=URI("/uri")),
+    )
+    envelope_pb = base_pb2.Envelope(
+        to="to",
+        sender="sender",
+        protocol_id="author/name:0.1.0",
+        message=b"message" * 100,
+        uri="/uri",
+    )
+    encoded_envelope = serializer.encode(envelope)
+    assert encoded_envelope == envelope_pb.SerializeToString()
+
+    framed = memoryview(b"header" + encoded_envelope + b"trailer")
+    decoded_envelope = serializer.decode(framed[6 : 6 + len(encoded_envelope)])
+    assert decoded_envelope == envelope
+    assert isinstance(decoded_envelope.message, bytes)
+
+
+def test_protobuf_envelope_serializer_decode_errors():
+    """Test malformed envelopes are rejected."""
+    serializer = ProtobufEnvelopeSerializer()
+    encoded_envelope = Envelope(
+        to="to",
+        sender="sender",
+        protocol_specification_id=PublicId("author", "name", "0.1.0"),
+        message=b"message",
+    ).encode()
+
+    with pytest.raises(DecodeError, match="Truncated message."):
+        serializer.decode(encoded_envelope[:-1])
+    with pytest.raises(DecodeError, match="Error decoding string field"):
+        serializer.decode(b"\x0a\x01\xff")
+
+
+@pytest.mark.parametrize(
+    "message_id,dialogue_reference,target",
+    [(1, ("", ""), 0), (-2, ("starter", "responder"), -1), (2**31 - 1, ("a", ""), 1)],
+)
+def test_dialogue_message_matches_protobuf(message_id, dialogue_reference, target):
+    """Test the dialogue message is encoded as its protobuf message, and decoded back."""
+    content = b"content" * 100
+    message_pb = base_pb2.Message()
+    dialogue_message_pb = message_pb.dialogue_message  # pylint: disable=no-member
+    dialogue_message_pb.message_id = message_id
+    dialogue_message_pb.dialogue_starter_reference = dialogue_reference[0]
+    dialogue_message_pb.dialogue_responder_reference = dialogue_reference[1]
+    dialogue_message_pb.target = target
+    dialogue_message_pb.content = content
+
+    message_bytes = encode_dialogue_message(
+        message_id, dialogue_reference, target, content
+    )
+    assert message_bytes == message_pb.SerializeToString()
+
+    decoded = decode_dialogue_message(message_bytes)
+    assert decoded[:3] == (message_id, dialogue_reference, target)
+    assert isinstance(decoded[3], memoryview)
+    assert decoded[3].tobytes() == content
+
+
+def test_decode_dialogue_message_body():
+    """Test a message with a body instead of a dialogue message is decoded as empty."""
+    message_pb = base_pb2.Message()
+    message_pb.body.update({"key": "value"})  # pylint: disable=no-member
+    message_id, dialogue_reference, target, content = decode_dialogue_message(
+        message_pb.SerializeToString()
+    )
+    assert (message_id, dialogue_reference, target) == (0, ("", ""), 0)
+    assert content.tobytes() == b""
+
+
 def test_envelope_serialization():
     """Test Envelope.encode and Envelope.decode methods."""
     expected_envelope = Envelope(
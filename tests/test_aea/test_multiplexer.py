@@ -26,7 +26,8 @@ import tempfile
 import time
 import unittest.mock
 from pathlib import Path
-from threading import Thread
+from threading import Event, Thread
+from typing import Dict, List
 from unittest import mock
 from unittest.mock import MagicMock, Mock, call, patch
 
@@ -35,9 +36,14 @@ from pexpect.exceptions import EOF  # type: ignore
 
 import aea
 from aea.cli.core import cli
+from aea.configurations.base import PublicId
 from aea.configurations.constants import DEFAULT_LEDGER
 from aea.connections.base import ConnectionStates
+from aea.exceptions import AEAEnforceError
 from aea.helpers.exception_policy import ExceptionPolicyEnum
+from aea.helpers.metrics import metrics
+from aea.helpers.overflow_policy import OverflowPolicyEnum, QueueLimit
+from aea.helpers.priority_lanes import PriorityLane
 from aea.identity.base import Identity
 from aea.mail.base import AEAConnectionError, Envelope, EnvelopeContext
 from aea.multiplexer import AsyncMultiplexer, InBox, Multiplexer, OutBox
@@ -1139,3 +1145,389 @@ async def test_stops_on_connectionerror_during_connect():
             await multiplexer.connect()
 
     assert multiplexer.connection_status.is_disconnected
+
+
+def _make_envelope(content: bytes, to: str = "to", sender: str = "sender") -> Envelope:
+    """Make an envelope with a default message."""
+    msg = DefaultMessage(
+        performative=DefaultMessage.Performative.BYTES,
+        content=content,
+    )
+    msg.to = to
+    msg.sender = sender
+    return Envelope(to=to, sender=sender, message=msg)
+
+
+async def _wait_for(condition, timeout: float = 2.0) -> None:
+    """Wait for a condition without blocking the event loop."""
+    deadline = time.time() + timeout
+    while not condition():
+        if time.time() > deadline:
+            raise TimeoutError("Condition not met in time.")
+        await asyncio.sleep(0.01)
+
+
+def _inbox_contents(multiplexer: AsyncMultiplexer) -> list:
+    """Get the contents of the envelopes in the inbox, in order."""
+    return [envelope.message.content for envelope in multiplexer.in_queue.queue]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "policy,expected",
+    [
+        (OverflowPolicyEnum.drop_newest, [b"1", b"2"]),
+        (OverflowPolicyEnum.drop_oldest, [b"2", b"3"]),
+        (OverflowPolicyEnum.reject, [b"1", b"2"]),
+    ],
+)
+async def test_inbox_overflow_policies(policy, expected):
+    """Test the overflow policies of a full inbox."""
+    connection = _make_dummy_connection()
+    rejected = []
+    multiplexer = AsyncMultiplexer(
+        [connection],
+        inbox_limit=QueueLimit(2, policy),
+        envelope_rejected_callback=rejected.append,
+    )
+    await multiplexer.connect()
+    try:
+        for content in (b"1", b"2", b"3"):
+            connection.put(_make_envelope(content))
+        await _wait_for(lambda: connection._queue.empty())
+        await asyncio.sleep(0.01)
+
+        assert _inbox_contents(multiplexer) == expected
+        if policy == OverflowPolicyEnum.reject:
+            assert [envelope.message.content for envelope in rejected] == [b"3"]
+        else:
+            assert rejected == []
+    finally:
+        await multiplexer.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_inbox_block_policy_throttles_connection():
+    """Test a full inbox stops the receiving from a connection until it has room."""
+    connection = _make_dummy_connection()
+    multiplexer = AsyncMultiplexer(
+        [connection], inbox_limit=QueueLimit(1, OverflowPolicyEnum.block)
+    )
+    await multiplexer.connect()
+    try:
+        for content in (b"1", b"2", b"3"):
+            connection.put(_make_envelope(content))
+        await _wait_for(lambda: connection._queue.qsize() == 1)
+        await asyncio.sleep(0.01)
+        assert _inbox_contents(multiplexer) == [b"1"]
+        assert connection._queue.qsize() == 1
+
+        received = [(await multiplexer.async_get()).message.content for _ in range(3)]
+        assert received == [b"1", b"2", b"3"]
+    finally:
+        await multiplexer.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_connection_limit():
+    """Test the limit of a connection applies to its envelopes only."""
+    connection_1 = _make_dummy_connection()
+    multiplexer = AsyncMultiplexer(
+        [connection_1],
+        connection_limits={
+            connection_1.connection_id: QueueLimit(1, OverflowPolicyEnum.drop_oldest)
+        },
+    )
+    await multiplexer.connect()
+    try:
+        for content in (b"1", b"2", b"3"):
+            connection_1.put(_make_envelope(content))
+        await _wait_for(lambda: connection_1._queue.empty())
+        await asyncio.sleep(0.01)
+        multiplexer.in_queue.put(_make_envelope(b"4"))
+
+        assert _inbox_contents(multiplexer) == [b"3", b"4"]
+        assert multiplexer.in_queue.count(connection_1.connection_id.to_any()) == 1
+        multiplexer.in_queue.get_nowait()
+        assert multiplexer.in_queue.count(connection_1.connection_id.to_any()) == 0
+    finally:
+        await multiplexer.disconnect()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "policy,expected",
+    [
+        (OverflowPolicyEnum.drop_newest, [b"2"]),
+        (OverflowPolicyEnum.drop_oldest, [b"3"]),
+    ],
+)
+async def test_outbox_overflow_policies(policy, expected):
+    """Test the overflow policies of a full outbox."""
+    connection = _make_dummy_connection()
+    multiplexer = AsyncMultiplexer([connection], outbox_limit=QueueLimit(1, policy))
+    await multiplexer.connect()
+    sending = asyncio.Event()
+    release = asyncio.Event()
+
+    async def send(envelope: Envelope) -> None:
+        sending.set()
+        await release.wait()
+
+    try:
+        with patch.object(connection, "send", send):
+            multiplexer.put(_make_envelope(b"1"))
+            await asyncio.wait_for(sending.wait(), timeout=2)
+            multiplexer.put(_make_envelope(b"2"))
+            multiplexer.put(_make_envelope(b"3"))
+            queued = [e.message.content for e in multiplexer.out_queue._queue]
+            assert queued == expected
+            release.set()
+    finally:
+        await multiplexer.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_outbox_full_reject():
+    """Test putting in a full outbox raises with the reject policy."""
+    connection = _make_dummy_connection()
+    multiplexer = AsyncMultiplexer(
+        [connection], outbox_limit=QueueLimit(1, OverflowPolicyEnum.reject)
+    )
+    await multiplexer.connect()
+    sending = asyncio.Event()
+    release = asyncio.Event()
+
+    async def send(envelope: Envelope) -> None:
+        sending.set()
+        await release.wait()
+
+    try:
+        with patch.object(connection, "send", send):
+            multiplexer.put(_make_envelope(b"1"))
+            await asyncio.wait_for(sending.wait(), timeout=2)
+            multiplexer.put(_make_envelope(b"2"))
+            with pytest.raises(asyncio.QueueFull):
+                multiplexer.put(_make_envelope(b"3"))
+            with pytest.raises(asyncio.QueueFull):
+                await multiplexer._put(_make_envelope(b"3"))
+            release.set()
+    finally:
+        await multiplexer.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_outbox_full_block():
+    """Test the envelopes put in a full outbox with the block policy wait for room, in order."""
+    connection = _make_dummy_connection()
+    multiplexer = AsyncMultiplexer(
+        [connection], outbox_limit=QueueLimit(1, OverflowPolicyEnum.block)
+    )
+    await multiplexer.connect()
+    sending = asyncio.Event()
+    release = asyncio.Event()
+    sent = []
+
+    async def send(envelope: Envelope) -> None:
+        sending.set()
+        await release.wait()
+        sent.append(envelope.message.content)
+
+    try:
+        with patch.object(connection, "send", send):
+            multiplexer.put(_make_envelope(b"1"))
+            await asyncio.wait_for(sending.wait(), timeout=2)
+            multiplexer.put(_make_envelope(b"2"))
+            multiplexer.put(_make_envelope(b"3"))
+            put_task = asyncio.ensure_future(multiplexer._put(_make_envelope(b"4")))
+            await asyncio.sleep(0.01)
+            assert not put_task.done()
+            assert multiplexer._get_outbox_depth() == 3
+
+            release.set()
+            await asyncio.wait_for(put_task, timeout=2)
+            await _wait_for(lambda: len(sent) == 4)
+            assert sent == [b"1", b"2", b"3", b"4"]
+            assert multiplexer._get_outbox_depth() == 0
+    finally:
+        await multiplexer.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_outbox_held_envelopes_dropped_on_disconnect():
+    """Test the envelopes held for room in the outbox are dropped on disconnection."""
+    connection = _make_dummy_connection()
+    multiplexer = AsyncMultiplexer(
+        [connection], outbox_limit=QueueLimit(1, OverflowPolicyEnum.block)
+    )
+    await multiplexer.connect()
+    sending = asyncio.Event()
+
+    async def send(envelope: Envelope) -> None:
+        sending.set()
+        await asyncio.Event().wait()
+
+    with patch.object(connection, "send", send):
+        multiplexer.put(_make_envelope(b"1"))
+        await asyncio.wait_for(sending.wait(), timeout=2)
+        multiplexer.put(_make_envelope(b"2"))
+        put_task = asyncio.ensure_future(multiplexer._put(_make_envelope(b"3")))
+        await asyncio.sleep(0.01)
+        await multiplexer.disconnect()
+    with pytest.raises(asyncio.CancelledError):
+        await put_task
+    assert not multiplexer._outbox_held
+
+
+def test_outbox_full_block_put_from_another_thread_times_out():
+    """Test a put from another thread in a full outbox with the block policy does not wait forever."""
+    connection = _make_dummy_connection()
+    multiplexer = Multiplexer(
+        [connection], outbox_limit=QueueLimit(1, OverflowPolicyEnum.block)
+    )
+    sending = Event()
+
+    async def send(envelope: Envelope) -> None:
+        sending.set()
+        await asyncio.Event().wait()
+
+    with patch.object(connection, "send", send), patch.object(
+        multiplexer, "PUT_TIMEOUT", 0.1
+    ):
+        multiplexer.put(_make_envelope(b"0"))  # not waited for, the loop is not running
+        multiplexer.connect()
+        try:
+            multiplexer.put(_make_envelope(b"1"))
+            wait_for_condition(sending.is_set, timeout=2)
+            multiplexer.put(_make_envelope(b"2"))
+            with pytest.raises(AEAConnectionError, match="Envelope not queued within"):
+                multiplexer.put(_make_envelope(b"3"))
+        finally:
+            multiplexer.disconnect()
+
+
+CONTROL_SKILL = "fetchai/control_skill:0.1.0"
+PRIORITY_LANES = [
+    PriorityLane("control", 3, skills=[PublicId.from_str(CONTROL_SKILL)]),
+    PriorityLane("bulk", 1, protocols=[DefaultMessage.protocol_id]),
+]
+
+
+def test_inbox_priority_lanes():
+    """Test the inbox dequeues the envelopes of the priority lanes in weighted round robin."""
+    multiplexer = AsyncMultiplexer(priority_lanes=PRIORITY_LANES)
+    for i in range(1, 5):
+        multiplexer.in_queue.put(_make_envelope(b"b%d" % i))
+    for i in range(1, 5):
+        multiplexer.in_queue.put(
+            _make_envelope(b"c%d" % i, to=CONTROL_SKILL, sender=str(STUB_CONNECTION_ID))
+        )
+    assert multiplexer.in_queue.lanes.names == ["control", "bulk", "default"]
+    assert multiplexer.in_queue.lanes.depth("control") == 4
+
+    received = [multiplexer.in_queue.get_nowait().message.content for _ in range(8)]
+    assert received == [b"c1", b"c2", b"c3", b"b1", b"c4", b"b2", b"b3", b"b4"]
+
+
+def test_skill_lanes_by_protocol():
+    """Test the envelopes of a protocol handled by a skill go to the lane of the skill."""
+    skill_protocols = {
+        PublicId.from_str(CONTROL_SKILL).to_any(): [FipaMessage.protocol_id]
+    }
+    multiplexer = AsyncMultiplexer(
+        protocols=[DefaultMessage, FipaMessage],
+        priority_lanes=PRIORITY_LANES,
+        get_skill_protocols=lambda skill_id: skill_protocols.get(skill_id, []),
+    )
+    fipa_envelope = Envelope(
+        to="to",
+        sender="sender",
+        protocol_specification_id=FipaMessage.protocol_specification_id,
+        message=b"some bytes",
+    )
+    assert multiplexer._get_lane(fipa_envelope) == "control"
+    assert multiplexer._get_lane(_make_envelope(b"1")) == "bulk"
+
+
+def test_skill_lanes_updated_with_the_skills():
+    """Test a skill added after the first envelope of a protocol it handles gets the envelopes of the protocol."""
+    skill_protocols: Dict[PublicId, List[PublicId]] = {}
+    multiplexer = AsyncMultiplexer(
+        protocols=[DefaultMessage, FipaMessage],
+        priority_lanes=PRIORITY_LANES,
+        get_skill_protocols=lambda skill_id: skill_protocols.get(skill_id, []),
+    )
+    fipa_envelope = Envelope(
+        to="to",
+        sender="sender",
+        protocol_specification_id=FipaMessage.protocol_specification_id,
+        message=b"some bytes",
+    )
+    assert multiplexer._get_lane(fipa_envelope) == "default"
+
+    skill_protocols[PublicId.from_str(CONTROL_SKILL).to_any()] = [
+        FipaMessage.protocol_id
+    ]
+    multiplexer.update_skill_lanes()
+    assert multiplexer._get_lane(fipa_envelope) == "control"
+
+
+def test_priority_lanes_defined_twice():
+    """Test a protocol cannot be in two priority lanes."""
+    with pytest.raises(AEAEnforceError, match="is in priority lanes"):
+        AsyncMultiplexer(
+            priority_lanes=[
+                PriorityLane("control", 2, protocols=[DefaultMessage.protocol_id]),
+                PriorityLane("bulk", 1, protocols=[DefaultMessage.protocol_id]),
+            ]
+        )
+
+
+def test_lane_wait_metrics():
+    """Test the time waited by the envelopes is recorded by lane."""
+    metrics.clear()
+    metrics.enable()
+    try:
+        multiplexer = AsyncMultiplexer(
+            priority_lanes=PRIORITY_LANES, agent_name="lanes_agent"
+        )
+        multiplexer.in_queue.put(_make_envelope(b"1"))
+        multiplexer.in_queue.get_nowait()
+        ((labels, value),) = metrics.snapshot()["aea_lane_wait_seconds"]
+        assert labels == {"agent": "lanes_agent", "lane": "bulk", "queue": "inbox"}
+        assert value["count"] == 1
+    finally:
+        metrics.disable()
+        metrics.clear()
+
+
+@pytest.mark.asyncio
+async def test_outbox_priority_lanes():
+    """Test the outbox sends the envelopes of the priority lanes in weighted round robin."""
+    connection = _make_dummy_connection()
+    multiplexer = AsyncMultiplexer([connection], priority_lanes=PRIORITY_LANES)
+    await multiplexer.connect()
+    release = asyncio.Event()
+    sent = []
+
+    async def send(envelope: Envelope) -> None:
+        sent.append(envelope.message.content)
+        await release.wait()
+
+    try:
+        with patch.object(connection, "send", send):
+            multiplexer.put(_make_envelope(b"b1"))
+            await _wait_for(lambda: sent == [b"b1"])
+            multiplexer.put(_make_envelope(b"b2"))
+            multiplexer.put(_make_envelope(b"b3"))
+            multiplexer.put(
+                _make_envelope(
+                    b"c1", to=str(connection.connection_id), sender=CONTROL_SKILL
+                )
+            )
+            assert multiplexer.out_queue.lanes.depth("control") == 1
+            release.set()
+            await _wait_for(lambda: len(sent) == 4)
+            assert sent == [b"b1", b"c1", b"b2", b"b3"]
+    finally:
+        await multiplexer.disconnect()
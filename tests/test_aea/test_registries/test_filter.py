@@ -52,6 +52,14 @@ class TestFilter:
         _msg = await self.filter.get_internal_message()
         assert msg == _msg, "Should get message"
 
+    @pytest.mark.asyncio
+    async def test_get_new_components_notification(self):
+        """Test the notifications of new components are merged while one is waiting."""
+        self.filter.notify_new_components()
+        self.filter.notify_new_components()
+        assert await self.filter.get_new_components_notification() is True
+        assert self.filter._new_components_notifications.empty()
+
     def test_get_active_handlers_skill_id_none(self):
         """Test get active handlers with skill id None."""
         protocol_id = PublicId.from_str("author/name:0.1.0")
@@ -169,6 +169,17 @@ class BaseTestSkillContext:
         """Test 'new_behaviours_queue' property getter."""
         assert isinstance(self.skill_context.new_handlers, Queue)
 
+    def test_new_components_notified(self):
+        """Test the agent is notified of the new behaviours and handlers of the skill."""
+        new_components_filter = self.my_aea.filter
+        assert new_components_filter._new_components_notifications.empty()
+        self.skill_context.new_behaviours.put(MagicMock())
+        self.skill_context.new_handlers.put(MagicMock())
+        assert new_components_filter._new_components_notifications.qsize() == 1
+        new_components_filter._new_components_notifications.get()
+        self.skill_context.new_behaviours.get()
+        self.skill_context.new_handlers.get()
+
     def test_search_service_address(self):
         """Test 'search_service_address' property getter."""
         assert (
@@ -269,9 +280,11 @@ class SkillContextTestCase(TestCase):
     @mock.patch("aea.skills.base.SkillContext.skill_id")
     def test_is_active_positive(self, skill_id_mock, debug_mock):
         """Test is_active setter positive result"""
-        obj = SkillContext("agent_context")
+        agent_context = mock.Mock()
+        obj = SkillContext(agent_context)
         obj.is_active = "value"
         debug_mock.assert_called_once()
+        agent_context.notify_new_components.assert_called_once()
 
     def test_task_manager_positive(self):
         """Test task_manager property positive result"""
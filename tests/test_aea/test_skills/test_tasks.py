@@ -19,6 +19,7 @@
 
 """This module contains the tests for the tasks module."""
 
+from multiprocessing.pool import ThreadPool
 from unittest import TestCase, mock
 from unittest.mock import Mock, patch
 
@@ -205,3 +206,24 @@ class TestTaskPoolManagementManager(TestCase):
         self.task_manager.enqueue_task(print)
 
         assert self.task_manager._pool is pool
+
+    def test_shared_pool(self) -> None:
+        """Test tasks run on a shared pool, which is not terminated on stop."""
+        pool = ThreadPool(1)
+        try:
+            self.task_manager = TaskManager()
+            self.task_manager.set_pool(pool)
+            self.task_manager.start()
+            with self.assertRaises(ValueError):
+                self.task_manager.set_pool(None)
+
+            task_id = self.task_manager.enqueue_task(len, args=("abc",))
+            assert self.task_manager._pool is pool
+            assert self.task_manager.get_task_result(task_id).get(5) == 3
+
+            self.task_manager.stop()
+            assert self.task_manager._pool is None
+            assert pool.apply_async(len, args=("ab",)).get(5) == 2
+        finally:
+            pool.terminate()
+            pool.join()
@@ -378,6 +378,62 @@ async def test_new_message_wait_flag(ledger_apis_connection: LedgerConnection):
     task.cancel()
 
 
+@pytest.mark.asyncio
+async def test_responses_in_completion_order(
+    ledger_apis_connection: LedgerConnection,
+):
+    """Test responses are received in the order their requests complete."""
+    loop = asyncio.get_event_loop()
+    futures = [loop.create_future() for _ in range(3)]
+    envelopes = [
+        Envelope(
+            to=str(ledger_apis_connection.connection_id),
+            sender=f"test/skill_{i}:0.1.0",
+            protocol_specification_id=LedgerApiMessage.protocol_specification_id,
+            message=b"message",
+        )
+        for i in range(3)
+    ]
+    with patch.object(ledger_apis_connection, "_schedule_request", side_effect=futures):
+        for envelope in envelopes:
+            await ledger_apis_connection.send(envelope)
+    assert len(ledger_apis_connection.receiving_tasks) == 3
+
+    for index in (2, 0, 1):
+        response_message = LedgerApiMessage(
+            performative=LedgerApiMessage.Performative.BALANCE,
+            ledger_id=FetchAICrypto.identifier,
+            balance=index,
+        )
+        response_message.to = envelopes[index].sender
+        response_message.sender = envelopes[index].to
+        futures[index].set_result(response_message)
+    for index in (2, 0, 1):
+        response = await asyncio.wait_for(ledger_apis_connection.receive(), 1)
+        assert response is not None
+        assert response.to == envelopes[index].sender
+        assert cast(LedgerApiMessage, response.message).balance == index
+    assert len(ledger_apis_connection.receiving_tasks) == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_task_not_received(ledger_apis_connection: LedgerConnection):
+    """Test cancelled requests do not produce a response."""
+    future = asyncio.get_event_loop().create_future()
+    envelope = Envelope(
+        to=str(ledger_apis_connection.connection_id),
+        sender="test/skill:0.1.0",
+        protocol_specification_id=LedgerApiMessage.protocol_specification_id,
+        message=b"message",
+    )
+    with patch.object(ledger_apis_connection, "_schedule_request", return_value=future):
+        await ledger_apis_connection.send(envelope)
+    future.cancel()
+    await asyncio.sleep(0)
+    assert len(ledger_apis_connection.receiving_tasks) == 0
+    assert ledger_apis_connection.response_queue.empty()
+
+
 @pytest.mark.asyncio
 async def test_no_balance():
     """Test no balance."""
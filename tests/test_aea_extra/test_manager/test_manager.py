@@ -677,6 +677,13 @@ class TestMultiAgentManagerThreadedMode(BaseTestMultiAgentManager):
     MODE = "threaded"
 
 
+@patch("aea.aea_builder.AEABuilder.install_pypi_dependencies")
+class TestMultiAgentManagerDenseMode(BaseTestMultiAgentManager):
+    """Tests for MultiAgentManager in dense mode."""
+
+    MODE = "dense"
+
+
 @patch("aea.aea_builder.AEABuilder.install_pypi_dependencies")
 class TestMultiAgentManagerMultiprocessMode(BaseTestMultiAgentManager):
     """Tests for MultiAgentManager in multiprocess mode."""
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2023 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains tests for the resources shared by densely hosted agents."""
+import asyncio
+import threading
+from typing import List
+from unittest.mock import AsyncMock
+
+import pytest
+
+from aea.aea import AEA
+from aea.aea_builder import AEABuilder
+from aea.configurations.base import SkillConfig
+from aea.configurations.constants import DEFAULT_LEDGER
+from aea.manager.shared import SharedAgentResources, _HostedStorage
+from aea.runtime import RuntimeStates
+from aea.skills.base import Skill, SkillContext
+from aea.skills.behaviours import TickerBehaviour
+
+from tests.common.utils import wait_for_condition
+
+
+DEFAULT_TIMEOUT = 10
+
+
+class StoringBehaviour(TickerBehaviour):
+    """Behaviour storing the agent name and running a task, once."""
+
+    stored = None
+    task_result = None
+
+    def act(self) -> None:
+        """Make an action."""
+        if self.stored is not None:
+            return
+        collection = self.context.storage.get_sync_collection("test")
+        collection.put("name", {"name": self.context.agent_name})
+        self.stored = collection.get("name")
+        task_id = self.context.task_manager.enqueue_task(len, args=("abc",))
+        self.task_result = self.context.task_manager.get_task_result(task_id)
+
+
+def make_agent(name: str) -> AEA:
+    """Make an agent with a storing behaviour."""
+    builder = AEABuilder()
+    builder.set_name(name)
+    builder.add_private_key(DEFAULT_LEDGER)
+    skill_context = SkillContext()
+    behaviour = StoringBehaviour(name="behaviour", skill_context=skill_context)
+    skill = Skill(
+        SkillConfig(name="test_skill", author="fetchai"),
+        skill_context=skill_context,
+        handlers={},
+        behaviours={"behaviour": behaviour},
+    )
+    builder.add_component_instance(skill)
+    builder.set_storage_uri("sqlite://:memory:")
+    agent = builder.build()
+    skill_context.set_agent_context(agent.context)
+    return agent
+
+
+def get_behaviour(agent: AEA) -> StoringBehaviour:
+    """Get the storing behaviour of an agent."""
+    return agent.resources.get_behaviour(
+        agent.resources.get_all_skills()[0].public_id, "behaviour"
+    )
+
+
+def test_agents_share_resources():
+    """Test agents hosted on one loop share the thread pools and the storage thread."""
+    loop = asyncio.new_event_loop()
+    loop_thread = threading.Thread(target=loop.run_forever, daemon=True)
+    loop_thread.start()
+    resources = SharedAgentResources(max_workers=2)
+    resources.start()
+    agents = [make_agent(f"agent_{i}") for i in range(3)]
+    futures: List = []
+    try:
+        for agent in agents:
+            resources.adopt(agent)
+            assert isinstance(agent.runtime.storage, _HostedStorage)
+
+            async def run(agent: AEA = agent) -> None:
+                agent.runtime.set_loop(loop)
+                await agent.runtime.run()
+
+            futures.append(asyncio.run_coroutine_threadsafe(run(), loop))
+
+        for agent in agents:
+            behaviour = get_behaviour(agent)
+            wait_for_condition(
+                lambda: behaviour.task_result is not None, timeout=DEFAULT_TIMEOUT
+            )
+            assert behaviour.stored == {"name": agent.name}
+            assert behaviour.task_result.get(DEFAULT_TIMEOUT) == 3
+            assert agent.runtime.decision_maker._thread is None
+            assert agent.runtime.task_manager._pool is resources.task_pool
+            assert agent.runtime.decision_maker.pool is resources.decision_maker_pool
+    finally:
+        for future in futures:
+            future.cancel()
+        wait_for_condition(
+            lambda: all(not agent.runtime.is_running for agent in agents),
+            timeout=DEFAULT_TIMEOUT,
+        )
+        resources.stop()
+        loop.call_soon_threadsafe(loop.stop)
+        loop_thread.join()
+    assert not resources.is_started
+
+
+def test_failed_agent_does_not_affect_others():
+    """Test an agent failing on the shared loop does not stop the other agents."""
+    loop = asyncio.new_event_loop()
+    resources = SharedAgentResources(max_workers=1)
+    resources.start()
+    failing, working = make_agent("failing"), make_agent("working")
+    try:
+        for agent in (failing, working):
+            resources.adopt(agent)
+            agent.runtime.set_loop(loop)
+
+        def fail() -> None:
+            raise ValueError("expected")
+
+        get_behaviour(failing).act = fail
+
+        async def run() -> None:
+            failing_task = loop.create_task(failing.runtime.run())
+            working_task = loop.create_task(working.runtime.run())
+            while get_behaviour(working).task_result is None or not failing_task.done():
+                await asyncio.sleep(0.01)
+            assert failing.runtime.state == RuntimeStates.error
+            assert not working_task.done()
+            working_task.cancel()
+            await asyncio.gather(failing_task, working_task, return_exceptions=True)
+
+        loop.run_until_complete(asyncio.wait_for(run(), timeout=DEFAULT_TIMEOUT))
+        assert get_behaviour(working).stored == {"name": "working"}
+    finally:
+        resources.stop()
+        loop.close()
+
+
+def test_hosted_storage_is_started_on_start():
+    """Test a hosted storage is started when start returns, and is waited for from another loop."""
+    loop = asyncio.new_event_loop()
+    try:
+        with SharedAgentResources(max_workers=1) as resources:
+            storage = resources._make_storage("sqlite://:memory:")
+            assert storage.start()
+            assert storage._task is not None
+            loop.run_until_complete(
+                asyncio.wait_for(storage.wait_connected(), DEFAULT_TIMEOUT)
+            )
+            assert storage.is_connected
+            storage.stop()
+            storage.wait_completed(sync=True, timeout=DEFAULT_TIMEOUT)
+            assert not storage.is_connected
+    finally:
+        loop.close()
+
+
+def test_hosted_storage_failing_to_connect():
+    """Test waiting a hosted storage that fails to connect raises instead of hanging."""
+    loop = asyncio.new_event_loop()
+    try:
+        with SharedAgentResources(max_workers=1) as resources:
+            storage = resources._make_storage("sqlite://:memory:")
+            storage._backend.connect = AsyncMock(side_effect=ValueError("expected"))
+            storage.start()
+            with pytest.raises(ValueError, match="stopped before it was connected"):
+                loop.run_until_complete(
+                    asyncio.wait_for(storage.wait_connected(), DEFAULT_TIMEOUT)
+                )
+            with pytest.raises(ValueError, match="expected"):
+                storage.wait_completed(sync=True, timeout=DEFAULT_TIMEOUT)
+    finally:
+        loop.close()
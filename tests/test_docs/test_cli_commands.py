@@ -48,7 +48,7 @@ class TestCliCommands(BaseTestMarkdownDocs):
         actual_commands = list(map(lambda match: match.group(1), commands_raw))
 
         actual_commands_set = set(actual_commands)
-        expected_commands = set(cli.commands.keys())
+        expected_commands = set(cli.load_all_commands().keys())
 
         # test no duplicates
         assert len(actual_commands) == len(
@@ -30,18 +30,21 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from aea.configurations.base import ConnectionConfig
+from aea.configurations.base import ConnectionConfig, PublicId
 from aea.crypto.registries import make_crypto
 from aea.identity.base import Identity
+from aea.mail.base import Envelope
 from aea.multiplexer import Multiplexer
 
 from packages.fetchai.connections.p2p_libp2p.connection import (
     LIBP2P_NODE_MODULE_NAME,
     Libp2pNode,
+    NodeClient,
     P2PLibp2pConnection,
     _golang_module_run,
     _ip_all_private_or_all_public,
 )
+from packages.fetchai.protocols.acn import acn_pb2
 from packages.fetchai.protocols.acn.message import AcnMessage
 
 from tests.conftest import DEFAULT_LEDGER, _make_libp2p_connection
@@ -452,6 +455,27 @@ async def test_acn_decode_error_on_read():
     mocked_write_acn_status_error.assert_called_once()
 
 
+def test_acn_envelope_framing():
+    """Test the acn envelope message is framed as its protobuf message and read without parsing it."""
+    envelope = Envelope(
+        to="to",
+        sender="sender",
+        protocol_specification_id=PublicId("author", "name", "0.1.0"),
+        message=b"message",
+    )
+    acn_msg = acn_pb2.AcnMessage()
+    acn_msg.aea_envelope.envelope = envelope.encode()  # pylint: disable=no-member
+
+    buf = NodeClient.make_acn_envelope_message(envelope)
+    assert buf == acn_msg.SerializeToString()
+    assert Envelope.decode(NodeClient.get_acn_envelope(buf)) == envelope
+
+    acn_msg.status.body.code = int(  # pylint: disable=no-member
+        AcnMessage.StatusBody.StatusCode.SUCCESS
+    )
+    assert NodeClient.get_acn_envelope(acn_msg.SerializeToString()) is None
+
+
 @pytest.mark.asyncio
 async def test_write_acn_error():
     """Test nodeclient write acn error."""
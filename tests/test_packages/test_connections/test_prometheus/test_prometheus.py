@@ -21,11 +21,13 @@ import asyncio
 from typing import cast
 from unittest.mock import MagicMock, Mock
 
+import aioprometheus  # type: ignore
 import pytest
 
 from aea.common import Address
 from aea.configurations.base import ConnectionConfig, PublicId
 from aea.exceptions import AEAEnforceError
+from aea.helpers.metrics import metrics
 from aea.identity.base import Identity
 from aea.mail.base import Envelope, Message
 from aea.protocols.dialogue.base import Dialogue as BaseDialogue
@@ -259,3 +261,43 @@ class TestPrometheusConnection:
         assert (
             self.prometheus_con.state == ConnectionStates.disconnected
         ), "should be disconnected"
+
+
+@pytest.mark.asyncio
+async def test_export_runtime_metrics():
+    """Test the runtime metrics of the framework are copied to prometheus."""
+    configuration = ConnectionConfig(
+        connection_id=PrometheusConnection.connection_id,
+        port=9091,
+        export_runtime_metrics=True,
+        runtime_metrics_interval=0.01,
+    )
+    prometheus_con = PrometheusConnection(
+        identity=Identity("name", address="my_address", public_key="my_public_key"),
+        configuration=configuration,
+        data_dir=MagicMock(),
+    )
+    metrics.clear()
+    try:
+        await prometheus_con.connect()
+        assert metrics.enabled
+        metrics.counter("aea_test_total", "a counter", connection="c").inc(3)
+        metrics.histogram(
+            "aea_test_seconds", "a histogram", buckets=(1.0,), handler="h"
+        ).observe(0.5)
+        await asyncio.sleep(0.1)
+
+        runtime_metrics = prometheus_con.channel._runtime_metrics
+        assert runtime_metrics["aea_test_total"].get({"connection": "c"}) == 3
+        histogram = runtime_metrics["aea_test_seconds"]
+        assert isinstance(histogram, aioprometheus.Histogram)
+        assert histogram.get({"handler": "h"}) == {
+            1.0: 1,
+            float("inf"): 1,
+            "count": 1,
+            "sum": 0.5,
+        }
+    finally:
+        await prometheus_con.disconnect()
+        metrics.clear()
+    assert not metrics.enabled
@@ -21,6 +21,7 @@
 import datetime
 import logging
 import pprint
+import random
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -47,6 +48,7 @@ from packages.fetchai.skills.tac_control.game import (
     Initialization,
     Phase,
     Registration,
+    Settlement,
     Transaction,
     Transactions,
 )
@@ -726,7 +728,8 @@ class TestTransactions:
 
     def test_simple_properties(self):
         """Test the properties of Game class."""
-        assert self.transactions.confirmed == {}
+        assert self.transactions.confirmed == []
+        assert self.transactions.timestamps == []
         assert self.transactions.confirmed_per_agent == {}
 
     def test_add(self):
@@ -762,16 +765,223 @@ class TestTransactions:
         with patch("datetime.datetime", new=datetime_mock):
             self.transactions.add(transaction)
 
-        assert self.transactions.confirmed[mocked_now] == transaction
-        assert (
-            self.transactions.confirmed_per_agent[sender_address][mocked_now]
-            == transaction
-        )
-        assert (
-            self.transactions.confirmed_per_agent[counterparty_address][mocked_now]
-            == transaction
+        assert self.transactions.confirmed == [transaction]
+        assert self.transactions.timestamps == [mocked_now]
+        assert self.transactions.confirmed_per_agent == {
+            sender_address: [transaction],
+            counterparty_address: [transaction],
+        }
+
+    def test_add_batch(self):
+        """Test transactions confirmed at the same time are all kept and indexed by agent."""
+        transactions = [
+            Transaction(
+                "ethereum",
+                sender_address,
+                counterparty_address,
+                {"1": 10},
+                {"2": -1},
+                True,
+                f"some_nonce_{i}",
+                {"1": 1},
+                "some_sender_signature",
+                "some_counterparty_signature",
+            )
+            for i, (sender_address, counterparty_address) in enumerate(
+                [("agent_1", "agent_2"), ("agent_2", "agent_3"), ("agent_1", "agent_3")]
+            )
+        ]
+
+        self.transactions.add_batch(transactions[:2])
+        self.transactions.add(transactions[2])
+
+        assert self.transactions.confirmed == transactions
+        assert len(self.transactions.timestamps) == 3
+        assert self.transactions.get_confirmed_for_agent("agent_1") == [
+            transactions[0],
+            transactions[2],
+        ]
+        assert self.transactions.get_confirmed_for_agent("agent_2") == transactions[:2]
+        assert self.transactions.get_confirmed_for_agent("agent_3") == transactions[1:]
+        assert self.transactions.get_confirmed_for_agent("agent_4") == []
+
+
+class TestSettlement:
+    """Test Settlement class of tac control."""
+
+    @classmethod
+    def setup(cls):
+        """Setup the test class."""
+        cls.agent_states = {
+            agent_address: AgentState(
+                agent_address,
+                {"1": 10},
+                {"1": 1.0},
+                {"2": 1, "3": 2},
+                {"2": 1.0, "3": 1.5},
+            )
+            for agent_address in ("agent_1", "agent_2", "agent_3")
+        }
+        cls.settlement = Settlement(cls.agent_states)
+
+    @staticmethod
+    def _make_transaction(
+        sender_address,
+        counterparty_address,
+        amount_by_currency_id,
+        quantities_by_good_id,
+        nonce="some_nonce",
+    ):
+        """Make a transaction."""
+        return Transaction(
+            "ethereum",
+            sender_address,
+            counterparty_address,
+            amount_by_currency_id,
+            quantities_by_good_id,
+            True,
+            nonce,
+            {currency_id: 1 for currency_id in amount_by_currency_id},
+            "some_sender_signature",
+            "some_counterparty_signature",
         )
 
+    def test_agent_states(self):
+        """Test the agent states are rebuilt from the arrays."""
+        assert self.settlement.agent_addresses == ["agent_1", "agent_2", "agent_3"]
+        for agent_address, agent_state in self.agent_states.items():
+            assert self.settlement.get_agent_state(agent_address) == agent_state
+        assert self.settlement.pop_updated_agents() == set()
+
+    def test_different_goods(self):
+        """Test agents must hold the same goods."""
+        agent_states = {
+            "agent_1": AgentState(
+                "agent_1", {"1": 10}, {"1": 1.0}, {"2": 1}, {"2": 1.0}
+            ),
+            "agent_2": AgentState(
+                "agent_2", {"1": 10}, {"1": 1.0}, {"3": 1}, {"3": 1.0}
+            ),
+        }
+        with pytest.raises(
+            AEAEnforceError, match="All agents must hold the same goods and currencies."
+        ):
+            Settlement(agent_states)
+
+    def test_is_consistent_transaction_as_agent_states(self):
+        """Test the consistency of transactions is checked as by the agent states."""
+        transactions = [
+            self._make_transaction("agent_1", "agent_2", {"1": -5}, {"2": 1}),
+            self._make_transaction("agent_1", "agent_2", {"1": -11}, {"2": 1}),
+            self._make_transaction("agent_1", "agent_2", {"1": -5}, {"2": 2}),
+            self._make_transaction("agent_1", "agent_2", {"1": 5}, {"2": -1}),
+            self._make_transaction("agent_1", "agent_2", {"1": 11}, {"2": -1}),
+            self._make_transaction("agent_1", "agent_2", {"1": 5}, {"3": -3}),
+            self._make_transaction("agent_1", "agent_2", {"1": 0}, {"2": 0}),
+            self._make_transaction("agent_1", "agent_2", {"1": -5}, {"2": -1}),
+        ]
+        for tx in transactions:
+            expected = self.agent_states[tx.sender_address].is_consistent_transaction(
+                tx
+            ) and self.agent_states[tx.counterparty_address].is_consistent_transaction(
+                tx
+            )
+            assert self.settlement.is_consistent_transaction(tx) is expected
+
+    def test_is_consistent_transaction_unknown(self):
+        """Test transactions with unknown agents, currencies or goods are not consistent."""
+        for tx in (
+            self._make_transaction("agent_1", "agent_4", {"1": -5}, {"2": 1}),
+            self._make_transaction("agent_1", "agent_2", {"4": -5}, {"2": 1}),
+            self._make_transaction("agent_1", "agent_2", {"1": -5}, {"4": 1}),
+        ):
+            assert self.settlement.is_consistent_transaction(tx) is False
+
+    def test_apply(self):
+        """Test a transaction is applied to both parties."""
+        tx = self._make_transaction("agent_1", "agent_2", {"1": -5}, {"2": 1, "3": 0})
+
+        self.settlement.apply(tx)
+
+        assert self.settlement.get_agent_state("agent_1") == self.agent_states[
+            "agent_1"
+        ].apply([tx])
+        assert self.settlement.get_agent_state("agent_2") == self.agent_states[
+            "agent_2"
+        ].apply([tx])
+        assert self.settlement.pop_updated_agents() == {"agent_1", "agent_2"}
+        assert self.settlement.pop_updated_agents() == set()
+
+        with pytest.raises(AEAEnforceError, match="Inconsistent transaction."):
+            self.settlement.apply(
+                self._make_transaction("agent_1", "agent_2", {"1": -50}, {"2": 1})
+            )
+
+    def test_settle(self):
+        """Test each transaction of a batch is checked against the holdings left by the previous ones."""
+        transactions = [
+            self._make_transaction("agent_1", "agent_2", {"1": -6}, {"2": 1}, "n1"),
+            self._make_transaction("agent_3", "agent_2", {"1": -6}, {"2": 1}, "n2"),
+            self._make_transaction("agent_1", "agent_3", {"1": -6}, {"3": 1}, "n3"),
+            self._make_transaction("agent_2", "agent_1", {"1": -16}, {"2": 1}, "n4"),
+        ]
+
+        assert self.settlement.settle(transactions) == [True, False, False, True]
+
+        assert self.settlement.get_agent_state("agent_1").amount_by_currency_id == {
+            "1": 20
+        }
+        assert self.settlement.get_agent_state("agent_1").quantities_by_good_id == {
+            "2": 1,
+            "3": 2,
+        }
+        assert self.settlement.get_agent_state("agent_2").amount_by_currency_id == {
+            "1": 0
+        }
+        assert self.settlement.get_agent_state("agent_2").quantities_by_good_id == {
+            "2": 1,
+            "3": 2,
+        }
+
+    def test_settle_batch_as_in_order(self):
+        """Test settling a batch gives the same holdings as settling its transactions one by one."""
+        rng = random.Random(0)
+        transactions = []
+        for i in range(200):
+            sender, counterparty = rng.sample(list(self.agent_states), 2)
+            sign = rng.choice((-1, 1))
+            transactions.append(
+                self._make_transaction(
+                    sender,
+                    counterparty,
+                    {"1": -sign * rng.randint(0, 3)},
+                    {"2": sign * rng.randint(0, 1), "3": sign * rng.randint(0, 2)},
+                    str(i),
+                )
+            )
+        one_by_one = Settlement(self.agent_states)
+
+        expected = [one_by_one.settle([tx])[0] for tx in transactions]
+
+        assert self.settlement.settle(transactions) == expected
+        assert not all(expected) and any(expected)
+        for agent_address in self.agent_states:
+            assert self.settlement.get_agent_state(
+                agent_address
+            ) == one_by_one.get_agent_state(agent_address)
+
+    def test_get_scores(self):
+        """Test the scores are the ones of the agent states."""
+        tx = self._make_transaction("agent_1", "agent_2", {"1": 5}, {"2": -1, "3": -2})
+        self.settlement.apply(tx)
+
+        scores = self.settlement.get_scores()
+
+        for agent_address in self.agent_states:
+            assert scores[agent_address] == pytest.approx(
+                self.settlement.get_agent_state(agent_address).get_score()
+            )
+
 
 class TestRegistration:
     """Test Registration class of tac control."""
@@ -978,6 +1188,28 @@ class TestGame(BaseSkillTestCase):
         assert self.game._initial_agent_states is not None
         assert self.game._current_agent_states is not None
 
+    def test_create_generate_seeded(self):
+        """Test the _generate method of the Game class is reproducible with a seed."""
+        self.game.registration.register_agent("some_agent_address_1", "agent_1")
+        self.game.registration.register_agent("some_agent_address_2", "agent_2")
+        self.game.context.parameters._seed = 7
+
+        self.game._generate()
+        initialization = self.game.initialization
+        self.game._generate()
+
+        for attribute in (
+            "agent_addr_to_good_endowments",
+            "agent_addr_to_utility_params",
+            "good_id_to_eq_prices",
+            "agent_addr_to_eq_good_holdings",
+            "agent_addr_to_eq_currency_holdings",
+        ):
+            assert getattr(self.game.initialization, attribute) == getattr(
+                initialization, attribute
+            )
+        assert self.game.initial_agent_states == self.game.current_agent_states
+
     def test_holdings_summary(self):
         """Test the holdings_summary method of the Game class."""
         # before
@@ -1124,7 +1356,7 @@ class TestGame(BaseSkillTestCase):
         # operation
         with patch.object(Transaction, "has_matching_signatures", return_value=True):
             with patch.object(
-                AgentState, "is_consistent_transaction", return_value=True
+                Settlement, "is_consistent_transaction", return_value=True
             ):
                 assert self.game.is_transaction_valid(tx) is True
 
@@ -1170,7 +1402,7 @@ class TestGame(BaseSkillTestCase):
         # operation
         with patch.object(Transaction, "has_matching_signatures", return_value=False):
             with patch.object(
-                AgentState, "is_consistent_transaction", return_value=True
+                Settlement, "is_consistent_transaction", return_value=True
             ):
                 assert self.game.is_transaction_valid(tx) is False
 
@@ -1216,7 +1448,7 @@ class TestGame(BaseSkillTestCase):
         # operation
         with patch.object(Transaction, "has_matching_signatures", return_value=True):
             with patch.object(
-                AgentState, "is_consistent_transaction", return_value=False
+                Settlement, "is_consistent_transaction", return_value=False
             ):
                 assert self.game.is_transaction_valid(tx) is False
 
@@ -1282,13 +1514,61 @@ class TestGame(BaseSkillTestCase):
             self.game.settle_transaction(tx)
 
         # after
-        assert (
-            self.game._current_agent_states[agent_address_1] == expected_agent_state_1
-        )
-        assert (
-            self.game._current_agent_states[agent_address_2] == expected_agent_state_2
+        assert self.game.current_agent_states[agent_address_1] == expected_agent_state_1
+        assert self.game.current_agent_states[agent_address_2] == expected_agent_state_2
+        assert self.game.transactions.confirmed == [tx]
+
+    def test_settle_transactions(self):
+        """Test the settle_transactions method of the Game class settles the signed and consistent transactions."""
+        agent_address_1 = "agent_address_1"
+        agent_address_2 = "agent_address_2"
+        self.game._current_agent_states = {
+            agent_address: AgentState(
+                agent_address,
+                {"1": 10},
+                {"1": 1.0},
+                {"2": 1, "3": 2},
+                {"2": 1.0, "3": 1.5},
+            )
+            for agent_address in (agent_address_1, agent_address_2)
+        }
+        txs = [
+            Transaction(
+                "ethereum",
+                agent_address_1,
+                agent_address_2,
+                {"1": amount},
+                {"2": -1},
+                True,
+                nonce,
+                {"1": 1},
+                "some_sender_signature",
+                "some_counterparty_signature",
+            )
+            for amount, nonce in ((10, "n1"), (10, "n2"), (0, "n3"))
+        ]
+
+        with patch.object(
+            Transaction, "has_matching_signatures", side_effect=[True, True, False]
+        ):
+            settled_txs = self.game.settle_transactions(txs)
+
+        assert settled_txs == txs[:1]
+        assert self.game.transactions.confirmed == txs[:1]
+        assert self.game.current_agent_states[agent_address_1] == AgentState(
+            agent_address_1,
+            {"1": 20},
+            {"1": 1.0},
+            {"2": 0, "3": 2},
+            {"2": 1.0, "3": 1.5},
         )
 
+        self.game._current_agent_states = None
+        with pytest.raises(
+            AEAEnforceError, match="Call create before calling current_agent_states."
+        ):
+            self.game.settle_transactions(txs)
+
     def test_settle_transaction_fails_current_agent_states_is_none(self):
         """Test the settle_transaction method of the Game class which fails because current_agent_states is None."""
         # before
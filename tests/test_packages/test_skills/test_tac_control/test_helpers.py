@@ -21,6 +21,7 @@
 from pathlib import Path
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from aea.exceptions import AEAEnforceError
@@ -29,16 +30,20 @@ from aea.test_tools.test_skill import BaseSkillTestCase
 from packages.fetchai.skills.tac_control.helpers import (
     ERC1155Contract,
     _sample_good_instances,
+    array_to_dicts,
     determine_scaling_factor,
     generate_currency_endowments,
     generate_currency_id_to_name,
     generate_currency_ids,
     generate_equilibrium_prices_and_holdings,
+    generate_equilibrium_prices_and_holdings_array,
     generate_exchange_params,
     generate_good_endowments,
+    generate_good_endowments_array,
     generate_good_id_to_name,
     generate_good_ids,
     generate_utility_params,
+    generate_utility_params_array,
 )
 
 from tests.conftest import ROOT_DIR
@@ -153,6 +158,47 @@ class TestHelpers(BaseSkillTestCase):
         assert "good_id_1" in endowments["ag_2_add"]
         assert "good_id_2" in endowments["ag_2_add"]
 
+    def test_generate_good_endowments_array(self):
+        """Test the generate_good_endowments_array of Helpers module."""
+        endowments = generate_good_endowments_array(
+            50, 10, 2, 1, 3, np.random.default_rng(42)
+        )
+        assert endowments.shape == (50, 10)
+        assert (endowments >= 2).all()
+        instances_per_good = endowments.sum(axis=0)
+        assert ((instances_per_good >= 150) & (instances_per_good <= 250)).all()
+        assert not (endowments == endowments[0]).all()
+
+        same_endowments = generate_good_endowments_array(
+            50, 10, 2, 1, 3, np.random.default_rng(42)
+        )
+        assert (endowments == same_endowments).all()
+
+    def test_generate_utility_params_array(self):
+        """Test the generate_utility_params_array of Helpers module."""
+        utility_params = generate_utility_params_array(
+            20, 5, 1000.0, np.random.default_rng(42)
+        )
+        assert utility_params.shape == (20, 5)
+        assert (utility_params > 0).all()
+        assert np.allclose(utility_params.sum(axis=1), 1000.0)
+
+        same_utility_params = generate_utility_params_array(
+            20, 5, 1000.0, np.random.default_rng(42)
+        )
+        assert (utility_params == same_utility_params).all()
+
+    def test_array_to_dicts(self):
+        """Test the array_to_dicts of Helpers module."""
+        assert array_to_dicts(
+            ["ag_1_add", "ag_2_add"],
+            ["good_id_1", "good_id_2"],
+            np.array([[1, 2], [3, 4]]),
+        ) == {
+            "ag_1_add": {"good_id_1": 1, "good_id_2": 2},
+            "ag_2_add": {"good_id_1": 3, "good_id_2": 4},
+        }
+
     def test_generate_utility_params(self):
         """Test the generate_utility_params of Helpers module."""
         utility_function_params = generate_utility_params(
@@ -218,3 +264,40 @@ class TestHelpers(BaseSkillTestCase):
 
         assert len(eq_currency_holdings_dict) == 1
         assert type(eq_currency_holdings_dict["ag_1"]["currency_1"]) == float
+
+    def test_generate_equilibrium_prices_and_holdings_array(self):
+        """Test the generate_equilibrium_prices_and_holdings_array of Helpers module matches the dict version."""
+        agent_addresses = ["ag_1", "ag_2", "ag_3"]
+        good_ids = ["good_1", "good_2"]
+        endowments = np.array([[1, 2], [3, 1], [2, 2]])
+        utility_params = np.array([[0.4, 0.6], [0.5, 0.5], [0.3, 0.7]]) * 100
+        currency_endowments = np.array([100, 100, 100])
+
+        (
+            eq_prices,
+            eq_good_holdings,
+            eq_currency_holdings,
+        ) = generate_equilibrium_prices_and_holdings_array(
+            endowments, utility_params, currency_endowments, 100.0
+        )
+        (
+            eq_prices_dict,
+            eq_good_holdings_dict,
+            eq_currency_holdings_dict,
+        ) = generate_equilibrium_prices_and_holdings(
+            array_to_dicts(agent_addresses, good_ids, endowments),
+            array_to_dicts(agent_addresses, good_ids, utility_params),
+            {agent_addr: {"currency_1": 100} for agent_addr in agent_addresses},
+            {agent_addr: {"currency_1": 1.0} for agent_addr in agent_addresses},
+            100.0,
+        )
+
+        assert eq_prices_dict == dict(zip(good_ids, eq_prices.tolist()))
+        assert eq_good_holdings_dict == array_to_dicts(
+            agent_addresses, good_ids, eq_good_holdings
+        )
+        assert eq_currency_holdings_dict == array_to_dicts(
+            agent_addresses, ["currency_1"], eq_currency_holdings.reshape(-1, 1)
+        )
+        # the equilibrium allocation clears the market
+        assert np.allclose(eq_good_holdings.sum(axis=0), endowments.sum(axis=0))
@@ -138,6 +138,7 @@ class TestParameters(BaseSkillTestCase):
         )
 
         assert self.parameters.inactivity_timeout == 30
+        assert self.parameters.seed is None
 
         assert self.parameters.agent_location == {
             "location": Location(latitude=51.5194, longitude=0.1270)
@@ -493,21 +493,80 @@ class TestTransactions(BaseSkillTestCase):
     def test_ownership_state_after_locks(self):
         """Test the ownership_state_after_locks method of the Transactions class."""
         # setup
-        is_seller = True
-        self.transactions._locked_txs_as_seller[self.transaction_id] = self.terms
-        expected_apply_transactions_argument = [self.terms]
-        expected_ownership_state = OwnershipState()
+        ownership_state = (
+            self.skill.skill_context.decision_maker_handler_context.ownership_state
+        )
+        ownership_state._amount_by_currency_id = {"1": 100}
+        ownership_state._quantities_by_good_id = {"2": 10, "3": 5}
+        self.transactions.add_locked_tx(self.terms, FipaDialogue.Role.SELLER)
 
         # operation
-        with patch.object(
-            self.skill.skill_context.decision_maker_handler_context.ownership_state,
-            "apply_transactions",
-            return_value=expected_ownership_state,
-        ) as mock_apply_transactions:
-            actual_ownership_states = self.transactions.ownership_state_after_locks(
-                is_seller
+        actual_ownership_state = self.transactions.ownership_state_after_locks(True)
+
+        # after
+        assert actual_ownership_state.amount_by_currency_id == {"1": 110}
+        assert actual_ownership_state.quantities_by_good_id == {"2": 5, "3": 5}
+        assert ownership_state.amount_by_currency_id == {"1": 100}
+        assert (
+            self.transactions.ownership_state_after_locks(False).amount_by_currency_id
+            == ownership_state.amount_by_currency_id
+        )
+
+    def test_ownership_state_after_locks_maintained_incrementally(self):
+        """Test the ownership state after locks follows the locks added, popped, confirmed and expired."""
+        # setup
+        ownership_state = (
+            self.skill.skill_context.decision_maker_handler_context.ownership_state
+        )
+        ownership_state._amount_by_currency_id = {"1": 100}
+        ownership_state._quantities_by_good_id = {"2": 10, "3": 5}
+        roles = [FipaDialogue.Role.SELLER, FipaDialogue.Role.BUYER] * 3
+        all_terms = [
+            Terms(
+                ledger_id=self.ledger_id,
+                sender_address=self.sender,
+                counterparty_address=self.counterparty,
+                amount_by_currency_id={"1": 10 - 4 * i},
+                quantities_by_good_id={"2": -1 + i % 2, "3": i % 3 - 1},
+                is_sender_payable_tx_fee=True,
+                nonce=str(i),
             )
+            for i in range(len(roles))
+        ]
+
+        def check() -> None:
+            for is_seller, role in ((True, roles[0]), (False, roles[1])):
+                expected = ownership_state.apply_transactions(
+                    [
+                        terms
+                        for terms, terms_role in zip(all_terms, roles)
+                        if terms_role == role
+                        and terms.id in self.transactions._locked_txs
+                    ]
+                )
+                actual = self.transactions.ownership_state_after_locks(is_seller)
+                assert actual.amount_by_currency_id == expected.amount_by_currency_id
+                assert actual.quantities_by_good_id == expected.quantities_by_good_id
+
+        # operation
+        for terms, role in zip(all_terms, roles):
+            self.transactions.add_locked_tx(terms, role)
+            check()
+
+        self.transactions.pop_locked_tx(all_terms[0])
+        check()
+
+        self.skill.skill_context._get_agent_context().shared_state[
+            "confirmed_tx_ids"
+        ] = [all_terms[1].id, all_terms[2].id]
+        self.transactions.update_confirmed_transactions()
+        check()
+
+        self.transactions._pending_transaction_timeout = -1
+        self.transactions.cleanup_pending_transactions()
+        check()
 
         # after
-        mock_apply_transactions.assert_any_call(expected_apply_transactions_argument)
-        assert actual_ownership_states == expected_ownership_state
+        assert self.transactions._locked_txs == {}
+        assert self.transactions._locked_delta_as_buyer == ({}, {})
+        assert self.transactions._locked_delta_as_seller == ({}, {})
@@ -174,6 +174,59 @@ class TestGymConnection:
         assert response_msg.info.any == info
         assert sending_dialogue == response_dialogue
 
+    @pytest.mark.asyncio
+    async def test_send_act_batch(self):
+        """Test send act message to a batch of environments."""
+        envs = [gym.GoalEnv() for _ in range(3)]
+        self.gym_con = GymConnection(
+            gym_env=envs,
+            identity=self.gym_con._identity,
+            configuration=self.gym_con.configuration,
+            data_dir=MagicMock(),
+        )
+        assert self.gym_con.channel.num_envs == 3
+        self.env = envs[0]
+        with patch.object(gym.GoalEnv, "reset"):
+            sending_dialogue = await self.send_reset(num_envs=3)
+        msg = sending_dialogue.reply(
+            performative=GymMessage.Performative.ACT,
+            action=GymMessage.AnyObject([0, 1, 2]),
+            step_id=1,
+        )
+        envelope = Envelope(to=msg.to, sender=msg.sender, message=msg)
+
+        with patch.object(gym.GoalEnv, "reset", return_value="first") as mock_reset:
+            with patch.object(
+                gym.GoalEnv,
+                "step",
+                side_effect=lambda action: (action, 1.0, action == 1, {"a": action}),
+            ) as mock_step:
+                await self.gym_con.send(envelope)
+        assert mock_step.call_count == 3
+        mock_reset.assert_called_once()
+
+        response = await asyncio.wait_for(self.gym_con.receive(), timeout=3)
+        response_msg = cast(GymMessage, response.message)
+        assert sending_dialogue == self.dialogues.update(response_msg)
+        assert response_msg.performative == GymMessage.Performative.PERCEPT
+        assert response_msg.observation.any == [0, "first", 2]
+        assert response_msg.reward == 3.0
+        assert response_msg.done is False
+        assert response_msg.info.any == {
+            "rewards": [1.0, 1.0, 1.0],
+            "dones": [False, True, False],
+            "infos": [{"a": 0}, {"a": 1}, {"a": 2}],
+        }
+
+        msg = sending_dialogue.reply(
+            performative=GymMessage.Performative.ACT,
+            action=GymMessage.AnyObject([0, 1]),
+            step_id=2,
+        )
+        envelope = Envelope(to=msg.to, sender=msg.sender, message=msg)
+        with pytest.raises(Exception, match="Expected a sequence of 3 actions"):
+            await self.gym_con.send(envelope)
+
     @pytest.mark.asyncio
     async def test_send_reset(self):
         """Test send reset message."""
@@ -224,7 +277,7 @@ class TestGymConnection:
                 f"Could not create dialogue from message={incorrect_msg}"
             )
 
-    async def send_reset(self) -> GymDialogue:
+    async def send_reset(self, num_envs: int = 1) -> GymDialogue:
         """Send a reset."""
         msg, sending_dialogue = self.dialogues.create(
             counterparty=self.gym_address,
@@ -246,8 +299,11 @@ class TestGymConnection:
         response_msg = cast(GymMessage, response.message)
         response_dialogue = self.dialogues.update(response_msg)
 
+        expected_content = {"reset": "success"}
+        if num_envs > 1:
+            expected_content["num_envs"] = str(num_envs)
         assert response_msg.performative == GymMessage.Performative.STATUS
-        assert response_msg.content == {"reset": "success"}
+        assert response_msg.content == expected_content
         assert sending_dialogue == response_dialogue
         return sending_dialogue
 
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2023 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This test module contains tests for the mailbox node client against a local mailbox stand-in."""
+import asyncio
+import struct
+import time
+from typing import List, Optional, Set
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from aiohttp import web
+
+from aea.connections.base import ConnectionStates
+from aea.helpers.acn.uri import Uri
+from aea.mail.base import Envelope
+
+from packages.fetchai.connections.p2p_libp2p_mailbox.connection import (
+    ENVELOPES_ROUTED_HEADER,
+    EnvelopesNotSentError,
+    NodeClient,
+    P2PLibp2pMailboxConnection,
+)
+from packages.fetchai.protocols.default.message import DefaultMessage
+
+from tests.conftest import get_unused_tcp_port
+
+
+SESSION_TOKEN = "0123456789abcdef0123456789abcdef"
+
+
+def make_envelope(content: bytes) -> Envelope:
+    """Make an envelope."""
+    message = DefaultMessage(
+        dialogue_reference=("", ""),
+        message_id=1,
+        target=0,
+        performative=DefaultMessage.Performative.BYTES,
+        content=content,
+    )
+    return Envelope(to="receiver", sender="sender", message=message)
+
+
+class MailboxStandIn:
+    """A local stand-in of the mailbox service of a node, over plain HTTP."""
+
+    def __init__(self, batch_api: bool = True) -> None:
+        """Initialize the stand-in."""
+        self.batch_api = batch_api
+        self.port = get_unused_tcp_port()
+        self.pending: List[Envelope] = []
+        self.routed: List[Envelope] = []
+        self.requests: List[str] = []
+        self.peers: Set[str] = set()
+        self.route_limit: Optional[int] = None
+        self._arrived: Optional[asyncio.Event] = None
+        self._runner: Optional[web.AppRunner] = None
+
+    async def start(self) -> None:
+        """Start serving."""
+        self._arrived = asyncio.Event()
+        app = web.Application()
+        app.router.add_get("/get_envelope", self.get_envelope)
+        app.router.add_post("/send_envelope", self.send_envelope)
+        app.router.add_get("/unregister", self.unregister)
+        if self.batch_api:
+            app.router.add_get("/get_envelopes", self.get_envelopes)
+            app.router.add_post("/send_envelopes", self.send_envelopes)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, "127.0.0.1", self.port).start()
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    def deposit(self, *envelopes: Envelope) -> None:
+        """Deposit envelopes in the mailbox of the client."""
+        self.pending.extend(envelopes)
+        self._arrived.set()
+
+    def _record(self, request: web.Request) -> None:
+        assert request.headers["Session-Id"] == SESSION_TOKEN
+        self.requests.append(request.path)
+        self.peers.add(str(request.transport.get_extra_info("peername")))
+
+    async def get_envelope(self, request: web.Request) -> web.Response:
+        """Handle the retrieval of one envelope."""
+        self._record(request)
+        if not self.pending:
+            return web.Response(body=b"")
+        return web.Response(body=self.pending.pop(0).encode())
+
+    async def get_envelopes(self, request: web.Request) -> web.Response:
+        """Handle the retrieval of a batch of envelopes, holding the request while there are none."""
+        self._record(request)
+        if not self.pending:
+            self._arrived.clear()
+            try:
+                await asyncio.wait_for(
+                    self._arrived.wait(), float(request.query["wait"])
+                )
+            except asyncio.TimeoutError:
+                pass
+        count = int(request.query["max"])
+        envelopes, self.pending = self.pending[:count], self.pending[count:]
+        body = b"".join(
+            struct.pack("!I", len(data)) + data
+            for data in (envelope.encode() for envelope in envelopes)
+        )
+        return web.Response(body=body)
+
+    async def send_envelope(self, request: web.Request) -> web.Response:
+        """Handle the sending of one envelope."""
+        self._record(request)
+        self.routed.append(Envelope.decode(await request.read()))
+        return web.Response()
+
+    async def send_envelopes(self, request: web.Request) -> web.Response:
+        """Handle the sending of a batch of envelopes."""
+        self._record(request)
+        data = await request.read()
+        routed = 0
+        while data:
+            if routed == self.route_limit:
+                return web.Response(
+                    status=400,
+                    body=b"failed to route envelope",
+                    headers={ENVELOPES_ROUTED_HEADER: str(routed)},
+                )
+            (size,) = struct.unpack("!I", data[:4])
+            self.routed.append(Envelope.decode(data[4 : 4 + size]))
+            data = data[4 + size :]
+            routed += 1
+        return web.Response(headers={ENVELOPES_ROUTED_HEADER: str(routed)})
+
+    async def unregister(self, request: web.Request) -> web.Response:
+        """Handle the unregistration of the client."""
+        self._record(request)
+        return web.Response()
+
+
+def encoded(envelopes: List[Envelope]) -> List[bytes]:
+    """Encode envelopes, to compare them."""
+    return [envelope.encode() for envelope in envelopes]
+
+
+def make_node_client(mailbox: MailboxStandIn) -> NodeClient:
+    """Make a node client registered to the mailbox stand-in."""
+    node_client = NodeClient(Uri(f"127.0.0.1:{mailbox.port}"), Mock())
+    node_client._url_prefix = f"http://127.0.0.1:{mailbox.port}"
+    node_client._session_token = SESSION_TOKEN
+    return node_client
+
+
+@pytest.mark.asyncio
+async def test_batches_and_long_polling():
+    """Test envelopes are sent and retrieved in batches, over a single connection."""
+    mailbox = MailboxStandIn()
+    await mailbox.start()
+    node_client = make_node_client(mailbox)
+    try:
+        envelopes = [make_envelope(str(i).encode()) for i in range(5)]
+        await node_client.send_envelopes(envelopes[:3])
+        assert encoded(mailbox.routed) == encoded(envelopes[:3])
+        assert mailbox.requests == ["/send_envelopes"]
+
+        start = time.monotonic()
+        read_task = asyncio.ensure_future(node_client.read_envelopes())
+        await asyncio.sleep(0.1)
+        assert not read_task.done()
+        mailbox.deposit(*envelopes[3:])
+        assert encoded(await read_task) == encoded(envelopes[3:])
+        assert time.monotonic() - start < NodeClient.NO_ENVELOPES_SLEEP_TIME
+
+        mailbox.deposit(*envelopes[:2])
+        assert (await node_client.read_envelope()).encode() == envelopes[0].encode()
+        assert (await node_client.read_envelope()).encode() == envelopes[1].encode()
+        assert mailbox.requests.count("/get_envelopes") == 2
+        assert len(mailbox.peers) == 1
+    finally:
+        await node_client.close()
+        await mailbox.stop()
+    assert node_client._http_session is None
+
+
+@pytest.mark.asyncio
+async def test_fallback_to_single_envelope_api():
+    """Test the client falls back to one envelope per request when the node has no batch endpoints."""
+    mailbox = MailboxStandIn(batch_api=False)
+    await mailbox.start()
+    node_client = make_node_client(mailbox)
+    try:
+        envelopes = [make_envelope(str(i).encode()) for i in range(2)]
+        await node_client.send_envelopes(envelopes)
+        assert encoded(mailbox.routed) == encoded(envelopes)
+        assert node_client._batch_api_supported is False
+
+        mailbox.deposit(*envelopes)
+        assert (await node_client.read_envelope()).encode() == envelopes[0].encode()
+        assert (await node_client.read_envelope()).encode() == envelopes[1].encode()
+        assert mailbox.requests == [
+            "/send_envelope",
+            "/send_envelope",
+            "/get_envelope",
+            "/get_envelope",
+        ]
+    finally:
+        await node_client.close()
+        await mailbox.stop()
+
+
+@pytest.mark.asyncio
+async def test_partially_routed_batch():
+    """Test only the envelopes the node did not route are sent again after a batch fails."""
+    mailbox = MailboxStandIn()
+    await mailbox.start()
+    node_client = make_node_client(mailbox)
+    try:
+        envelopes = [make_envelope(str(i).encode()) for i in range(5)]
+        mailbox.route_limit = 2
+        with pytest.raises(EnvelopesNotSentError) as exc_info:
+            await node_client.send_envelopes(envelopes)
+        assert exc_info.value.sent == 2
+        assert encoded(mailbox.routed) == encoded(envelopes[:2])
+
+        def reconnect() -> None:
+            mailbox.route_limit = None
+
+        connection = Mock(
+            _node_client=node_client,
+            _perform_connection_to_node=AsyncMock(side_effect=reconnect),
+        )
+        mailbox.route_limit = 1
+        await P2PLibp2pMailboxConnection._send_envelopes_with_node_client(
+            connection, envelopes[2:]
+        )
+        connection._perform_connection_to_node.assert_awaited_once()
+        assert encoded(mailbox.routed) == encoded(envelopes)
+    finally:
+        await node_client.close()
+        await mailbox.stop()
+
+
+@pytest.mark.asyncio
+async def test_reconnect_closes_previous_client():
+    """Test a reconnection closes the previous client and keeps the envelopes it retrieved but did not return."""
+    mailbox = MailboxStandIn()
+    await mailbox.start()
+    previous_client = make_node_client(mailbox)
+    new_client = make_node_client(mailbox)
+    try:
+        envelopes = [make_envelope(str(i).encode()) for i in range(2)]
+        mailbox.deposit(*envelopes)
+        assert (await previous_client.read_envelope()).encode() == envelopes[0].encode()
+        assert previous_client._http_session is not None
+
+        connection = Mock(
+            _node_client=previous_client,
+            connect_retries=1,
+            state=ConnectionStates.connected,
+            _setup_connection=AsyncMock(),
+        )
+        with patch(
+            "packages.fetchai.connections.p2p_libp2p_mailbox.connection.NodeClient",
+            return_value=new_client,
+        ):
+            await P2PLibp2pMailboxConnection._perform_connection_to_node(connection)
+        assert connection._node_client is new_client
+        assert previous_client._http_session is None
+        assert mailbox.requests[-1] == "/unregister"
+        assert (await new_client.read_envelope()).encode() == envelopes[1].encode()
+    finally:
+        await new_client.close()
+        await mailbox.stop()
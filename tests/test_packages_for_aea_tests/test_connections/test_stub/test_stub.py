@@ -360,6 +360,104 @@ async def test_multiple_envelopes():
     await connection.disconnect()
 
 
+@pytest.mark.asyncio
+async def test_multiple_envelopes_polling():
+    """Test many envelopes received when file change notifications are not available."""
+    tmpdir = Path(tempfile.mkdtemp())
+    d = tmpdir / "test_stub"
+    d.mkdir(parents=True)
+    input_file_path = d / "input_file.csv"
+    output_file_path = d / "output_file.csv"
+    connection = _make_stub_connection(input_file_path, output_file_path)
+
+    num_envelopes = 5
+    with mock.patch(
+        "packages.fetchai.connections.stub.connection._make_inotify_fd",
+        return_value=None,
+    ):
+        await connection.connect()
+    assert connection._input_changed is None
+
+    async def wait_num(num):
+        for _ in range(num):
+            assert await connection.receive()
+
+    task = asyncio.get_event_loop().create_task(wait_num(num_envelopes))
+
+    with open(input_file_path, "ab+") as f:
+        for _ in range(num_envelopes):
+            write_envelope(make_test_envelope(), f)
+            await asyncio.sleep(0.01)  # spin asyncio loop
+
+    await asyncio.wait_for(task, timeout=3)
+    await connection.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_input_file_read_incrementally():
+    """Test the input file is only truncated once enough data has been consumed."""
+    tmpdir = Path(tempfile.mkdtemp())
+    d = tmpdir / "test_stub"
+    d.mkdir(parents=True)
+    input_file_path = d / "input_file.csv"
+    output_file_path = d / "output_file.csv"
+    connection = _make_stub_connection(input_file_path, output_file_path)
+    await connection.connect()
+
+    with open(input_file_path, "ab+") as f:
+        write_envelope(make_test_envelope(), f)
+    assert await asyncio.wait_for(connection.receive(), timeout=3)
+    size = input_file_path.stat().st_size
+    assert size > 0
+    assert connection._input_offset == size
+
+    connection.compact_threshold = size + 1
+    with open(input_file_path, "ab+") as f:
+        write_envelope(make_test_envelope(), f)
+    assert await asyncio.wait_for(connection.receive(), timeout=3)
+    assert input_file_path.stat().st_size == 0
+    assert connection._input_offset == 0
+
+    await connection.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_no_envelope_delivered_twice_on_reconnect():
+    """Test the envelopes delivered before a disconnect are not delivered again on reconnect."""
+    tmpdir = Path(tempfile.mkdtemp())
+    d = tmpdir / "test_stub"
+    d.mkdir(parents=True)
+    input_file_path = d / "input_file.csv"
+    output_file_path = d / "output_file.csv"
+    connection = _make_stub_connection(input_file_path, output_file_path)
+    await connection.connect()
+
+    first = make_test_envelope()
+    with open(input_file_path, "ab+") as f:
+        write_envelope(first, f)
+    received = await asyncio.wait_for(connection.receive(), timeout=3)
+    assert received.message_bytes == first.message_bytes
+    await connection.disconnect()
+    assert input_file_path.stat().st_size == 0
+
+    msg = DefaultMessage(
+        dialogue_reference=("", ""),
+        message_id=1,
+        target=0,
+        performative=DefaultMessage.Performative.BYTES,
+        content=b"second",
+    )
+    second = Envelope(to="any", sender="any", message=msg)
+    with open(input_file_path, "ab+") as f:
+        write_envelope(second, f)
+    await connection.connect()
+    received = await asyncio.wait_for(connection.receive(), timeout=3)
+    assert received.message_bytes == second.message_bytes
+    await asyncio.sleep(0.1)
+    assert connection.in_queue.empty()
+    await connection.disconnect()
+
+
 @pytest.mark.asyncio
 async def test_bad_envelope():
     """Test bad format envelop."""
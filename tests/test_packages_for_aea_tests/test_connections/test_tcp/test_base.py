@@ -130,3 +130,27 @@ async def test_send_cancelled():
 
     await tcp_client.disconnect()
     await tcp_server.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_server_closes_writer_on_eof():
+    """Test the server closes the writer of a client whose stream hits EOF."""
+    port = get_unused_tcp_port()
+    tcp_server = _make_tcp_server_connection(
+        "address_server", "public_key", "127.0.0.1", port
+    )
+    tcp_client = _make_tcp_client_connection(
+        "address_client", "public_key_client", "127.0.0.1", port
+    )
+
+    await tcp_server.connect()
+    await tcp_client.connect()
+    await asyncio.sleep(0.1)
+    _, writer = tcp_server.connections["address_client"]
+
+    await tcp_client.disconnect()
+    assert await tcp_server.receive() is None
+    assert "address_client" not in tcp_server.connections
+    assert writer.is_closing()
+
+    await tcp_server.disconnect()
@@ -111,6 +111,42 @@ class TestProxyEnv(GymTestCase):
         assert actual_done is True
         assert actual_info == self.mocked_info.any
 
+    def test_step_batch(self):
+        """Test the step method of the ProxyEnv class with a batch of environments."""
+        # setup
+        actions = ["some_action", "other_action"]
+        gym_dialogue = cast(
+            GymDialogue,
+            self.prepare_skill_dialogue(
+                dialogues=self.gym_dialogues,
+                messages=self.list_of_gym_messages[:2],
+            ),
+        )
+        self.proxy_env._active_dialogue = gym_dialogue
+        self.proxy_env._num_envs = 2
+        batch_info = {"rewards": [1.0, 0.0], "dones": [True, False], "infos": [{}, {}]}
+        percept_msg = self.build_incoming_message(
+            message_type=GymMessage,
+            performative=GymMessage.Performative.PERCEPT,
+            step_id=self.proxy_env._step_count + 1,
+            observation=GymMessage.AnyObject(["obs_0", "obs_1"]),
+            reward=1.0,
+            done=False,
+            info=GymMessage.AnyObject(batch_info),
+        )
+
+        # operation
+        with patch.object(self.proxy_env._queue, "get", return_value=percept_msg):
+            observations, rewards, dones, infos = self.proxy_env.step(actions)
+
+        # after
+        message = self.get_message_from_outbox()
+        assert message.action.any == actions
+        assert observations == ["obs_0", "obs_1"]
+        assert rewards == [1.0, 0.0]
+        assert dones == [True, False]
+        assert infos == [{}, {}]
+
     def test_step_ii(self):
         """Test the step method of the ProxyEnv class where performative is NOT percept."""
         # setup
@@ -241,6 +277,22 @@ class TestProxyEnv(GymTestCase):
 
         mocked_q_get.assert_called_with(block=True, timeout=None)
 
+    def test_reset_batch(self):
+        """Test the reset method of the ProxyEnv class reads the number of environments."""
+        # setup
+        status_msg = self.build_incoming_message(
+            message_type=GymMessage,
+            performative=GymMessage.Performative.STATUS,
+            content={"reset": "success", "num_envs": "4"},
+        )
+
+        # operation
+        with patch.object(self.proxy_env._queue, "get", return_value=status_msg):
+            self.proxy_env.reset()
+
+        # after
+        assert self.proxy_env.num_envs == 4
+
     def test_reset_ii(self):
         """Test the reset method of the ProxyEnv class where performative is NOT status."""
         # setup
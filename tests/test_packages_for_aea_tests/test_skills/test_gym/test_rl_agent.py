@@ -159,3 +159,30 @@ class TestMyRLAgent(GymTestCase):
         # fit
         mock_logger.assert_called()
         mocked_close.assert_called()
+
+    def test_fit_batch(self):
+        """Test the fit method of the MyRLAgent class with a batch of environments."""
+        # setup
+        num_envs = 4
+        self.proxy_env._num_envs = num_envs
+        step_result = (
+            ["obs"] * num_envs,
+            [1.0] * num_envs,
+            [False] * num_envs,
+            [{}] * num_envs,
+        )
+
+        # operation
+        with patch.object(ProxyEnv, "reset"):
+            with patch.object(
+                ProxyEnv, "step", return_value=step_result
+            ) as mocked_step:
+                with patch.object(ProxyEnv, "close") as mocked_close:
+                    with patch.object(GoodPriceModel, "update") as mocked_update:
+                        self.my_rl_agent.fit(self.proxy_env, self.nb_steps)
+
+        # after
+        assert mocked_step.call_count == self.nb_steps // num_envs
+        assert len(mocked_step.call_args[0][0]) == num_envs
+        assert mocked_update.call_count == self.nb_steps
+        mocked_close.assert_called()